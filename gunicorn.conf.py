@@ -0,0 +1,23 @@
+# Configuração do gunicorn (lida automaticamente quando o gunicorn é iniciado na raiz do projeto)
+# Ex: gunicorn --timeout 600 --chdir src app:server
+import os
+
+# Carrega a aplicação uma única vez no processo mestre e cria os workers por fork
+preload_app = os.getenv("GUNICORN_PRELOAD", "True").lower() in ("true", "1", "yes")
+
+
+def when_ready(server):
+    # Dados compartilhados com os workers e fechamento das conexões do mestre
+    if preload_app:
+        from modules.gunicorn_utils import prepara_processo_mestre
+
+        prepara_processo_mestre()
+
+
+def post_fork(server, worker):
+    # Cada worker usa o seu próprio pool de conexões (sem o preload, nada foi herdado do mestre e o
+    # .env ainda não foi lido, pois o worker carrega a aplicação depois deste hook)
+    if preload_app:
+        from modules.gunicorn_utils import prepara_worker
+
+        prepara_worker()
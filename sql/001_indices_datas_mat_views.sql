@@ -0,0 +1,45 @@
+-- Índices das colunas de data das views de retrabalho
+--
+-- As datas das views estão em texto no formato ISO (YYYY-MM-DDTHH:MI:SS), cuja ordem lexicográfica
+-- é a mesma ordem cronológica. Assim, os filtros "DATA ..." BETWEEN '<inicio>' AND '<fim>' e o
+-- agrupamento por LEFT("DATA ...", 7) (ano-mês) podem usar índices B-tree sem conversão de tipo.
+--
+-- Os índices são criados para todas as views mat_view_retrabalho_{min_dias}_dias(_distinct).
+-- Os índices de views materializadas são mantidos após o REFRESH MATERIALIZED VIEW.
+-- Execute novamente ao criar views para um novo número de dias.
+
+DO $$
+DECLARE
+    v RECORD;
+BEGIN
+    FOR v IN
+        SELECT matviewname
+        FROM pg_matviews
+        WHERE matviewname ~ '^mat_view_retrabalho_[0-9]+_dias(_distinct)?$'
+    LOOP
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON %I ("DATA DO FECHAMENTO DA OS")',
+            v.matviewname || '_dt_fech_idx', v.matviewname
+        );
+
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON %I ("DATA DA ABERTURA DA OS")',
+            v.matviewname || '_dt_aber_idx', v.matviewname
+        );
+
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON %I ("CODIGO DO VEICULO", "DATA DO FECHAMENTO DA OS")',
+            v.matviewname || '_veic_dt_fech_idx', v.matviewname
+        );
+
+        -- Apenas as views não distintas possuem uma linha por colaborador
+        IF v.matviewname !~ '_distinct$' THEN
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS %I ON %I ("COLABORADOR QUE EXECUTOU O SERVICO", "DATA DO FECHAMENTO DA OS")',
+                v.matviewname || '_colab_dt_fech_idx', v.matviewname
+            );
+        END IF;
+    END LOOP;
+END
+$$;
+
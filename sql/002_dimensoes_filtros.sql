@@ -0,0 +1,84 @@
+-- Views de dimensão usadas nas listas dos filtros (oficinas, seções, serviços, modelos, veículos e colaboradores)
+--
+-- As listas dos filtros eram obtidas com SELECT DISTINCT sobre mat_view_retrabalho_10_dias, o que exige
+-- ler toda a view (todo o histórico de OSs). As views abaixo guardam apenas os valores distintos e
+-- possuem índice único, portanto as listas passam a ser lidas em poucos milissegundos.
+--
+-- As dimensões devem ser atualizadas logo após a atualização de mat_view_retrabalho_10_dias:
+--     SELECT refresh_dimensoes_filtros();
+-- Enquanto as views não existirem, o painel continua lendo as listas de mat_view_retrabalho_10_dias.
+
+-- Oficinas
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_dim_oficinas AS
+SELECT DISTINCT
+    "DESCRICAO DA OFICINA"
+FROM
+    mat_view_retrabalho_10_dias;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_dim_oficinas_idx ON mat_view_dim_oficinas ("DESCRICAO DA OFICINA");
+
+-- Seções
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_dim_secoes AS
+SELECT DISTINCT
+    "DESCRICAO DA SECAO"
+FROM
+    mat_view_retrabalho_10_dias;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_dim_secoes_idx ON mat_view_dim_secoes ("DESCRICAO DA SECAO");
+
+-- Serviços (OSs) e suas seções
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_dim_servicos AS
+SELECT DISTINCT
+    "DESCRICAO DA SECAO",
+    "DESCRICAO DO SERVICO"
+FROM
+    mat_view_retrabalho_10_dias;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_dim_servicos_idx
+    ON mat_view_dim_servicos ("DESCRICAO DO SERVICO", "DESCRICAO DA SECAO");
+
+-- Modelos
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_dim_modelos AS
+SELECT DISTINCT
+    "DESCRICAO DO MODELO"
+FROM
+    mat_view_retrabalho_10_dias;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_dim_modelos_idx ON mat_view_dim_modelos ("DESCRICAO DO MODELO");
+
+-- Veículos e seus modelos (um modelo por veículo, o primeiro em ordem alfabética)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_dim_veiculos AS
+SELECT DISTINCT ON ("CODIGO DO VEICULO")
+    "CODIGO DO VEICULO",
+    "DESCRICAO DO MODELO"
+FROM
+    mat_view_retrabalho_10_dias
+ORDER BY
+    "CODIGO DO VEICULO",
+    "DESCRICAO DO MODELO";
+
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_dim_veiculos_idx ON mat_view_dim_veiculos ("CODIGO DO VEICULO");
+
+-- Colaboradores que executaram serviços
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_dim_colaboradores AS
+SELECT DISTINCT
+    "COLABORADOR QUE EXECUTOU O SERVICO"
+FROM
+    mat_view_retrabalho_10_dias;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_dim_colaboradores_idx
+    ON mat_view_dim_colaboradores ("COLABORADOR QUE EXECUTOU O SERVICO");
+
+-- Atualização de todas as dimensões (CONCURRENTLY não bloqueia as leituras do painel)
+CREATE OR REPLACE FUNCTION refresh_dimensoes_filtros() RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_dim_oficinas;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_dim_secoes;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_dim_servicos;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_dim_modelos;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_dim_veiculos;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_dim_colaboradores;
+END
+$$;
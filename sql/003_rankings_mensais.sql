@@ -0,0 +1,131 @@
+-- Agregados mensais usados nos rankings de veículos e de colaboradores
+--
+-- Os indicadores de ranking (ex: posição do veículo no retrabalho entre os veículos do modelo, posição do
+-- colaborador na nota média) precisam calcular as métricas de todos os veículos/colaboradores do período.
+-- As views abaixo guardam essas métricas somadas por mês e pelas colunas dos filtros (modelo, seção, serviço
+-- e oficina). Os serviços somam os meses inteiramente contidos no período e leem as linhas das views de
+-- retrabalho apenas para os dias restantes (início e fim do período), ver modules/ranking_mensal_utils.py.
+--
+-- As métricas são somas (ex: soma e quantidade das notas, em vez da média), portanto podem ser somadas entre
+-- meses. As expressões devem ser as mesmas de METRICAS_RANKING_VEICULO e METRICAS_RANKING_COLABORADOR
+-- (veiculo_service.py e colaborador_service.py), que calculam as métricas das linhas das bordas do período.
+--
+-- É criada uma view para cada view mat_view_retrabalho_{min_dias}_dias existente. Execute novamente ao criar
+-- views de retrabalho para um novo número de dias. Os agregados devem ser atualizados logo após a atualização
+-- das views de retrabalho:
+--     SELECT refresh_rankings_mensais();
+-- Enquanto as views não existirem, os rankings continuam sendo calculados sobre as views de retrabalho.
+
+DO $$
+DECLARE
+    v RECORD;
+    view_veiculo TEXT;
+    view_colaborador TEXT;
+BEGIN
+    FOR v IN
+        SELECT matviewname, substring(matviewname FROM '^mat_view_retrabalho_([0-9]+)_dias$') AS min_dias
+        FROM pg_matviews
+        WHERE matviewname ~ '^mat_view_retrabalho_[0-9]+_dias$'
+    LOOP
+        view_veiculo := 'mat_view_ranking_mensal_veiculo_' || v.min_dias || '_dias';
+        view_colaborador := 'mat_view_ranking_mensal_colaborador_' || v.min_dias || '_dias';
+
+        -- Veículos
+        EXECUTE format(
+            $q$
+            CREATE MATERIALIZED VIEW IF NOT EXISTS %I AS
+            SELECT
+                LEFT(main."DATA DO FECHAMENTO DA OS", 7) AS "ANO_MES",
+                main."CODIGO DO VEICULO",
+                main."DESCRICAO DO MODELO",
+                main."DESCRICAO DA SECAO",
+                main."DESCRICAO DO SERVICO",
+                main."DESCRICAO DA OFICINA",
+                COUNT(*) AS quantidade_de_os,
+                COUNT(*) FILTER (WHERE main.retrabalho) AS quantidade_de_os_retrabalho,
+                COUNT(*) FILTER (WHERE main.correcao_primeira) AS quantidade_de_os_correcao_primeira,
+                SUM(pc.total_gasto) AS total_gasto,
+                COALESCE(SUM(pc.quantidade_de_pecas), 0) AS quantidade_de_pecas,
+                SUM(pc.total_gasto) FILTER (WHERE main.retrabalho) AS total_gasto_retrabalho,
+                COALESCE(SUM(pc.quantidade_de_pecas) FILTER (WHERE main.retrabalho), 0) AS quantidade_de_pecas_retrabalho
+            FROM
+                %I main
+            LEFT JOIN (
+                SELECT "OS", SUM("VALOR") AS total_gasto, COUNT("OS") AS quantidade_de_pecas
+                FROM view_pecas_desconsiderando_combustivel
+                GROUP BY "OS"
+            ) pc ON pc."OS" = main."NUMERO DA OS"
+            GROUP BY 1, 2, 3, 4, 5, 6
+            $q$,
+            view_veiculo, v.matviewname
+        );
+
+        EXECUTE format(
+            'CREATE UNIQUE INDEX IF NOT EXISTS %I ON %I ("ANO_MES", "CODIGO DO VEICULO", "DESCRICAO DO MODELO", '
+            '"DESCRICAO DA SECAO", "DESCRICAO DO SERVICO", "DESCRICAO DA OFICINA")',
+            view_veiculo || '_idx', view_veiculo
+        );
+
+        -- Colaboradores
+        EXECUTE format(
+            $q$
+            CREATE MATERIALIZED VIEW IF NOT EXISTS %I AS
+            SELECT
+                LEFT(main."DATA DO FECHAMENTO DA OS", 7) AS "ANO_MES",
+                main."COLABORADOR QUE EXECUTOU O SERVICO",
+                main."DESCRICAO DO MODELO",
+                main."DESCRICAO DA SECAO",
+                main."DESCRICAO DO SERVICO",
+                main."DESCRICAO DA OFICINA",
+                COUNT(main."NUMERO DA OS") AS "TOTAL_OS",
+                COUNT(*) AS "TOTAL_LINHAS",
+                COUNT(*) FILTER (WHERE main.retrabalho) AS "TOTAL_RETRABALHO",
+                COUNT(*) FILTER (WHERE main.correcao) AS "TOTAL_CORRECAO",
+                COUNT(*) FILTER (WHERE main.correcao_primeira) AS "TOTAL_CORRECAO_PRIMEIRA",
+                SUM(nt.soma_nota) AS "SOMA_NOTA",
+                COALESCE(SUM(nt.quantidade_nota), 0) AS "QTD_NOTA",
+                SUM(pc.total_gasto) AS "TOTAL_GASTO",
+                SUM(pc.total_gasto) FILTER (WHERE main.retrabalho) AS "TOTAL_GASTO_RETRABALHO"
+            FROM
+                %I main
+            LEFT JOIN (
+                SELECT "KEY_HASH", SUM("SCORE_SOLUTION_TEXT_QUALITY") AS soma_nota,
+                    COUNT("SCORE_SOLUTION_TEXT_QUALITY") AS quantidade_nota
+                FROM os_dados_classificacao
+                GROUP BY "KEY_HASH"
+            ) nt ON nt."KEY_HASH" = main."KEY_HASH"
+            LEFT JOIN (
+                SELECT "OS", SUM("VALOR") AS total_gasto
+                FROM view_pecas_desconsiderando_combustivel
+                GROUP BY "OS"
+            ) pc ON pc."OS" = main."NUMERO DA OS"
+            GROUP BY 1, 2, 3, 4, 5, 6
+            $q$,
+            view_colaborador, v.matviewname
+        );
+
+        EXECUTE format(
+            'CREATE UNIQUE INDEX IF NOT EXISTS %I ON %I ("ANO_MES", "COLABORADOR QUE EXECUTOU O SERVICO", '
+            '"DESCRICAO DO MODELO", "DESCRICAO DA SECAO", "DESCRICAO DO SERVICO", "DESCRICAO DA OFICINA")',
+            view_colaborador || '_idx', view_colaborador
+        );
+    END LOOP;
+END
+$$;
+
+-- Atualização de todos os agregados mensais (CONCURRENTLY não bloqueia as leituras do painel)
+CREATE OR REPLACE FUNCTION refresh_rankings_mensais() RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v RECORD;
+BEGIN
+    FOR v IN
+        SELECT matviewname
+        FROM pg_matviews
+        WHERE matviewname ~ '^mat_view_ranking_mensal_(veiculo|colaborador)_[0-9]+_dias$'
+    LOOP
+        EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I', v.matviewname);
+    END LOOP;
+END
+$$;
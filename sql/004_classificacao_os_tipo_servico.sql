@@ -0,0 +1,236 @@
+-- Classificação incremental das OSs (retrabalho, correção e número do problema) para a página de tipo de serviço
+--
+-- A página de tipo de serviço classificava as OSs a cada requisição a partir de os_dados: validação das datas,
+-- remoção das duplicadas, lag/lead por veículo e soma acumulada do número do problema sobre todo o histórico.
+-- A tabela abaixo guarda essa classificação por min_dias, com as OSs de cada veículo ordenadas por serviço
+-- (a página filtra um serviço por vez). As condições que dependem da data atual (now()) são avaliadas na leitura.
+--
+-- A função atualiza_classificacao_os_tipo_servico(min_dias) reprocessa apenas os veículos com OSs novas,
+-- alteradas ou removidas desde a última execução (comparando KEY_HASH, número, serviço e datas de cada OS).
+-- Ela deve ser executada após cada carga de os_dados, para cada número de dias usado no painel:
+--     SELECT atualiza_classificacao_os_tipo_servico(10);
+--     SELECT atualiza_classificacao_os_tipo_servico(15);
+--     SELECT atualiza_classificacao_os_tipo_servico(30);
+-- Enquanto a classificação de um número de dias não tiver sido executada, o painel continua classificando as OSs
+-- a cada requisição (o mesmo ocorre ao selecionar mais de um serviço ou uma oficina específica).
+
+-- OSs válidas para a classificação (datas no formato ISO, a partir de 2024, com prioridade), também lidas pela página
+CREATE OR REPLACE VIEW view_os_dados_tipo_servico AS
+SELECT
+    od."FILIAL",
+    od."DESCRICAO DA FILIAL",
+    od."NUMERO DA OS",
+    od."CODIGO DO VEICULO",
+    od."DESCRICAO DO VEICULO",
+    od."DESCRICAO DO MODELO",
+    od."OFICINA",
+    od."DESCRICAO DA OFICINA",
+    od."DATA DA ABERTURA DA OS",
+    NULLIF(od."DATA DO FECHAMENTO DA OS", ''::text) AS "DATA DO FECHAMENTO DA OS",
+    od."TIPO DE MANUTENCAO",
+    od."CODIGO DO MOTIVO",
+    od."DESCRICAO DO MOTIVO",
+    od."TIPO DA OS",
+    od."DESCRICAO DO TIPO DA OS",
+    od."OBSERVACAO DA OS",
+    od."JUSTIFICATIVA",
+    od."USUARIO DE ABRIU A OS",
+    od."USUARIO DE ALTERACAO",
+    od."SERVICO DA OS",
+    od."DESCRICAO DO SERVICO",
+    od."TEMPO PADRAO",
+    od."PRIORIDADE SERVICO",
+    od."SERVICO VINCULADO",
+    od."QTD DE SERVICO",
+    od."SECAO",
+    od."DESCRICAO DA SECAO",
+    od."COMPLEMENTO DO SERVICO",
+    od."FLAG DE NAO EXECUTADO",
+    od."DATA DE INI. DO PLANEJAMENTO",
+    od."DATA DE FIN. DO PLANEJAMENTO",
+    od."DATA INICIO SERVIÇO",
+    od."DATA DE FECHAMENTO DO SERVICO",
+    od."TEMPO TOTAL",
+    od."COLABORADOR QUE EXECUTOU O SERVICO",
+    od."KEY",
+    od."KEY_HASH"
+FROM
+    os_dados od
+WHERE
+    od."DATA DA ABERTURA DA OS" IS NOT NULL
+    AND od."DATA DA ABERTURA DA OS" ~ '^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$'::text
+    AND od."DATA DA ABERTURA DA OS" >= '2024-01-01'::text
+    AND od."DATA DO FECHAMENTO DA OS" IS NOT NULL
+    AND (
+        od."DATA DO FECHAMENTO DA OS" ~ '^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$'::text
+        OR
+        od."DATA DO FECHAMENTO DA OS" = ''::text
+    )
+    AND (od."PRIORIDADE SERVICO" = ANY (ARRAY['Vermelho'::text, 'Amarelo'::text, 'Verde'::text]));
+
+-- Uma linha por OS válida; a classificação fica na linha mantida na remoção das duplicadas (principal)
+CREATE TABLE IF NOT EXISTS os_classificacao_tipo_servico AS
+SELECT
+    0 AS min_dias,
+    v."KEY_HASH",
+    v."CODIGO DO VEICULO",
+    v."NUMERO DA OS",
+    v."DESCRICAO DO SERVICO",
+    v."DATA DA ABERTURA DA OS",
+    v."DATA DO FECHAMENTO DA OS",
+    false AS principal,
+    NULL::double precision AS prev_days,
+    NULL::double precision AS next_days,
+    NULL::bigint AS problem_no_base
+FROM
+    view_os_dados_tipo_servico v
+WITH NO DATA;
+
+CREATE INDEX IF NOT EXISTS os_classificacao_tipo_servico_veic_idx
+    ON os_classificacao_tipo_servico (min_dias, "CODIGO DO VEICULO");
+
+CREATE INDEX IF NOT EXISTS os_classificacao_tipo_servico_serv_dt_idx
+    ON os_classificacao_tipo_servico (min_dias, "DESCRICAO DO SERVICO", "DATA DA ABERTURA DA OS")
+    WHERE principal;
+
+-- Última execução da classificação de cada número de dias
+CREATE TABLE IF NOT EXISTS os_classificacao_tipo_servico_execucoes (
+    min_dias INTEGER PRIMARY KEY,
+    data_execucao TIMESTAMP WITH TIME ZONE NOT NULL,
+    veiculos_reprocessados INTEGER NOT NULL
+);
+
+-- Reprocessa a classificação dos veículos com OSs novas, alteradas ou removidas. Retorna o número de veículos
+CREATE OR REPLACE FUNCTION atualiza_classificacao_os_tipo_servico(p_min_dias INTEGER) RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    total_veiculos INTEGER;
+BEGIN
+    DROP TABLE IF EXISTS veiculos_alterados;
+
+    CREATE TEMP TABLE veiculos_alterados AS
+    SELECT DISTINCT
+        "CODIGO DO VEICULO"
+    FROM (
+        (
+            SELECT "KEY_HASH", "CODIGO DO VEICULO", "NUMERO DA OS", "DESCRICAO DO SERVICO",
+                "DATA DA ABERTURA DA OS", "DATA DO FECHAMENTO DA OS"
+            FROM view_os_dados_tipo_servico
+            EXCEPT
+            SELECT "KEY_HASH", "CODIGO DO VEICULO", "NUMERO DA OS", "DESCRICAO DO SERVICO",
+                "DATA DA ABERTURA DA OS", "DATA DO FECHAMENTO DA OS"
+            FROM os_classificacao_tipo_servico
+            WHERE min_dias = p_min_dias
+        )
+        UNION ALL
+        (
+            SELECT "KEY_HASH", "CODIGO DO VEICULO", "NUMERO DA OS", "DESCRICAO DO SERVICO",
+                "DATA DA ABERTURA DA OS", "DATA DO FECHAMENTO DA OS"
+            FROM os_classificacao_tipo_servico
+            WHERE min_dias = p_min_dias
+            EXCEPT
+            SELECT "KEY_HASH", "CODIGO DO VEICULO", "NUMERO DA OS", "DESCRICAO DO SERVICO",
+                "DATA DA ABERTURA DA OS", "DATA DO FECHAMENTO DA OS"
+            FROM view_os_dados_tipo_servico
+        )
+    ) alteracoes;
+
+    SELECT COUNT(*) INTO total_veiculos FROM veiculos_alterados;
+
+    DELETE FROM os_classificacao_tipo_servico c
+    WHERE
+        c.min_dias = p_min_dias
+        AND (
+            c."CODIGO DO VEICULO" IN (SELECT "CODIGO DO VEICULO" FROM veiculos_alterados)
+            OR (c."CODIGO DO VEICULO" IS NULL AND EXISTS (SELECT 1 FROM veiculos_alterados WHERE "CODIGO DO VEICULO" IS NULL))
+        );
+
+    INSERT INTO os_classificacao_tipo_servico
+    WITH
+    os_clean AS (
+        SELECT
+            v."KEY_HASH",
+            v."CODIGO DO VEICULO",
+            v."NUMERO DA OS",
+            v."DESCRICAO DO SERVICO",
+            v."DATA DA ABERTURA DA OS",
+            v."DATA DO FECHAMENTO DA OS"
+        FROM
+            view_os_dados_tipo_servico v
+        WHERE
+            v."CODIGO DO VEICULO" IN (SELECT "CODIGO DO VEICULO" FROM veiculos_alterados)
+            OR (v."CODIGO DO VEICULO" IS NULL AND EXISTS (SELECT 1 FROM veiculos_alterados WHERE "CODIGO DO VEICULO" IS NULL))
+    ),
+    os_remove_duplicadas AS (
+        SELECT DISTINCT ON (od."NUMERO DA OS", od."DESCRICAO DO SERVICO")
+            *
+        FROM
+            os_clean od
+        ORDER BY
+            od."NUMERO DA OS", od."DESCRICAO DO SERVICO", od."DATA DA ABERTURA DA OS" DESC
+    ),
+    os_diff_days AS (
+        SELECT
+            od.*,
+            CASE
+                WHEN
+                    lag(od."DATA DO FECHAMENTO DA OS") OVER w IS NOT NULL
+                    AND od."DATA DA ABERTURA DA OS" IS NOT NULL
+                THEN abs(date_part('day'::text, od."DATA DA ABERTURA DA OS"::timestamp without time zone - (lag(od."DATA DO FECHAMENTO DA OS") OVER w)::timestamp without time zone))
+                ELSE NULL::double precision
+            END AS prev_days,
+            CASE
+                WHEN
+                    od."DATA DO FECHAMENTO DA OS" IS NOT NULL
+                    AND lead(od."DATA DA ABERTURA DA OS") OVER w IS NOT NULL
+                THEN abs(date_part('day'::text, (lead(od."DATA DA ABERTURA DA OS") OVER w)::timestamp without time zone - od."DATA DO FECHAMENTO DA OS"::timestamp without time zone))
+                ELSE NULL::double precision
+            END AS next_days
+        FROM
+            os_remove_duplicadas od
+        WINDOW w AS (PARTITION BY od."CODIGO DO VEICULO", od."DESCRICAO DO SERVICO" ORDER BY od."DATA DA ABERTURA DA OS")
+    ),
+    -- Número do problema considerando como correção todas as OSs sem OS seguinte (a parte que depende de now()
+    -- é descontada na leitura, para as OSs abertas há menos de min_dias)
+    os_problem_no AS (
+        SELECT
+            od."KEY_HASH",
+            od.prev_days,
+            od.next_days,
+            SUM(
+                CASE
+                    WHEN od.next_days > p_min_dias::double precision OR od.next_days IS NULL THEN 1
+                    ELSE 0
+                END
+            ) OVER (PARTITION BY od."CODIGO DO VEICULO", od."DESCRICAO DO SERVICO" ORDER BY od."DATA DA ABERTURA DA OS") AS problem_no_base
+        FROM
+            os_diff_days od
+    )
+    SELECT
+        p_min_dias,
+        c."KEY_HASH",
+        c."CODIGO DO VEICULO",
+        c."NUMERO DA OS",
+        c."DESCRICAO DO SERVICO",
+        c."DATA DA ABERTURA DA OS",
+        c."DATA DO FECHAMENTO DA OS",
+        p."KEY_HASH" IS NOT NULL AS principal,
+        p.prev_days,
+        p.next_days,
+        p.problem_no_base
+    FROM
+        os_clean c
+    LEFT JOIN
+        os_problem_no p ON p."KEY_HASH" = c."KEY_HASH";
+
+    INSERT INTO os_classificacao_tipo_servico_execucoes (min_dias, data_execucao, veiculos_reprocessados)
+    VALUES (p_min_dias, now(), total_veiculos)
+    ON CONFLICT (min_dias) DO UPDATE
+    SET data_execucao = EXCLUDED.data_execucao, veiculos_reprocessados = EXCLUDED.veiculos_reprocessados;
+
+    DROP TABLE veiculos_alterados;
+
+    RETURN total_veiculos;
+END
+$$;
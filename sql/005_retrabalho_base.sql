@@ -0,0 +1,262 @@
+-- Base única de retrabalho e views por número de dias
+--
+-- Cada número de dias (10, 15, 30...) usado no painel tinha as suas próprias views materializadas
+-- mat_view_retrabalho_{min_dias}_dias e mat_view_retrabalho_{min_dias}_dias_distinct, com todo o histórico
+-- de OSs, o que multiplica o tempo de atualização e o espaço ocupado. Os dias até a OS anterior (prev_days)
+-- e até a próxima OS (next_days) não dependem do número de dias, portanto são calculados uma única vez em
+-- mat_view_retrabalho_base. As classificações (retrabalho, correção, correção primeira, nova OS com/sem
+-- retrabalho anterior) e o número do problema são derivados desta base pelas views criadas com
+-- cria_views_retrabalho(min_dias):
+--     SELECT cria_views_retrabalho(20);
+-- cria view_retrabalho_20_dias_distinct e view_retrabalho_20_dias, com as mesmas colunas das views
+-- materializadas.
+--
+-- O número do problema é uma soma acumulada (janela) por veículo e serviço sobre todo o histórico. Em uma view
+-- comum, a janela impede que os filtros de data das páginas sejam aplicados antes dela, e cada consulta
+-- ordenaria o histórico inteiro. Por isso view_retrabalho_{min_dias}_dias_distinct (uma linha por OS e serviço)
+-- é materializada a partir da base, com os índices das datas, e a janela é calculada apenas na atualização.
+-- view_retrabalho_{min_dias}_dias (uma linha por OS e colaborador) é uma view comum que junta as linhas da base
+-- com a view distinta pelo número da OS e serviço, sem janela (os filtros são aplicados na base, pelos índices).
+-- Cada número de dias ocupa apenas as colunas de uma linha por OS e serviço, e não é preciso reordenar os_dados
+-- para calcular os dias até a OS anterior e a próxima em cada atualização.
+--
+-- Os serviços usam a view mat_view_retrabalho_{min_dias}_dias quando ela existe e, caso contrário,
+-- view_retrabalho_{min_dias}_dias (ver modules/views_retrabalho_utils.py). Como nas views materializadas
+-- antigas, as condições que dependem da data atual (now()) são avaliadas na atualização.
+--
+-- Depende de view_os_dados_tipo_servico (sql/004_classificacao_os_tipo_servico.sql). A base e as views
+-- distintas devem ser atualizadas após cada carga de os_dados:
+--     SELECT refresh_retrabalho_base();
+
+-- Uma linha por OS válida (e colaborador). Os dias até a OS anterior e a próxima são calculados por veículo e
+-- serviço na linha mantida na remoção das duplicadas (principal) e repetidos nas demais linhas da mesma OS e serviço
+CREATE MATERIALIZED VIEW IF NOT EXISTS mat_view_retrabalho_base AS
+WITH
+os_numeradas AS (
+    SELECT
+        od.*,
+        row_number() OVER (
+            PARTITION BY od."NUMERO DA OS", od."DESCRICAO DO SERVICO" ORDER BY od."DATA DA ABERTURA DA OS" DESC
+        ) = 1 AS principal
+    FROM
+        view_os_dados_tipo_servico od
+),
+os_principais AS (
+    SELECT
+        od.*,
+        CASE
+            WHEN
+                lag(od."DATA DO FECHAMENTO DA OS") OVER w IS NOT NULL
+                AND od."DATA DA ABERTURA DA OS" IS NOT NULL
+            THEN abs(date_part('day'::text, od."DATA DA ABERTURA DA OS"::timestamp without time zone - (lag(od."DATA DO FECHAMENTO DA OS") OVER w)::timestamp without time zone))
+            ELSE NULL::double precision
+        END AS prev_days,
+        CASE
+            WHEN
+                od."DATA DO FECHAMENTO DA OS" IS NOT NULL
+                AND lead(od."DATA DA ABERTURA DA OS") OVER w IS NOT NULL
+            THEN abs(date_part('day'::text, (lead(od."DATA DA ABERTURA DA OS") OVER w)::timestamp without time zone - od."DATA DO FECHAMENTO DA OS"::timestamp without time zone))
+            ELSE NULL::double precision
+        END AS next_days
+    FROM
+        os_numeradas od
+    WHERE
+        od.principal
+    WINDOW w AS (PARTITION BY od."CODIGO DO VEICULO", od."DESCRICAO DO SERVICO" ORDER BY od."DATA DA ABERTURA DA OS")
+)
+SELECT
+    *
+FROM
+    os_principais
+UNION ALL
+SELECT
+    od.*,
+    p.prev_days,
+    p.next_days
+FROM
+    os_numeradas od
+LEFT JOIN
+    os_principais p
+ON
+    p."NUMERO DA OS" = od."NUMERO DA OS"
+    AND p."DESCRICAO DO SERVICO" = od."DESCRICAO DO SERVICO"
+WHERE
+    NOT od.principal
+WITH NO DATA;
+
+-- Índices das datas (ver sql/001_indices_datas_mat_views.sql) e da numeração dos problemas por veículo e serviço.
+-- O índice único de KEY_HASH permite a atualização com CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS mat_view_retrabalho_base_key_hash_idx
+    ON mat_view_retrabalho_base ("KEY_HASH");
+
+CREATE INDEX IF NOT EXISTS mat_view_retrabalho_base_dt_fech_idx
+    ON mat_view_retrabalho_base ("DATA DO FECHAMENTO DA OS");
+
+CREATE INDEX IF NOT EXISTS mat_view_retrabalho_base_dt_aber_idx
+    ON mat_view_retrabalho_base ("DATA DA ABERTURA DA OS");
+
+CREATE INDEX IF NOT EXISTS mat_view_retrabalho_base_veic_dt_fech_idx
+    ON mat_view_retrabalho_base ("CODIGO DO VEICULO", "DATA DO FECHAMENTO DA OS");
+
+CREATE INDEX IF NOT EXISTS mat_view_retrabalho_base_colab_dt_fech_idx
+    ON mat_view_retrabalho_base ("COLABORADOR QUE EXECUTOU O SERVICO", "DATA DO FECHAMENTO DA OS");
+
+CREATE INDEX IF NOT EXISTS mat_view_retrabalho_base_problema_idx
+    ON mat_view_retrabalho_base ("CODIGO DO VEICULO", "DESCRICAO DO SERVICO", "DATA DA ABERTURA DA OS")
+    WHERE principal;
+
+REFRESH MATERIALIZED VIEW mat_view_retrabalho_base;
+
+-- Atualização da base e das views distintas de cada número de dias (CONCURRENTLY não bloqueia as leituras do painel)
+CREATE OR REPLACE FUNCTION refresh_retrabalho_base() RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v RECORD;
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mat_view_retrabalho_base;
+
+    FOR v IN
+        SELECT matviewname
+        FROM pg_matviews
+        WHERE matviewname ~ '^view_retrabalho_[0-9]+_dias_distinct$'
+    LOOP
+        EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I', v.matviewname);
+    END LOOP;
+END
+$$;
+
+-- Cria (ou recria) view_retrabalho_{min_dias}_dias_distinct (materializada, uma linha por OS e serviço) e
+-- view_retrabalho_{min_dias}_dias (uma linha por OS e colaborador) sobre mat_view_retrabalho_base
+CREATE OR REPLACE FUNCTION cria_views_retrabalho(p_min_dias INTEGER) RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    view_distinct TEXT := 'view_retrabalho_' || p_min_dias || '_dias_distinct';
+    view_todas TEXT := 'view_retrabalho_' || p_min_dias || '_dias';
+    tipo_view_distinct "char";
+    colunas_base TEXT;
+BEGIN
+    -- Remove as views existentes (a view distinta pode ser uma view comum, criada por versões anteriores do script)
+    EXECUTE format('DROP VIEW IF EXISTS %I', view_todas);
+
+    SELECT c.relkind INTO tipo_view_distinct FROM pg_class c WHERE c.oid = to_regclass(quote_ident(view_distinct));
+    IF tipo_view_distinct = 'v' THEN
+        EXECUTE format('DROP VIEW %I', view_distinct);
+    ELSIF tipo_view_distinct = 'm' THEN
+        EXECUTE format('DROP MATERIALIZED VIEW %I', view_distinct);
+    END IF;
+
+    -- Colunas de os_dados da base (sem as colunas da classificação)
+    SELECT
+        string_agg(format('b.%I', a.attname), ', ' ORDER BY a.attnum)
+    INTO
+        colunas_base
+    FROM
+        pg_attribute a
+    WHERE
+        a.attrelid = 'mat_view_retrabalho_base'::regclass
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+        AND a.attname NOT IN ('principal', 'prev_days', 'next_days');
+
+    EXECUTE format(
+        $q$
+        CREATE MATERIALIZED VIEW %1$I AS
+        WITH
+        os_with_flags AS (
+            SELECT
+                %2$s,
+                b.prev_days,
+                b.next_days,
+                CASE
+                    WHEN b.next_days <= %3$s::double precision AND b.next_days IS NOT NULL THEN true
+                    ELSE false
+                END AS retrabalho,
+                CASE
+                    WHEN b.next_days > %3$s::double precision OR b.next_days IS NULL
+                    AND (now() - b."DATA DA ABERTURA DA OS"::timestamp without time zone::timestamp with time zone) > '%3$s days'::interval
+                    THEN true
+                    ELSE false
+                END AS correcao,
+                CASE
+                    WHEN (b.next_days > %3$s::double precision OR b.next_days IS NULL)
+                    AND (b.prev_days > 10::double precision OR b.prev_days IS NULL)
+                    AND (now() - b."DATA DA ABERTURA DA OS"::timestamp without time zone::timestamp with time zone) > '%3$s days'::interval
+                    THEN true
+                    ELSE false
+                END AS correcao_primeira,
+                CASE
+                    WHEN b.prev_days <= %3$s::double precision
+                    AND b.next_days IS NULL
+                    AND (now() - b."DATA DA ABERTURA DA OS"::timestamp without time zone::timestamp with time zone) <= '%3$s days'::interval
+                    THEN true
+                    ELSE false
+                END AS nova_os_com_retrabalho_anterior,
+                CASE
+                    WHEN (b.prev_days > %3$s::double precision OR b.prev_days IS NULL)
+                    AND b.next_days IS NULL
+                    AND (now() - b."DATA DA ABERTURA DA OS"::timestamp without time zone::timestamp with time zone) <= '%3$s days'::interval
+                    THEN true
+                    ELSE false
+                END AS nova_os_sem_retrabalho_anterior
+            FROM
+                mat_view_retrabalho_base b
+            WHERE
+                b.principal
+        )
+        SELECT
+            SUM(
+                CASE
+                    WHEN f.correcao THEN 1
+                    ELSE 0
+                END
+            ) OVER (PARTITION BY f."CODIGO DO VEICULO", f."DESCRICAO DO SERVICO" ORDER BY f."DATA DA ABERTURA DA OS")
+            + CASE
+                WHEN f.retrabalho OR f.nova_os_com_retrabalho_anterior OR f.nova_os_sem_retrabalho_anterior THEN 1
+                ELSE 0
+            END AS problem_no,
+            f.*
+        FROM
+            os_with_flags f
+        $q$,
+        view_distinct, colunas_base, p_min_dias
+    );
+
+    -- Índices da view distinta: KEY_HASH (CONCURRENTLY), junção com a base e datas (ver sql/001_indices_datas_mat_views.sql)
+    EXECUTE format('CREATE UNIQUE INDEX %I ON %I ("KEY_HASH")', view_distinct || '_key_hash_idx', view_distinct);
+    EXECUTE format(
+        'CREATE INDEX %I ON %I ("NUMERO DA OS", "DESCRICAO DO SERVICO")', view_distinct || '_os_serv_idx', view_distinct
+    );
+    EXECUTE format('CREATE INDEX %I ON %I ("DATA DO FECHAMENTO DA OS")', view_distinct || '_dt_fech_idx', view_distinct);
+    EXECUTE format('CREATE INDEX %I ON %I ("DATA DA ABERTURA DA OS")', view_distinct || '_dt_aber_idx', view_distinct);
+    EXECUTE format(
+        'CREATE INDEX %I ON %I ("CODIGO DO VEICULO", "DATA DO FECHAMENTO DA OS")',
+        view_distinct || '_veic_dt_fech_idx', view_distinct
+    );
+
+    EXECUTE format(
+        $q$
+        CREATE VIEW %I AS
+        SELECT
+            d.problem_no,
+            d.retrabalho,
+            d.correcao,
+            d.correcao_primeira,
+            d.nova_os_com_retrabalho_anterior,
+            d.nova_os_sem_retrabalho_anterior,
+            d.prev_days,
+            d.next_days,
+            %s
+        FROM
+            mat_view_retrabalho_base b
+        LEFT JOIN
+            %I d
+        ON
+            d."NUMERO DA OS" = b."NUMERO DA OS"
+            AND d."DESCRICAO DO SERVICO" = b."DESCRICAO DO SERVICO"
+        $q$,
+        view_todas, colunas_base, view_distinct
+    );
+END
+$$;
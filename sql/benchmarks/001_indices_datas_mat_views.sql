@@ -0,0 +1,69 @@
+-- Planos das queries de datas das views de retrabalho (ver sql/001_indices_datas_mat_views.sql)
+--
+-- Executa EXPLAIN (ANALYZE) das formas antigas e novas dos filtros/agrupamentos por data e das consultas
+-- por período, veículo e colaborador. Apenas lê as views, pode ser executado no banco de produção:
+--     psql -f sql/benchmarks/001_indices_datas_mat_views.sql
+--     psql -v min_dias=30 -f sql/benchmarks/001_indices_datas_mat_views.sql
+--
+-- Com os índices criados, as formas novas devem usar Index Scan / Bitmap Index Scan nos índices
+-- *_dt_aber_idx, *_dt_fech_idx, *_veic_dt_fech_idx e *_colab_dt_fech_idx, e as formas antigas
+-- (com conversão da coluna) devem continuar com Seq Scan.
+
+\if :{?min_dias}
+\else
+    \set min_dias 10
+\endif
+\set view_retrabalho 'mat_view_retrabalho_' :min_dias '_dias'
+\set view_retrabalho_distinct 'mat_view_retrabalho_' :min_dias '_dias_distinct'
+
+\echo '===== Regra: últimos 30 dias (forma antiga, cast da coluna para timestamp)'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT COUNT(*), SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)
+FROM :"view_retrabalho_distinct"
+WHERE "DATA DA ABERTURA DA OS"::timestamp BETWEEN CURRENT_DATE - INTERVAL '30 days' AND CURRENT_DATE;
+
+\echo '===== Regra: últimos 30 dias (subquery_periodo_dias_atras)'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT COUNT(*), SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)
+FROM :"view_retrabalho_distinct"
+WHERE "DATA DA ABERTURA DA OS" BETWEEN to_char(CURRENT_DATE - 30 * INTERVAL '1 day', 'YYYY-MM-DD"T"HH24:MI:SS')
+    AND to_char(CURRENT_DATE, 'YYYY-MM-DD"T"HH24:MI:SS');
+
+\echo '===== Período de 1 mês no fechamento da OS'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT COUNT(*), SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)
+FROM :"view_retrabalho_distinct"
+WHERE "DATA DO FECHAMENTO DA OS" BETWEEN to_char(CURRENT_DATE - INTERVAL '2 months', 'YYYY-MM-DD')
+    AND to_char(CURRENT_DATE - INTERVAL '1 month', 'YYYY-MM-DD');
+
+\echo '===== Evolução mensal de 6 meses (forma antiga, to_char(to_timestamp(...)))'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month, COUNT(*)
+FROM :"view_retrabalho"
+WHERE "DATA DO FECHAMENTO DA OS" BETWEEN to_char(CURRENT_DATE - INTERVAL '7 months', 'YYYY-MM-DD')
+    AND to_char(CURRENT_DATE - INTERVAL '1 month', 'YYYY-MM-DD')
+GROUP BY year_month;
+
+\echo '===== Evolução mensal de 6 meses (sql_ano_mes)'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT LEFT("DATA DO FECHAMENTO DA OS", 7) AS year_month, COUNT(*)
+FROM :"view_retrabalho"
+WHERE "DATA DO FECHAMENTO DA OS" BETWEEN to_char(CURRENT_DATE - INTERVAL '7 months', 'YYYY-MM-DD')
+    AND to_char(CURRENT_DATE - INTERVAL '1 month', 'YYYY-MM-DD')
+GROUP BY year_month;
+
+\echo '===== Veículo em 1 ano'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT COUNT(*), SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)
+FROM :"view_retrabalho_distinct"
+WHERE "CODIGO DO VEICULO" = (SELECT "CODIGO DO VEICULO" FROM :"view_retrabalho_distinct" LIMIT 1)
+    AND "DATA DO FECHAMENTO DA OS" BETWEEN to_char(CURRENT_DATE - INTERVAL '1 year', 'YYYY-MM-DD')
+    AND to_char(CURRENT_DATE, 'YYYY-MM-DD');
+
+\echo '===== Colaborador em 1 ano'
+EXPLAIN (ANALYZE, COSTS OFF)
+SELECT COUNT(*), SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)
+FROM :"view_retrabalho"
+WHERE "COLABORADOR QUE EXECUTOU O SERVICO" = (SELECT "COLABORADOR QUE EXECUTOU O SERVICO" FROM :"view_retrabalho" LIMIT 1)
+    AND "DATA DO FECHAMENTO DA OS" BETWEEN to_char(CURRENT_DATE - INTERVAL '1 year', 'YYYY-MM-DD')
+    AND to_char(CURRENT_DATE, 'YYYY-MM-DD');
@@ -4,6 +4,7 @@
 
 # Imports básicos
 import os
+import hmac
 import pandas as pd
 
 # Dotenv
@@ -34,6 +35,9 @@ import tema
 
 # Banco de Dados
 from db import PostgresSingleton
+from modules.pool_metricas_utils import registra_rota_metricas
+from modules.callback_metricas_utils import instrumenta_callbacks, registra_rota_metricas_callbacks
+from modules.cache_utils import CacheResultados
 
 # Profiler
 from werkzeug.middleware.profiler import ProfilerMiddleware
@@ -110,6 +114,9 @@ app = Dash(
 # Server
 server = app.server
 
+# Métricas do pool de conexões do worker (texto no formato do Prometheus)
+registra_rota_metricas(server, pgEngine)
+
 
 # Menu / Navbar
 def criarMenu(dirVertical=True):
@@ -245,14 +252,46 @@ app.clientside_callback(
 )
 
 
+##############################################################################
+# Métricas dos callbacks #####################################################
+##############################################################################
+# Mede todos os callbacks (páginas e app), por isso deve ficar após a definição do último callback
+instrumenta_callbacks(app)
+
+# Métricas dos callbacks do worker em JSON (ver também a página /admin-callbacks)
+registra_rota_metricas_callbacks(server)
+
+
 ##############################################################################
 # Auth #######################################################################
 ##############################################################################
-df_users = pd.read_sql("SELECT * FROM users_ra_dash", pgEngine)
-dict_users = df_users.set_index("ra_username")["ra_password"].to_dict()
 SECRET_KEY = os.getenv("SECRET_KEY")
 
-auth = dash_auth.BasicAuth(app, dict_users, secret_key=SECRET_KEY)
+# Usuários do painel: lidos no primeiro login (e não na importação) e relidos a cada USUARIOS_TTL_SEGUNDOS
+USUARIOS_TTL_SEGUNDOS = 5 * 60
+cache_usuarios = CacheResultados("usuarios", ttl_segundos=USUARIOS_TTL_SEGUNDOS)
+
+
+def get_usuarios():
+    """Retorna o dicionário usuário -> senha dos usuários do painel"""
+
+    def le_usuarios():
+        df_users = pd.read_sql("SELECT * FROM users_ra_dash", pgEngine)
+        return df_users.set_index("ra_username")["ra_password"].to_dict()
+
+    return cache_usuarios.obtem_ou_calcula("usuarios", le_usuarios)
+
+
+def valida_usuario(username, password):
+    """Verifica o usuário e a senha informados no login"""
+    senha = get_usuarios().get(username)
+    if senha is None or password is None:
+        return False
+
+    return hmac.compare_digest(str(senha).encode("utf-8"), str(password).encode("utf-8"))
+
+
+auth = dash_auth.BasicAuth(app, auth_func=valida_usuario, secret_key=SECRET_KEY)
 
 ##############################################################################
 # MAIN #######################################################################
@@ -6,6 +6,24 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from threading import Lock
 
+# Pool de conexões instrumentado (métricas de espera por conexão)
+from modules.pool_metricas_utils import QueuePoolInstrumentado
+
+##############################################################################
+# CONFIGURAÇÕES DO POOL ######################################################
+##############################################################################
+# Número de conexões mantidas abertas no pool (por worker)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+
+# Número de conexões extras que podem ser abertas quando o pool estiver esgotado
+DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", 10))
+
+# Tempo máximo (em segundos) de espera por uma conexão livre
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+
+# Tempo (em segundos) após o qual uma conexão é reaberta (-1 = nunca)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", -1))
+
 
 class PostgresSingleton:
     """
@@ -43,7 +61,11 @@ class PostgresSingleton:
         db_url = f"postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
         self._engine = create_engine(
             db_url,
-            pool_size=10,  # Número de conexões na pool
+            poolclass=QueuePoolInstrumentado,  # Mede a espera por conexões (ver /metrics)
+            pool_size=DB_POOL_SIZE,  # Número de conexões na pool
+            max_overflow=DB_POOL_MAX_OVERFLOW,  # Conexões extras quando a pool está esgotada
+            pool_timeout=DB_POOL_TIMEOUT,  # Espera máxima por uma conexão livre
+            pool_recycle=DB_POOL_RECYCLE,  # Reabre conexões antigas
             pool_pre_ping=True,  # Verifica se conexão tá viva antes de usar
             # echo=debug_mode,  # Se true, mostra os logs das queries
         )
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Arquivo que centraliza as tabelas utilizadas nas páginas de administração (desempenho das queries e dos callbacks)
+
+# Os tempos (ms) e as médias já chegam arredondados (ver pages/admin_queries.py)
+# Tabela de estatísticas agregadas por query (origem + fingerprint)
+tbl_estatisticas_queries = [
+    {"field": "origem", "headerName": "ORIGEM", "minWidth": 260, "pinned": "left"},
+    {"field": "fingerprint", "headerName": "FINGERPRINT", "minWidth": 130},
+    {"field": "execucoes", "headerName": "EXECUÇÕES", "type": ["numericColumn"], "minWidth": 110},
+    {
+        "field": "tempo_total_ms",
+        "headerName": "TEMPO TOTAL (ms)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "sort": "desc",
+        "minWidth": 120,
+    },
+    {
+        "field": "tempo_banco_medio_ms",
+        "headerName": "BANCO MÉDIO (ms)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "tempo_banco_max_ms",
+        "headerName": "BANCO MÁX (ms)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "tempo_dataframe_medio_ms",
+        "headerName": "DATAFRAME MÉDIO (ms)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "tempo_dataframe_max_ms",
+        "headerName": "DATAFRAME MÁX (ms)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "linhas_media",
+        "headerName": "LINHAS (MÉDIA)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 110,
+    },
+    {"field": "linhas_max", "headerName": "LINHAS (MÁX)", "type": ["numericColumn"], "minWidth": 110},
+    {"field": "lentas", "headerName": "LENTAS", "type": ["numericColumn"], "minWidth": 90},
+    {"field": "erros", "headerName": "ERROS", "type": ["numericColumn"], "minWidth": 90},
+    {"field": "ultima_execucao", "headerName": "ÚLTIMA EXECUÇÃO", "minWidth": 170},
+    {"field": "query", "headerName": "QUERY (NORMALIZADA)", "minWidth": 400, "tooltipField": "query"},
+]
+
+# Tabela das últimas queries lentas
+tbl_queries_lentas = [
+    {"field": "data", "headerName": "DATA", "minWidth": 170, "sort": "desc"},
+    {"field": "origem", "headerName": "ORIGEM", "minWidth": 260},
+    {"field": "fingerprint", "headerName": "FINGERPRINT", "minWidth": 130},
+    {
+        "field": "tempo_total_ms",
+        "headerName": "TOTAL (ms)",
+        "type": ["numericColumn"],
+        "minWidth": 110,
+    },
+    {
+        "field": "tempo_banco_ms",
+        "headerName": "BANCO (ms)",
+        "type": ["numericColumn"],
+        "minWidth": 110,
+    },
+    {
+        "field": "tempo_dataframe_ms",
+        "headerName": "DATAFRAME (ms)",
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {"field": "linhas", "headerName": "LINHAS", "type": ["numericColumn"], "minWidth": 100},
+    {"field": "params", "headerName": "PARÂMETROS", "minWidth": 300, "tooltipField": "params"},
+    {"field": "erro", "headerName": "ERRO", "minWidth": 200, "tooltipField": "erro"},
+]
+
+# Tabela de latência por callback
+tbl_metricas_callbacks = [
+    {"field": "funcao", "headerName": "FUNÇÃO", "minWidth": 280, "pinned": "left", "tooltipField": "callback_id"},
+    {"field": "chamadas", "headerName": "CHAMADAS", "type": ["numericColumn"], "minWidth": 110},
+    {
+        "field": "tempo_total_ms",
+        "headerName": "TEMPO TOTAL (ms)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "sort": "desc",
+        "minWidth": 120,
+    },
+    {"field": "p50_ms", "headerName": "P50 (ms)", "type": ["numericColumn"], "minWidth": 100},
+    {"field": "p95_ms", "headerName": "P95 (ms)", "type": ["numericColumn"], "minWidth": 100},
+    {"field": "p99_ms", "headerName": "P99 (ms)", "type": ["numericColumn"], "minWidth": 100},
+    {"field": "max_ms", "headerName": "MÁX (ms)", "type": ["numericColumn"], "minWidth": 100},
+    {
+        "field": "bytes_entrada_medio",
+        "headerName": "ENTRADA MÉDIA (bytes)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "bytes_saida_medio",
+        "headerName": "SAÍDA MÉDIA (bytes)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "bytes_saida_max",
+        "headerName": "SAÍDA MÁX (bytes)",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 120,
+    },
+    {
+        "field": "sem_atualizacao",
+        "headerName": "SEM ATUALIZAÇÃO",
+        "wrapHeaderText": True,
+        "autoHeaderHeight": True,
+        "type": ["numericColumn"],
+        "minWidth": 110,
+    },
+    {"field": "erros", "headerName": "ERROS", "type": ["numericColumn"], "minWidth": 90},
+    {"field": "ultimo_erro", "headerName": "ÚLTIMO ERRO", "minWidth": 250, "tooltipField": "ultimo_erro"},
+    {"field": "ultima_chamada", "headerName": "ÚLTIMA CHAMADA", "minWidth": 170},
+    {"field": "callback_id", "headerName": "SAÍDAS (ID DO CALLBACK)", "minWidth": 400, "tooltipField": "callback_id"},
+]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Funções e classes utilitárias para cache dos resultados dos serviços
+
+# Imports básicos
+import os
+import sys
+import time
+import inspect
+import functools
+import pandas as pd
+from collections import OrderedDict
+from threading import Lock
+
+# Imports auxiliares
+from modules.data_version_utils import get_versao_dados
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Tempo de vida de cada resultado (em segundos)
+# Como a chave inclui a versão dos dados, os resultados são descartados assim que as views forem atualizadas
+CACHE_TTL_SEGUNDOS = int(os.getenv("CACHE_TTL_SEGUNDOS", 4 * 60 * 60))
+
+# Número máximo de resultados armazenados por cache
+CACHE_MAX_ITENS = int(os.getenv("CACHE_MAX_ITENS", 256))
+
+# Limite de memória (em MB) ocupada pelos resultados de cada cache
+CACHE_MAX_MB = int(os.getenv("CACHE_MAX_MB", 256))
+
+# Termo usado para representar "todas as opções" na chave do cache
+TERMO_CHAVE_TODAS = "__TODAS__"
+
+
+##############################################################################
+# CHAVES #####################################################################
+##############################################################################
+def normaliza_lista_filtro(lista, termo_all="TODAS"):
+    """Normaliza uma lista de filtro para ser usada na chave do cache (ordena, remove repetidos e trata o termo TODAS/TODOS)"""
+    if lista is None:
+        return None
+
+    if termo_all in lista:
+        return (TERMO_CHAVE_TODAS,)
+
+    return tuple(sorted(set(str(x) for x in lista)))
+
+
+def normaliza_valor_chave(nome, valor, termos_all):
+    """Converte um argumento de um serviço em um valor imutável (hashable) para a chave do cache"""
+    if isinstance(valor, (list, tuple, set)):
+        # Listas de filtro (lista_modelos, lista_oficinas, ...) não dependem da ordem de seleção
+        if nome.startswith("lista"):
+            return normaliza_lista_filtro(valor, termos_all.get(nome, "TODAS"))
+
+        # Demais listas (ex: datas) mantém a ordem
+        return tuple(str(x) for x in valor)
+
+    if isinstance(valor, dict):
+        return tuple(sorted((k, normaliza_valor_chave(k, v, termos_all)) for k, v in valor.items()))
+
+    return valor
+
+
+def gera_chave_filtros(funcao, args, kwargs, termos_all=None):
+    """Gera a chave canônica de uma chamada de serviço (nome do método + filtros normalizados)"""
+    termos_all = termos_all or {}
+
+    assinatura = inspect.signature(funcao)
+    argumentos = assinatura.bind(*args, **kwargs)
+    argumentos.apply_defaults()
+
+    chave = [funcao.__qualname__]
+    for nome, valor in argumentos.arguments.items():
+        if nome == "self":
+            continue
+        chave.append((nome, normaliza_valor_chave(nome, valor, termos_all)))
+
+    return tuple(chave)
+
+
+##############################################################################
+# TAMANHO E CÓPIA ############################################################
+##############################################################################
+def estima_tamanho_bytes(valor):
+    """Estima o tamanho em memória de um resultado (DataFrame, dict, lista ou escalar)"""
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True).sum())
+
+    if isinstance(valor, pd.Series):
+        return int(valor.memory_usage(deep=True))
+
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(estima_tamanho_bytes(v) for v in valor.values())
+
+    if isinstance(valor, (list, tuple)):
+        return sys.getsizeof(valor) + sum(estima_tamanho_bytes(v) for v in valor)
+
+    return sys.getsizeof(valor)
+
+
+def copia_resultado(valor):
+    """Copia o resultado para evitar que os callbacks alterem o objeto armazenado no cache"""
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        return valor.copy()
+
+    if isinstance(valor, dict):
+        return {k: copia_resultado(v) for k, v in valor.items()}
+
+    if isinstance(valor, list):
+        return [copia_resultado(v) for v in valor]
+
+    if isinstance(valor, tuple):
+        return tuple(copia_resultado(v) for v in valor)
+
+    return valor
+
+
+##############################################################################
+# CACHE ######################################################################
+##############################################################################
+class CacheResultados:
+    """
+    Cache LRU de resultados, com tempo de vida (TTL) e limite de memória.
+    É compartilhado por todas as threads do processo (worker).
+    """
+
+    def __init__(self, nome, ttl_segundos=CACHE_TTL_SEGUNDOS, max_itens=CACHE_MAX_ITENS, max_mb=CACHE_MAX_MB):
+        self.nome = nome
+        self.ttl_segundos = ttl_segundos
+        self.max_itens = max_itens
+        self.max_bytes = max_mb * 1024 * 1024
+
+        # chave -> (instante de expiração, tamanho em bytes, valor)
+        self._itens = OrderedDict()
+        self._total_bytes = 0
+
+        # Lock geral e locks por chave (evita que a mesma consulta seja feita em paralelo)
+        self._lock = Lock()
+        self._locks_chave = {}
+
+        # Versão dos dados dos itens armazenados
+        self._versao_dados = None
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+
+    def verifica_versao_dados(self, versao_dados):
+        """Limpa o cache se a versão dos dados mudou (ex: as views materializadas foram atualizadas)"""
+        with self._lock:
+            if versao_dados == self._versao_dados:
+                return
+
+            if self._versao_dados is not None:
+                self._itens.clear()
+                self._total_bytes = 0
+
+            self._versao_dados = versao_dados
+
+    def _remove(self, chave):
+        """Remove uma chave (deve ser chamada com o lock adquirido)"""
+        _, tamanho, _ = self._itens.pop(chave)
+        self._total_bytes -= tamanho
+
+    def busca(self, chave, contabiliza=True):
+        """Retorna (True, valor) se a chave estiver no cache e não tiver expirado, senão (False, None)"""
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is not None and item[0] < time.monotonic():
+                self._remove(chave)
+                item = None
+
+            if item is None:
+                if contabiliza:
+                    self.misses += 1
+                return False, None
+
+            # Marca como usado recentemente
+            self._itens.move_to_end(chave)
+            valor = item[2]
+            self.hits += 1
+
+        return True, copia_resultado(valor)
+
+    def armazena(self, chave, valor):
+        """Armazena um valor, removendo os itens menos usados se os limites forem excedidos"""
+        tamanho = estima_tamanho_bytes(valor)
+
+        # Resultados maiores que o limite total não são armazenados
+        if tamanho > self.max_bytes:
+            return
+
+        with self._lock:
+            if chave in self._itens:
+                self._remove(chave)
+
+            self._itens[chave] = (time.monotonic() + self.ttl_segundos, tamanho, valor)
+            self._total_bytes += tamanho
+
+            # Remove os itens menos usados (LRU) até respeitar os limites
+            while self._itens and (len(self._itens) > self.max_itens or self._total_bytes > self.max_bytes):
+                self._remove(next(iter(self._itens)))
+
+    def obtem_ou_calcula(self, chave, funcao):
+        """Retorna o valor do cache ou executa a função, garantindo uma única execução por chave"""
+        encontrado, valor = self.busca(chave)
+        if encontrado:
+            return valor
+
+        with self._lock:
+            lock_chave = self._locks_chave.setdefault(chave, Lock())
+
+        try:
+            with lock_chave:
+                # Outra thread pode ter calculado o valor enquanto esperávamos
+                encontrado, valor = self.busca(chave, contabiliza=False)
+                if encontrado:
+                    return valor
+
+                valor = funcao()
+                self.armazena(chave, valor)
+        finally:
+            with self._lock:
+                self._locks_chave.pop(chave, None)
+
+        return copia_resultado(valor)
+
+    def limpa(self):
+        """Remove todos os itens do cache"""
+        with self._lock:
+            self._itens.clear()
+            self._total_bytes = 0
+
+    def estatisticas(self):
+        """Retorna as estatísticas de uso do cache"""
+        with self._lock:
+            return {
+                "nome": self.nome,
+                "itens": len(self._itens),
+                "tamanho_mb": round(self._total_bytes / (1024 * 1024), 2),
+                "versao_dados": self._versao_dados,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def get_engine_servico(servico):
+    """Retorna a engine do banco usada pelo serviço (os serviços usam dbEngine ou pgEngine)"""
+    dbEngine = getattr(servico, "dbEngine", None)
+    if dbEngine is None:
+        dbEngine = getattr(servico, "pgEngine", None)
+
+    return dbEngine
+
+
+def cache_servico(cache, termos_all=None):
+    """
+    Decorador para métodos dos serviços: guarda o resultado no cache usando como chave a versão dos dados,
+    o nome do método e os filtros normalizados (ex: termos_all={"lista_modelos": "TODOS"})
+    """
+
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def wrapper(self, *args, **kwargs):
+            versao_dados = get_versao_dados(get_engine_servico(self))
+            cache.verifica_versao_dados(versao_dados)
+
+            chave = (versao_dados,) + gera_chave_filtros(funcao, (self,) + args, kwargs, termos_all)
+            return cache.obtem_ou_calcula(chave, lambda: funcao(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorador
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Medição dos callbacks do Dash (latência, tamanho das requisições/respostas e exceções), por callback
+
+# Imports básicos
+import os
+import json
+import time
+import functools
+import numpy as np
+from collections import deque
+from datetime import datetime
+from threading import Lock
+
+# Imports do Dash/Flask
+import dash
+from dash.exceptions import PreventUpdate
+from flask import request, has_request_context
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Número de execuções (as mais recentes) usadas no cálculo dos percentis de cada callback
+CALLBACK_METRICAS_AMOSTRAS = int(os.getenv("CALLBACK_METRICAS_AMOSTRAS", 1000))
+
+# Tamanho máximo da mensagem de erro guardada
+TAMANHO_MAX_ERRO = 500
+
+
+##############################################################################
+# MÉTRICAS ###################################################################
+##############################################################################
+class MetricasCallbacks:
+    """Acumula, por callback, as durações recentes (para os percentis), os tamanhos das requisições/respostas e os erros"""
+
+    def __init__(self, amostras=CALLBACK_METRICAS_AMOSTRAS):
+        self.amostras = amostras
+
+        self._lock = Lock()
+        self._callbacks = {}
+
+    def reinicia(self):
+        """Zera as métricas (ex: no worker recém-criado, que herda as métricas do processo mestre)"""
+        with self._lock:
+            self._callbacks.clear()
+
+    def registra(self, callback_id, funcao, duracao_segundos, bytes_entrada, bytes_saida, resultado, erro=None):
+        """Registra uma execução do callback (resultado: ok, sem_atualizacao ou erro)"""
+        with self._lock:
+            c = self._callbacks.get(callback_id)
+            if c is None:
+                c = {
+                    "callback_id": callback_id,
+                    "funcao": funcao,
+                    "chamadas": 0,
+                    "sem_atualizacao": 0,
+                    "erros": 0,
+                    "duracao_total_segundos": 0.0,
+                    "duracoes": deque(maxlen=self.amostras),
+                    "bytes_entrada_total": 0,
+                    "bytes_entrada_max": 0,
+                    "bytes_saida_total": 0,
+                    "bytes_saida_max": 0,
+                    "ultimo_erro": "",
+                    "ultima_chamada": None,
+                }
+                self._callbacks[callback_id] = c
+
+            c["chamadas"] += 1
+            c["sem_atualizacao"] += resultado == "sem_atualizacao"
+            c["erros"] += resultado == "erro"
+            c["duracao_total_segundos"] += duracao_segundos
+            c["duracoes"].append(duracao_segundos)
+            c["bytes_entrada_total"] += bytes_entrada
+            c["bytes_entrada_max"] = max(c["bytes_entrada_max"], bytes_entrada)
+            c["bytes_saida_total"] += bytes_saida
+            c["bytes_saida_max"] = max(c["bytes_saida_max"], bytes_saida)
+            c["ultima_chamada"] = datetime.now().isoformat(timespec="seconds")
+            if erro is not None:
+                c["ultimo_erro"] = f"{type(erro).__name__}: {erro}"[:TAMANHO_MAX_ERRO]
+
+    def estatisticas(self):
+        """Retorna as estatísticas por callback (percentis em ms), ordenadas pelo tempo total acumulado"""
+        with self._lock:
+            copias = [(dict(c), np.array(c["duracoes"])) for c in self._callbacks.values()]
+
+        lista = []
+        for c, duracoes in copias:
+            p50, p95, p99 = np.percentile(duracoes, [50, 95, 99]) * 1000
+            lista.append(
+                {
+                    "callback_id": c["callback_id"],
+                    "funcao": c["funcao"],
+                    "chamadas": c["chamadas"],
+                    "sem_atualizacao": c["sem_atualizacao"],
+                    "erros": c["erros"],
+                    "tempo_total_ms": c["duracao_total_segundos"] * 1000,
+                    "tempo_medio_ms": c["duracao_total_segundos"] * 1000 / c["chamadas"],
+                    "p50_ms": p50,
+                    "p95_ms": p95,
+                    "p99_ms": p99,
+                    "max_ms": duracoes.max() * 1000,
+                    "amostras": len(duracoes),
+                    "bytes_entrada_medio": c["bytes_entrada_total"] / c["chamadas"],
+                    "bytes_entrada_max": c["bytes_entrada_max"],
+                    "bytes_saida_medio": c["bytes_saida_total"] / c["chamadas"],
+                    "bytes_saida_max": c["bytes_saida_max"],
+                    "ultimo_erro": c["ultimo_erro"],
+                    "ultima_chamada": c["ultima_chamada"],
+                }
+            )
+
+        return sorted(lista, key=lambda c: c["tempo_total_ms"], reverse=True)
+
+    def exporta_json(self):
+        """Exporta as estatísticas (e o processo que as coletou) em JSON"""
+        return json.dumps(
+            {
+                "pid": os.getpid(),
+                "gerado_em": datetime.now().isoformat(timespec="seconds"),
+                "callbacks": self.estatisticas(),
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+
+# Métricas do processo (cada worker do gunicorn possui as suas)
+metricas_callbacks = MetricasCallbacks()
+
+
+##############################################################################
+# INSTRUMENTAÇÃO #############################################################
+##############################################################################
+def instrumenta_callback(callback_id, funcao):
+    """Envolve a função registrada pelo Dash para o callback, medindo cada execução"""
+    if getattr(funcao, "_callback_instrumentado", False):
+        return funcao
+
+    nome_funcao = f"{getattr(funcao, '__module__', '')}.{getattr(funcao, '__name__', '')}"
+
+    @functools.wraps(funcao)
+    def wrapper(*args, **kwargs):
+        bytes_entrada = (request.content_length or 0) if has_request_context() else 0
+        inicio = time.perf_counter()
+        resultado = "ok"
+        erro = None
+        saida = None
+        try:
+            saida = funcao(*args, **kwargs)
+            return saida
+        except PreventUpdate:
+            resultado = "sem_atualizacao"
+            raise
+        except Exception as e:
+            resultado = "erro"
+            erro = e
+            raise
+        finally:
+            # A função registrada pelo Dash retorna a resposta já serializada em JSON
+            bytes_saida = len(saida) if isinstance(saida, (str, bytes)) else 0
+            metricas_callbacks.registra(
+                callback_id, nome_funcao, time.perf_counter() - inicio, bytes_entrada, bytes_saida, resultado, erro
+            )
+
+    wrapper._callback_instrumentado = True
+
+    return wrapper
+
+
+def instrumenta_callbacks(app):
+    """
+    Instrumenta todos os callbacks já registrados: os das páginas (dash.callback, ainda no mapa global até a
+    primeira requisição) e os registrados diretamente no app. Deve ser chamada após a definição de todos os callbacks.
+    """
+    mapas = [dash._callback.GLOBAL_CALLBACK_MAP, app.callback_map]
+
+    for mapa in mapas:
+        for callback_id, definicao in mapa.items():
+            if "callback" in definicao:
+                definicao["callback"] = instrumenta_callback(callback_id, definicao["callback"])
+
+
+##############################################################################
+# ENDPOINT ###################################################################
+##############################################################################
+def registra_rota_metricas_callbacks(server, rota="/metrics/callbacks"):
+    """Adiciona ao servidor Flask a rota com as métricas dos callbacks em JSON (protegida pela autenticação do painel)"""
+
+    def metricas():
+        return metricas_callbacks.exporta_json(), 200, {"Content-Type": "application/json; charset=utf-8"}
+
+    server.add_url_rule(rota, "metricas_callbacks", metricas)
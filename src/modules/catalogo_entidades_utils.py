@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Catálogo das entidades usadas nos filtros das páginas (modelos, oficinas, seções, OSs, colaboradores e veículos)
+
+# Imports básicos
+import os
+import time
+from threading import Lock, Thread
+
+# Imports auxiliares
+from modules.entities_utils import get_modelos, get_oficinas, get_secoes, get_mecanicos, get_lista_os, get_veiculos
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Tempo (em segundos) após o qual uma entidade é atualizada em segundo plano
+CATALOGO_ENTIDADES_TTL_SEGUNDOS = int(os.getenv("CATALOGO_ENTIDADES_TTL_SEGUNDOS", 10 * 60))
+
+# Funções que leem cada entidade do banco
+FUNCOES_ENTIDADES = {
+    "modelos": get_modelos,
+    "oficinas": get_oficinas,
+    "secoes": get_secoes,
+    "mecanicos": get_mecanicos,
+    "lista_os": get_lista_os,
+    "veiculos": get_veiculos,
+}
+
+
+##############################################################################
+# CATÁLOGO ###################################################################
+##############################################################################
+class CatalogoEntidades:
+    """
+    Catálogo das entidades, compartilhado por todas as páginas do processo (worker).
+    Cada entidade é lida do banco apenas no primeiro uso (e não na importação das páginas).
+    Após o tempo de vida, a entidade é atualizada em segundo plano e, enquanto isso, os dados anteriores são retornados.
+    """
+
+    def __init__(self, dbEngine, ttl_segundos=CATALOGO_ENTIDADES_TTL_SEGUNDOS, funcoes_entidades=FUNCOES_ENTIDADES):
+        self.dbEngine = dbEngine
+        self.ttl_segundos = ttl_segundos
+        self.funcoes_entidades = funcoes_entidades
+
+        # nome -> (instante da leitura, DataFrame)
+        self._entidades = {}
+
+        # Lock geral, locks por entidade (evita leituras simultâneas da mesma entidade) e atualizações em andamento
+        self._lock = Lock()
+        self._locks_entidade = {nome: Lock() for nome in funcoes_entidades}
+        self._atualizando = set()
+
+    def _le_entidade(self, nome):
+        """Lê a entidade do banco e a armazena no catálogo"""
+        df = self.funcoes_entidades[nome](self.dbEngine)
+        with self._lock:
+            self._entidades[nome] = (time.monotonic(), df)
+
+        return df
+
+    def _atualiza_em_segundo_plano(self, nome):
+        """Dispara a atualização da entidade em uma thread (apenas uma por entidade)"""
+        with self._lock:
+            if nome in self._atualizando:
+                return
+            self._atualizando.add(nome)
+
+        def atualiza():
+            try:
+                with self._locks_entidade[nome]:
+                    self._le_entidade(nome)
+            except Exception as e:
+                # Mantém os dados anteriores e tenta novamente após o tempo de vida
+                # (se a entidade foi invalidada durante a atualização, ela será lida no próximo uso)
+                print(f"Erro ao atualizar a entidade {nome} do catálogo: {e}")
+                with self._lock:
+                    item = self._entidades.get(nome)
+                    if item is not None:
+                        self._entidades[nome] = (time.monotonic(), item[1])
+            finally:
+                with self._lock:
+                    self._atualizando.discard(nome)
+
+        Thread(target=atualiza, name=f"catalogo-{nome}", daemon=True).start()
+
+    def obtem(self, nome, ordena_por=None):
+        """Retorna uma cópia do DataFrame da entidade (opcionalmente ordenado pela coluna ordena_por)"""
+        with self._lock:
+            item = self._entidades.get(nome)
+
+        if item is None:
+            # Primeiro uso: lê a entidade (uma única vez, mesmo com várias threads pedindo ao mesmo tempo)
+            with self._locks_entidade[nome]:
+                with self._lock:
+                    item = self._entidades.get(nome)
+
+                if item is None:
+                    item = (time.monotonic(), self._le_entidade(nome))
+        elif time.monotonic() - item[0] >= self.ttl_segundos:
+            self._atualiza_em_segundo_plano(nome)
+
+        df = item[1].copy()
+        if ordena_por is not None:
+            df = df.sort_values(ordena_por)
+
+        return df
+
+    def lista_registros(self, nome, registro_todos=None, ordena_por=None):
+        """Retorna a entidade como lista de registros, com a opção "todos" (registro_todos) no início, se informada"""
+        lista = self.obtem(nome, ordena_por).to_dict(orient="records")
+        if registro_todos is not None:
+            lista.insert(0, registro_todos)
+
+        return lista
+
+    def precarrega(self):
+        """Lê todas as entidades (ex: no processo mestre do gunicorn, para os workers herdarem os dados)"""
+        for nome in self.funcoes_entidades:
+            try:
+                with self._locks_entidade[nome]:
+                    self._le_entidade(nome)
+            except Exception as e:
+                print(f"Erro ao pré-carregar a entidade {nome} do catálogo: {e}")
+
+    def invalida(self, nome=None):
+        """Descarta a entidade (ou todas), que será lida novamente no próximo uso"""
+        with self._lock:
+            if nome is None:
+                self._entidades.clear()
+            else:
+                self._entidades.pop(nome, None)
+
+    def estatisticas(self):
+        """Retorna a idade (em segundos) de cada entidade carregada"""
+        agora = time.monotonic()
+        with self._lock:
+            return {
+                nome: {"idade_segundos": round(agora - instante, 1), "linhas": len(df)}
+                for nome, (instante, df) in self._entidades.items()
+            }
+
+
+# Uma instância por engine (compartilhada por todas as páginas do processo)
+_catalogos_por_engine = {}
+_lock_catalogos = Lock()
+
+
+def get_catalogo_entidades(dbEngine):
+    """Retorna o catálogo de entidades da engine informada"""
+    with _lock_catalogos:
+        catalogo = _catalogos_por_engine.get(id(dbEngine))
+        if catalogo is None:
+            catalogo = CatalogoEntidades(dbEngine)
+            _catalogos_por_engine[id(dbEngine)] = catalogo
+
+    return catalogo
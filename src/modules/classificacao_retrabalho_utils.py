@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Classificação das OSs em retrabalho, correção e número do problema em Python (NumPy/pandas)
+#
+# Reproduz as regras de TipoServicoService.obtem_dados_os_sql (e das views mat_view_retrabalho_{min_dias}_dias)
+# sobre um DataFrame já extraído de os_dados, permitindo classificar qualquer min_dias sem criar novas views
+# (ex: simulações de limiar em lote) e comparar o resultado e o tempo com a classificação feita no banco.
+# As funções de janela (lag, lead e soma acumulada por veículo) são trocadas por vetores ordenados por
+# veículo e data de abertura, com os limites de cada veículo obtidos por searchsorted.
+
+# Imports básicos
+import numpy as np
+import pandas as pd
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Colunas de os_dados mantidas na limpeza (mesma ordem do os_clean de obtem_dados_os_sql)
+COLUNAS_OS_CLEAN = [
+    "FILIAL",
+    "DESCRICAO DA FILIAL",
+    "NUMERO DA OS",
+    "CODIGO DO VEICULO",
+    "DESCRICAO DO VEICULO",
+    "DESCRICAO DO MODELO",
+    "OFICINA",
+    "DESCRICAO DA OFICINA",
+    "DATA DA ABERTURA DA OS",
+    "DATA DO FECHAMENTO DA OS",
+    "TIPO DE MANUTENCAO",
+    "CODIGO DO MOTIVO",
+    "DESCRICAO DO MOTIVO",
+    "TIPO DA OS",
+    "DESCRICAO DO TIPO DA OS",
+    "OBSERVACAO DA OS",
+    "JUSTIFICATIVA",
+    "USUARIO DE ABRIU A OS",
+    "USUARIO DE ALTERACAO",
+    "SERVICO DA OS",
+    "DESCRICAO DO SERVICO",
+    "TEMPO PADRAO",
+    "PRIORIDADE SERVICO",
+    "SERVICO VINCULADO",
+    "QTD DE SERVICO",
+    "SECAO",
+    "DESCRICAO DA SECAO",
+    "COMPLEMENTO DO SERVICO",
+    "FLAG DE NAO EXECUTADO",
+    "DATA DE INI. DO PLANEJAMENTO",
+    "DATA DE FIN. DO PLANEJAMENTO",
+    "DATA INICIO SERVIÇO",
+    "DATA DE FECHAMENTO DO SERVICO",
+    "TEMPO TOTAL",
+    "COLABORADOR QUE EXECUTOU O SERVICO",
+    "KEY",
+    "KEY_HASH",
+]
+
+# Colunas da classificação, na ordem retornada por obtem_dados_os_sql
+COLUNAS_CLASSIFICACAO = [
+    "problem_no",
+    "retrabalho",
+    "correcao",
+    "correcao_primeira",
+    "nova_os_com_retrabalho_anterior",
+    "nova_os_sem_retrabalho_anterior",
+    "prev_days",
+    "next_days",
+]
+
+# Filtros do os_clean
+REGEX_DATA_ISO = r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
+DATA_ABERTURA_MINIMA = "2024-01-01"
+PRIORIDADES_VALIDAS = ["Vermelho", "Amarelo", "Verde"]
+
+# Limite de dias sem OS anterior usado na correção primeira (fixo em 10 dias na query original)
+DIAS_CORRECAO_PRIMEIRA = 10
+
+# As chaves de ordenação juntam o veículo e a data de abertura (em segundos) em um único inteiro
+BITS_SEGUNDOS = 34
+SEGUNDOS_POR_DIA = 86400
+
+
+##############################################################################
+# LIMPEZA ####################################################################
+##############################################################################
+def limpa_os_dados(df_os_dados):
+    """
+    Aplica os filtros do os_clean (datas no formato ISO, abertura a partir de 2024 e prioridades válidas)
+    às linhas de os_dados e troca o fechamento vazio por nulo
+    """
+    abertura = df_os_dados["DATA DA ABERTURA DA OS"].astype(object)
+    fechamento = df_os_dados["DATA DO FECHAMENTO DA OS"].astype(object)
+
+    abertura_str = abertura.where(abertura.notna(), "").astype(str)
+    fechamento_str = fechamento.where(fechamento.notna(), "").astype(str)
+
+    filtro = (
+        abertura.notna()
+        & abertura_str.str.fullmatch(REGEX_DATA_ISO)
+        & (abertura_str >= DATA_ABERTURA_MINIMA)
+        & fechamento.notna()
+        & (fechamento_str.str.fullmatch(REGEX_DATA_ISO) | (fechamento_str == ""))
+        & df_os_dados["PRIORIDADE SERVICO"].isin(PRIORIDADES_VALIDAS)
+    )
+
+    df_os = df_os_dados.loc[filtro, COLUNAS_OS_CLEAN].copy()
+    df_os["DATA DO FECHAMENTO DA OS"] = df_os["DATA DO FECHAMENTO DA OS"].replace("", None)
+
+    # Datas no formato ISO mas inexistentes (ex: 2024-02-30T10:00:00) não podem ser classificadas
+    # (no banco, a conversão para timestamp falha), logo são descartadas
+    data_invalida = np.isnan(segundos_data_iso(df_os["DATA DA ABERTURA DA OS"])) | (
+        df_os["DATA DO FECHAMENTO DA OS"].notna().to_numpy()
+        & np.isnan(segundos_data_iso(df_os["DATA DO FECHAMENTO DA OS"]))
+    )
+    if data_invalida.any():
+        print(f"OSs com data inválida descartadas da classificação: {int(data_invalida.sum())}")
+        df_os = df_os.loc[~data_invalida]
+
+    return df_os.reset_index(drop=True)
+
+
+def remove_os_duplicadas(df_os):
+    """Mantém uma linha por OS e serviço (a de abertura mais recente), como o DISTINCT ON da query"""
+    df_os = df_os.sort_values("DATA DA ABERTURA DA OS", ascending=False, kind="stable")
+    df_os = df_os.drop_duplicates(subset=["NUMERO DA OS", "DESCRICAO DO SERVICO"], keep="first")
+
+    return df_os.reset_index(drop=True)
+
+
+##############################################################################
+# CLASSIFICAÇÃO ##############################################################
+##############################################################################
+def segundos_data_iso(datas):
+    """Converte as datas ISO (texto) em segundos desde 1970 (float, NaN para datas nulas ou inválidas)"""
+    datas = pd.to_datetime(pd.Series(datas, dtype=object), format="%Y-%m-%dT%H:%M:%S", errors="coerce")
+    segundos = datas.to_numpy(dtype="datetime64[s]").astype(np.int64).astype(float)
+    segundos[datas.isna().to_numpy()] = np.nan
+
+    return segundos
+
+
+def dias_entre(segundos_inicio, segundos_fim):
+    """abs(date_part('day', fim - inicio)): dias inteiros do intervalo, truncados em direção ao zero"""
+    return np.floor(np.abs(segundos_fim - segundos_inicio) / SEGUNDOS_POR_DIA)
+
+
+def classifica_retrabalho(df_os, min_dias, agora=None):
+    """
+    Classifica as OSs (já sem duplicadas) de acordo com as regras de retrabalho de obtem_dados_os_sql.
+    A janela é o veículo, com as OSs ordenadas pela data de abertura; agora é a data atual usada nas OSs abertas
+    há menos de min_dias (para comparar com o banco, use a hora do banco; sem agora, usa a hora local).
+    Retorna o DataFrame ordenado por veículo e data de abertura, com as colunas de COLUNAS_CLASSIFICACAO.
+    OSs sem data de abertura válida são descartadas (ver limpa_os_dados)
+    """
+    if agora is None:
+        agora = pd.Timestamp.now()
+    segundos_agora = pd.Timestamp(agora).floor("s").value // 10**9
+
+    # A data de abertura faz parte da chave de ordenação (inteiro), logo não pode ser nula
+    abertura = segundos_data_iso(df_os["DATA DA ABERTURA DA OS"])
+    abertura_invalida = np.isnan(abertura)
+    if abertura_invalida.any():
+        print(f"OSs sem data de abertura válida descartadas da classificação: {int(abertura_invalida.sum())}")
+        df_os = df_os.loc[~abertura_invalida]
+        abertura = abertura[~abertura_invalida]
+
+    # Ordena por veículo (os nulos formam um grupo) e data de abertura
+    codigo_veiculo, _ = pd.factorize(df_os["CODIGO DO VEICULO"], use_na_sentinel=False)
+    fechamento = segundos_data_iso(df_os["DATA DO FECHAMENTO DA OS"])
+
+    ordem = np.lexsort((abertura, codigo_veiculo))
+    df_os = df_os.iloc[ordem].reset_index(drop=True)
+    codigo_veiculo = codigo_veiculo[ordem].astype(np.int64)
+    abertura = abertura[ordem]
+    fechamento = fechamento[ordem]
+
+    # Limites de cada veículo e de cada grupo de OSs com a mesma abertura (pares na soma acumulada)
+    chave = (codigo_veiculo << BITS_SEGUNDOS) | abertura.astype(np.int64)
+    inicio_veiculo = np.searchsorted(chave, codigo_veiculo << BITS_SEGUNDOS, side="left")
+    fim_veiculo = np.searchsorted(chave, (codigo_veiculo + 1) << BITS_SEGUNDOS, side="left")
+    fim_pares = np.searchsorted(chave, chave, side="right")
+
+    # lag/lead dentro do veículo
+    posicao = np.arange(len(df_os))
+    tem_anterior = posicao > inicio_veiculo
+    tem_proxima = posicao + 1 < fim_veiculo
+
+    fechamento_anterior = np.full(len(df_os), np.nan)
+    fechamento_anterior[1:] = fechamento[:-1]
+    fechamento_anterior[~tem_anterior] = np.nan
+
+    abertura_proxima = np.full(len(df_os), np.nan)
+    abertura_proxima[:-1] = abertura[1:]
+    abertura_proxima[~tem_proxima] = np.nan
+
+    # As comparações com NaN são falsas, como as comparações com NULL no CASE WHEN
+    prev_days = dias_entre(fechamento_anterior, abertura)
+    next_days = dias_entre(fechamento, abertura_proxima)
+
+    sem_prev = np.isnan(prev_days)
+    sem_next = np.isnan(next_days)
+    passou_min_dias = (segundos_agora - abertura) > min_dias * SEGUNDOS_POR_DIA
+
+    retrabalho = (next_days <= min_dias) & ~sem_next
+    correcao = (next_days > min_dias) | (sem_next & passou_min_dias)
+    correcao_primeira = (
+        ((next_days > min_dias) | sem_next)
+        & ((prev_days > DIAS_CORRECAO_PRIMEIRA) | sem_prev)
+        & passou_min_dias
+    )
+    nova_os_com_retrabalho_anterior = (prev_days <= min_dias) & sem_next & ~passou_min_dias
+    nova_os_sem_retrabalho_anterior = ((prev_days > min_dias) | sem_prev) & sem_next & ~passou_min_dias
+
+    # Soma acumulada das correções no veículo; OSs com a mesma abertura recebem a soma até a última delas
+    soma_correcao = np.concatenate(([0], np.cumsum(correcao, dtype=np.int64)))
+    problem_no = soma_correcao[fim_pares] - soma_correcao[inicio_veiculo]
+    problem_no = problem_no + (retrabalho | nova_os_com_retrabalho_anterior | nova_os_sem_retrabalho_anterior)
+
+    df_os["problem_no"] = problem_no
+    df_os["retrabalho"] = retrabalho
+    df_os["correcao"] = correcao
+    df_os["correcao_primeira"] = correcao_primeira
+    df_os["nova_os_com_retrabalho_anterior"] = nova_os_com_retrabalho_anterior
+    df_os["nova_os_sem_retrabalho_anterior"] = nova_os_sem_retrabalho_anterior
+    df_os["prev_days"] = prev_days
+    df_os["next_days"] = next_days
+
+    return df_os
+
+
+def classifica_os_periodo(df_os_clean, data_inicio_str, data_fim_str, min_dias, agora=None):
+    """
+    Equivalente em Python de obtem_dados_os_sql a partir do os_clean (ver limpa_os_dados) já filtrado por modelo,
+    oficina e serviço: classifica todo o histórico e retorna as OSs abertas no período com a classificação
+    da OS e serviço correspondente (nula se a linha mantida na remoção das duplicadas estiver fora do período)
+    """
+    df_classificado = classifica_retrabalho(remove_os_duplicadas(df_os_clean), min_dias, agora)
+
+    # As datas são texto ISO, comparadas como texto (BETWEEN da query)
+    def no_periodo(df):
+        abertura = df["DATA DA ABERTURA DA OS"]
+        return (abertura >= data_inicio_str) & (abertura <= data_fim_str)
+
+    chaves = ["NUMERO DA OS", "DESCRICAO DO SERVICO"]
+    df_classificado = df_classificado.loc[no_periodo(df_classificado), chaves + COLUNAS_CLASSIFICACAO]
+    # No SQL, chaves nulas não têm correspondente no JOIN
+    df_classificado = df_classificado.dropna(subset=chaves)
+
+    df_os = df_os_clean.loc[no_periodo(df_os_clean)]
+    df_os = df_os.merge(df_classificado, on=chaves, how="left", sort=False)
+
+    df_os = df_os.sort_values("DATA DA ABERTURA DA OS", kind="stable").reset_index(drop=True)
+
+    return df_os[COLUNAS_CLASSIFICACAO + COLUNAS_OS_CLEAN]
+
+
+##############################################################################
+# COMPARAÇÃO #################################################################
+##############################################################################
+def diferencas_classificacao(df_a, df_b):
+    """
+    Número de linhas com classificação diferente entre dois resultados (ex: SQL e Python) do mesmo filtro,
+    pareadas por KEY_HASH. Linhas presentes em apenas um dos resultados também contam como diferença
+    """
+    colunas = ["KEY_HASH"] + COLUNAS_CLASSIFICACAO
+
+    def normaliza(df):
+        df = df[colunas].astype(object)
+        df = df.where(df.notna(), None)
+        for coluna in ["problem_no", "prev_days", "next_days"]:
+            df[coluna] = [None if x is None else float(x) for x in df[coluna]]
+        for coluna in COLUNAS_CLASSIFICACAO[1:6]:
+            df[coluna] = [None if x is None else bool(x) for x in df[coluna]]
+        return df.astype(str).value_counts()
+
+    contagem_a = normaliza(df_a)
+    contagem_b = normaliza(df_b)
+    diferenca = contagem_a.sub(contagem_b, fill_value=0).abs()
+
+    return int(diferenca.sum())
@@ -9,56 +9,96 @@ import numpy as np
 import re
 
 # Imports auxiliares
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos
-from modules.service_utils import definir_status
+from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos, sql_ano_mes, le_sql
+from modules.service_utils import adiciona_status_os
+from modules.cache_utils import CacheResultados, cache_servico
+from modules.ranking_mensal_utils import subquery_parciais_mensais, le_sql_ranking_mensal, SQL_GASTO_PECAS_LINHA
+from modules.views_retrabalho_utils import get_view_retrabalho
 
 # Imports do tema
 import tema
 
+# Cache compartilhado pelos callbacks da página de colaborador
+cache_colaborador = CacheResultados("colaborador")
+
+# Métricas de uma linha (OS) usadas nos indicadores e rankings dos colaboradores, as mesmas dos agregados mensais
+# mat_view_ranking_mensal_colaborador_{min_dias}_dias (ver sql/003_rankings_mensais.sql)
+SQL_NOTA_LINHA = """(
+    SELECT {agregacao}(odc."SCORE_SOLUTION_TEXT_QUALITY") FROM os_dados_classificacao odc WHERE odc."KEY_HASH" = main."KEY_HASH"
+)"""
+METRICAS_RANKING_COLABORADOR = [
+    ("TOTAL_OS", 'CASE WHEN main."NUMERO DA OS" IS NOT NULL THEN 1 ELSE 0 END'),
+    ("TOTAL_LINHAS", "1"),
+    ("TOTAL_RETRABALHO", "CASE WHEN main.retrabalho THEN 1 ELSE 0 END"),
+    ("TOTAL_CORRECAO", "CASE WHEN main.correcao THEN 1 ELSE 0 END"),
+    ("TOTAL_CORRECAO_PRIMEIRA", "CASE WHEN main.correcao_primeira THEN 1 ELSE 0 END"),
+    ("SOMA_NOTA", SQL_NOTA_LINHA.format(agregacao="SUM")),
+    ("QTD_NOTA", SQL_NOTA_LINHA.format(agregacao="COUNT")),
+    ("TOTAL_GASTO", SQL_GASTO_PECAS_LINHA),
+    ("TOTAL_GASTO_RETRABALHO", f"CASE WHEN main.retrabalho THEN {SQL_GASTO_PECAS_LINHA} END"),
+]
+
+
+def _codigo_colaborador_str(codigos):
+    """
+    Retorna os códigos dos colaboradores (Series) como texto, para comparar códigos lidos como número ou texto.
+    Os códigos numéricos de uma coluna com nulos são lidos como float (ex: 123.0), logo o sufixo .0 é removido
+    """
+    return codigos.astype(str).str.replace(r"\.0$", "", regex=True)
+
 
 class ColaboradorService:
     def __init__(self, dbEngine):
         self.pgEngine = dbEngine
 
+    @cache_servico(cache_colaborador)
     def get_modelos_veiculos_colaborador(self, id_colaborador):
         """Retorna uma lista dos modelos de veículos possíveis para o colaborador"""
 
+        # Parâmetros da query
+        params = {"id_colaborador": id_colaborador}
+
         # Query
-        query = f"""
+        query = """
         SELECT DISTINCT
             "DESCRICAO DO MODELO" as "LABEL"
         FROM 
             mat_view_retrabalho_10_dias mvrd 
-        WHERE "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
+        WHERE "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
         ORDER BY
             "DESCRICAO DO MODELO"
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         return df
     
 
+    @cache_servico(cache_colaborador)
     def get_os_possiveis_colaborador(self, id_colaborador):
         """Retorna uma lista dos OS possíveis para o colaborador"""
 
+        # Parâmetros da query
+        params = {"id_colaborador": id_colaborador}
+
         # Query
-        query = f"""
+        query = """
         SELECT DISTINCT
             "DESCRICAO DO SERVICO" as "LABEL"
         FROM 
             mat_view_retrabalho_10_dias mvrd 
-        WHERE "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
+        WHERE "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
         ORDER BY
             "DESCRICAO DO SERVICO"
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         return df
 
+    @cache_servico(cache_colaborador)
     def get_sinteze_retrabalho_colaborador_para_grafico_pizza(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -70,11 +110,14 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_colaborador": id_colaborador}
+
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         SELECT
@@ -85,9 +128,9 @@ class ColaboradorService:
             100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.pgEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' AND "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim AND "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -95,7 +138,7 @@ class ColaboradorService:
         """
 
         # Executa query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
         
         # Calcula o total de correções tardia
         df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
@@ -103,10 +146,13 @@ class ColaboradorService:
         return df
 
 
-    def get_indicadores_gerais_retrabalho_colaborador(
-        self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
-    ):
-        """Obtem estatisticas e dados analisados de retrabalho para o grafico de pizza geral"""
+    @cache_servico(cache_colaborador)
+    def get_indicadores_colaboradores(self, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina):
+        """
+        Obtem, em uma única query, os indicadores e os rankings de todos os colaboradores nos filtros selecionados.
+        O resultado fica no cache por combinação de filtros e os indicadores de cada colaborador são obtidos por consulta
+        a este DataFrame (a troca de colaborador não executa novas queries)
+        """
         data_inicio_str = datas[0]
 
         # Remove min_dias antes para evitar que a última OS não seja retrabalho
@@ -114,254 +160,261 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
 
-        query = f"""
-        SELECT
-            COUNT("NUMERO DA OS") AS "TOTAL_OS",
-            SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END) AS "TOTAL_RETRABALHO",
-            SUM(CASE WHEN correcao THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO",
-            SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO_PRIMEIRA",
-            100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
-            100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
-            100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
-            COUNT(DISTINCT "DESCRICAO DO SERVICO") AS "QTD_SERVICOS_DIFERENTES"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' AND "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-        """
-
-        # Executa query
-        df = pd.read_sql(query, self.pgEngine)
-        
-        # Calcula o total de correções tardia
-        df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
-
-        return df
-
-
-    def get_indicador_rank_servico_colaborador(
-        self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
-    ):
-        """Obtem dados para rank de serviços diferentes"""
-        data_inicio_str = datas[0]
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-        
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
-        query = f"""
-        WITH TABELA_RANK AS (
-            SELECT 
-                "COLABORADOR QUE EXECUTOU O SERVICO",
-                COUNT(DISTINCT "DESCRICAO DO SERVICO") AS quantidade_de_servicos_diferentes,
-                ROW_NUMBER() OVER (ORDER BY COUNT(DISTINCT "DESCRICAO DO SERVICO") DESC) AS rank_colaborador
-            FROM
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+        filtros = f"""
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
                 {subquery_oficina_str}
-            GROUP BY 
-                "COLABORADOR QUE EXECUTOU O SERVICO"
-        ),
-        TOTAL AS (
-                SELECT COUNT(*) AS total_colaboradores FROM TABELA_RANK
-        ) 
-        SELECT 
-            tr.rank_colaborador || '/' || t.total_colaboradores AS rank_colaborador
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
         """
-        df = pd.read_sql(query, self.pgEngine)
+
+        # As métricas de cada colaborador são somadas a partir dos agregados mensais (e das linhas dos dias restantes).
+        # Sem os agregados mensais, as métricas são calculadas sobre as linhas do período; nesse caso a nota e os gastos
+        # são agregados à parte, pois as junções com as classificações e as peças multiplicam as linhas.
+        # Empates nos rankings são desfeitos pelo código do colaborador, para o ranking não mudar entre execuções
+        def monta_query(view_mensal, periodo_mensal, params):
+            view_linhas = get_view_retrabalho(self.pgEngine, min_dias)
+
+            if view_mensal is None:
+                subquery_por_colaborador_str = f"""
+            BASE AS (
+                SELECT
+                    "COLABORADOR QUE EXECUTOU O SERVICO",
+                    "NUMERO DA OS",
+                    "DESCRICAO DO SERVICO",
+                    "KEY_HASH",
+                    retrabalho,
+                    correcao,
+                    correcao_primeira
+                FROM
+                    {view_linhas}
+                WHERE
+                    "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
+                    {filtros}
+            ),
+            OS_POR_COLABORADOR AS (
+                SELECT
+                    "COLABORADOR QUE EXECUTOU O SERVICO",
+                    COUNT("NUMERO DA OS") AS "TOTAL_OS",
+                    COUNT(*) AS "TOTAL_LINHAS",
+                    SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END) AS "TOTAL_RETRABALHO",
+                    SUM(CASE WHEN correcao THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO",
+                    SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO_PRIMEIRA",
+                    100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
+                    100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
+                    100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
+                    COUNT(DISTINCT "DESCRICAO DO SERVICO") AS "QTD_SERVICOS_DIFERENTES"
+                FROM
+                    BASE
+                GROUP BY
+                    "COLABORADOR QUE EXECUTOU O SERVICO"
+            ),
+            NOTA_POR_COLABORADOR AS (
+                SELECT
+                    b."COLABORADOR QUE EXECUTOU O SERVICO",
+                    ROUND(AVG(odc."SCORE_SOLUTION_TEXT_QUALITY"), 2) AS nota_media_colaborador
+                FROM
+                    BASE b
+                LEFT JOIN
+                    os_dados_classificacao odc ON b."KEY_HASH" = odc."KEY_HASH"
+                GROUP BY
+                    b."COLABORADOR QUE EXECUTOU O SERVICO"
+            ),
+            GASTO_POR_COLABORADOR AS (
+                SELECT
+                    b."COLABORADOR QUE EXECUTOU O SERVICO",
+                    SUM(pg."VALOR") AS "TOTAL_GASTO",
+                    SUM(CASE WHEN b.retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO"
+                FROM
+                    BASE b
+                JOIN
+                    view_pecas_desconsiderando_combustivel pg ON b."NUMERO DA OS" = pg."OS"
+                GROUP BY
+                    b."COLABORADOR QUE EXECUTOU O SERVICO"
+            ),
+            POR_COLABORADOR AS (
+                SELECT
+                    oc.*,
+                    n.nota_media_colaborador,
+                    g."TOTAL_GASTO",
+                    g."TOTAL_GASTO_RETRABALHO"
+                FROM
+                    OS_POR_COLABORADOR oc
+                LEFT JOIN
+                    NOTA_POR_COLABORADOR n ON oc."COLABORADOR QUE EXECUTOU O SERVICO" IS NOT DISTINCT FROM n."COLABORADOR QUE EXECUTOU O SERVICO"
+                LEFT JOIN
+                    GASTO_POR_COLABORADOR g ON oc."COLABORADOR QUE EXECUTOU O SERVICO" IS NOT DISTINCT FROM g."COLABORADOR QUE EXECUTOU O SERVICO"
+            )"""
+            else:
+                subquery_parciais_str = subquery_parciais_mensais(
+                    ['"COLABORADOR QUE EXECUTOU O SERVICO"', '"DESCRICAO DO SERVICO"'],
+                    METRICAS_RANKING_COLABORADOR,
+                    view_linhas,
+                    view_mensal,
+                    periodo_mensal,
+                    filtros,
+                    params,
+                )
+                subquery_por_colaborador_str = f"""
+            PARCIAIS AS (
+                {subquery_parciais_str}
+            ),
+            POR_COLABORADOR AS (
+                SELECT
+                    "COLABORADOR QUE EXECUTOU O SERVICO",
+                    SUM("TOTAL_OS")::BIGINT AS "TOTAL_OS",
+                    SUM("TOTAL_LINHAS")::BIGINT AS "TOTAL_LINHAS",
+                    SUM("TOTAL_RETRABALHO")::BIGINT AS "TOTAL_RETRABALHO",
+                    SUM("TOTAL_CORRECAO")::BIGINT AS "TOTAL_CORRECAO",
+                    SUM("TOTAL_CORRECAO_PRIMEIRA")::BIGINT AS "TOTAL_CORRECAO_PRIMEIRA",
+                    100 * ROUND(SUM("TOTAL_RETRABALHO")::NUMERIC / SUM("TOTAL_LINHAS")::NUMERIC, 4) AS "PERC_RETRABALHO",
+                    100 * ROUND(SUM("TOTAL_CORRECAO")::NUMERIC / SUM("TOTAL_LINHAS")::NUMERIC, 4) AS "PERC_CORRECAO",
+                    100 * ROUND(SUM("TOTAL_CORRECAO_PRIMEIRA")::NUMERIC / SUM("TOTAL_LINHAS")::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
+                    COUNT(DISTINCT "DESCRICAO DO SERVICO") AS "QTD_SERVICOS_DIFERENTES",
+                    ROUND(SUM("SOMA_NOTA")::NUMERIC / NULLIF(SUM("QTD_NOTA"), 0)::NUMERIC, 2) AS nota_media_colaborador,
+                    SUM("TOTAL_GASTO") AS "TOTAL_GASTO",
+                    SUM("TOTAL_GASTO_RETRABALHO") AS "TOTAL_GASTO_RETRABALHO"
+                FROM
+                    PARCIAIS
+                GROUP BY
+                    "COLABORADOR QUE EXECUTOU O SERVICO"
+            )"""
+
+            return f"""
+            WITH {subquery_por_colaborador_str}
+            SELECT
+                pc.*,
+                ROW_NUMBER() OVER (
+                    ORDER BY pc."QTD_SERVICOS_DIFERENTES" DESC, pc."COLABORADOR QUE EXECUTOU O SERVICO"
+                ) AS "RANK_SERVICO",
+                ROW_NUMBER() OVER (
+                    ORDER BY pc."TOTAL_LINHAS" DESC, pc."COLABORADOR QUE EXECUTOU O SERVICO"
+                ) AS "RANK_TOTAL_OS",
+                ROW_NUMBER() OVER (
+                    ORDER BY pc.nota_media_colaborador DESC NULLS LAST, pc."COLABORADOR QUE EXECUTOU O SERVICO"
+                ) AS "RANK_NOTA",
+                COUNT(*) OVER () AS "TOTAL_COLABORADORES"
+            FROM
+                POR_COLABORADOR pc
+            """
+
+        df = le_sql_ranking_mensal(
+            monta_query,
+            f"mat_view_ranking_mensal_colaborador_{min_dias}_dias",
+            data_inicio_str,
+            data_fim_str,
+            self.pgEngine,
+            params,
+        )
+
+        # Calcula o total de correções tardia
+        df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
 
         return df
 
-    def get_indicador_rank_total_os_colaborador(
+    def get_indicadores_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
-        """Obtem dados para rank de total de OS"""
-        data_inicio_str = datas[0]
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
+        """Retorna a linha do colaborador em get_indicadores_colaboradores (vazio se ele não tiver OS nos filtros)"""
+        df = self.get_indicadores_colaboradores(datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina)
 
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        codigos = _codigo_colaborador_str(df["COLABORADOR QUE EXECUTOU O SERVICO"])
+        id_colaborador_str = _codigo_colaborador_str(pd.Series([id_colaborador])).iloc[0]
 
-        query = f"""
-            WITH TABELA_RANK AS (
-                SELECT 
-                "COLABORADOR QUE EXECUTOU O SERVICO",
-                COUNT(*) AS quantidade_de_OS,
-                ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) AS rank_colaborador
-            FROM
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-            GROUP BY "COLABORADOR QUE EXECUTOU O SERVICO"),
-            TOTAL AS (
-                SELECT COUNT(*) AS total_colaboradores FROM TABELA_RANK
-            ) 
-            SELECT 
-                tr.rank_colaborador || '/' || t.total_colaboradores AS rank_colaborador
-            FROM 
-                TABELA_RANK tr, TOTAL t
-            WHERE
-                "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-        """
-        df = pd.read_sql(query, self.pgEngine)
+        return df[codigos == id_colaborador_str].reset_index(drop=True)
 
-        return df
+    def _get_rank_colaborador(
+        self, coluna_rank, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+    ):
+        """Retorna o ranking do colaborador (ex: 3/120) na coluna informada; vazio se ele não tiver OS nos filtros"""
+        df = self.get_indicadores_colaborador(
+            id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
+        rank = df[coluna_rank].astype(str) + "/" + df["TOTAL_COLABORADORES"].astype(str)
 
+        return pd.DataFrame({"rank_colaborador": rank})
 
-    def get_indicador_nota_media_colaborador(
+    def get_indicadores_gerais_retrabalho_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
-        """Retorna a nota media do colaborador"""
+        """Obtem estatisticas e dados analisados de retrabalho para o grafico de pizza geral"""
+        df = self.get_indicadores_colaborador(
+            id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
 
-        data_inicio_str = datas[0]
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
+        colunas = [
+            "TOTAL_OS",
+            "TOTAL_RETRABALHO",
+            "TOTAL_CORRECAO",
+            "TOTAL_CORRECAO_PRIMEIRA",
+            "PERC_RETRABALHO",
+            "PERC_CORRECAO",
+            "PERC_CORRECAO_PRIMEIRA",
+            "QTD_SERVICOS_DIFERENTES",
+            "TOTAL_CORRECAO_TARDIA",
+        ]
+        if df.empty:
+            # Colaborador sem OS nos filtros: contagens zeradas e demais valores nulos
+            return pd.DataFrame([{"TOTAL_OS": 0, "QTD_SERVICOS_DIFERENTES": 0}], columns=colunas)
+
+        return df[colunas]
 
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+    def get_indicador_rank_servico_colaborador(
+        self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+    ):
+        """Obtem dados para rank de serviços diferentes"""
+        return self._get_rank_colaborador(
+            "RANK_SERVICO", id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
 
-        query = f"""
-        SELECT
-          	ROUND(AVG("SCORE_SOLUTION_TEXT_QUALITY"), 2) as nota_media_colaborador
-        FROM
-            mat_view_retrabalho_{min_dias}_dias mt
-        LEFT JOIN
-		    os_dados_classificacao odc  on mt."KEY_HASH" = odc."KEY_HASH" 
+    def get_indicador_rank_total_os_colaborador(
+        self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+    ):
+        """Obtem dados para rank de total de OS"""
+        return self._get_rank_colaborador(
+            "RANK_TOTAL_OS", id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
 
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' AND "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-    
-        """
-        
-        df = pd.read_sql(query, self.pgEngine)
-        
-        return df
+    def get_indicador_nota_media_colaborador(
+        self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+    ):
+        """Retorna a nota media do colaborador"""
+        df = self.get_indicadores_colaborador(
+            id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
+        # Colaborador sem OS ou sem nota nos filtros
+        nota_media = None
+        if not df.empty and not pd.isna(df["nota_media_colaborador"].iloc[0]):
+            nota_media = df["nota_media_colaborador"].iloc[0]
 
+        return pd.DataFrame({"nota_media_colaborador": [nota_media]})
 
     def get_indicador_posicao_rank_nota_media(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
         """Retorna o rank do colaborador (nota média)"""
-
-        data_inicio_str = datas[0]
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
-
-        query = f"""
-        WITH TABELA_RANK AS (
-        SELECT
-            "COLABORADOR QUE EXECUTOU O SERVICO",
-            ROUND(AVG("SCORE_SOLUTION_TEXT_QUALITY"), 2) AS nota_media_colaborador,
-            ROW_NUMBER() OVER (
-                ORDER BY 
-                    ROUND(AVG("SCORE_SOLUTION_TEXT_QUALITY"), 2) DESC NULLS LAST
-            ) AS rank_colaborador
-        FROM
-            mat_view_retrabalho_{min_dias}_dias mt
-        LEFT JOIN
-            os_dados_classificacao odc ON mt."KEY_HASH" = odc."KEY_HASH"
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-        GROUP BY 
-            "COLABORADOR QUE EXECUTOU O SERVICO"
-        ), 
-        TOTAL AS (
-            SELECT COUNT(*) AS total_colaboradores FROM TABELA_RANK
-        ) 
-        SELECT 
-            tr.rank_colaborador || '/' || t.total_colaboradores AS rank_colaborador
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-        """
-
-        df = pd.read_sql(query, self.pgEngine)
-        return df
-
+        return self._get_rank_colaborador(
+            "RANK_NOTA", id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
 
     def get_indicador_gasto_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
         """Retorna dados de gasto do colaborador"""
-
-        data_inicio_str = datas[0]
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
-
-        query = f"""SELECT
-            SUM(pg."VALOR") AS "TOTAL_GASTO",
-            SUM(CASE WHEN retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias main
-        JOIN
-            view_pecas_desconsiderando_combustivel pg 
-        ON
-            main."NUMERO DA OS" = pg."OS"
-        WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' AND main."COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-        """
-
-        df = pd.read_sql(query, self.pgEngine)
+        df = self.get_indicadores_colaborador(
+            id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
+        )
+        if df.empty:
+            df = pd.DataFrame({"TOTAL_GASTO": [None], "TOTAL_GASTO_RETRABALHO": [None]})
+        df = df[["TOTAL_GASTO", "TOTAL_GASTO_RETRABALHO"]].copy()
 
         # Formatar "VALOR" para R$ no formato brasileiro e substituindo por 0 os valores nulos
         df["TOTAL_GASTO"] = df["TOTAL_GASTO"].fillna(0).astype(float).round(2)
@@ -376,6 +429,7 @@ class ColaboradorService:
         return df
 
 
+    @cache_servico(cache_colaborador)
     def get_evolucao_retrabalho_por_mes(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -390,16 +444,19 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"id_colaborador": id_colaborador, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         SELECT
             'COLABORADOR' AS escopo,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END) AS "TOTAL_RETRABALHO",
             SUM(CASE WHEN correcao THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO",
             SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO_PRIMEIRA",
@@ -407,10 +464,10 @@ class ColaboradorService:
             100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.pgEngine, min_dias)}
         WHERE
-            "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
+            AND "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -422,7 +479,7 @@ class ColaboradorService:
 
         SELECT
             "DESCRICAO DA OFICINA" AS escopo,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END) AS "TOTAL_RETRABALHO",
             SUM(CASE WHEN correcao THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO",
             SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO_PRIMEIRA",
@@ -430,9 +487,9 @@ class ColaboradorService:
             100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.pgEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -445,7 +502,7 @@ class ColaboradorService:
         """
 
         # Executa query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Converte para datetime
         df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
@@ -453,6 +510,7 @@ class ColaboradorService:
         return df
 
 
+    @cache_servico(cache_colaborador)
     def get_evolucao_nota_media_colaborador_por_mes(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -467,24 +525,27 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"id_colaborador": id_colaborador, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         SELECT
             'COLABORADOR' AS escopo,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             ROUND(AVG("SCORE_SOLUTION_TEXT_QUALITY"), 2) as nota_media
         FROM
-            mat_view_retrabalho_{min_dias}_dias mt1
+            {get_view_retrabalho(self.pgEngine, min_dias)} mt1
         LEFT JOIN
 		    os_dados_classificacao odc  on mt1."KEY_HASH" = odc."KEY_HASH"
         WHERE
-            "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
+            AND "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -496,14 +557,14 @@ class ColaboradorService:
 
         SELECT
             "DESCRICAO DA OFICINA" AS escopo,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             ROUND(AVG("SCORE_SOLUTION_TEXT_QUALITY"), 2) as nota_media
         FROM
-            mat_view_retrabalho_{min_dias}_dias mt2
+            {get_view_retrabalho(self.pgEngine, min_dias)} mt2
         LEFT JOIN
 		    os_dados_classificacao odc  on mt2."KEY_HASH" = odc."KEY_HASH" 
         WHERE 
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -516,11 +577,12 @@ class ColaboradorService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         return df
 
 
+    @cache_servico(cache_colaborador)
     def get_evolucao_gasto_colaborador_por_mes(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -535,25 +597,28 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_colaborador": id_colaborador}
+
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         WITH retrabalho_por_colaborador_por_oficina_por_mes AS (
             SELECT
                 "DESCRICAO DA OFICINA" AS escopo,
                 "COLABORADOR QUE EXECUTOU O SERVICO",
-                to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+                {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
                 ROUND(SUM(CASE WHEN mt2.retrabalho THEN pg."VALOR" ELSE 0 END), 2) as soma_gasto_retrabalho
             FROM
-                mat_view_retrabalho_{min_dias}_dias mt2
+                {get_view_retrabalho(self.pgEngine, min_dias)} mt2
             JOIN view_pecas_desconsiderando_combustivel pg
                 ON mt2."NUMERO DA OS" = pg."OS"
             WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
@@ -566,15 +631,15 @@ class ColaboradorService:
         )
         SELECT
             'COLABORADOR' AS escopo,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             ROUND(SUM(CASE WHEN mt1.retrabalho THEN pg."VALOR" ELSE 0 END), 2) as media_gasto
         FROM
-            mat_view_retrabalho_{min_dias}_dias mt1
+            {get_view_retrabalho(self.pgEngine, min_dias)} mt1
         JOIN view_pecas_desconsiderando_combustivel pg
             ON mt1."NUMERO DA OS" = pg."OS"
         WHERE
-            "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
+            AND "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -596,7 +661,7 @@ class ColaboradorService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Preenche valores nulos com 0
         df["media_gasto"] = pd.to_numeric(df["media_gasto"], errors="coerce").fillna(0).round(2)
@@ -616,6 +681,7 @@ class ColaboradorService:
         return df
 
 
+    @cache_servico(cache_colaborador)
     def get_atuacao_colaborador(self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina):
         """Retorna dados de atuação do colaborador"""
 
@@ -628,21 +694,24 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"id_colaborador": id_colaborador, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         SELECT
             "DESCRICAO DO TIPO DA OS",
             COUNT(*) AS "QUANTIDADE"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.pgEngine, min_dias)}
         WHERE
-            "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
+            AND "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -654,10 +723,11 @@ class ColaboradorService:
         """ 
 
         # Executa a query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         return df
 
+    @cache_servico(cache_colaborador)
     def get_top_10_tipo_os_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -669,20 +739,23 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_colaborador": id_colaborador}
+
         # Subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         SELECT
             "DESCRICAO DO SERVICO",
             COUNT(*) as "TOTAL_OS" 
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.pgEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' AND "COLABORADOR QUE EXECUTOU O SERVICO" = {id_colaborador}
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim AND "COLABORADOR QUE EXECUTOU O SERVICO" = :id_colaborador
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
@@ -694,7 +767,7 @@ class ColaboradorService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Total de OS
         total_os = df["TOTAL_OS"].sum()
@@ -709,6 +782,7 @@ class ColaboradorService:
         return df
 
 
+    @cache_servico(cache_colaborador)
     def get_dados_tabela_retrabalho_por_categoria_os_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -720,11 +794,14 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_colaborador": id_colaborador}
+
         # Subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         WITH os_nota_media AS (
@@ -733,11 +810,11 @@ class ColaboradorService:
                 "DESCRICAO DA SECAO",
                 "DESCRICAO DO SERVICO",
                 ROUND(AVG(odc."SCORE_SOLUTION_TEXT_QUALITY"), 2) AS nota_media_os
-            FROM mat_view_retrabalho_{min_dias}_dias mt
+            FROM {get_view_retrabalho(self.pgEngine, min_dias)} mt
             LEFT JOIN os_dados_classificacao odc
                 ON mt."KEY_HASH" = odc."KEY_HASH"
             WHERE
-                mt."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                mt."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
@@ -752,14 +829,14 @@ class ColaboradorService:
             SELECT
                 main.*,
                 pg."VALOR"
-            FROM mat_view_retrabalho_{min_dias}_dias main
+            FROM {get_view_retrabalho(self.pgEngine, min_dias)} main
             LEFT JOIN 
                 view_pecas_desconsiderando_combustivel pg
             ON 
                 main."NUMERO DA OS" = pg."OS"
             WHERE
-                main."COLABORADOR QUE EXECUTOU O SERVICO" = {id_colaborador}
-                AND main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                main."COLABORADOR QUE EXECUTOU O SERVICO" = :id_colaborador
+                AND main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
@@ -823,12 +900,13 @@ class ColaboradorService:
             AND main."DESCRICAO DO SERVICO" = onm."DESCRICAO DO SERVICO";
         """
 
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
         df["nota_media_colaborador"] = df["nota_media_colaborador"].replace(np.nan, 0)
         df["nota_media_os"] = df["nota_media_os"].replace(np.nan, 0)
 
         return df
 
+    @cache_servico(cache_colaborador)
     def get_dados_tabela_detalhamento_os_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina
     ):
@@ -841,10 +919,13 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_colaborador": id_colaborador}
+
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         WITH 
@@ -857,7 +938,7 @@ class ColaboradorService:
             FROM 
                 view_pecas_desconsiderando_combustivel pg 
             WHERE 
-                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN :data_inicio AND :data_fim
             GROUP BY 
                 pg."OS"
         ),
@@ -865,13 +946,13 @@ class ColaboradorService:
             SELECT
                 *
             FROM
-                mat_view_retrabalho_{min_dias}_dias m
+                {get_view_retrabalho(self.pgEngine, min_dias)} m
             LEFT JOIN 
                 os_dados_classificacao odc
             ON 
                 m."KEY_HASH" = odc."KEY_HASH" 
             WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' AND "COLABORADOR QUE EXECUTOU O SERVICO"= '{id_colaborador}'
+                "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim AND "COLABORADOR QUE EXECUTOU O SERVICO"= :id_colaborador
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
@@ -882,7 +963,7 @@ class ColaboradorService:
         LEFT JOIN pecas_agg p
         ON os."NUMERO DA OS" = p."OS"
         """
-        df_os_detalhada_colaborador = pd.read_sql(query, self.pgEngine)
+        df_os_detalhada_colaborador = le_sql(query, self.pgEngine, params)
 
         # Preenche valores nulos
         df_os_detalhada_colaborador["total_valor"] = df_os_detalhada_colaborador["total_valor"].fillna(0)
@@ -892,7 +973,7 @@ class ColaboradorService:
         )
 
         # Aplica a função para definir o status de cada OS
-        df_os_detalhada_colaborador["status_os"] = df_os_detalhada_colaborador.apply(definir_status, axis=1)
+        adiciona_status_os(df_os_detalhada_colaborador, label=False, emoji=False)
 
         # Datas aberturas (converte para DT)
         df_os_detalhada_colaborador["DATA DA ABERTURA DA OS DT"] = pd.to_datetime(
@@ -909,6 +990,7 @@ class ColaboradorService:
 
         return df_os_detalhada_colaborador
 
+    @cache_servico(cache_colaborador)
     def get_dados_tabela_detalhamento_problema_colaborador(
         self, id_colaborador, datas, min_dias, lista_secaos, lista_os, lista_modelo, lista_oficina, vec_problema, servico, num_problema
     ):
@@ -921,10 +1003,13 @@ class ColaboradorService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelo)
-        subquery_oficina_str = subquery_oficinas(lista_oficina)
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "vec_problema": vec_problema, "servico": servico, "num_problema": num_problema}
+
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelo, params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficina, params=params)
 
         query = f"""
         WITH 
@@ -937,7 +1022,7 @@ class ColaboradorService:
             FROM 
                 view_pecas_desconsiderando_combustivel pg 
             WHERE 
-                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN :data_inicio AND :data_fim
             GROUP BY 
                 pg."OS"
         ),
@@ -945,20 +1030,20 @@ class ColaboradorService:
             SELECT
                 *
             FROM
-                mat_view_retrabalho_{min_dias}_dias m
+                {get_view_retrabalho(self.pgEngine, min_dias)} m
             LEFT JOIN 
                 os_dados_classificacao odc
             ON 
                 m."KEY_HASH" = odc."KEY_HASH" 
             WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
                 {subquery_oficina_str}
-                AND "CODIGO DO VEICULO" = '{vec_problema}'
-                AND "DESCRICAO DO SERVICO" = '{servico}'
-                AND "problem_no" = {num_problema}
+                AND "CODIGO DO VEICULO" = :vec_problema
+                AND "DESCRICAO DO SERVICO" = :servico
+                AND "problem_no" = :num_problema
         ),
         os_avaliadas_com_pecas AS (
             SELECT *
@@ -971,7 +1056,7 @@ class ColaboradorService:
         LEFT JOIN colaboradores_frotas_os cfo 
         ON os."COLABORADOR QUE EXECUTOU O SERVICO" = cfo.cod_colaborador
         """
-        df_os_detalhada_colaborador = pd.read_sql(query, self.pgEngine)
+        df_os_detalhada_colaborador = le_sql(query, self.pgEngine, params)
 
         # Preenche valores nulos
         df_os_detalhada_colaborador["total_valor"] = df_os_detalhada_colaborador["total_valor"].fillna(0).infer_objects(copy=False)
@@ -986,7 +1071,7 @@ class ColaboradorService:
         ].fillna("Não classificado").infer_objects(copy=False)
 
         # Aplica a função para definir o status de cada OS
-        df_os_detalhada_colaborador["status_os"] = df_os_detalhada_colaborador.apply(definir_status, axis=1)
+        adiciona_status_os(df_os_detalhada_colaborador, label=False, emoji=False)
 
         # Datas aberturas (converte para DT)
         df_os_detalhada_colaborador["DATA DA ABERTURA DA OS DT"] = pd.to_datetime(
@@ -4,7 +4,6 @@
 # Classe que centraliza os serviços para CRUD de regras
 
 # Imports básicos
-import re
 import pandas as pd
 import numpy as np
 
@@ -15,9 +14,45 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import text
 
 # Imports auxiliares
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos
-from modules.entities_utils import get_mecanicos
-from modules.service_utils import definir_status, definir_status_label, definir_emoji_status
+from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos, subquery_periodo_dias_atras, le_sql, colunas_sql
+from modules.entities_utils import get_mecanicos, formata_nome_colaborador
+from modules.service_utils import adiciona_status_os, COLUNAS_STATUS_OS
+from modules.views_retrabalho_utils import get_view_retrabalho
+
+# Colunas lidas por tabela (apelido) na prévia das OSs da regra (mensagens de e-mail / WhatsApp)
+COLUNAS_PREVIA_OS_REGRA = {
+    "m": [
+        *COLUNAS_STATUS_OS,
+        "NUMERO DA OS",
+        "CODIGO DO VEICULO",
+        "DESCRICAO DO SERVICO",
+        "DATA DA ABERTURA DA OS",
+    ],
+}
+
+# Colunas lidas por tabela (apelido) na prévia detalhada (tabela das páginas de criar e editar regra e mensagens)
+COLUNAS_PREVIA_OS_REGRA_DETALHADA = {
+    "m": [
+        *COLUNAS_STATUS_OS,
+        "prev_days",
+        "NUMERO DA OS",
+        "CODIGO DO VEICULO",
+        "DESCRICAO DO MODELO",
+        "DESCRICAO DO SERVICO",
+        "COLABORADOR QUE EXECUTOU O SERVICO",
+        "DATA DA ABERTURA DA OS",
+        "DATA DO FECHAMENTO DA OS",
+    ],
+    "odc": [
+        "SINTOMA",
+        "CORRECAO",
+        "SCORE_SYMPTOMS_TEXT_QUALITY",
+        "SCORE_SOLUTION_TEXT_QUALITY",
+        "WHY_SOLUTION_IS_PROBLEM",
+    ],
+    "p": ["total_valor", "pecas_valor_str", "pecas_trocadas_str"],
+    "cfo": ["nome_colaborador"],
+}
 
 
 # Classe do serviço
@@ -28,14 +63,17 @@ class CRUDRegraService:
     def get_regra_by_id(self, id_regra):
         """Função para obter uma regra de monitoramento pelo ID"""
 
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
         # Query
-        query = f"""
-            SELECT * FROM regra_monitoramento_os WHERE id = {id_regra}
+        query = """
+            SELECT * FROM regra_monitoramento_os WHERE id = :id_regra
             ORDER BY nome
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         return df
 
@@ -63,16 +101,19 @@ class CRUDRegraService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine)
 
         return df
 
     def existe_execucao_regra_no_dia(self, id_regra, dia):
         """Função para verificar se uma regra já foi executada no dia"""
-        query = f"""
-            SELECT 1 AS "EXISTE" FROM relatorio_regra_monitoramento_os WHERE id_regra = {id_regra} AND dia = '{dia}'
+        # Parâmetros da query
+        params = {"dia": dia, "id_regra": id_regra}
+
+        query = """
+            SELECT 1 AS "EXISTE" FROM relatorio_regra_monitoramento_os WHERE id_regra = :id_regra AND dia = :dia
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         if df.empty:
             return False
@@ -81,19 +122,20 @@ class CRUDRegraService:
 
     def get_resultado_regra(self, id_regra, dia_execucao):
         """Função para obter o resultado de uma regra de monitoramento"""
-        query = f"""
+        # Parâmetros da query
+        params = {"dia_execucao": dia_execucao, "id_regra": id_regra}
+
+        query = """
             SELECT *
             FROM relatorio_regra_monitoramento_os r 
             LEFT JOIN os_dados od 
             ON r.os_key_hash = od."KEY_HASH" 
-            WHERE r.id_regra = {id_regra} AND r.dia = '{dia_execucao}'
+            WHERE r.id_regra = :id_regra AND r.dia = :dia_execucao
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Aplica a função para definir o status de cada OS
-        df["status_os"] = df.apply(definir_status, axis=1)
-        df["status_os_label"] = df.apply(definir_status_label, axis=1)
-        df["status_os_emoji"] = df.apply(definir_emoji_status, axis=1)
+        adiciona_status_os(df)
 
         # Ordena por serviço e por status_os
         df = df.sort_values(by=["DESCRICAO DO SERVICO", "status_os", "CODIGO DO VEICULO"], ascending=[True, False, True])
@@ -103,15 +145,18 @@ class CRUDRegraService:
     def apagar_regra(self, id_regra):
         """Função para apagar uma regra de monitoramento"""
 
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
         # Query
-        query = f"""
-            DELETE FROM regra_monitoramento_os WHERE id = {id_regra}
+        query = """
+            DELETE FROM regra_monitoramento_os WHERE id = :id_regra
         """
 
         try:
             # Executa a query
             with self.dbEngine.begin() as conn:
-                conn.execute(text(query))
+                conn.execute(text(query), params)
 
             return True
         except Exception as e:
@@ -148,13 +193,16 @@ class CRUDRegraService:
 
     def get_ultima_data_regra(self, id_regra):
         """Função para obter a última data de uma regra de monitoramento"""
-        query = f"""
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
+        query = """
             SELECT id_regra, MAX(dia) AS ultimo_dia
             FROM relatorio_regra_monitoramento_os
-            WHERE id_regra = {id_regra}
+            WHERE id_regra = :id_regra
             GROUP BY id_regra
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
         return df
 
     def subquery_checklist(self, checklist_alvo, prefix=""):
@@ -170,11 +218,14 @@ class CRUDRegraService:
     def get_sintese_geral(self, data_periodo_regra, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
         """Função para obter a síntese geral (que será usado para o gráfico de pizza)"""
 
+        # Parâmetros da query
+        params = {}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         # Query
         query = f"""
@@ -191,9 +242,9 @@ class CRUDRegraService:
                 100 * ROUND(SUM(CASE WHEN nova_os_com_retrabalho_anterior THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_NOVA_OS_COM_RETRABALHO_ANTERIOR",
                 100 * ROUND(SUM(CASE WHEN nova_os_sem_retrabalho_anterior THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_NOVA_OS_SEM_RETRABALHO_ANTERIOR"
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct
+                {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)}
             WHERE
-                "DATA DA ABERTURA DA OS"::timestamp BETWEEN CURRENT_DATE - INTERVAL '{data_periodo_regra} days' AND CURRENT_DATE
+                {subquery_periodo_dias_atras("DATA DA ABERTURA DA OS", data_periodo_regra, params=params)}
                 {subquery_modelos_str}
                 {subquery_oficinas_str}
                 {subquery_secoes_str}
@@ -201,7 +252,7 @@ class CRUDRegraService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Calcula o total de correções tardia
         df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
@@ -213,11 +264,14 @@ class CRUDRegraService:
     ):
         """Função para obter a síntese geral (que será usado para o gráfico de pizza)"""
 
+        # Parâmetros da query
+        params = {}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         # Subquery checklist
         subquery_checklist_str = self.subquery_checklist(checklist_alvo)
@@ -237,9 +291,9 @@ class CRUDRegraService:
                 100 * ROUND(SUM(CASE WHEN nova_os_com_retrabalho_anterior THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_NOVA_OS_COM_RETRABALHO_ANTERIOR",
                 100 * ROUND(SUM(CASE WHEN nova_os_sem_retrabalho_anterior THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_NOVA_OS_SEM_RETRABALHO_ANTERIOR"
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct
+                {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)}
             WHERE
-                "DATA DA ABERTURA DA OS"::timestamp BETWEEN CURRENT_DATE - INTERVAL '{data_periodo_regra} days' AND CURRENT_DATE
+                {subquery_periodo_dias_atras("DATA DA ABERTURA DA OS", data_periodo_regra, params=params)}
                 {subquery_modelos_str}
                 {subquery_oficinas_str}
                 {subquery_secoes_str}
@@ -248,7 +302,7 @@ class CRUDRegraService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         return df
 
@@ -257,21 +311,24 @@ class CRUDRegraService:
     ):
         """Função para obter a prévia das OS detectadas pela regra (que será usado para envio do e-mail / WhatsApp)"""
 
+        # Parâmetros da query
+        params = {}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
         subquery_checklist_str = self.subquery_checklist(checklist_alvo)
 
         # Query
         query = f"""
             SELECT
-                *
+                {colunas_sql(COLUNAS_PREVIA_OS_REGRA)}
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct
+                {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} m
             WHERE
-                "DATA DA ABERTURA DA OS"::timestamp BETWEEN CURRENT_DATE - INTERVAL '{data_periodo_regra} days' AND CURRENT_DATE + INTERVAL '2 days' 
+                {subquery_periodo_dias_atras("DATA DA ABERTURA DA OS", data_periodo_regra, dias_apos_hoje=2, params=params)}
                 {subquery_modelos_str}
                 {subquery_oficinas_str}
                 {subquery_secoes_str}
@@ -280,12 +337,10 @@ class CRUDRegraService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Aplica a função para definir o status de cada OS
-        df["status_os"] = df.apply(definir_status, axis=1)
-        df["status_os_label"] = df.apply(definir_status_label, axis=1)
-        df["status_os_emoji"] = df.apply(definir_emoji_status, axis=1)
+        adiciona_status_os(df)
 
         return df
 
@@ -294,11 +349,14 @@ class CRUDRegraService:
     ):
         """Função para obter a prévia das OS detectadas pela regra (que será usado para envio do e-mail / WhatsApp)"""
 
+        # Parâmetros da query
+        params = {"num_dias_periodo": int(data_periodo_regra)}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
         subquery_checklist_str = self.subquery_checklist(checklist_alvo)
 
         # Query
@@ -313,48 +371,43 @@ class CRUDRegraService:
             FROM 
                 view_pecas_desconsiderando_combustivel pg 
             WHERE 
-                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN CURRENT_DATE - INTERVAL '{data_periodo_regra} days' AND CURRENT_DATE
+                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN CURRENT_DATE - :num_dias_periodo * INTERVAL '1 day' AND CURRENT_DATE
             GROUP BY 
                 pg."OS"
         ),
         os_avaliadas AS (
             SELECT
-                *
+                m.*
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct m
-            LEFT JOIN 
-                os_dados_classificacao odc
-            ON 
-                m."KEY_HASH" = odc."KEY_HASH" 
+                {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} m
             WHERE
-                "DATA DA ABERTURA DA OS"::timestamp BETWEEN CURRENT_DATE - INTERVAL '{data_periodo_regra} days' AND CURRENT_DATE
+                {subquery_periodo_dias_atras("DATA DA ABERTURA DA OS", data_periodo_regra, params=params)}
                 {subquery_modelos_str}
                 {subquery_oficinas_str}
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_checklist_str}
-        ),
-        os_avaliadas_com_pecas AS (
-            SELECT *
-            FROM os_avaliadas os
-            LEFT JOIN pecas_agg p
-            ON os."NUMERO DA OS" = p."OS"
         )
-        SELECT *
-        FROM os_avaliadas_com_pecas os
+        SELECT
+            {colunas_sql(COLUNAS_PREVIA_OS_REGRA_DETALHADA)}
+        FROM os_avaliadas m
+        LEFT JOIN os_dados_classificacao odc
+        ON m."KEY_HASH" = odc."KEY_HASH"
+        LEFT JOIN pecas_agg p
+        ON m."NUMERO DA OS" = p."OS"
         LEFT JOIN colaboradores_frotas_os cfo 
-        ON os."COLABORADOR QUE EXECUTOU O SERVICO" = cfo.cod_colaborador
+        ON m."COLABORADOR QUE EXECUTOU O SERVICO" = cfo.cod_colaborador
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Preenche valores nulos
         df["total_valor"] = df["total_valor"].fillna(0)
         df["pecas_valor_str"] = df["pecas_valor_str"].fillna("0")
         df["pecas_trocadas_str"] = df["pecas_trocadas_str"].fillna("Nenhuma / Não inserida ainda")
         df["nome_colaborador"] = df["nome_colaborador"].fillna("Não inserido ainda")
-        df["nome_colaborador"] = df["nome_colaborador"].apply(lambda x: re.sub(r"(?<!^)([A-Z])", r" \1", x))
+        df["nome_colaborador"] = formata_nome_colaborador(df["nome_colaborador"])
 
         # Campos da LLM
         df["SCORE_SYMPTOMS_TEXT_QUALITY"] = df["SCORE_SYMPTOMS_TEXT_QUALITY"].fillna("-")
@@ -362,7 +415,7 @@ class CRUDRegraService:
         df["WHY_SOLUTION_IS_PROBLEM"] = df["WHY_SOLUTION_IS_PROBLEM"].fillna("Não classificado")
 
         # Aplica a função para definir o status de cada OS
-        df["status_os"] = df.apply(definir_status, axis=1)
+        adiciona_status_os(df, label=False, emoji=False)
 
         # Datas aberturas (converte para DT)
         df["DATA DA ABERTURA DA OS DT"] = pd.to_datetime(df["DATA DA ABERTURA DA OS"])
@@ -5,7 +5,6 @@
 
 # Imports básicos
 import re
-import pandas as pd
 import numpy as np
 
 # Imports BD
@@ -15,9 +14,8 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import text
 
 # Imports auxiliares
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos
+from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos, le_sql
 from modules.entities_utils import get_mecanicos
-from modules.service_utils import definir_status, definir_status_label, definir_emoji_status
 
 
 # Classe do serviço
@@ -42,13 +40,16 @@ class CRUDRelatorioService:
     def get_regra_by_id(self, id_regra):
         """Função para obter uma regra de monitoramento pelo ID"""
 
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
         # Query
-        query = f"""
-            SELECT * FROM regra_relatorio_llm_os WHERE id = {id_regra}
+        query = """
+            SELECT * FROM regra_relatorio_llm_os WHERE id = :id_regra
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         return df
 
@@ -77,40 +78,49 @@ class CRUDRelatorioService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine)
 
         return df
 
     def get_ultima_data_regra(self, id_regra):
         """Função para obter a última data de uma regra de relatório"""
-        query = f"""
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
+        query = """
             SELECT id_regra, MAX(dia) AS ultimo_dia
             FROM relatorio_regra_relatorio_llm_os
-            WHERE id_regra = {id_regra}
+            WHERE id_regra = :id_regra
             GROUP BY id_regra
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
         return df
     
     def get_datas_regra(self, id_regra):
         """Função para obter todas as datas de uma regra de relatório"""
-        query = f"""
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
+        query = """
             SELECT dia
             FROM relatorio_regra_relatorio_llm_os
-            WHERE id_regra = {id_regra}
+            WHERE id_regra = :id_regra
             ORDER BY dia DESC
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
         return df
 
     def get_relatorio_markdown_regra(self, id_regra, data_relatorio):
         """Função para obter o relatório em markdown de uma regra e data específica"""
-        query = f"""
+        # Parâmetros da query
+        params = {"data_relatorio": data_relatorio, "id_regra": id_regra}
+
+        query = """
             SELECT relatorio_md
             FROM relatorio_regra_relatorio_llm_os
-            WHERE id_regra = {id_regra} AND dia = '{data_relatorio}'
+            WHERE id_regra = :id_regra AND dia = :data_relatorio
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
         return df
     
     def atualizar_regra_monitoramento(self, id_regra, payload):
@@ -130,10 +140,13 @@ class CRUDRelatorioService:
 
     def existe_execucao_regra_no_dia(self, id_regra, dia):
         """Função para verificar se uma regra já foi executada no dia"""
-        query = f"""
-            SELECT 1 AS "EXISTE" FROM relatorio_regra_relatorio_llm_os WHERE id_regra = {id_regra} AND dia = '{dia}'
+        # Parâmetros da query
+        params = {"dia": dia, "id_regra": id_regra}
+
+        query = """
+            SELECT 1 AS "EXISTE" FROM relatorio_regra_relatorio_llm_os WHERE id_regra = :id_regra AND dia = :dia
         """
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         if df.empty:
             return False
@@ -143,15 +156,18 @@ class CRUDRelatorioService:
     def apagar_regra(self, id_regra):
         """Função para apagar uma regra de monitoramento"""
 
+        # Parâmetros da query
+        params = {"id_regra": id_regra}
+
         # Query
-        query = f"""
-            DELETE FROM regra_relatorio_llm_os WHERE id = {id_regra}
+        query = """
+            DELETE FROM regra_relatorio_llm_os WHERE id = :id_regra
         """
 
         try:
             # Executa a query
             with self.dbEngine.begin() as conn:
-                conn.execute(text(query))
+                conn.execute(text(query), params)
 
             return True
         except Exception as e:
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Funções e classes para identificar a versão dos dados (atualizações das views materializadas)
+
+# Imports básicos
+import os
+import time
+import hashlib
+from threading import Lock
+
+# Imports auxiliares
+from modules.sql_utils import le_sql
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Intervalo mínimo (em segundos) entre duas consultas ao catálogo do banco
+VERSAO_DADOS_INTERVALO_SEGUNDOS = int(os.getenv("VERSAO_DADOS_INTERVALO_SEGUNDOS", 30))
+
+# Intervalo (em segundos) para renovar a versão caso não seja possível consultar o catálogo
+VERSAO_DADOS_INTERVALO_FALHA_SEGUNDOS = 600
+
+# Relações lidas pelos serviços (além das views mat_view_retrabalho_*, mat_view_ranking_mensal_* e
+# view_retrabalho_N_dias(_distinct), criadas por cria_views_retrabalho(N))
+# Para as views comuns, são monitoradas as tabelas/views materializadas das quais elas dependem
+RELACOES_MONITORADAS = [
+    "view_pecas_desconsiderando_combustivel",
+    "os_dados",
+    "os_dados_classificacao",
+    "colaboradores_frotas_os",
+    "os_classificacao_tipo_servico",
+    "mat_view_dim_oficinas",
+    "mat_view_dim_secoes",
+    "mat_view_dim_servicos",
+    "mat_view_dim_modelos",
+    "mat_view_dim_veiculos",
+    "mat_view_dim_colaboradores",
+]
+
+
+##############################################################################
+# VERSÃO DOS DADOS ###########################################################
+##############################################################################
+class VersaoDados:
+    """
+    Gera um token que muda sempre que as views materializadas forem atualizadas.
+    Um REFRESH MATERIALIZED VIEW troca o arquivo da view (relfilenode) e um REFRESH CONCURRENTLY
+    altera os contadores de linhas inseridas/removidas, portanto ambos mudam o token.
+    """
+
+    def __init__(self, dbEngine, intervalo_segundos=VERSAO_DADOS_INTERVALO_SEGUNDOS):
+        self.dbEngine = dbEngine
+        self.intervalo_segundos = intervalo_segundos
+
+        self._lock = Lock()
+        self._versao = None
+        self._ultima_consulta = 0
+
+    def _consulta_versao(self):
+        """Consulta o catálogo do banco e retorna o hash do estado das relações monitoradas"""
+        lista_relacoes_str = ", ".join([f"'{x}'" for x in RELACOES_MONITORADAS])
+
+        query = f"""
+        WITH RECURSIVE relacoes AS (
+            SELECT
+                c.oid
+            FROM
+                pg_class c
+            WHERE
+                c.relname ~ '^mat_view_(retrabalho|ranking_mensal)_'
+                OR c.relname ~ '^view_retrabalho_[0-9]+_dias(_distinct)?$'
+                OR c.relname IN ({lista_relacoes_str})
+            UNION
+            SELECT
+                dep.refobjid
+            FROM
+                relacoes r
+            JOIN
+                pg_rewrite rw ON rw.ev_class = r.oid
+            JOIN
+                pg_depend dep ON dep.objid = rw.oid
+                AND dep.classid = 'pg_rewrite'::regclass
+                AND dep.refclassid = 'pg_class'::regclass
+                AND dep.refobjid <> r.oid
+        )
+        SELECT
+            c.relname,
+            c.relfilenode,
+            COALESCE(s.n_tup_ins, 0) AS n_tup_ins,
+            COALESCE(s.n_tup_upd, 0) AS n_tup_upd,
+            COALESCE(s.n_tup_del, 0) AS n_tup_del
+        FROM
+            relacoes r
+        JOIN
+            pg_class c ON c.oid = r.oid
+        LEFT JOIN
+            pg_stat_all_tables s ON s.relid = c.oid
+        WHERE
+            c.relkind IN ('r', 'm', 'p')
+        ORDER BY
+            c.relname
+        """
+
+        df = le_sql(query, self.dbEngine)
+        estado = df.to_csv(index=False)
+
+        return hashlib.md5(estado.encode("utf-8")).hexdigest()
+
+    def get_versao(self):
+        """Retorna o token da versão atual dos dados (consulta o banco no máximo uma vez por intervalo)"""
+        with self._lock:
+            agora = time.monotonic()
+            if self._versao is None or agora - self._ultima_consulta >= self.intervalo_segundos:
+                try:
+                    self._versao = self._consulta_versao()
+                except Exception as e:
+                    # Sem acesso ao catálogo, a versão é renovada periodicamente para não manter dados antigos
+                    print(f"Erro ao consultar a versão dos dados: {e}")
+                    self._versao = f"falha-{int(time.time() // VERSAO_DADOS_INTERVALO_FALHA_SEGUNDOS)}"
+
+                self._ultima_consulta = agora
+
+            return self._versao
+
+
+# Uma instância por engine (compartilhada por todos os serviços do processo)
+_versoes_por_engine = {}
+_lock_versoes = Lock()
+
+
+def get_versao_dados(dbEngine):
+    """Retorna o token da versão dos dados para a engine informada"""
+    if dbEngine is None:
+        return None
+
+    with _lock_versoes:
+        versao_dados = _versoes_por_engine.get(id(dbEngine))
+        if versao_dados is None:
+            versao_dados = VersaoDados(dbEngine)
+            _versoes_por_engine[id(dbEngine)] = versao_dados
+
+    return versao_dados.get_versao()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Codificação dos DataFrames trocados entre callbacks (Arrow IPC comprimido, em base64)
+
+# Imports básicos
+import base64
+import functools
+import pandas as pd
+import pyarrow as pa
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Chaves que identificam um DataFrame codificado dentro dos dados de um dcc.Store
+CHAVE_DATAFRAME_ARROW = "__dataframe_arrow__"
+CHAVE_DATAFRAME_RECORDS = "__dataframe_records__"
+
+# Compressão dos buffers Arrow
+COMPRESSAO_ARROW = "zstd"
+
+
+##############################################################################
+# ARROW ######################################################################
+##############################################################################
+def normaliza_tipos_dataframe(df):
+    """Converte as colunas NUMERIC do banco (Decimal) para float, como era feito pelo JSON do dcc.Store"""
+    colunas_decimal = [
+        coluna
+        for coluna in df.columns[df.dtypes == object]
+        if pd.api.types.infer_dtype(df[coluna], skipna=True) == "decimal"
+    ]
+    if not colunas_decimal:
+        return df
+
+    df = df.copy()
+    for coluna in colunas_decimal:
+        df[coluna] = df[coluna].astype(float)
+
+    return df
+
+
+def dataframe_para_arrow(df):
+    """Serializa o DataFrame no formato Arrow IPC (stream) comprimido"""
+    tabela = pa.Table.from_pandas(normaliza_tipos_dataframe(df), preserve_index=False)
+
+    sink = pa.BufferOutputStream()
+    opcoes = pa.ipc.IpcWriteOptions(compression=COMPRESSAO_ARROW)
+    with pa.ipc.new_stream(sink, tabela.schema, options=opcoes) as writer:
+        writer.write_table(tabela)
+
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_para_dataframe(dados):
+    """Reconstrói o DataFrame a partir dos bytes Arrow IPC (os buffers são lidos sem cópia intermediária)"""
+    with pa.ipc.open_stream(pa.py_buffer(dados)) as reader:
+        return reader.read_pandas()
+
+
+##############################################################################
+# CODIFICAÇÃO PARA O DCC.STORE ###############################################
+##############################################################################
+def codifica_dataframe(df):
+    """Codifica o DataFrame para ser enviado em um dcc.Store (Arrow em base64, ou records se o Arrow falhar)"""
+    try:
+        return {CHAVE_DATAFRAME_ARROW: base64.b64encode(dataframe_para_arrow(df)).decode("ascii")}
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        print(f"Erro ao codificar DataFrame em Arrow: {e}")
+        return {CHAVE_DATAFRAME_RECORDS: df.to_dict(orient="records")}
+
+
+def eh_dataframe_codificado(valor):
+    """Verifica se o valor é um DataFrame codificado por codifica_dataframe"""
+    return isinstance(valor, dict) and len(valor) == 1 and (CHAVE_DATAFRAME_ARROW in valor or CHAVE_DATAFRAME_RECORDS in valor)
+
+
+def decodifica_dataframe(valor):
+    """Decodifica um DataFrame codificado por codifica_dataframe"""
+    if CHAVE_DATAFRAME_ARROW in valor:
+        return arrow_para_dataframe(base64.b64decode(valor[CHAVE_DATAFRAME_ARROW]))
+
+    return pd.DataFrame(valor[CHAVE_DATAFRAME_RECORDS])
+
+
+def codifica_dataframes(valor):
+    """Codifica todos os DataFrames contidos no valor (percorre dicts, listas e tuplas)"""
+    if isinstance(valor, pd.DataFrame):
+        return codifica_dataframe(valor)
+
+    if isinstance(valor, dict):
+        return {k: codifica_dataframes(v) for k, v in valor.items()}
+
+    if isinstance(valor, (list, tuple)):
+        return type(valor)(codifica_dataframes(v) for v in valor)
+
+    return valor
+
+
+def decodifica_dataframes(valor):
+    """Decodifica todos os DataFrames codificados contidos no valor (percorre dicts, listas e tuplas)"""
+    if eh_dataframe_codificado(valor):
+        return decodifica_dataframe(valor)
+
+    if isinstance(valor, dict):
+        return {k: decodifica_dataframes(v) for k, v in valor.items()}
+
+    if isinstance(valor, (list, tuple)):
+        return type(valor)(decodifica_dataframes(v) for v in valor)
+
+    return valor
+
+
+##############################################################################
+# DECORADORES PARA CALLBACKS #################################################
+##############################################################################
+def codifica_saida_dataframes(funcao):
+    """Decorador para callbacks que escrevem em um dcc.Store: codifica os DataFrames retornados"""
+
+    @functools.wraps(funcao)
+    def wrapper(*args, **kwargs):
+        return codifica_dataframes(funcao(*args, **kwargs))
+
+    return wrapper
+
+
+def decodifica_entrada_dataframes(funcao):
+    """Decorador para callbacks que leem um dcc.Store: decodifica os DataFrames recebidos nos argumentos"""
+
+    @functools.wraps(funcao)
+    def wrapper(*args, **kwargs):
+        args = [decodifica_dataframes(v) for v in args]
+        kwargs = {k: decodifica_dataframes(v) for k, v in kwargs.items()}
+        return funcao(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Armazenamento dos DataFrames no servidor (os dcc.Store carregam apenas o identificador dos dados)
+
+# Imports básicos
+import os
+import hashlib
+import pandas as pd
+
+# Imports auxiliares
+from modules.cache_utils import CacheResultados, normaliza_valor_chave
+from modules.dataframe_codec_utils import dataframe_para_arrow, arrow_para_dataframe
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Tempo de vida (em segundos) dos DataFrames armazenados
+ARMAZEM_DATAFRAMES_TTL_SEGUNDOS = int(os.getenv("ARMAZEM_DATAFRAMES_TTL_SEGUNDOS", 60 * 60))
+
+# Número máximo de conjuntos de DataFrames (um por combinação de filtros) armazenados
+ARMAZEM_DATAFRAMES_MAX_ITENS = int(os.getenv("ARMAZEM_DATAFRAMES_MAX_ITENS", 64))
+
+# Limite de memória (em MB) ocupada pelos DataFrames serializados
+ARMAZEM_DATAFRAMES_MAX_MB = int(os.getenv("ARMAZEM_DATAFRAMES_MAX_MB", 256))
+
+
+##############################################################################
+# SERIALIZAÇÃO ###############################################################
+##############################################################################
+def serializa_dataframe(df):
+    """Serializa o DataFrame em Arrow IPC comprimido (se não for possível, mantém o próprio DataFrame)"""
+    try:
+        return dataframe_para_arrow(df)
+    except Exception as e:
+        print(f"Erro ao serializar DataFrame em Arrow: {e}")
+        return df.copy()
+
+
+def desserializa_dataframe(valor):
+    """Reconstrói o DataFrame serializado por serializa_dataframe"""
+    if isinstance(valor, pd.DataFrame):
+        return valor
+
+    return arrow_para_dataframe(valor)
+
+
+##############################################################################
+# ARMAZÉM ####################################################################
+##############################################################################
+class ArmazemDataFrames:
+    """
+    Armazena conjuntos de DataFrames (ex: {"df_os": ..., "df_custo": ...}) no servidor, em Arrow IPC comprimido,
+    com remoção dos menos usados (LRU), tempo de vida e limite de memória.
+    Cada conjunto é identificado por um handle (hash dos filtros), que é o que vai para o navegador.
+    """
+
+    def __init__(
+        self,
+        nome,
+        ttl_segundos=ARMAZEM_DATAFRAMES_TTL_SEGUNDOS,
+        max_itens=ARMAZEM_DATAFRAMES_MAX_ITENS,
+        max_mb=ARMAZEM_DATAFRAMES_MAX_MB,
+    ):
+        self.nome = nome
+        self._cache = CacheResultados(nome, ttl_segundos=ttl_segundos, max_itens=max_itens, max_mb=max_mb)
+
+    def gera_handle(self, versao_dados, filtros, termos_all=None):
+        """Gera o identificador dos dados a partir da versão dos dados e dos filtros normalizados"""
+        termos_all = termos_all or {}
+        chave = (self.nome, versao_dados) + tuple(
+            (nome, normaliza_valor_chave(nome, valor, termos_all)) for nome, valor in sorted(filtros.items())
+        )
+
+        return hashlib.sha1(repr(chave).encode("utf-8")).hexdigest()
+
+    def salva(self, handle, dict_dfs):
+        """Armazena o conjunto de DataFrames com o handle informado"""
+        self._cache.armazena(handle, {nome: serializa_dataframe(df) for nome, df in dict_dfs.items()})
+
+    def carrega(self, handle, nome_df, funcao_calcula=None):
+        """
+        Retorna o DataFrame nome_df do conjunto identificado pelo handle.
+        Se o conjunto não estiver armazenado (expirou ou foi calculado em outro processo),
+        executa funcao_calcula (que retorna o conjunto completo) uma única vez e armazena o resultado.
+        """
+        if funcao_calcula is None:
+            encontrado, dict_serializado = self._cache.busca(handle)
+            if not encontrado:
+                return None
+        else:
+            dict_serializado = self._cache.obtem_ou_calcula(
+                handle, lambda: {nome: serializa_dataframe(df) for nome, df in funcao_calcula().items()}
+            )
+
+        return desserializa_dataframe(dict_serializado[nome_df])
+
+    def estatisticas(self):
+        """Retorna as estatísticas de uso do armazém"""
+        return self._cache.estatisticas()
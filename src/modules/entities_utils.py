@@ -3,15 +3,42 @@
 
 # Bibliotecas padrão
 import io
-import re
 import pandas as pd
 
+# Imports auxiliares
+from modules.cache_utils import CacheResultados
+from modules.data_version_utils import get_versao_dados
+from modules.sql_utils import le_sql
+from modules.views_retrabalho_utils import view_existe
+
 # Funções utilitárias para obtenção das principais entidades do sistema
 
+# Cache das dimensões (tabelas pequenas usadas por vários serviços), renovado a cada versão dos dados
+cache_dimensoes = CacheResultados("dimensoes")
+
+
+def obtem_dimensao(nome, dbEngine, funcao_calcula):
+    """Retorna a dimensão do cache ou a calcula uma única vez por versão dos dados"""
+    versao_dados = get_versao_dados(dbEngine)
+    cache_dimensoes.verifica_versao_dados(versao_dados)
+
+    return cache_dimensoes.obtem_ou_calcula((versao_dados, nome, id(dbEngine)), funcao_calcula)
+
+
+def le_view_dimensao(query, view_dimensao, dbEngine):
+    """
+    Executa a query das listas dos filtros sobre a view de dimensão (ver sql/002_dimensoes_filtros.sql).
+    Se a view ainda não tiver sido criada no banco, executa a mesma query sobre mat_view_retrabalho_10_dias.
+    """
+    if not view_existe(dbEngine, view_dimensao):
+        return le_sql(query.format(relacao="mat_view_retrabalho_10_dias"), dbEngine)
+
+    return le_sql(query.format(relacao=view_dimensao), dbEngine)
+
 
 def get_linhas(dbEngine):
     # Linhas
-    return pd.read_sql(
+    return le_sql(
         """
         SELECT 
             DISTINCT "linhanumero" AS "LABEL"
@@ -26,113 +53,156 @@ def get_linhas(dbEngine):
 
 def get_oficinas(dbEngine):
     # Oficinas
-    return pd.read_sql(
+    return le_view_dimensao(
         """
         SELECT 
             DISTINCT "DESCRICAO DA OFICINA" AS "LABEL"
         FROM 
-            mat_view_retrabalho_10_dias mvrd 
+            {relacao} mvrd 
         ORDER BY 
             "DESCRICAO DA OFICINA"
         """,
+        "mat_view_dim_oficinas",
         dbEngine,
     )
 
 
 def get_secoes(dbEngine):
     # Seções
-    return pd.read_sql(
+    return le_view_dimensao(
         """
         SELECT 
             DISTINCT "DESCRICAO DA SECAO" AS "LABEL"
         FROM 
-            mat_view_retrabalho_10_dias mvrd
+            {relacao} mvrd
         ORDER BY 
             "DESCRICAO DA SECAO"
         """,
+        "mat_view_dim_secoes",
         dbEngine,
     )
 
 
+def formata_nome_colaborador(nomes):
+    """Separa as palavras dos nomes em CamelCase (ex: JoaoSilva -> Joao Silva)"""
+    return nomes.str.replace(r"(?<!^)([A-Z])", r" \1", regex=True)
+
+
 def get_mecanicos(dbEngine):
     # Colaboradores / Mecânicos
-    df = pd.read_sql(
+    return obtem_dimensao("mecanicos", dbEngine, lambda: _le_mecanicos(dbEngine))
+
+
+def _le_mecanicos(dbEngine):
+    df = le_view_dimensao(
         """
         SELECT DISTINCT "COLABORADOR QUE EXECUTOU O SERVICO" as "CODIGO", cfo.id, cfo.cod_colaborador, cfo.nome_colaborador 
-        FROM mat_view_retrabalho_10_dias mvrd 
+        FROM {relacao} mvrd 
         LEFT JOIN colaboradores_frotas_os cfo 
         ON mvrd."COLABORADOR QUE EXECUTOU O SERVICO" = cfo.cod_colaborador 
         """,
+        "mat_view_dim_colaboradores",
         dbEngine,
     )
     df["nome_colaborador"] = df["nome_colaborador"].fillna("Não informado").infer_objects(copy=False)
     df["LABEL_COLABORADOR"] = (
-        df["nome_colaborador"].apply(lambda x: re.sub(r"(?<!^)([A-Z])", r" \1", x))
-        + " ("
-        + df["CODIGO"].astype(int).astype(str)
-        + ")"
+        formata_nome_colaborador(df["nome_colaborador"]) + " (" + df["CODIGO"].astype(int).astype(str) + ")"
     )
     df.sort_values(by="LABEL_COLABORADOR", inplace=True)
 
     return df
 
 
+def get_dimensao_colaboradores(dbEngine):
+    """Retorna os colaboradores (cod_colaborador -> NOME_COLABORADOR já formatado), um por código"""
+    return obtem_dimensao("colaboradores", dbEngine, lambda: _le_dimensao_colaboradores(dbEngine))
+
+
+def _le_dimensao_colaboradores(dbEngine):
+    df = le_sql(
+        """
+        SELECT 
+            cod_colaborador, nome_colaborador
+        FROM 
+            colaboradores_frotas_os
+        WHERE 
+            cod_colaborador IS NOT NULL
+        """,
+        dbEngine,
+    )
+    df = df.drop_duplicates(subset="cod_colaborador")
+    df["cod_colaborador"] = df["cod_colaborador"].astype(int)
+    df["NOME_COLABORADOR"] = formata_nome_colaborador(df["nome_colaborador"].fillna("Não informado"))
+
+    return df[["cod_colaborador", "NOME_COLABORADOR"]]
+
+
+def adiciona_nome_colaborador(
+    df, df_colaboradores, coluna_codigo="COLABORADOR QUE EXECUTOU O SERVICO", nome_nao_encontrado="Não encontrado"
+):
+    """Adiciona as colunas NOME_COLABORADOR, LABEL_COLABORADOR e ID_COLABORADOR usando a dimensão dos colaboradores"""
+    codigos = df[coluna_codigo].astype(int)
+    nomes = df_colaboradores.set_index("cod_colaborador")["NOME_COLABORADOR"]
+
+    df["NOME_COLABORADOR"] = codigos.map(nomes).fillna(nome_nao_encontrado)
+    df["LABEL_COLABORADOR"] = df["NOME_COLABORADOR"] + " - " + codigos.astype(str)
+    df["ID_COLABORADOR"] = codigos
+
+    return df
+
+
 def get_lista_os(dbEngine):
     # Lista de OS
-    return pd.read_sql(
+    return le_view_dimensao(
         """
         SELECT DISTINCT
             "DESCRICAO DA SECAO" as "SECAO",
             "DESCRICAO DO SERVICO" AS "LABEL"
         FROM 
-            mat_view_retrabalho_10_dias mvrd 
+            {relacao} mvrd 
         ORDER BY
             "DESCRICAO DO SERVICO"
         """,
+        "mat_view_dim_servicos",
         dbEngine,
     )
 
 
 def get_modelos(dbEngine):
     # Lista de OS
-    return pd.read_sql(
+    return le_view_dimensao(
         """
         SELECT DISTINCT
             "DESCRICAO DO MODELO" AS "MODELO"
         FROM 
-            mat_view_retrabalho_10_dias mvrd
+            {relacao} mvrd
         """,
+        "mat_view_dim_modelos",
         dbEngine,
     )
 
 
 def get_veiculos(dbEngine):
-    # Lista de veículos
-    return pd.read_sql(
+    # Lista de veículos (um modelo por veículo)
+    return le_view_dimensao(
         """
-        WITH veiculos_unicos AS (
-            SELECT
-                "CODIGO DO VEICULO",
-                "DESCRICAO DO MODELO",
-                ROW_NUMBER() OVER (PARTITION BY "CODIGO DO VEICULO" ORDER BY "DESCRICAO DO MODELO") AS rn
-            FROM 
-                mat_view_retrabalho_10_dias
-        )
-        SELECT
+        SELECT DISTINCT ON ("CODIGO DO VEICULO")
             "CODIGO DO VEICULO" AS "VEICULO",
             "DESCRICAO DO MODELO" AS "MODELO"
         FROM 
-            veiculos_unicos
-        WHERE 
-            rn = 1;
+            {relacao}
+        ORDER BY
+            "CODIGO DO VEICULO",
+            "DESCRICAO DO MODELO"
         """,
+        "mat_view_dim_veiculos",
         dbEngine,
     )
 
 
 def get_regras_monitoramento_os(dbEngine):
     # Lista de regras
-    return pd.read_sql(
+    return le_sql(
         """
         SELECT nome as "label", id as "value" FROM regra_monitoramento_os
         ORDER BY nome;
@@ -143,7 +213,7 @@ def get_regras_monitoramento_os(dbEngine):
 
 def get_relatorios_llm_os(dbEngine):
     # Lista de regras
-    return pd.read_sql(
+    return le_sql(
         """
         SELECT nome as "label", id as "value" FROM regra_relatorio_llm_os
         ORDER BY nome;
@@ -169,7 +239,7 @@ def get_tipos_eventos_telemetria_mix_com_data(dbEngine):
     WHERE 
         t."DescriptionCLEAN" IN ( SELECT evt_name FROM eventos_aptos );
     """
-    return pd.read_sql(query, dbEngine)
+    return le_sql(query, dbEngine)
 
 
 def get_tipos_eventos_telemetria_mix_com_gps(dbEngine):
@@ -189,7 +259,7 @@ def get_tipos_eventos_telemetria_mix_com_gps(dbEngine):
     WHERE 
         t."DescriptionCLEAN" IN ( SELECT evt_name FROM eventos_aptos)
     """
-    return pd.read_sql(query, dbEngine)
+    return le_sql(query, dbEngine)
 
 
 def gerar_excel(df):
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Funções executadas pelos hooks do gunicorn (ver gunicorn.conf.py na raiz do projeto)
+
+# Imports auxiliares
+from db import PostgresSingleton
+from modules.catalogo_entidades_utils import get_catalogo_entidades
+from modules.pool_metricas_utils import metricas_pool
+from modules.query_metricas_utils import metricas_queries
+from modules.callback_metricas_utils import metricas_callbacks
+
+
+def prepara_processo_mestre():
+    """
+    Executada no processo mestre após carregar a aplicação (preload_app), antes de criar os workers.
+    Lê as entidades dos filtros uma única vez: os workers herdam os dados por copy-on-write.
+    Depois, fecha as conexões abertas no mestre, que não podem ser compartilhadas com os workers.
+    """
+    pgEngine = PostgresSingleton.get_instance().get_engine()
+
+    get_catalogo_entidades(pgEngine).precarrega()
+    pgEngine.dispose()
+
+
+def prepara_worker():
+    """
+    Executada em cada worker logo após o fork.
+    Descarta o pool herdado do mestre sem fechar as conexões dele (close=False); o worker abre as suas próprias.
+    Também zera as métricas (pool, queries e callbacks) herdadas do mestre.
+    """
+    pgEngine = PostgresSingleton.get_instance().get_engine()
+
+    pgEngine.dispose(close=False)
+    metricas_pool.reinicia()
+    metricas_queries.reinicia()
+    metricas_callbacks.reinicia()
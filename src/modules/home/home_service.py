@@ -4,13 +4,20 @@
 # Classe que centraliza os serviços para mostrar na página home
 
 # Imports básicos
-import re
 import pandas as pd
 import numpy as np
 
 # Imports auxiliares
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos
-from modules.entities_utils import get_mecanicos
+from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos, sql_ano_mes, le_sql
+from modules.entities_utils import get_dimensao_colaboradores, adiciona_nome_colaborador
+from modules.cache_utils import CacheResultados, cache_servico
+from modules.views_retrabalho_utils import get_view_retrabalho
+
+# Cache compartilhado pelos callbacks da página home (todas as threads do worker)
+cache_home = CacheResultados("home")
+
+# Termos para "todas as opções" de cada filtro (usado na chave do cache)
+TERMOS_ALL_HOME = {"lista_modelos": "TODOS"}
 
 
 # Classe do serviço
@@ -18,190 +25,137 @@ class HomeService:
     def __init__(self, dbEngine):
         self.dbEngine = dbEngine
 
-    def get_sintese_geral(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        """Função para obter a síntese geral (que será usado para o gráfico de pizza)"""
+    @cache_servico(cache_home, termos_all=TERMOS_ALL_HOME)
+    def get_dados_base_os(self, datas, min_dias, lista_modelos, lista_oficinas):
+        """Função para obter as OSs filtradas por período, modelo e oficina (base para as agregações feitas em memória)"""
 
-        # Extraí a data inicial e final
+        # Extraí a data inicial e final (sem remover min_dias, as funções que precisam filtram depois)
         data_inicio_str = datas[0]
         data_fim_str = datas[1]
 
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        # data_fim = pd.to_datetime(datas[1])
-        # data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        # data_fim_str = data_fim.strftime("%Y-%m-%d")
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
 
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        # Os filtros de seção e OS são aplicados em memória, pois o total da frota por modelo não os considera
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
 
         # Query
+        # O gasto com peças é somado por OS apenas para as OSs filtradas (usado na evolução do custo)
         query = f"""
+            WITH os_filtradas AS (
+                SELECT
+                    "NUMERO DA OS",
+                    "DATA DO FECHAMENTO DA OS",
+                    "DESCRICAO DO MODELO",
+                    "DESCRICAO DA OFICINA",
+                    "DESCRICAO DA SECAO",
+                    "DESCRICAO DO SERVICO",
+                    "CODIGO DO VEICULO",
+                    retrabalho,
+                    correcao,
+                    correcao_primeira,
+                    nova_os_com_retrabalho_anterior,
+                    nova_os_sem_retrabalho_anterior
+                FROM
+                    {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)}
+                WHERE
+                    "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
+                    {subquery_modelos_str}
+                    {subquery_oficinas_str}
+            ),
+            pecas_os AS (
+                SELECT
+                    pg."OS",
+                    SUM(pg."VALOR") AS "VALOR_PECAS"
+                FROM
+                    view_pecas_desconsiderando_combustivel pg
+                WHERE
+                    pg."OS" IN (SELECT DISTINCT "NUMERO DA OS" FROM os_filtradas)
+                GROUP BY
+                    pg."OS"
+            )
             SELECT
-                COUNT(*) AS "TOTAL_NUM_OS",
-                SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END) AS "TOTAL_RETRABALHO",
-                SUM(CASE WHEN correcao THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO",
-                SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END) AS "TOTAL_CORRECAO_PRIMEIRA",
-                SUM(CASE WHEN nova_os_com_retrabalho_anterior THEN 1 ELSE 0 END) AS "TOTAL_NOVA_OS_COM_RETRABALHO_ANTERIOR",
-                SUM(CASE WHEN nova_os_sem_retrabalho_anterior THEN 1 ELSE 0 END) AS "TOTAL_NOVA_OS_SEM_RETRABALHO_ANTERIOR",
-                100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
-                100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
-                100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
-                100 * ROUND(SUM(CASE WHEN nova_os_com_retrabalho_anterior THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_NOVA_OS_COM_RETRABALHO_ANTERIOR",
-                100 * ROUND(SUM(CASE WHEN nova_os_sem_retrabalho_anterior THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_NOVA_OS_SEM_RETRABALHO_ANTERIOR"
+                main."DATA DO FECHAMENTO DA OS",
+                main."DESCRICAO DO MODELO",
+                main."DESCRICAO DA OFICINA",
+                main."DESCRICAO DA SECAO",
+                main."DESCRICAO DO SERVICO",
+                main."CODIGO DO VEICULO",
+                main.retrabalho,
+                main.correcao,
+                main.correcao_primeira,
+                main.nova_os_com_retrabalho_anterior,
+                main.nova_os_sem_retrabalho_anterior,
+                pecas."VALOR_PECAS"
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-                {subquery_modelos_str}
-                {subquery_oficinas_str}
-                {subquery_secoes_str}
-                {subquery_os_str}
+                os_filtradas main
+            LEFT JOIN
+                pecas_os pecas
+            ON
+                main."NUMERO DA OS" = pecas."OS"
         """
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
-        # Calcula o total de correções tardia
-        df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
-
-        return df
-
-    def get_retrabalho_por_modelo(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        """Função para obter o quantitativo de retrabalho e correções de primeira por modelo"""
-
-        # Extraí a data inicial (já em string)
-        data_inicio_str = datas[0]
-
-        # Extraí a data final
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-
-        # Queries
-        # Primeiro pegamos o total de veículos por modelo no período, não vamos restringir por problema
-        query_total_frota = f"""
-        SELECT 
-            "DESCRICAO DO MODELO", 
-            COUNT(DISTINCT "CODIGO DO VEICULO") AS "TOTAL_FROTA_PERIODO"
-        FROM 
-            mat_view_retrabalho_{min_dias}_dias_distinct
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-        GROUP BY 
-            "DESCRICAO DO MODELO"
-        """
-
-        query_teve_problema = f"""
-        SELECT 
-            "DESCRICAO DO MODELO", 
-            COUNT(DISTINCT "CODIGO DO VEICULO") AS "TOTAL_FROTA_TEVE_PROBLEMA"
-        FROM 
-            mat_view_retrabalho_{min_dias}_dias_distinct
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-            {subquery_secoes_str}
-            {subquery_os_str}
-        GROUP BY 
-            "DESCRICAO DO MODELO"
-        """
+        # Valor das peças (NaN se a OS não teve peças)
+        df["VALOR_PECAS"] = pd.to_numeric(df["VALOR_PECAS"], errors="coerce")
 
-        query_teve_retrabalho = f"""
-        SELECT 
-            "DESCRICAO DO MODELO", 
-            COUNT(DISTINCT "CODIGO DO VEICULO") AS "TOTAL_FROTA_TEVE_RETRABALHO"
-        FROM 
-            mat_view_retrabalho_{min_dias}_dias_distinct
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-            {subquery_secoes_str}
-            {subquery_os_str}
-            AND retrabalho = TRUE
-        GROUP BY 
-            "DESCRICAO DO MODELO"
-        """
+        # Mês de fechamento (a data está no formato YYYY-MM-DDTHH:MI:SS)
+        df["year_month"] = df["DATA DO FECHAMENTO DA OS"].str[:7]
 
-        # Executa Queries
-        df_total_frota = pd.read_sql(query_total_frota, self.dbEngine)
-        df_teve_problema = pd.read_sql(query_teve_problema, self.dbEngine)
-        df_teve_retrabalho = pd.read_sql(query_teve_retrabalho, self.dbEngine)
+        # Colunas com poucos valores distintos ocupam menos memória como categoria
+        for coluna in ["year_month", "DESCRICAO DO MODELO", "DESCRICAO DA OFICINA", "DESCRICAO DA SECAO", "DESCRICAO DO SERVICO"]:
+            df[coluna] = df[coluna].astype("category")
 
-        # Merge dos dataframes
-        df = df_total_frota.merge(df_teve_problema, on="DESCRICAO DO MODELO", how="left")
-        df = df.merge(df_teve_retrabalho, on="DESCRICAO DO MODELO", how="left")
-        df.fillna(0, inplace=True)
+        # Garante que as flags são booleanas
+        for coluna in ["retrabalho", "correcao", "correcao_primeira", "nova_os_com_retrabalho_anterior", "nova_os_sem_retrabalho_anterior"]:
+            df[coluna] = df[coluna].fillna(False).astype(bool)
 
-        # Calcular campos
-        df["NAO_TEVE_PROBLEMA"] = df["TOTAL_FROTA_PERIODO"] - df["TOTAL_FROTA_TEVE_PROBLEMA"]
-        df["TEVE_PROBLEMA_SEM_RETRABALHO"] = df["TOTAL_FROTA_TEVE_PROBLEMA"] - df["TOTAL_FROTA_TEVE_RETRABALHO"]
-        df["TEVE_PROBLEMA_E_RETRABALHO"] = df["TOTAL_FROTA_TEVE_RETRABALHO"]
+        return df
 
-        # Calcula as porcentagens
-        df["PERC_NAO_TEVE_PROBLEMA"] = round(100 * df["NAO_TEVE_PROBLEMA"] / df["TOTAL_FROTA_PERIODO"], 1)
-        df["PERC_TEVE_PROBLEMA_SEM_RETRABALHO"] = round(100 * df["TEVE_PROBLEMA_SEM_RETRABALHO"] / df["TOTAL_FROTA_PERIODO"], 1)
-        df["PERC_TEVE_PROBLEMA_E_RETRABALHO"] = round(100 * df["TEVE_PROBLEMA_E_RETRABALHO"] / df["TOTAL_FROTA_PERIODO"], 1)
+    def mascara_dados_base_os(self, df, data_fim_str, lista_secaos, lista_os):
+        """Função que retorna a máscara dos filtros de data final, seção e OS (mesma semântica das subqueries)"""
+        mascara = df["DATA DO FECHAMENTO DA OS"] <= data_fim_str
 
-        return df
+        if "TODAS" not in lista_secaos:
+            mascara &= df["DESCRICAO DA SECAO"].isin(lista_secaos)
 
-    def get_evolucao_retrabalho_por_modelo_por_mes(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        """Função para obter a evolução do retrabalho por modelo por mes"""
-        # Extraí a data inicial (já em string)
-        data_inicio_str = datas[0]
+        lista_os_validas = [x for x in lista_os if x] if lista_os else []
+        if lista_os_validas and "TODAS" not in lista_os:
+            mascara &= df["DESCRICAO DO SERVICO"].isin(lista_os_validas)
 
-        # Extraí a data final
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
+        return mascara
 
-        # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+    def filtra_dados_base_os(self, df, data_fim_str, lista_secaos, lista_os):
+        """Função para aplicar em memória os filtros de data final, seção e OS"""
+        return df[self.mascara_dados_base_os(df, data_fim_str, lista_secaos, lista_os)]
 
-        query = f"""
-        SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
-            "DESCRICAO DO MODELO",
-            100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
-            100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-            {subquery_secoes_str}
-            {subquery_os_str}
-        GROUP BY
-            year_month, "DESCRICAO DO MODELO"
-        ORDER BY
-            year_month;
-        """
+    def agrega_evolucao_retrabalho_por_mes(self, df, coluna):
+        """Função para agregar o % de retrabalho e correção de primeira por mês e pela coluna informada"""
+        df_agg = (
+            df.groupby(["year_month", coluna], observed=True)
+            .agg(
+                TOTAL_NUM_OS=("retrabalho", "size"),
+                TOTAL_RETRABALHO=("retrabalho", "sum"),
+                TOTAL_CORRECAO_PRIMEIRA=("correcao_primeira", "sum"),
+            )
+            .reset_index()
+        )
+        df_agg["year_month"] = df_agg["year_month"].astype(str)
+        df_agg[coluna] = df_agg[coluna].astype(str)
 
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
+        # Percentuais (mesmo arredondamento feito antes no SQL)
+        df_agg["PERC_RETRABALHO"] = 100 * (df_agg["TOTAL_RETRABALHO"] / df_agg["TOTAL_NUM_OS"]).round(4)
+        df_agg["PERC_CORRECAO_PRIMEIRA"] = 100 * (df_agg["TOTAL_CORRECAO_PRIMEIRA"] / df_agg["TOTAL_NUM_OS"]).round(4)
 
         # Arruma dt
-        df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
+        df_agg["year_month_dt"] = pd.to_datetime(df_agg["year_month"], format="%Y-%m", errors="coerce")
 
         # Funde (melt) colunas de retrabalho e correção
-        df_combinado = df.melt(
-            id_vars=["year_month_dt", "DESCRICAO DO MODELO"],
+        df_combinado = df_agg.melt(
+            id_vars=["year_month_dt", coluna],
             value_vars=["PERC_RETRABALHO", "PERC_CORRECAO_PRIMEIRA"],
             var_name="CATEGORIA",
             value_name="PERC",
@@ -212,66 +166,83 @@ class HomeService:
 
         return df_combinado
 
-    def get_evolucao_retrabalho_por_oficina_por_mes(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        """Função para obter a evolução do retrabalho por oficina por mes"""
-        # Extraí a data inicial (já em string)
-        data_inicio_str = datas[0]
+    def agrega_evolucao_custo_por_mes(self, df):
+        """Função para agregar o gasto total e o gasto com retrabalho por mês"""
+        # Considera apenas as OSs com peças (mesmo resultado do JOIN com as peças)
+        df_pecas = df[df["VALOR_PECAS"].notna()]
+        df_pecas = df_pecas.assign(VALOR_PECAS_RETRABALHO=df_pecas["VALOR_PECAS"].where(df_pecas["retrabalho"]))
+
+        df_agg = (
+            df_pecas.groupby("year_month", observed=True)[["VALOR_PECAS", "VALOR_PECAS_RETRABALHO"]]
+            .sum(min_count=1)
+            .reset_index()
+            .rename(columns={"VALOR_PECAS": "TOTAL_GASTO", "VALOR_PECAS_RETRABALHO": "TOTAL_GASTO_RETRABALHO"})
+        )
+        df_agg["year_month"] = df_agg["year_month"].astype(str)
+
+        # Arruma dt
+        df_agg["year_month_dt"] = pd.to_datetime(df_agg["year_month"], format="%Y-%m", errors="coerce")
+
+        # Computa Perc
+        df_agg["PERC_GASTO_RETRABALHO"] = df_agg["TOTAL_GASTO_RETRABALHO"] / df_agg["TOTAL_GASTO"]
+
+        # Arredonda valores
+        df_agg["TOTAL_GASTO"] = df_agg["TOTAL_GASTO"].round(2)
+        df_agg["TOTAL_GASTO_RETRABALHO"] = df_agg["TOTAL_GASTO_RETRABALHO"].round(2)
+
+        # Funde (melt) colunas de retrabalho e correção dos sintomas
+        df_custo = df_agg.melt(
+            id_vars=["year_month_dt", "PERC_GASTO_RETRABALHO"],
+            value_vars=["TOTAL_GASTO", "TOTAL_GASTO_RETRABALHO"],
+            var_name="CATEGORIA",
+            value_name="GASTO",
+        )
+
+        return df_custo
+
+    def get_sintese_geral(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
+        """Função para obter a síntese geral (que será usado para o gráfico de pizza)"""
+
+        # Extraí a data inicial e final
+        data_fim_str = datas[1]
 
-        # Extraí a data final
         # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
+        # data_fim = pd.to_datetime(datas[1])
+        # data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
+        # data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        # Dados base (cache) filtrados em memória
+        df_base = self.get_dados_base_os(datas, min_dias, lista_modelos, lista_oficinas)
+        df_base = self.filtra_dados_base_os(df_base, data_fim_str, lista_secaos, lista_os)
 
-        query = f"""
-        SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
-            "DESCRICAO DA OFICINA",
-            100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
-            100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-            {subquery_secoes_str}
-            {subquery_os_str}
-        GROUP BY
-            year_month, "DESCRICAO DA OFICINA"
-        ORDER BY
-            year_month;
-        """
+        # Totais
+        total_num_os = len(df_base)
+        totais = {
+            "TOTAL_RETRABALHO": "retrabalho",
+            "TOTAL_CORRECAO": "correcao",
+            "TOTAL_CORRECAO_PRIMEIRA": "correcao_primeira",
+            "TOTAL_NOVA_OS_COM_RETRABALHO_ANTERIOR": "nova_os_com_retrabalho_anterior",
+            "TOTAL_NOVA_OS_SEM_RETRABALHO_ANTERIOR": "nova_os_sem_retrabalho_anterior",
+        }
 
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
+        linha = {"TOTAL_NUM_OS": total_num_os}
+        for coluna_total, flag in totais.items():
+            linha[coluna_total] = int(df_base[flag].sum())
 
-        # Arruma dt
-        df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
+        # Percentuais (mesmo arredondamento feito antes no SQL)
+        for coluna_total in totais.keys():
+            coluna_perc = coluna_total.replace("TOTAL_", "PERC_", 1)
+            linha[coluna_perc] = 100 * round(linha[coluna_total] / total_num_os, 4) if total_num_os > 0 else np.nan
 
-        # Funde (melt) colunas de retrabalho e correção
-        df_combinado = df.melt(
-            id_vars=["year_month_dt", "DESCRICAO DA OFICINA"],
-            value_vars=["PERC_RETRABALHO", "PERC_CORRECAO_PRIMEIRA"],
-            var_name="CATEGORIA",
-            value_name="PERC",
-        )
+        df = pd.DataFrame([linha])
 
-        # Renomeia as colunas
-        df_combinado["CATEGORIA"] = df_combinado["CATEGORIA"].replace({"PERC_RETRABALHO": "RETRABALHO", "PERC_CORRECAO_PRIMEIRA": "CORRECAO_PRIMEIRA"})
+        # Calcula o total de correções tardia
+        df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
 
-        return df_combinado
+        return df
 
-    def get_evolucao_retrabalho_por_secao_por_mes(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        """Função para obter a evolução do retrabalho por seção por mes"""
-        # Extraí a data inicial (já em string)
-        data_inicio_str = datas[0]
+    def get_retrabalho_por_modelo(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
+        """Função para obter o quantitativo de retrabalho e correções de primeira por modelo"""
 
         # Extraí a data final
         # Remove min_dias antes para evitar que a última OS não seja retrabalho
@@ -279,51 +250,66 @@ class HomeService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        # Dados base (cache)
+        df_base = self.get_dados_base_os(datas, min_dias, lista_modelos, lista_oficinas)
 
-        query = f"""
-        SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
-            "DESCRICAO DA SECAO",
-            100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
-            100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-            {subquery_secoes_str}
-            {subquery_os_str}
-        GROUP BY
-            year_month, "DESCRICAO DA SECAO"
-        ORDER BY
-            year_month;
-        """
-
-        # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
+        # Veículos no período (total da frota, não vamos restringir por problema)
+        df_periodo = df_base[df_base["DATA DO FECHAMENTO DA OS"] <= data_fim_str]
 
-        # Arruma dt
-        df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
+        # Veículos que tiveram problema (filtrando seções e OS) e os que tiveram retrabalho
+        # Equivalente ao COUNT(DISTINCT ...) FILTER (WHERE ...): os veículos fora do filtro viram NaN e não são contados
+        mascara_problema = self.mascara_dados_base_os(df_periodo, data_fim_str, lista_secaos, lista_os)
+        df_periodo = df_periodo.assign(
+            VEICULO_TEVE_PROBLEMA=df_periodo["CODIGO DO VEICULO"].where(mascara_problema),
+            VEICULO_TEVE_RETRABALHO=df_periodo["CODIGO DO VEICULO"].where(mascara_problema & df_periodo["retrabalho"]),
+        )
 
-        # Funde (melt) colunas de retrabalho e correção
-        df_combinado = df.melt(
-            id_vars=["year_month_dt", "DESCRICAO DA SECAO"],
-            value_vars=["PERC_RETRABALHO", "PERC_CORRECAO_PRIMEIRA"],
-            var_name="CATEGORIA",
-            value_name="PERC",
+        # Agrega em uma única passada
+        df = (
+            df_periodo.groupby("DESCRICAO DO MODELO", observed=True)
+            .agg(
+                TOTAL_FROTA_PERIODO=("CODIGO DO VEICULO", "nunique"),
+                TOTAL_FROTA_TEVE_PROBLEMA=("VEICULO_TEVE_PROBLEMA", "nunique"),
+                TOTAL_FROTA_TEVE_RETRABALHO=("VEICULO_TEVE_RETRABALHO", "nunique"),
+            )
+            .reset_index()
         )
+        df["DESCRICAO DO MODELO"] = df["DESCRICAO DO MODELO"].astype(str)
 
-        # Renomeia as colunas
-        df_combinado["CATEGORIA"] = df_combinado["CATEGORIA"].replace({"PERC_RETRABALHO": "RETRABALHO", "PERC_CORRECAO_PRIMEIRA": "CORRECAO_PRIMEIRA"})
+        # Calcular campos
+        df["NAO_TEVE_PROBLEMA"] = df["TOTAL_FROTA_PERIODO"] - df["TOTAL_FROTA_TEVE_PROBLEMA"]
+        df["TEVE_PROBLEMA_SEM_RETRABALHO"] = df["TOTAL_FROTA_TEVE_PROBLEMA"] - df["TOTAL_FROTA_TEVE_RETRABALHO"]
+        df["TEVE_PROBLEMA_E_RETRABALHO"] = df["TOTAL_FROTA_TEVE_RETRABALHO"]
 
-        return df_combinado
+        # Calcula as porcentagens
+        df["PERC_NAO_TEVE_PROBLEMA"] = round(100 * df["NAO_TEVE_PROBLEMA"] / df["TOTAL_FROTA_PERIODO"], 1)
+        df["PERC_TEVE_PROBLEMA_SEM_RETRABALHO"] = round(100 * df["TEVE_PROBLEMA_SEM_RETRABALHO"] / df["TOTAL_FROTA_PERIODO"], 1)
+        df["PERC_TEVE_PROBLEMA_E_RETRABALHO"] = round(100 * df["TEVE_PROBLEMA_E_RETRABALHO"] / df["TOTAL_FROTA_PERIODO"], 1)
 
+        return df
+
+    def get_evolucao_retrabalho_por_mes(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
+        """Função para obter a evolução mensal do retrabalho por modelo, oficina, seção, nota e custo (um dataframe por gráfico)"""
+        # Extraí a data final
+        # Remove min_dias antes para evitar que a última OS não seja retrabalho
+        data_fim = pd.to_datetime(datas[1])
+        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
+        data_fim_str = data_fim.strftime("%Y-%m-%d")
+
+        # Dados base (cache) filtrados em memória
+        df_base = self.get_dados_base_os(datas, min_dias, lista_modelos, lista_oficinas)
+        df_base = self.filtra_dados_base_os(df_base, data_fim_str, lista_secaos, lista_os)
+
+        return {
+            "modelo": self.agrega_evolucao_retrabalho_por_mes(df_base, "DESCRICAO DO MODELO"),
+            "oficina": self.agrega_evolucao_retrabalho_por_mes(df_base, "DESCRICAO DA OFICINA"),
+            "secao": self.agrega_evolucao_retrabalho_por_mes(df_base, "DESCRICAO DA SECAO"),
+            # As notas são por colaborador, portanto usam a view não distinta (consulta própria)
+            "nota": self.get_evolucao_retrabalho_por_nota_por_mes(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os),
+            "custo": self.agrega_evolucao_custo_por_mes(df_base),
+        }
+
+    @cache_servico(cache_home, termos_all=TERMOS_ALL_HOME)
     def get_evolucao_retrabalho_por_nota_por_mes(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
         """Função para obter a evolução do retrabalho por nota por mes"""
 
@@ -336,27 +322,30 @@ class HomeService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         query = f"""
         SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month_str,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month_str,
             AVG(CASE WHEN retrabalho THEN osclass."SCORE_SYMPTOMS_TEXT_QUALITY" ELSE NULL END) AS "NOTA_MEDIA_SINTOMA_COM_RETRABALHO",
             AVG(CASE WHEN retrabalho THEN osclass."SCORE_SOLUTION_TEXT_QUALITY" ELSE NULL END) AS "NOTA_MEDIA_SOLUCAO_COM_RETRABALHO",
             AVG(CASE WHEN correcao_primeira THEN osclass."SCORE_SYMPTOMS_TEXT_QUALITY" ELSE NULL END) AS "NOTA_MEDIA_SINTOMA_SOLUCAO",
             AVG(CASE WHEN correcao_primeira THEN osclass."SCORE_SOLUTION_TEXT_QUALITY" ELSE NULL END) AS "NOTA_MEDIA_SOLUCAO_SOLUCAO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias AS retview
+            {get_view_retrabalho(self.dbEngine, min_dias)} AS retview
         LEFT JOIN 
             os_dados_classificacao AS osclass
             ON retview."KEY_HASH" = osclass."KEY_HASH"
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_modelos_str}
             {subquery_oficinas_str}
             {subquery_secoes_str}
@@ -368,7 +357,7 @@ class HomeService:
         """
 
         # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Arruma dt
         df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
@@ -410,71 +399,7 @@ class HomeService:
 
         return df_combinado
 
-    def get_evolucao_retrabalho_por_custo_por_mes(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        """Função para obter a evolução do retrabalho por custo por mes"""
-
-        # Extraí a data inicial (já em string)
-        data_inicio_str = datas[0]
-
-        # Extraí a data final
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-
-        query = f"""
-        SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month_str,
-            SUM(pg."VALOR") AS "TOTAL_GASTO",
-	        SUM(CASE WHEN retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct AS main
-        JOIN
-            view_pecas_desconsiderando_combustivel pg 
-        ON
-            main."NUMERO DA OS" = pg."OS"
-        WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_modelos_str}
-            {subquery_oficinas_str}
-            {subquery_secoes_str}
-            {subquery_os_str}
-        GROUP BY
-            year_month
-        ORDER BY
-            year_month;
-        """
-
-        # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
-
-        # Arruma dt
-        df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
-
-        # Computa Perc
-        df["PERC_GASTO_RETRABALHO"] = df["TOTAL_GASTO_RETRABALHO"] / df["TOTAL_GASTO"]
-
-        # Arredonda valores
-        df["TOTAL_GASTO"] = df["TOTAL_GASTO"].round(2)
-        df["TOTAL_GASTO_RETRABALHO"] = df["TOTAL_GASTO_RETRABALHO"].round(2)
-
-        # Funde (melt) colunas de retrabalho e correção dos sintomas
-        df_custo = df.melt(
-            id_vars=["year_month_dt", "PERC_GASTO_RETRABALHO"],
-            value_vars=["TOTAL_GASTO", "TOTAL_GASTO_RETRABALHO"],
-            var_name="CATEGORIA",
-            value_name="GASTO",
-        )
-
-        return df_custo
-
+    @cache_servico(cache_home, termos_all=TERMOS_ALL_HOME)
     def get_top_os_geral_retrabalho(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
         """Função para obter as OSs com mais retrabalho"""
 
@@ -486,16 +411,19 @@ class HomeService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
-        inner_subquery_modelos_str = subquery_modelos(lista_modelos, "main.", termo_all="TODOS")
-        inner_subquery_oficinas_str = subquery_oficinas(lista_oficinas, "main.")
-        inner_subquery_secoes_str = subquery_secoes(lista_secaos, "main.")
-        inner_subquery_os_str = subquery_os(lista_os, "main.")
+        inner_subquery_modelos_str = subquery_modelos(lista_modelos, "main.", termo_all="TODOS", params=params)
+        inner_subquery_oficinas_str = subquery_oficinas(lista_oficinas, "main.", params=params)
+        inner_subquery_secoes_str = subquery_secoes(lista_secaos, "main.", params=params)
+        inner_subquery_os_str = subquery_os(lista_os, "main.", params=params)
 
         query = f"""
         WITH normaliza_problema AS (
@@ -506,9 +434,9 @@ class HomeService:
                 "CODIGO DO VEICULO",
                 "problem_no"
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct
+                {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)}
             WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_modelos_str}
                 {subquery_oficinas_str}
                 {subquery_secoes_str}
@@ -546,7 +474,7 @@ class HomeService:
             100 * ROUND(SUM(CASE WHEN main.correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
             COALESCE(op.num_problema, 0) AS "TOTAL_PROBLEMA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct AS main
+            {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} AS main
         LEFT JOIN
             os_problema op
         ON
@@ -554,7 +482,7 @@ class HomeService:
             AND main."DESCRICAO DA SECAO" = op."DESCRICAO DA SECAO"
             AND main."DESCRICAO DO SERVICO" = op.servico
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -569,7 +497,7 @@ class HomeService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Adiciona campo de relação entre OS e problemas
         df["REL_OS_PROBLEMA"] = round(df["TOTAL_OS"] / df["TOTAL_PROBLEMA"], 2)
@@ -587,13 +515,13 @@ class HomeService:
             100 * ROUND(SUM(CASE WHEN NOT osclass."SOLUTION_HAS_COHERENCE_TO_PROBLEM" THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_SOLUCAO_NAO_COERENTE",
             100 * ROUND(SUM(CASE WHEN osclass."SOLUTION_HAS_COHERENCE_TO_PROBLEM" THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_SOLUCAO_COERENTE"
         FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct AS main
+            {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} AS main
         LEFT JOIN 
             os_dados_classificacao AS osclass
         ON 
             main."KEY_HASH" = osclass."KEY_HASH"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -604,7 +532,7 @@ class HomeService:
             main."DESCRICAO DO SERVICO"
         """
         # Executa a query
-        df_llm = pd.read_sql(query_llm, self.dbEngine)
+        df_llm = le_sql(query_llm, self.dbEngine, params)
 
         # Lida com NaNs
         df_llm = df_llm.fillna(0)
@@ -624,13 +552,13 @@ class HomeService:
             SUM(pg."VALOR") AS "TOTAL_GASTO",
             SUM(CASE WHEN retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct AS main
+            {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} AS main
         JOIN
             view_pecas_desconsiderando_combustivel pg 
         ON
             main."NUMERO DA OS" = pg."OS"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -642,7 +570,7 @@ class HomeService:
         """
 
         # Executa a query
-        df_custo = pd.read_sql(query_custo, self.dbEngine)
+        df_custo = le_sql(query_custo, self.dbEngine, params)
 
         # Arredonda valores
         df_custo["TOTAL_GASTO"] = df_custo["TOTAL_GASTO"].round(2)
@@ -659,11 +587,12 @@ class HomeService:
 
         return df_combinado
 
+    @cache_servico(cache_home, termos_all=TERMOS_ALL_HOME)
     def get_top_os_colaboradores(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
         """Função para obter os colaboradores com mais retrabalho"""
 
-        # Obtem lista de mecânicos
-        df_mecanicos = get_mecanicos(self.dbEngine)
+        # Obtem a dimensão dos colaboradores
+        df_colaboradores = get_dimensao_colaboradores(self.dbEngine)
 
         # Datas
         data_inicio_str = datas[0]
@@ -673,16 +602,19 @@ class HomeService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
-        inner_subquery_modelos_str = subquery_modelos(lista_modelos, "main.", termo_all="TODOS")
-        inner_subquery_oficinas_str = subquery_oficinas(lista_oficinas, "main.")
-        inner_subquery_secoes_str = subquery_secoes(lista_secaos, "main.")
-        inner_subquery_os_str = subquery_os(lista_os, "main.")
+        inner_subquery_modelos_str = subquery_modelos(lista_modelos, "main.", termo_all="TODOS", params=params)
+        inner_subquery_oficinas_str = subquery_oficinas(lista_oficinas, "main.", params=params)
+        inner_subquery_secoes_str = subquery_secoes(lista_secaos, "main.", params=params)
+        inner_subquery_os_str = subquery_os(lista_os, "main.", params=params)
 
         query = f"""
             WITH normaliza_problema AS (
@@ -692,9 +624,9 @@ class HomeService:
                     "CODIGO DO VEICULO",
                     "problem_no"
                 FROM
-                    mat_view_retrabalho_{min_dias}_dias
+                    {get_view_retrabalho(self.dbEngine, min_dias)}
                 WHERE
-                    "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                    "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                     {subquery_modelos_str}
                     {subquery_oficinas_str}
                     {subquery_secoes_str}
@@ -725,13 +657,13 @@ class HomeService:
                 100 * ROUND(SUM(CASE WHEN main.correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
                 COALESCE(cp.num_problema, 0) AS "TOTAL_PROBLEMA"
             FROM
-                mat_view_retrabalho_{min_dias}_dias main
+                {get_view_retrabalho(self.dbEngine, min_dias)} main
             LEFT JOIN
                 colaborador_problema cp
                 ON
                 main."COLABORADOR QUE EXECUTOU O SERVICO" = cp.colaborador
             WHERE
-                main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {inner_subquery_modelos_str}
                 {inner_subquery_oficinas_str}
                 {inner_subquery_secoes_str}
@@ -744,7 +676,7 @@ class HomeService:
         """
 
         # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         df["REL_OS_PROBLEMA"] = round(df["TOTAL_OS"] / df["TOTAL_PROBLEMA"], 2)
 
@@ -752,16 +684,7 @@ class HomeService:
         df["COLABORADOR QUE EXECUTOU O SERVICO"] = df["COLABORADOR QUE EXECUTOU O SERVICO"].astype(int)
 
         # Encontra o nome do colaborador
-        for ix, linha in df.iterrows():
-            colaborador = linha["COLABORADOR QUE EXECUTOU O SERVICO"]
-            nome_colaborador = "Não encontrado"
-            if colaborador in df_mecanicos["cod_colaborador"].values:
-                nome_colaborador = df_mecanicos[df_mecanicos["cod_colaborador"] == colaborador]["nome_colaborador"].values[0]
-                nome_colaborador = re.sub(r"(?<!^)([A-Z])", r" \1", nome_colaborador)
-
-            df.at[ix, "LABEL_COLABORADOR"] = f"{nome_colaborador} - {int(colaborador)}"
-            df.at[ix, "NOME_COLABORADOR"] = f"{nome_colaborador}"
-            df.at[ix, "ID_COLABORADOR"] = int(colaborador)
+        adiciona_nome_colaborador(df, df_colaboradores)
 
         # Novo DF com notas LLM
         query_llm = f"""
@@ -770,13 +693,13 @@ class HomeService:
             AVG(osclass."SCORE_SOLUTION_TEXT_QUALITY") AS "NOTA_MEDIA_SOLUCAO",
             100 * ROUND(SUM(CASE WHEN osclass."SOLUTION_HAS_COHERENCE_TO_PROBLEM" THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_SOLUCAO_COERENTE"
         FROM
-            mat_view_retrabalho_{min_dias}_dias main
+            {get_view_retrabalho(self.dbEngine, min_dias)} main
         LEFT JOIN 
             os_dados_classificacao AS osclass
         ON 
             main."KEY_HASH" = osclass."KEY_HASH"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -786,7 +709,7 @@ class HomeService:
         """
 
         # Executa a query
-        df_llm = pd.read_sql(query_llm, self.dbEngine)
+        df_llm = le_sql(query_llm, self.dbEngine, params)
 
         # Arruma tipo
         df_llm["COLABORADOR QUE EXECUTOU O SERVICO"] = df_llm["COLABORADOR QUE EXECUTOU O SERVICO"].astype(int)
@@ -807,13 +730,13 @@ class HomeService:
             SUM(pg."VALOR") AS "TOTAL_GASTO",
             SUM(CASE WHEN retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias main
+            {get_view_retrabalho(self.dbEngine, min_dias)} main
         JOIN
             view_pecas_desconsiderando_combustivel pg 
         ON
             main."NUMERO DA OS" = pg."OS"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -823,7 +746,7 @@ class HomeService:
         """
 
         # Executa a query
-        df_custo = pd.read_sql(query_custo, self.dbEngine)
+        df_custo = le_sql(query_custo, self.dbEngine, params)
 
         # Arruma tipo
         df_custo["COLABORADOR QUE EXECUTOU O SERVICO"] = df_custo["COLABORADOR QUE EXECUTOU O SERVICO"].astype(int)
@@ -848,13 +771,13 @@ class HomeService:
             SUM(od."TEMPO PADRAO") AS "TOTAL_TEMPO",
             SUM(CASE WHEN retrabalho THEN od."TEMPO PADRAO" ELSE NULL END) AS "TOTAL_TEMPO_RETRABALHO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias main
+            {get_view_retrabalho(self.dbEngine, min_dias)} main
         JOIN
             os_dados od
         ON
             main."KEY_HASH" = od."KEY_HASH"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -864,7 +787,7 @@ class HomeService:
         """
 
         # Executa a query
-        df_tempo = pd.read_sql(query_tempo, self.dbEngine)
+        df_tempo = le_sql(query_tempo, self.dbEngine, params)
 
         # Arredonda valores
         df_tempo["TOTAL_TEMPO"] = df_tempo["TOTAL_TEMPO"].round(2)
@@ -884,6 +807,7 @@ class HomeService:
 
         return df_combinado
 
+    @cache_servico(cache_home, termos_all=TERMOS_ALL_HOME)
     def get_top_veiculos(self, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
         """Função para obter os veículos  com mais retrabalho"""
 
@@ -895,16 +819,19 @@ class HomeService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
-        inner_subquery_modelos_str = subquery_modelos(lista_modelos, "main.", termo_all="TODOS")
-        inner_subquery_oficinas_str = subquery_oficinas(lista_oficinas, "main.")
-        inner_subquery_secoes_str = subquery_secoes(lista_secaos, "main.")
-        inner_subquery_os_str = subquery_os(lista_os, "main.")
+        inner_subquery_modelos_str = subquery_modelos(lista_modelos, "main.", termo_all="TODOS", params=params)
+        inner_subquery_oficinas_str = subquery_oficinas(lista_oficinas, "main.", params=params)
+        inner_subquery_secoes_str = subquery_secoes(lista_secaos, "main.", params=params)
+        inner_subquery_os_str = subquery_os(lista_os, "main.", params=params)
 
         query = f"""
             WITH normaliza_problema AS (
@@ -913,9 +840,9 @@ class HomeService:
                     "CODIGO DO VEICULO" AS cod_veiculo,
                     "problem_no"
                 FROM
-                    mat_view_retrabalho_{min_dias}_dias_distinct
+                    {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)}
                 WHERE
-                    "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                    "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                     {subquery_modelos_str}
                     {subquery_oficinas_str}
                     {subquery_secoes_str}
@@ -948,14 +875,14 @@ class HomeService:
                 100 * ROUND(SUM(CASE WHEN main.correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
                 COALESCE(op.num_problema, 0) AS "TOTAL_PROBLEMA"
             FROM
-                mat_view_retrabalho_{min_dias}_dias_distinct main
+                {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} main
             LEFT JOIN
                 os_problema op
             ON
                 main."DESCRICAO DO MODELO" = op."DESCRICAO DO MODELO"
                 AND main."CODIGO DO VEICULO" = op.cod_veiculo
             WHERE
-                main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {inner_subquery_modelos_str}
                 {inner_subquery_oficinas_str}
                 {inner_subquery_secoes_str}
@@ -969,7 +896,7 @@ class HomeService:
         """
 
         # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         df["REL_OS_PROBLEMA"] = round(df["TOTAL_OS"] / df["TOTAL_PROBLEMA"], 2)
 
@@ -980,13 +907,13 @@ class HomeService:
             AVG(osclass."SCORE_SOLUTION_TEXT_QUALITY") AS "NOTA_MEDIA_SOLUCAO",
             100 * ROUND(SUM(CASE WHEN osclass."SOLUTION_HAS_COHERENCE_TO_PROBLEM" THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_SOLUCAO_COERENTE"
         FROM
-            mat_view_retrabalho_{min_dias}_dias main
+            {get_view_retrabalho(self.dbEngine, min_dias)} main
         LEFT JOIN 
             os_dados_classificacao AS osclass
         ON 
             main."KEY_HASH" = osclass."KEY_HASH"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -996,7 +923,7 @@ class HomeService:
         """
 
         # Executa a query
-        df_llm = pd.read_sql(query_llm, self.dbEngine)
+        df_llm = le_sql(query_llm, self.dbEngine, params)
 
         # Lida com NaNs
         df_llm = df_llm.fillna(0)
@@ -1014,13 +941,13 @@ class HomeService:
             SUM(pg."VALOR") AS "TOTAL_GASTO",
             SUM(CASE WHEN retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias_distinct main
+            {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} main
         JOIN
             view_pecas_desconsiderando_combustivel pg 
         ON
             main."NUMERO DA OS" = pg."OS"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {inner_subquery_modelos_str}
             {inner_subquery_oficinas_str}
             {inner_subquery_secoes_str}
@@ -1030,7 +957,7 @@ class HomeService:
         """
 
         # Executa a query
-        df_custo = pd.read_sql(query_custo, self.dbEngine)
+        df_custo = le_sql(query_custo, self.dbEngine, params)
 
         # Arredonda valores
         df_custo["TOTAL_GASTO"] = df_custo["TOTAL_GASTO"].round(2)
@@ -6,36 +6,74 @@
 # Imports básicos
 import pandas as pd
 import numpy as np
-import re
 
 # Imports auxiliares
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos
-from modules.service_utils import definir_status, definir_status_label, definir_emoji_status
+from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos, le_sql, colunas_sql
+from modules.service_utils import adiciona_status_os, COLUNAS_STATUS_OS
+from modules.entities_utils import formata_nome_colaborador
+from modules.cache_utils import CacheResultados, cache_servico
+from modules.views_retrabalho_utils import get_view_retrabalho
 
 # Imports do tema
 import tema
 
+# Cache compartilhado pelos callbacks da página de detalhamento de OS
+cache_os = CacheResultados("os")
+
+# Colunas lidas por tabela (apelido) no detalhamento da OS (cards, gantt e tabela da página de detalhamento de OS)
+COLUNAS_DETALHAMENTO_OS = {
+    "m": [
+        "problem_no",
+        *COLUNAS_STATUS_OS,
+        "next_days",
+        "NUMERO DA OS",
+        "CODIGO DO VEICULO",
+        "DESCRICAO DO MODELO",
+        "DESCRICAO DO SERVICO",
+        "COLABORADOR QUE EXECUTOU O SERVICO",
+        "DATA DA ABERTURA DA OS",
+        "DATA DO FECHAMENTO DA OS",
+    ],
+    "odc": [
+        "SINTOMA",
+        "CORRECAO",
+        "SCORE_SYMPTOMS_TEXT_QUALITY",
+        "SCORE_SOLUTION_TEXT_QUALITY",
+        "WHY_SOLUTION_IS_PROBLEM",
+    ],
+    "p": ["total_valor", "pecas_valor_str", "pecas_trocadas_str"],
+    "cfo": ["nome_colaborador"],
+}
+
 
 class OSService:
     def __init__(self, dbEngine):
         self.pgEngine = dbEngine
 
+    @cache_servico(cache_os)
     def os_existe(self, os_numero, min_dias):
         """Verifica se a OS existe"""
+        # Parâmetros da query
+        params = {"os_numero": os_numero}
+
         query = f"""
         SELECT 
             1
         FROM 
-            mat_view_retrabalho_{min_dias}_dias m
+            {get_view_retrabalho(self.pgEngine, min_dias)} m
         WHERE 
-            m."NUMERO DA OS" = '{os_numero}'
+            m."NUMERO DA OS" = :os_numero
         """
-        df_os_existe = pd.read_sql(query, self.pgEngine)
+        df_os_existe = le_sql(query, self.pgEngine, params)
 
         return not df_os_existe.empty
 
+    @cache_servico(cache_os)
     def obtem_detalhamento_os(self, os_numero, min_dias):
         """Retorna dados de detalhamento de uma OS específica"""
+        # Parâmetros da query
+        params = {"os_numero": os_numero}
+
         # Query
         query = f"""
         WITH 
@@ -56,53 +94,41 @@ class OSService:
                 "DESCRICAO DO SERVICO",
                 "CODIGO DO VEICULO"
             FROM 
-                mat_view_retrabalho_{min_dias}_dias_distinct m
+                {get_view_retrabalho(self.pgEngine, min_dias, distinct=True)} m
             WHERE 
-                m."NUMERO DA OS" = '{os_numero}'
+                m."NUMERO DA OS" = :os_numero
         ),
         os_correlatas AS (
             SELECT
                 todas.*
             FROM 
-                mat_view_retrabalho_{min_dias}_dias todas
+                {get_view_retrabalho(self.pgEngine, min_dias)} todas
             JOIN 
                 os_alvo alvo
             ON
                 todas."CODIGO DO VEICULO" = alvo."CODIGO DO VEICULO"
             AND todas."DESCRICAO DO SERVICO" = alvo."DESCRICAO DO SERVICO"
-        ),
-        os_avaliadas AS (
-            SELECT
-                *
-            FROM
-                os_correlatas m
-            LEFT JOIN 
-                os_dados_classificacao odc
-            ON 
-                m."KEY_HASH" = odc."KEY_HASH" 
-        ),
-        os_avaliadas_com_pecas AS (
-            SELECT 
-                *
-            FROM 
-                os_avaliadas os
-            LEFT JOIN 
-                pecas_agg p
-            ON 
-                os."NUMERO DA OS" = p."OS"
         )
         SELECT 
-            *
-        FROM 
-            os_avaliadas_com_pecas os
+            {colunas_sql(COLUNAS_DETALHAMENTO_OS)}
+        FROM
+            os_correlatas m
+        LEFT JOIN 
+            os_dados_classificacao odc
+        ON 
+            m."KEY_HASH" = odc."KEY_HASH" 
+        LEFT JOIN 
+            pecas_agg p
+        ON 
+            m."NUMERO DA OS" = p."OS"
         LEFT JOIN 
             colaboradores_frotas_os cfo 
         ON 
-            os."COLABORADOR QUE EXECUTOU O SERVICO" = cfo.cod_colaborador
+            m."COLABORADOR QUE EXECUTOU O SERVICO" = cfo.cod_colaborador
         ORDER BY
-            os."DATA DA ABERTURA DA OS" DESC
+            m."DATA DA ABERTURA DA OS" DESC
         """
-        df_os_detalhada = pd.read_sql(query, self.pgEngine)
+        df_os_detalhada = le_sql(query, self.pgEngine, params)
 
         # Formata datas de abertura
         df_os_detalhada["DATA DA ABERTURA DA OS DT"] = pd.to_datetime(
@@ -131,9 +157,7 @@ class OSService:
 
         # Preenche valores nulos do colaborador
         df_os_detalhada["nome_colaborador"] = df_os_detalhada["nome_colaborador"].fillna("Não Informado")
-        df_os_detalhada["nome_colaborador"] = df_os_detalhada["nome_colaborador"].apply(
-            lambda x: re.sub(r"(?<!^)([A-Z])", r" \1", x)
-        )
+        df_os_detalhada["nome_colaborador"] = formata_nome_colaborador(df_os_detalhada["nome_colaborador"])
 
         # Preenche valores nulos de peças
         df_os_detalhada["total_valor"] = df_os_detalhada["total_valor"].fillna(0)
@@ -148,9 +172,7 @@ class OSService:
         df_os_detalhada["CORRECAO"] = df_os_detalhada["CORRECAO"].fillna("Não Informado")
 
         # Aplica a função para definir o status de cada OS
-        df_os_detalhada["status_os"] = df_os_detalhada.apply(definir_status, axis=1)
-        df_os_detalhada["status_os_label"] = df_os_detalhada.apply(definir_status_label, axis=1)
-        df_os_detalhada["status_os_emoji"] = df_os_detalhada.apply(definir_emoji_status, axis=1)
+        adiciona_status_os(df_os_detalhada)
 
         return df_os_detalhada
 
@@ -203,17 +225,21 @@ class OSService:
         # Retorna o df agregado
         return df_agg_problema_alvo
 
+    @cache_servico(cache_os)
     def obtem_asset_id_veiculo(self, vec_codigo_id):
         """Retorna o AssetId do veículo com base no código do veículo"""
-        query = f"""
+        # Parâmetros da query
+        params = {"vec_codigo_id": vec_codigo_id}
+
+        query = """
                 SELECT 
                     va."AssetId"
                 FROM veiculos_api va
                 WHERE 
-                    va."Description" = '{vec_codigo_id}'
+                    va."Description" = :vec_codigo_id
                 LIMIT 1;
             """
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         if not df.empty:
             return df.iloc[0]["AssetId"]
@@ -222,19 +248,22 @@ class OSService:
 
     def obtem_odometro_veiculo(self, vec_asset_id, data_inicio_str, data_fim_str):
         """Retorna dados de odômetro do veículo ao longo do tempo com base nos dados das trips"""
-        query = f"""
+        # Parâmetros da query
+        params = {"vec_asset_id": vec_asset_id, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
+        query = """
             SELECT 
                 ("TripStart"::timestamptz AT TIME ZONE 'America/Sao_Paulo')::date AS travel_date,
                 COUNT(*) AS trip_count,
                 SUM("DistanceKilometers") AS distance_km
             FROM trips_api ta
             WHERE 
-                ta."AssetId" = '{vec_asset_id}'
-                AND ("TripStart"::timestamptz AT TIME ZONE 'America/Sao_Paulo') BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                ta."AssetId" = :vec_asset_id
+                AND ("TripStart"::timestamptz AT TIME ZONE 'America/Sao_Paulo') BETWEEN :data_inicio AND :data_fim
             GROUP BY travel_date
             ORDER BY travel_date;
         """
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Seta a classe
         df["CLASSE"] = "KM Percorrido"
@@ -245,19 +274,22 @@ class OSService:
 
     def obtem_consumo_veiculo(self, vec_asset_id, data_inicio_str, data_fim_str):
         """Retorna dados de consumo do veículo ao longo do tempo com base nos dados das trips"""
-        query = f"""
+        # Parâmetros da query
+        params = {"vec_asset_id": vec_asset_id, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
+        query = """
             SELECT 
                 ("TripStart"::timestamptz AT TIME ZONE 'America/Sao_Paulo')::date AS travel_date,
                 COUNT(*) AS trip_count,
                 SUM("FuelUsedLitres") AS consumo_litros
             FROM trips_api ta
             WHERE 
-                ta."AssetId" = '{vec_asset_id}'
-                AND ("TripStart"::timestamptz AT TIME ZONE 'America/Sao_Paulo') BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                ta."AssetId" = :vec_asset_id
+                AND ("TripStart"::timestamptz AT TIME ZONE 'America/Sao_Paulo') BETWEEN :data_inicio AND :data_fim
             GROUP BY travel_date
             ORDER BY travel_date;
         """
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Seta a classe
         df["CLASSE"] = "Consumo (L)"
@@ -268,6 +300,9 @@ class OSService:
 
     def obtem_historico_evento_veiculo(self, vec_asset_id, event_name, data_inicio_str, data_fim_str):
         """Retorna dados de eventos do veículo ao longo do tempo"""
+        # Parâmetros da query
+        params = {"vec_asset_id": vec_asset_id, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         query = f"""
             SELECT 
                 "AssetId", DATE("StartDateTime"::timestamptz AT TIME ZONE 'America/Sao_Paulo') AS travel_date,
@@ -275,16 +310,16 @@ class OSService:
             FROM 
                 public.{event_name} 
             WHERE 
-                "AssetId" = '{vec_asset_id}'
+                "AssetId" = :vec_asset_id
                 AND 
                 "StartDateTime" IS NOT NULL
                 AND "StartDateTime"::text NOT ILIKE 'NaN'
                 AND ("StartDateTime"::timestamptz AT TIME ZONE 'America/Sao_Paulo')
-                    BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                    BETWEEN :data_inicio AND :data_fim
             GROUP BY "AssetId", travel_date;
 
         """
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Seta a classe
         df["CLASSE"] = event_name
@@ -294,6 +329,9 @@ class OSService:
         return df
 
     def obtem_detalhamento_evento_os(self, vec_asset_id, event_name, data_inicio_str, data_fim_str):
+        # Parâmetros da query
+        params = {"vec_asset_id": vec_asset_id, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         query = f"""
             SELECT
             *
@@ -302,14 +340,14 @@ class OSService:
             LEFT JOIN motoristas_api ma 
                 on evt."DriverId" = ma."DriverId" 
             WHERE
-                "AssetId" = '{vec_asset_id}'
+                "AssetId" = :vec_asset_id
                 AND
                 "StartDateTime" IS NOT NULL
                 AND "StartDateTime"::text NOT ILIKE 'NaN'
                 AND ("StartDateTime"::timestamptz AT TIME ZONE 'America/Sao_Paulo')
-                    BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                    BETWEEN :data_inicio AND :data_fim
         """
-        df = pd.read_sql(query, self.pgEngine)
+        df = le_sql(query, self.pgEngine, params)
 
         # Seta nome não conhecido para os motoristas que não tiverem dado
         df["Name"] = df["Name"].fillna("Não informado")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Métricas do pool de conexões com o banco (uma instância por processo/worker)
+
+# Imports básicos
+import os
+import time
+from threading import Lock
+
+# Imports do SQLAlchemy
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Esperas (em ms) por uma conexão acima deste limite são registradas no log
+DB_POOL_ESPERA_LOG_MS = float(os.getenv("DB_POOL_ESPERA_LOG_MS", 500))
+
+# Limites (em segundos) das faixas do histograma de espera por conexão
+FAIXAS_ESPERA_SEGUNDOS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30]
+
+
+##############################################################################
+# MÉTRICAS ###################################################################
+##############################################################################
+class MetricasPool:
+    """Acumula o tempo de espera por conexões do pool (histograma) e o número de timeouts"""
+
+    def __init__(self, faixas_segundos=FAIXAS_ESPERA_SEGUNDOS):
+        self.faixas_segundos = faixas_segundos
+
+        self._lock = Lock()
+        self._contagem_faixas = [0] * len(faixas_segundos)
+        self._total_esperas = 0
+        self._soma_esperas_segundos = 0.0
+        self._max_espera_segundos = 0.0
+        self._total_timeouts = 0
+
+    def reinicia(self):
+        """Zera as métricas (ex: no worker recém-criado, que herda as métricas do processo mestre)"""
+        with self._lock:
+            self._contagem_faixas = [0] * len(self.faixas_segundos)
+            self._total_esperas = 0
+            self._soma_esperas_segundos = 0.0
+            self._max_espera_segundos = 0.0
+            self._total_timeouts = 0
+
+    def registra_espera(self, espera_segundos):
+        """Registra o tempo que uma requisição esperou para obter uma conexão"""
+        with self._lock:
+            self._total_esperas += 1
+            self._soma_esperas_segundos += espera_segundos
+            self._max_espera_segundos = max(self._max_espera_segundos, espera_segundos)
+            for i, limite in enumerate(self.faixas_segundos):
+                if espera_segundos <= limite:
+                    self._contagem_faixas[i] += 1
+                    break
+
+    def registra_timeout(self):
+        """Registra uma requisição que desistiu de esperar por uma conexão (pool_timeout)"""
+        with self._lock:
+            self._total_timeouts += 1
+
+    def estatisticas(self):
+        """Retorna uma cópia das métricas acumuladas (faixas do histograma já acumuladas)"""
+        with self._lock:
+            acumulado = 0
+            faixas = []
+            for limite, contagem in zip(self.faixas_segundos, self._contagem_faixas):
+                acumulado += contagem
+                faixas.append((limite, acumulado))
+
+            return {
+                "faixas": faixas,
+                "total_esperas": self._total_esperas,
+                "soma_esperas_segundos": self._soma_esperas_segundos,
+                "max_espera_segundos": self._max_espera_segundos,
+                "total_timeouts": self._total_timeouts,
+            }
+
+
+# Métricas do processo (o pool é recriado em cada worker, mas as métricas são do processo)
+metricas_pool = MetricasPool()
+
+
+class QueuePoolInstrumentado(QueuePool):
+    """QueuePool que mede o tempo de espera por conexão e registra no log as esperas longas"""
+
+    def connect(self):
+        inicio = time.perf_counter()
+        try:
+            conexao = super().connect()
+        except PoolTimeoutError:
+            metricas_pool.registra_timeout()
+            print(f"Timeout ao obter conexão do pool após {time.perf_counter() - inicio:.1f} s ({self.status()})")
+            raise
+
+        espera_segundos = time.perf_counter() - inicio
+        metricas_pool.registra_espera(espera_segundos)
+        if espera_segundos * 1000 > DB_POOL_ESPERA_LOG_MS:
+            print(f"Espera de {espera_segundos * 1000:.0f} ms para obter conexão do pool ({self.status()})")
+
+        return conexao
+
+
+##############################################################################
+# ENDPOINT ###################################################################
+##############################################################################
+def estatisticas_pool(dbEngine):
+    """Retorna o estado atual do pool da engine e as métricas acumuladas do processo"""
+    pool = dbEngine.pool
+    estatisticas = metricas_pool.estatisticas()
+    estatisticas.update(
+        {
+            "tamanho": pool.size(),
+            "em_uso": pool.checkedout(),
+            "livres": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+    )
+
+    return estatisticas
+
+
+def gera_texto_metricas(dbEngine):
+    """Gera as métricas do pool no formato texto do Prometheus (rótulo pid identifica o worker)"""
+    e = estatisticas_pool(dbEngine)
+    rotulo = f'pid="{os.getpid()}"'
+
+    linhas = [
+        "# HELP ra_dash_db_pool_tamanho Número de conexões fixas do pool",
+        "# TYPE ra_dash_db_pool_tamanho gauge",
+        f"ra_dash_db_pool_tamanho{{{rotulo}}} {e['tamanho']}",
+        "# HELP ra_dash_db_pool_em_uso Conexões emprestadas no momento",
+        "# TYPE ra_dash_db_pool_em_uso gauge",
+        f"ra_dash_db_pool_em_uso{{{rotulo}}} {e['em_uso']}",
+        "# HELP ra_dash_db_pool_livres Conexões ociosas no pool",
+        "# TYPE ra_dash_db_pool_livres gauge",
+        f"ra_dash_db_pool_livres{{{rotulo}}} {e['livres']}",
+        "# HELP ra_dash_db_pool_overflow Conexões abertas além do tamanho do pool",
+        "# TYPE ra_dash_db_pool_overflow gauge",
+        f"ra_dash_db_pool_overflow{{{rotulo}}} {e['overflow']}",
+        "# HELP ra_dash_db_pool_timeouts_total Requisições que não obtiveram conexão dentro do pool_timeout",
+        "# TYPE ra_dash_db_pool_timeouts_total counter",
+        f"ra_dash_db_pool_timeouts_total{{{rotulo}}} {e['total_timeouts']}",
+        "# HELP ra_dash_db_pool_espera_segundos Tempo de espera para obter uma conexão do pool",
+        "# TYPE ra_dash_db_pool_espera_segundos histogram",
+    ]
+    for limite, acumulado in e["faixas"]:
+        linhas.append(f'ra_dash_db_pool_espera_segundos_bucket{{{rotulo},le="{limite}"}} {acumulado}')
+    linhas += [
+        f'ra_dash_db_pool_espera_segundos_bucket{{{rotulo},le="+Inf"}} {e["total_esperas"]}',
+        f"ra_dash_db_pool_espera_segundos_sum{{{rotulo}}} {e['soma_esperas_segundos']:.6f}",
+        f"ra_dash_db_pool_espera_segundos_count{{{rotulo}}} {e['total_esperas']}",
+    ]
+
+    return "\n".join(linhas) + "\n"
+
+
+def registra_rota_metricas(server, dbEngine, rota="/metrics"):
+    """Adiciona ao servidor Flask a rota com as métricas do pool (protegida pela mesma autenticação do painel)"""
+
+    def metricas():
+        return gera_texto_metricas(dbEngine), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+    server.add_url_rule(rota, "metricas", metricas)
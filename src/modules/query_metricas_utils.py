@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Medição das queries executadas pelos serviços (tempo no banco, tempo de montagem do DataFrame e linhas retornadas)
+
+# Imports básicos
+import os
+import re
+import sys
+import time
+import hashlib
+import threading
+from collections import deque
+from datetime import datetime
+from threading import Lock
+
+# Imports do SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+##############################################################################
+# CONFIGURAÇÕES ##############################################################
+##############################################################################
+# Queries com tempo total (banco + DataFrame) acima deste limite (em ms) são registradas no log de queries lentas
+QUERY_LENTA_LOG_MS = float(os.getenv("QUERY_LENTA_LOG_MS", 1000))
+
+# Número de queries lentas mantidas em memória (as mais recentes) para a página de administração
+QUERY_LENTA_MAX_REGISTROS = int(os.getenv("QUERY_LENTA_MAX_REGISTROS", 200))
+
+# Tamanho máximo do texto da query (e dos parâmetros) guardado nas estatísticas
+TAMANHO_MAX_TEXTO_QUERY = 2000
+
+# Módulos e funções que apenas executam a query (a origem é quem os chamou)
+MODULOS_EXECUTORES = {"modules.query_metricas_utils", "modules.sql_utils"}
+FUNCOES_EXECUTORAS = {"le_view_dimensao"}
+
+
+##############################################################################
+# TEMPO NO BANCO #############################################################
+##############################################################################
+# Tempo acumulado nos cursores durante a medição em andamento na thread (None fora de uma medição)
+_medicao_thread = threading.local()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _inicio_cursor(conn, cursor, statement, parameters, context, executemany):
+    conn.info["inicio_cursor"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _fim_cursor(conn, cursor, statement, parameters, context, executemany):
+    inicio = conn.info.pop("inicio_cursor", None)
+    if inicio is not None and getattr(_medicao_thread, "tempo_banco", None) is not None:
+        _medicao_thread.tempo_banco += time.perf_counter() - inicio
+
+
+##############################################################################
+# IDENTIFICAÇÃO DAS QUERIES ##################################################
+##############################################################################
+def normaliza_query(query):
+    """Remove comentários e espaços repetidos e troca os literais por ? (mesma query com valores diferentes -> mesmo texto)"""
+    query = re.sub(r"--[^\n]*", " ", str(query))
+    query = re.sub(r"'(?:[^']|'')*'", "?", query)
+    query = re.sub(r"(?<![\w\"])\d+(?:\.\d+)?\b", "?", query)
+    query = re.sub(r"\s+", " ", query).strip()
+
+    return query
+
+
+def fingerprint_query(query_normalizada):
+    """Identificador curto da query normalizada"""
+    return hashlib.sha1(query_normalizada.encode("utf-8")).hexdigest()[:12]
+
+
+def origem_query():
+    """Retorna o método (Classe.metodo) ou a função (modulo.funcao) que executou a query"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        modulo = frame.f_globals.get("__name__", "")
+        codigo = frame.f_code
+        if (
+            modulo not in MODULOS_EXECUTORES
+            and not modulo.startswith("pandas")
+            and codigo.co_name not in FUNCOES_EXECUTORAS
+        ):
+            nome = getattr(codigo, "co_qualname", codigo.co_name).replace(".<locals>", "")
+            if "." not in nome:
+                nome = f"{modulo.rsplit('.', 1)[-1]}.{nome}"
+            return nome
+        frame = frame.f_back
+
+    return "desconhecida"
+
+
+##############################################################################
+# MÉTRICAS ###################################################################
+##############################################################################
+class MetricasQueries:
+    """Acumula as estatísticas por (origem, fingerprint) e guarda as últimas queries lentas"""
+
+    def __init__(self, limite_lenta_ms=QUERY_LENTA_LOG_MS, max_registros_lentas=QUERY_LENTA_MAX_REGISTROS):
+        self.limite_lenta_ms = limite_lenta_ms
+
+        self._lock = Lock()
+        self._estatisticas = {}
+        self._lentas = deque(maxlen=max_registros_lentas)
+
+    def reinicia(self):
+        """Zera as métricas (ex: no worker recém-criado, que herda as métricas do processo mestre)"""
+        with self._lock:
+            self._estatisticas.clear()
+            self._lentas.clear()
+
+    def registra(self, origem, query, params, linhas, tempo_banco_ms, tempo_dataframe_ms, erro=None):
+        """Registra uma execução de query"""
+        query_normalizada = normaliza_query(query)
+        fingerprint = fingerprint_query(query_normalizada)
+        tempo_total_ms = tempo_banco_ms + tempo_dataframe_ms
+
+        with self._lock:
+            e = self._estatisticas.get((origem, fingerprint))
+            if e is None:
+                e = {
+                    "origem": origem,
+                    "fingerprint": fingerprint,
+                    "query": query_normalizada[:TAMANHO_MAX_TEXTO_QUERY],
+                    "execucoes": 0,
+                    "erros": 0,
+                    "lentas": 0,
+                    "linhas_total": 0,
+                    "linhas_max": 0,
+                    "tempo_banco_total_ms": 0.0,
+                    "tempo_banco_max_ms": 0.0,
+                    "tempo_dataframe_total_ms": 0.0,
+                    "tempo_dataframe_max_ms": 0.0,
+                    "tempo_total_max_ms": 0.0,
+                    "ultima_execucao": None,
+                }
+                self._estatisticas[(origem, fingerprint)] = e
+
+            e["execucoes"] += 1
+            e["erros"] += erro is not None
+            e["linhas_total"] += linhas
+            e["linhas_max"] = max(e["linhas_max"], linhas)
+            e["tempo_banco_total_ms"] += tempo_banco_ms
+            e["tempo_banco_max_ms"] = max(e["tempo_banco_max_ms"], tempo_banco_ms)
+            e["tempo_dataframe_total_ms"] += tempo_dataframe_ms
+            e["tempo_dataframe_max_ms"] = max(e["tempo_dataframe_max_ms"], tempo_dataframe_ms)
+            e["tempo_total_max_ms"] = max(e["tempo_total_max_ms"], tempo_total_ms)
+            e["ultima_execucao"] = datetime.now().isoformat(timespec="seconds")
+
+            lenta = tempo_total_ms >= self.limite_lenta_ms
+            if lenta:
+                e["lentas"] += 1
+                self._lentas.append(
+                    {
+                        "data": e["ultima_execucao"],
+                        "origem": origem,
+                        "fingerprint": fingerprint,
+                        "linhas": linhas,
+                        "tempo_banco_ms": round(tempo_banco_ms, 1),
+                        "tempo_dataframe_ms": round(tempo_dataframe_ms, 1),
+                        "tempo_total_ms": round(tempo_total_ms, 1),
+                        "params": repr(params)[:TAMANHO_MAX_TEXTO_QUERY] if params else "",
+                        "erro": str(erro)[:TAMANHO_MAX_TEXTO_QUERY] if erro is not None else "",
+                    }
+                )
+
+        if lenta:
+            print(
+                f"Query lenta ({tempo_total_ms:.0f} ms: banco {tempo_banco_ms:.0f} ms, DataFrame {tempo_dataframe_ms:.0f} ms, "
+                f"{linhas} linhas) em {origem} [{fingerprint}]"
+            )
+
+    def estatisticas(self):
+        """Retorna as estatísticas por query (com as médias), ordenadas pelo tempo total acumulado"""
+        with self._lock:
+            lista = [dict(e) for e in self._estatisticas.values()]
+
+        for e in lista:
+            e["tempo_total_ms"] = e["tempo_banco_total_ms"] + e["tempo_dataframe_total_ms"]
+            e["tempo_banco_medio_ms"] = e["tempo_banco_total_ms"] / e["execucoes"]
+            e["tempo_dataframe_medio_ms"] = e["tempo_dataframe_total_ms"] / e["execucoes"]
+            e["linhas_media"] = e["linhas_total"] / e["execucoes"]
+
+        return sorted(lista, key=lambda e: e["tempo_total_ms"], reverse=True)
+
+    def queries_lentas(self):
+        """Retorna as queries lentas registradas, da mais recente para a mais antiga"""
+        with self._lock:
+            return list(reversed(self._lentas))
+
+
+# Métricas do processo (cada worker do gunicorn possui as suas)
+metricas_queries = MetricasQueries()
+
+
+##############################################################################
+# EXECUÇÃO ###################################################################
+##############################################################################
+def executa_query_medida(funcao_le, query, params=None, origem=None):
+    """
+    Executa funcao_le (que lê a query e retorna um DataFrame) medindo o tempo gasto no banco (execução dos cursores)
+    e o tempo restante, gasto na montagem do DataFrame. Registra a execução em metricas_queries.
+    """
+    if origem is None:
+        origem = origem_query()
+
+    tempo_banco_anterior = getattr(_medicao_thread, "tempo_banco", None)
+    _medicao_thread.tempo_banco = 0.0
+
+    inicio = time.perf_counter()
+    df = None
+    erro = None
+    try:
+        df = funcao_le()
+        return df
+    except Exception as e:
+        erro = e
+        raise
+    finally:
+        tempo_total = time.perf_counter() - inicio
+        tempo_banco = min(_medicao_thread.tempo_banco, tempo_total)
+        # Em medições aninhadas, o tempo no banco também é somado à medição externa
+        _medicao_thread.tempo_banco = None if tempo_banco_anterior is None else tempo_banco_anterior + tempo_banco
+
+        metricas_queries.registra(
+            origem,
+            query,
+            params,
+            len(df) if df is not None else 0,
+            tempo_banco * 1000,
+            (tempo_total - tempo_banco) * 1000,
+            erro,
+        )
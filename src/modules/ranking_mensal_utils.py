@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Funções para montar os rankings de um período a partir dos agregados mensais (ver sql/003_rankings_mensais.sql)
+
+# Imports básicos
+import pandas as pd
+
+# Imports auxiliares
+from modules.sql_utils import registra_parametro, le_sql
+from modules.views_retrabalho_utils import view_existe
+
+##############################################################################
+# MÉTRICAS ###################################################################
+##############################################################################
+# Expressões das métricas de peças de uma linha (alias main) das views de retrabalho
+SQL_GASTO_PECAS_LINHA = """(
+    SELECT SUM(pg."VALOR") FROM view_pecas_desconsiderando_combustivel pg WHERE pg."OS" = main."NUMERO DA OS"
+)"""
+SQL_QUANTIDADE_PECAS_LINHA = """(
+    SELECT COUNT(pg."OS") FROM view_pecas_desconsiderando_combustivel pg WHERE pg."OS" = main."NUMERO DA OS"
+)"""
+
+
+##############################################################################
+# PERÍODO ####################################################################
+##############################################################################
+def periodo_meses_completos(data_inicio_str, data_fim_str):
+    """
+    Retorna o primeiro dia do primeiro mês e o primeiro dia após o último mês (YYYY-MM-DD) inteiramente contidos
+    no filtro "DATA" BETWEEN data_inicio AND data_fim, ou None se nenhum mês estiver inteiramente contido
+    """
+    data_inicio = pd.to_datetime(data_inicio_str)
+    inicio_mes = data_inicio.to_period("M").start_time
+    if data_inicio != inicio_mes:
+        inicio_mes = inicio_mes + pd.DateOffset(months=1)
+
+    # As datas são texto ISO com hora, logo as OSs do dia data_fim (após 00:00:00) ficam fora do filtro
+    fim_mes = pd.to_datetime(data_fim_str).to_period("M").start_time
+
+    if inicio_mes >= fim_mes:
+        return None
+
+    return inicio_mes.strftime("%Y-%m-%d"), fim_mes.strftime("%Y-%m-%d")
+
+
+##############################################################################
+# PARCIAIS ###################################################################
+##############################################################################
+def subquery_parciais_mensais(
+    colunas_chave, metricas, view_linhas, view_mensal, periodo_mensal, filtros, params, coluna_data="DATA DO FECHAMENTO DA OS"
+):
+    """
+    Gera a query com as métricas parciais do período: as linhas de view_mensal dos meses completos (periodo_mensal)
+    e as métricas calculadas linha a linha em view_linhas (alias main) para os demais dias do período.
+    metricas é uma lista de (nome, expressão SQL da métrica de uma linha); basta somar os parciais por colunas_chave.
+    Sem view_mensal ou periodo_mensal, todo o período é lido de view_linhas (com as subqueries correlacionadas de cada
+    linha, mais lentas que as junções; por isso le_sql_ranking_mensal usa a query sobre as linhas nesse caso).
+    """
+    colunas_chave_str = ", ".join(colunas_chave)
+    metricas_linha_str = ", ".join([f'{expressao} AS "{nome}"' for nome, expressao in metricas])
+    filtro_bordas = ""
+    query_mensal = ""
+
+    if view_mensal is not None and periodo_mensal is not None:
+        inicio_mensal = registra_parametro(params, "inicio_mensal", periodo_mensal[0])
+        fim_mensal = registra_parametro(params, "fim_mensal", periodo_mensal[1])
+        ano_mes_inicio = registra_parametro(params, "ano_mes_inicio", periodo_mensal[0][:7])
+        ano_mes_fim = registra_parametro(params, "ano_mes_fim", periodo_mensal[1][:7])
+
+        filtro_bordas = f"""AND ("{coluna_data}" < {inicio_mensal} OR "{coluna_data}" >= {fim_mensal})"""
+        metricas_mensal_str = ", ".join([f'"{nome}"' for nome, _ in metricas])
+        query_mensal = f"""
+            UNION ALL
+            SELECT
+                {colunas_chave_str}, {metricas_mensal_str}
+            FROM
+                {view_mensal}
+            WHERE
+                "ANO_MES" >= {ano_mes_inicio} AND "ANO_MES" < {ano_mes_fim}
+                {filtros}
+        """
+
+    return f"""
+            SELECT
+                {colunas_chave_str}, {metricas_linha_str}
+            FROM
+                {view_linhas} main
+            WHERE
+                "{coluna_data}" BETWEEN :data_inicio AND :data_fim
+                {filtro_bordas}
+                {filtros}
+            {query_mensal}
+    """
+
+
+def le_sql_ranking_mensal(monta_query, view_mensal, data_inicio_str, data_fim_str, dbEngine, params):
+    """
+    Executa a query de ranking montada por monta_query(view_mensal, periodo_mensal, params) usando os agregados mensais.
+    Se o período não tiver meses completos ou a view mensal ainda não tiver sido criada, a query é montada com
+    monta_query(None, None, params), que deve ler as views de retrabalho diretamente (com as junções das peças e notas)
+    """
+    periodo_mensal = periodo_meses_completos(data_inicio_str, data_fim_str)
+
+    if periodo_mensal is None or not view_existe(dbEngine, view_mensal):
+        view_mensal = None
+        periodo_mensal = None
+
+    params_query = dict(params)
+    return le_sql(monta_query(view_mensal, periodo_mensal, params_query), dbEngine, params_query)
@@ -2,6 +2,7 @@
 # coding: utf-8
 
 # Imports básicos
+import numpy as np
 import pandas as pd
 import io
 
@@ -10,49 +11,110 @@ import tema
 
 # Funções utilitárias para os serviços
 
+##############################################################################
+# STATUS DAS OSs #############################################################
+##############################################################################
+# Classificações possíveis das OSs, na ordem de prioridade: (coluna booleana, ícone, emoji, label)
+# O código do status de uma OS é a posição da sua classificação nesta lista
+CLASSIFICACOES_STATUS_OS = [
+    ("correcao_primeira", tema.ICONE_CORRECAO_PRIMEIRA, tema.EMOJI_CORRECAO_PRIMEIRA, "Correção Primeira"),
+    ("correcao", tema.ICONE_CORRECAO_TARDIA, tema.EMOJI_CORRECAO_TARDIA, "Correção Tardia"),
+    ("retrabalho", tema.ICONE_RETRABALHO, tema.EMOJI_RETRABALHO, "Retrabalho"),
+    (
+        "nova_os_com_retrabalho_anterior",
+        tema.ICONE_NOVA_OS_COM_RETRABALHO_ANTERIOR,
+        tema.EMOJI_NOVA_OS_COM_RETRABALHO_ANTERIOR,
+        "Nova OS, com retrabalho prévio",
+    ),
+    (
+        "nova_os_sem_retrabalho_anterior",
+        tema.ICONE_NOVA_OS_SEM_RETRABALHO_ANTERIOR,
+        tema.EMOJI_NOVA_OS_SEM_RETRABALHO_ANTERIOR,
+        "Nova OS, sem retrabalho prévio",
+    ),
+]
+
+# Classificação das OSs que não se encaixam em nenhuma das anteriores (último código)
+CLASSIFICACAO_STATUS_OS_NAO_CLASSIFICADO = (None, tema.ICONE_NAO_CLASSIFICADO, tema.EMOJI_NAO_CLASSIFICADO, "Não classificado")
+CODIGO_STATUS_OS_NAO_CLASSIFICADO = len(CLASSIFICACOES_STATUS_OS)
+
+# Colunas booleanas lidas pelas queries que calculam o status das OSs
+COLUNAS_STATUS_OS = [coluna for coluna, _, _, _ in CLASSIFICACOES_STATUS_OS]
+
+# Tabelas de consulta indexadas pelo código do status
+_TODAS_CLASSIFICACOES_STATUS_OS = CLASSIFICACOES_STATUS_OS + [CLASSIFICACAO_STATUS_OS_NAO_CLASSIFICADO]
+STATUS_OS_POR_CODIGO = np.array([f"{icone} {label}" for _, icone, _, label in _TODAS_CLASSIFICACOES_STATUS_OS], dtype=object)
+LABEL_STATUS_OS_POR_CODIGO = np.array([label for _, _, _, label in _TODAS_CLASSIFICACOES_STATUS_OS], dtype=object)
+EMOJI_STATUS_OS_POR_CODIGO = np.array([emoji for _, _, emoji, _ in _TODAS_CLASSIFICACOES_STATUS_OS], dtype=object)
+
+
+def classificar_status_os(df):
+    """Retorna o código do status de cada OS do DataFrame (vetorizado, colunas ausentes contam como False)"""
+    condicoes = []
+    for coluna, _, _, _ in CLASSIFICACOES_STATUS_OS:
+        if coluna in df.columns:
+            # Mesmo critério de os_row.get(coluna) == True (nulos e valores diferentes de True são False)
+            condicoes.append(df[coluna].eq(True).fillna(False).to_numpy(dtype=bool))
+        else:
+            condicoes.append(np.zeros(len(df), dtype=bool))
+
+    return np.select(condicoes, range(len(condicoes)), default=CODIGO_STATUS_OS_NAO_CLASSIFICADO)
+
+
+def adiciona_status_os(df, label=True, emoji=True):
+    """Adiciona ao DataFrame as colunas status_os (e, opcionalmente, status_os_label e status_os_emoji) em uma única passada"""
+    codigos = classificar_status_os(df)
+
+    df["status_os"] = STATUS_OS_POR_CODIGO[codigos]
+    if label:
+        df["status_os_label"] = LABEL_STATUS_OS_POR_CODIGO[codigos]
+    if emoji:
+        df["status_os_emoji"] = EMOJI_STATUS_OS_POR_CODIGO[codigos]
+
+    return df
+
+
+def _codigo_status_linha(os_row):
+    """Retorna o código do status de uma única OS"""
+    for codigo, (coluna, _, _, _) in enumerate(CLASSIFICACOES_STATUS_OS):
+        if os_row.get(coluna) == True:
+            return codigo
+
+    return CODIGO_STATUS_OS_NAO_CLASSIFICADO
+
 
 # Função para definir o status de uma OS
 def definir_status(os_row):
-    if os_row.get("correcao_primeira") == True:
-        return f"{tema.ICONE_CORRECAO_PRIMEIRA} Correção Primeira"
-    elif os_row.get("correcao") == True:
-        return f"{tema.ICONE_CORRECAO_TARDIA} Correção Tardia"
-    elif os_row.get("retrabalho") == True:
-        return f"{tema.ICONE_RETRABALHO} Retrabalho"
-    elif os_row.get("nova_os_com_retrabalho_anterior") == True:
-        return f"{tema.ICONE_NOVA_OS_COM_RETRABALHO_ANTERIOR} Nova OS, com retrabalho prévio"
-    elif os_row.get("nova_os_sem_retrabalho_anterior") == True:
-        return f"{tema.ICONE_NOVA_OS_SEM_RETRABALHO_ANTERIOR} Nova OS, sem retrabalho prévio"
-    else:
-        return f"{tema.ICONE_NAO_CLASSIFICADO} Não classificado"
+    return STATUS_OS_POR_CODIGO[_codigo_status_linha(os_row)]
 
 
 def definir_status_label(os_row):
-    if os_row.get("correcao_primeira") == True:
-        return "Correção Primeira"
-    elif os_row.get("correcao") == True:
-        return "Correção Tardia"
-    elif os_row.get("retrabalho") == True:
-        return "Retrabalho"
-    elif os_row.get("nova_os_com_retrabalho_anterior") == True:
-        return "Nova OS, com retrabalho prévio"
-    elif os_row.get("nova_os_sem_retrabalho_anterior") == True:
-        return "Nova OS, sem retrabalho prévio"
-    else:
-        return "Não classificado"
+    return LABEL_STATUS_OS_POR_CODIGO[_codigo_status_linha(os_row)]
+
 
 # Função para definir o emoji do status de uma OS
 def definir_emoji_status(os_row):
-    if os_row.get("correcao_primeira") == True:
-        return f"{tema.EMOJI_CORRECAO_PRIMEIRA}"
-    elif os_row.get("correcao") == True:
-        return f"{tema.EMOJI_CORRECAO_TARDIA}"
-    elif os_row.get("retrabalho") == True:
-        return f"{tema.EMOJI_RETRABALHO}"
-    elif os_row.get("nova_os_com_retrabalho_anterior") == True:
-        return f"{tema.EMOJI_NOVA_OS_COM_RETRABALHO_ANTERIOR}"
-    elif os_row.get("nova_os_sem_retrabalho_anterior") == True:
-        return f"{tema.EMOJI_NOVA_OS_SEM_RETRABALHO_ANTERIOR}"
-    else:
-        return f"{tema.EMOJI_NAO_CLASSIFICADO}"
+    return EMOJI_STATUS_OS_POR_CODIGO[_codigo_status_linha(os_row)]
+
+
+##############################################################################
+# DATAS DAS OSs ##############################################################
+##############################################################################
+def data_invalida_os(datas, datas_dt):
+    """Indica as datas preenchidas que não puderam ser convertidas"""
+    return datas_dt.isna() & datas.notna() & (datas.astype(str) != "")
+
+
+def converte_datas_os(datas):
+    """Converte as datas das OSs (texto ISO) de uma única vez; as que estiverem em outro formato são convertidas uma a uma"""
+    if pd.api.types.is_datetime64_any_dtype(datas):
+        return datas
+
+    datas_dt = pd.to_datetime(datas, errors="coerce", format="ISO8601")
+
+    pendentes = data_invalida_os(datas, datas_dt)
+    if pendentes.any():
+        datas_dt = datas_dt.copy()
+        datas_dt[pendentes] = pd.to_datetime(datas[pendentes], errors="coerce", format="mixed")
 
+    return datas_dt
@@ -3,87 +3,158 @@
 
 # Funções utilitárias para construção das queries SQL
 
+# Imports básicos
+import pandas as pd
 
+# Imports do banco de dados
+from sqlalchemy.sql import text
+
+# Imports auxiliares
+from modules.query_metricas_utils import executa_query_medida
+
+
+##############################################################################
+# PARÂMETROS #################################################################
+##############################################################################
+# Os valores dos filtros são enviados como parâmetros vinculados (:nome) em vez de serem interpolados na query.
+# Assim o texto da query é o mesmo para qualquer combinação de filtros e os valores são escapados pelo driver.
+def registra_parametro(params, nome, valor):
+    """Adiciona um valor ao dicionário de parâmetros da query e retorna o marcador (:nome) a ser usado no SQL"""
+    nome_param = nome
+    sufixo = 2
+    while nome_param in params and params[nome_param] != valor:
+        nome_param = f"{nome}_{sufixo}"
+        sufixo += 1
+
+    params[nome_param] = valor
+
+    return f":{nome_param}"
+
+
+def subquery_lista(coluna, lista, nome_param, prefix="", params=None):
+    """Gera o filtro AND coluna = ANY(:lista); sem o dicionário params, gera a lista de literais (com escape)"""
+    valores = [str(x) for x in lista]
+
+    if params is None:
+        valores_str = ", ".join(["'" + x.replace("'", "''") + "'" for x in valores])
+        return f"""AND {prefix}{coluna} IN ({valores_str})"""
+
+    return f"""AND {prefix}{coluna} = ANY({registra_parametro(params, nome_param, valores)})"""
+
+
+def le_sql(query, dbEngine, params=None):
+    """Executa a query com os parâmetros vinculados e retorna o resultado em um DataFrame (com medição de tempo)"""
+    return executa_query_medida(lambda: pd.read_sql(text(query), dbEngine, params=params or {}), query, params)
+
+
+##############################################################################
+# COLUNAS ####################################################################
+##############################################################################
+# As queries com junções declaram as colunas lidas de cada tabela em um dicionário {apelido: [colunas]}, com apenas
+# as colunas usadas pelas páginas, em vez de SELECT * (que traz também os textos longos e as colunas repetidas da junção)
+def colunas_sql(colunas_por_tabela):
+    """Gera a lista de colunas do SELECT (apelido."coluna", ...) a partir do dicionário {apelido: [colunas]}"""
+    return ", ".join(
+        f'{apelido}."{coluna}"' for apelido, colunas in colunas_por_tabela.items() for coluna in colunas
+    )
+
+
+##############################################################################
+# FILTROS ####################################################################
+##############################################################################
 # Subqueries para filtrar as oficinas, seções e ordens de serviço quando TODAS não for selecionado
-def subquery_oficinas(lista_oficinas, prefix="", termo_all="TODAS"):
+def subquery_oficinas(lista_oficinas, prefix="", termo_all="TODAS", params=None):
     query = ""
     if termo_all not in lista_oficinas:
-        query = f"""AND {prefix}"DESCRICAO DA OFICINA" IN ({', '.join([f"'{x}'" for x in lista_oficinas])})"""
+        query = subquery_lista('"DESCRICAO DA OFICINA"', lista_oficinas, "lista_oficinas", prefix, params)
 
     return query
 
 
-def subquery_secoes(lista_secaos, prefix="", termo_all="TODAS"):
+def subquery_secoes(lista_secaos, prefix="", termo_all="TODAS", params=None):
     query = ""
     if termo_all not in lista_secaos:
-        query = f"""AND {prefix}"DESCRICAO DA SECAO" IN ({', '.join([f"'{x}'" for x in lista_secaos])})"""
+        query = subquery_lista('"DESCRICAO DA SECAO"', lista_secaos, "lista_secoes", prefix, params)
 
     return query
 
 
-def subquery_os(lista_os, prefix="", termo_all="TODAS"):
+def subquery_os(lista_os, prefix="", termo_all="TODAS", params=None):
     if not lista_os or termo_all in lista_os:
         return ""
-    valores = ", ".join([f"'{x}'" for x in lista_os if x])  
-    if not valores:  
+    valores = [x for x in lista_os if x]
+    if not valores:
         return ""
 
-    return f'AND {prefix}"DESCRICAO DO SERVICO" IN ({valores})'
+    return subquery_lista('"DESCRICAO DO SERVICO"', valores, "lista_os", prefix, params)
 
 
-
-def subquery_modelos(lista_modelos, prefix="", termo_all="TODAS"):
+def subquery_modelos(lista_modelos, prefix="", termo_all="TODAS", params=None):
     query = ""
     if termo_all not in lista_modelos:
-        query = f"""AND {prefix}"DESCRICAO DO MODELO" IN ({', '.join([f"'{x}'" for x in lista_modelos])})"""
+        query = subquery_lista('"DESCRICAO DO MODELO"', lista_modelos, "lista_modelos", prefix, params)
 
     return query
 
 
-def subquery_veiculos(lista_veiculos, prefix="", termo_all="TODAS"):
+def subquery_veiculos(lista_veiculos, prefix="", termo_all="TODAS", params=None):
     query = ""
     if termo_all not in lista_veiculos:
-        query = f"""AND {prefix}"CODIGO DO VEICULO" IN ({', '.join([f"'{x}'" for x in lista_veiculos])})"""
+        query = subquery_lista('"CODIGO DO VEICULO"', lista_veiculos, "lista_veiculos", prefix, params)
 
     return query
 
-def subquery_equipamentos(lista_veiculos, prefix=""):
+def subquery_equipamentos(lista_veiculos, prefix="", params=None):
     query = ""
     if "TODAS" not in lista_veiculos:
-        query = f"""AND {prefix}"EQUIPAMENTO" IN ({', '.join([f"'{x}'" for x in lista_veiculos])})"""
+        query = subquery_lista('"EQUIPAMENTO"', lista_veiculos, "lista_equipamentos", prefix, params)
     return query
 
-def subquery_modelos_veiculos(lista_modelos, prefix=""):
-    #query = ""
+def subquery_modelos_veiculos(lista_modelos, prefix="", params=None):
     if not lista_modelos or "TODOS" in lista_modelos:
         return ""  # Não adiciona a cláusula IN se a lista estiver vazia ou for "TODOS":
-    query = f"""AND {prefix}"DESCRICAO DO MODELO" IN ({', '.join([f"'{x}'" for x in lista_modelos])})"""
-    return query
+    return subquery_lista('"DESCRICAO DO MODELO"', lista_modelos, "lista_modelos", prefix, params)
 
-def subquery_modelos_pecas(lista_modelos, prefix=""):
-    #query = ""
+def subquery_modelos_pecas(lista_modelos, prefix="", params=None):
     if not lista_modelos or "TODOS" in lista_modelos:
         return ""  # Não adiciona a cláusula IN se a lista estiver vazia ou for "TODOS":
-    query = f"""AND {prefix}"MODELO" IN ({', '.join([f"'{x}'" for x in lista_modelos])})"""
-    return query
+    return subquery_lista('"MODELO"', lista_modelos, "lista_modelos_pecas", prefix, params)
 
-def subquery_modelos_combustivel(lista_modelos, prefix=""):
-    #query = ""
+def subquery_modelos_combustivel(lista_modelos, prefix="", params=None):
     if not lista_modelos or "TODOS" in lista_modelos:
         return ""  # Não adiciona a cláusula IN se a lista estiver vazia ou for "TODOS":
-    query = f"""AND {prefix} vec_model IN ({', '.join([f"'{x}'" for x in [lista_modelos]])})"""
-    return query
+    return subquery_lista("vec_model", [lista_modelos], "lista_modelos_combustivel", prefix, params)
 
-def subquery_linha_combustivel(lista_linhas, prefix=""):
-    #query = ""
+def subquery_linha_combustivel(lista_linhas, prefix="", params=None):
     if not lista_linhas or "TODAS" in lista_linhas:
         return ""  # Não adiciona a cláusula IN se a lista estiver vazia ou for "TODOS":
-    query = f"""AND {prefix} encontrou_numero_linha IN ({', '.join([f"'{x}'" for x in lista_linhas])})"""
-    return query
+    return subquery_lista("encontrou_numero_linha", lista_linhas, "lista_linhas", prefix, params)
 
-def subquery_sentido_combustivel(sentido_linha, prefix=""):
-    #query = ""
+def subquery_sentido_combustivel(sentido_linha, prefix="", params=None):
     if not sentido_linha or "IDA_VOLTA" in sentido_linha:
         return ""  # Não adiciona a cláusula IN se a lista estiver vazia ou for "TODOS":
-    query = f"""AND {prefix} encontrou_numero_linha IN ({', '.join([f"'{x}'" for x in sentido_linha])})"""
-    return query
\ No newline at end of file
+    return subquery_lista("encontrou_numero_linha", sentido_linha, "lista_sentidos", prefix, params)
+
+
+##############################################################################
+# DATAS ######################################################################
+##############################################################################
+# Expressões para as datas das OSs, armazenadas como texto no formato ISO (YYYY-MM-DDTHH:MI:SS)
+# Como a ordem do texto ISO é a ordem cronológica, comparar o texto diretamente permite o uso dos índices B-tree
+# (ao contrário de to_timestamp(...) ou ::timestamp na coluna, que obrigam a ler a view inteira)
+FORMATO_DATA_ISO_SQL = 'YYYY-MM-DD"T"HH24:MI:SS'
+
+
+def sql_ano_mes(coluna, prefix=""):
+    # Ano-mês (YYYY-MM) são os 7 primeiros caracteres da data ISO
+    return f"""LEFT({prefix}"{coluna}", 7)"""
+
+
+def subquery_periodo_dias_atras(coluna, num_dias, dias_apos_hoje=0, prefix="", params=None):
+    # Filtra o período [hoje - num_dias, hoje + dias_apos_hoje], convertendo os limites (e não a coluna) para texto ISO
+    num_dias_sql = int(num_dias) if params is None else registra_parametro(params, "num_dias_periodo", int(num_dias))
+    limite_final = "CURRENT_DATE" if dias_apos_hoje == 0 else f"CURRENT_DATE + INTERVAL '{int(dias_apos_hoje)} days'"
+    return (
+        f"""{prefix}"{coluna}" BETWEEN to_char(CURRENT_DATE - {num_dias_sql} * INTERVAL '1 day', '{FORMATO_DATA_ISO_SQL}') """
+        f"""AND to_char({limite_final}, '{FORMATO_DATA_ISO_SQL}')"""
+    )
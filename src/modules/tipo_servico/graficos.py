@@ -17,7 +17,7 @@ import tema
 
 
 # Rotinas para gerar os Gráficos
-def gerar_grafico_pizza_sinteze_os(df, labels, values):
+def gerar_grafico_pizza_sinteze_os(total_num_os, labels, values):
     """Gera o gráfico de pizza com síntese do total de OS e retrabalhos da tela inicial"""
 
     fig = go.Figure(
@@ -36,7 +36,6 @@ def gerar_grafico_pizza_sinteze_os(df, labels, values):
     fig.update_traces(textinfo="value+percent", sort=False)
 
     # Total numérico de OS, para o título
-    total_num_os = len(df)
     total_num_os_str = f"{total_num_os:,}".replace(",", ".")
     fig.update_layout(
         title=dict(
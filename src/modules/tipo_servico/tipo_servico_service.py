@@ -4,13 +4,93 @@
 # Classe que centraliza os serviços para mostrar na página retrabalho por OS (tipo de serviço)
 
 # Imports básicos
-import re
+import time
 import pandas as pd
 import numpy as np
 
 # Imports auxiliares
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_modelos
-from modules.entities_utils import get_mecanicos
+from modules.sql_utils import (
+    subquery_oficinas,
+    subquery_secoes,
+    subquery_os,
+    subquery_modelos,
+    le_sql,
+    colunas_sql,
+    registra_parametro,
+)
+from modules.entities_utils import get_dimensao_colaboradores, adiciona_nome_colaborador
+from modules.service_utils import converte_datas_os, data_invalida_os
+from modules.cache_utils import CacheResultados, cache_servico
+from modules.views_retrabalho_utils import view_existe
+from modules.classificacao_retrabalho_utils import (
+    COLUNAS_OS_CLEAN,
+    limpa_os_dados,
+    classifica_os_periodo,
+    diferencas_classificacao,
+)
+
+# Cache compartilhado pelos callbacks da página de tipo de serviço
+cache_tipo_servico = CacheResultados("tipo_servico")
+
+# Termos para "todas as opções" de cada filtro (usado na chave do cache)
+TERMOS_ALL_TIPO_SERVICO = {"lista_modelos": "TODOS"}
+
+# Colunas lidas por tabela (apelido) nas queries da LLM e de custo (usadas em obtem_dados_colaboradores_pandas)
+COLUNAS_OS_LLM = {
+    "main": ["KEY_HASH", "COLABORADOR QUE EXECUTOU O SERVICO"],
+    "osclass": ["SOLUTION_HAS_COHERENCE_TO_PROBLEM", "SCORE_SOLUTION_TEXT_QUALITY"],
+}
+COLUNAS_OS_CUSTO = {
+    "main": ["NUMERO DA OS"],
+    "pg": ["VALOR"],
+}
+
+# Colunas dos agregados calculados no banco por obtem_agregados_os_sql (um DataFrame por nível)
+COLUNAS_AGREGADOS_OS = {
+    "df_resumo": [
+        "TOTAL_NUM_OS",
+        "TOTAL_RETRABALHO",
+        "TOTAL_CORRECAO",
+        "TOTAL_CORRECAO_PRIMEIRA",
+        "TOTAL_DE_OS",
+        "TOTAL_DE_PROBLEMAS",
+        "TOTAL_DE_RETRABALHOS",
+        "TOTAL_DE_CORRECOES",
+        "TOTAL_DE_CORRECOES_DE_PRIMEIRA",
+        "MEDIA_DE_DIAS_PARA_CORRECAO",
+        "MEDIANA_DE_DIAS_PARA_CORRECAO",
+        "MEDIA_DE_OS_PARA_CORRECAO",
+        "NUM_PROBLEMAS_COM_UMA_OS",
+        "CUSTO_TOTAL",
+        "CUSTO_RETRABALHO",
+    ],
+    "df_modelo": ["DESCRICAO DO MODELO", "TOTAL_DE_OS", "RETRABALHO", "CORRECAO", "CORRECOES_DE_PRIMEIRA", "NUM_PROBLEMAS"],
+    "df_problema": ["problem_no", "vehicle_id", "tempo_cumulativo"],
+    "df_colaborador": [
+        "COLABORADOR QUE EXECUTOU O SERVICO",
+        "TOTAL_DE_OS",
+        "RETRABALHOS",
+        "CORRECOES",
+        "CORRECOES_DE_PRIMEIRA",
+        "NUM_PROBLEMAS",
+        "TOTAL_GASTO_RETRABALHO",
+        "TOTAL_GASTO",
+        "sum_coherence",
+        "count_coherence",
+        "NOTA_MEDIA_SOLUCAO",
+    ],
+}
+
+# Colunas de texto (chaves) dos agregados; as demais são numéricas
+COLUNAS_TEXTO_AGREGADOS_OS = ["DESCRICAO DO MODELO", "vehicle_id", "COLABORADOR QUE EXECUTOU O SERVICO"]
+
+
+# Função para converter as datas de início e fim dos serviços das OSs
+def trata_datas_servico_os(df_os):
+    df_os["DATA INICIO SERVICO"] = pd.to_datetime(df_os["DATA INICIO SERVIÇO"])
+    df_os["DATA DE FECHAMENTO DO SERVICO"] = pd.to_datetime(df_os["DATA DE FECHAMENTO DO SERVICO"])
+
+    return df_os
 
 
 # Classe do serviço
@@ -19,7 +99,17 @@ class TipoServicoService:
         self.dbEngine = dbEngine
 
     # Função que retorna as OS para os filtros selecionados
+    @cache_servico(cache_tipo_servico, termos_all=TERMOS_ALL_TIPO_SERVICO)
     def obtem_dados_os_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os):
+        params = {}
+        query = self.query_dados_os_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os, params)
+        print(query)
+        df_os_query = le_sql(query, self.dbEngine, params)
+
+        return trata_datas_servico_os(df_os_query)
+
+    def query_dados_os_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os, params):
+        """Retorna a query das OSs classificadas dos filtros (preenchendo params), usada pelas OSs e pelos agregados"""
         # Extraí a data inicial (já em string)
         data_inicio_str = datas[0]
 
@@ -29,14 +119,24 @@ class TipoServicoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Com um único serviço e todas as oficinas, lê as OSs já classificadas (ver sql/004_classificacao_os_tipo_servico.sql)
+        if self.classificacao_incremental_disponivel(min_dias, lista_oficinas, lista_os):
+            return self.query_dados_os_classificados_sql(
+                data_inicio_str, data_fim_str, min_dias, lista_modelos, lista_os, params
+            )
+
+        # Parâmetros da query (registrados sem sobrescrever os das outras queries que compartilham params)
+        data_inicio_sql = registra_parametro(params, "data_inicio", data_inicio_str)
+        data_fim_sql = registra_parametro(params, "data_fim", data_fim_str)
+
         # Subqueries
-        withquery_modelos_str = subquery_modelos(lista_modelos, prefix="od.", termo_all="TODOS")
-        withquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="od.")
-        withquery_os_str = subquery_os(lista_os, prefix="od.")
+        withquery_modelos_str = subquery_modelos(lista_modelos, prefix="od.", termo_all="TODOS", params=params)
+        withquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="od.", params=params)
+        withquery_os_str = subquery_os(lista_os, prefix="od.", params=params)
 
-        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="problem_grouping.", termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="problem_grouping.")
-        subquery_os_str = subquery_os(lista_os, prefix="problem_grouping.")
+        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="problem_grouping.", termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="problem_grouping.", params=params)
+        subquery_os_str = subquery_os(lista_os, prefix="problem_grouping.", params=params)
 
         # Query
         query = f"""
@@ -259,7 +359,7 @@ class TipoServicoService:
             FROM 
                 problem_grouping
             WHERE
-                problem_grouping."DATA DA ABERTURA DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                problem_grouping."DATA DA ABERTURA DA OS" BETWEEN {data_inicio_sql} AND {data_fim_sql}
                 {subquery_modelos_str}
                 {subquery_oficinas_str}
                 {subquery_os_str}
@@ -320,19 +420,280 @@ class TipoServicoService:
             od."NUMERO DA OS" = od_fix."NUMERO DA OS" 
             AND od."DESCRICAO DO SERVICO" = od_fix."DESCRICAO DO SERVICO"
         WHERE
-            od."DATA DA ABERTURA DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            od."DATA DA ABERTURA DA OS" BETWEEN {data_inicio_sql} AND {data_fim_sql}
         ORDER BY od."DATA DA ABERTURA DA OS"
         """
-        print(query)
-        df_os_query = pd.read_sql_query(query, self.dbEngine)
 
-        # Tratamento de datas
-        df_os_query["DATA INICIO SERVICO"] = pd.to_datetime(df_os_query["DATA INICIO SERVIÇO"])
-        df_os_query["DATA DE FECHAMENTO DO SERVICO"] = pd.to_datetime(df_os_query["DATA DE FECHAMENTO DO SERVICO"])
+        return query
+
+    def classificacao_incremental_disponivel(self, min_dias, lista_oficinas, lista_os):
+        """
+        Retorna se as OSs podem ser lidas da classificação incremental: a classificação é feita por veículo e serviço,
+        logo é válida apenas para um único serviço e todas as oficinas, e precisa ter sido executada para min_dias
+        """
+        lista_servicos = [x for x in lista_os if x] if lista_os else []
+        if len(lista_servicos) != 1 or "TODAS" in lista_servicos or "TODAS" not in lista_oficinas:
+            return False
+
+        # Enquanto sql/004 não tiver sido executado, as OSs são classificadas na consulta
+        if not view_existe(self.dbEngine, "os_classificacao_tipo_servico_execucoes"):
+            return False
+
+        query = """
+        SELECT
+            data_execucao
+        FROM
+            os_classificacao_tipo_servico_execucoes
+        WHERE
+            min_dias = :min_dias
+        """
+        df = le_sql(query, self.dbEngine, {"min_dias": int(min_dias)})
+
+        return not df.empty
+
+    def obtem_dados_os_classificados_sql(self, data_inicio_str, data_fim_str, min_dias, lista_modelos, lista_os):
+        """
+        Retorna as OSs do período com a classificação incremental (os_classificacao_tipo_servico), nas mesmas colunas
+        de obtem_dados_os_sql. As condições que dependem da data atual são avaliadas aqui: OSs abertas há menos de
+        min_dias e sem OS seguinte ainda não são correção (e não contam no número do problema)
+        """
+        params = {}
+        query = self.query_dados_os_classificados_sql(data_inicio_str, data_fim_str, min_dias, lista_modelos, lista_os, params)
+        df_os_query = le_sql(query, self.dbEngine, params)
+
+        return trata_datas_servico_os(df_os_query)
+
+    def query_dados_os_classificados_sql(self, data_inicio_str, data_fim_str, min_dias, lista_modelos, lista_os, params):
+        """Retorna a query de obtem_dados_os_classificados_sql (preenchendo params)"""
+        # Parâmetros da query (registrados sem sobrescrever os das outras queries que compartilham params)
+        data_inicio_sql = registra_parametro(params, "data_inicio", data_inicio_str)
+        data_fim_sql = registra_parametro(params, "data_fim", data_fim_str)
+        min_dias_sql = registra_parametro(params, "min_dias", int(min_dias))
+
+        # Subqueries
+        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="od.", termo_all="TODOS", params=params)
+        subquery_os_str = subquery_os(lista_os, prefix="od.", params=params)
+        subquery_os_classificadas_str = subquery_os(lista_os, prefix="c.", params=params)
+
+        # Query
+        query = f"""
+        WITH
+        os_clean AS (
+            SELECT
+                *
+            FROM
+                view_os_dados_tipo_servico od
+            WHERE
+                od."DATA DA ABERTURA DA OS" BETWEEN {data_inicio_sql} AND {data_fim_sql}
+                {subquery_modelos_str}
+                {subquery_os_str}
+        ),
+        os_classificadas AS (
+            SELECT
+                c."NUMERO DA OS",
+                c."DESCRICAO DO SERVICO",
+                c."CODIGO DO VEICULO",
+                c."DATA DA ABERTURA DA OS",
+                c.prev_days,
+                c.next_days,
+                c.problem_no_base,
+                (now() - c."DATA DA ABERTURA DA OS"::timestamp without time zone::timestamp with time zone) > {min_dias_sql} * INTERVAL '1 day' AS passou_min_dias
+            FROM
+                os_classificacao_tipo_servico c
+            WHERE
+                c.min_dias = {min_dias_sql}
+                AND c.principal
+                AND c."DATA DA ABERTURA DA OS" BETWEEN {data_inicio_sql} AND {data_fim_sql}
+                {subquery_os_classificadas_str}
+        ),
+        os_with_flags AS (
+            SELECT
+                oc.*,
+                CASE
+                    WHEN oc.next_days <= {min_dias_sql} AND oc.next_days IS NOT NULL THEN true
+                    ELSE false
+                END AS retrabalho,
+                CASE
+                    WHEN oc.next_days > {min_dias_sql} OR oc.next_days IS NULL AND oc.passou_min_dias THEN true
+                    ELSE false
+                END AS correcao,
+                CASE
+                    WHEN (oc.next_days > {min_dias_sql} OR oc.next_days IS NULL)
+                    AND (oc.prev_days > 10 OR oc.prev_days IS NULL)
+                    AND oc.passou_min_dias
+                    THEN true
+                    ELSE false
+                END AS correcao_primeira,
+                CASE
+                    WHEN oc.prev_days <= {min_dias_sql} AND oc.next_days IS NULL AND NOT oc.passou_min_dias THEN true
+                    ELSE false
+                END AS nova_os_com_retrabalho_anterior,
+                CASE
+                    WHEN (oc.prev_days > {min_dias_sql} OR oc.prev_days IS NULL) AND oc.next_days IS NULL AND NOT oc.passou_min_dias
+                    THEN true
+                    ELSE false
+                END AS nova_os_sem_retrabalho_anterior
+            FROM
+                os_classificadas oc
+        ),
+        os_with_fix_problem_number AS (
+            SELECT
+                -- problem_no_base conta como correção todas as OSs sem OS seguinte; desconta as abertas há menos de min_dias
+                f.problem_no_base
+                - CASE 
+                    WHEN f.passou_min_dias THEN 0
+                    ELSE (
+                        SELECT 
+                            COUNT(*)
+                        FROM 
+                            os_classificacao_tipo_servico a
+                        WHERE
+                            a.min_dias = {min_dias_sql}
+                            AND a.principal
+                            AND a."DESCRICAO DO SERVICO" = f."DESCRICAO DO SERVICO"
+                            AND a."CODIGO DO VEICULO" IS NOT DISTINCT FROM f."CODIGO DO VEICULO"
+                            AND a.next_days IS NULL
+                            AND a."DATA DA ABERTURA DA OS" <= f."DATA DA ABERTURA DA OS"
+                            AND (now() - a."DATA DA ABERTURA DA OS"::timestamp without time zone::timestamp with time zone) <= {min_dias_sql} * INTERVAL '1 day'
+                    )
+                END
+                + CASE
+                    WHEN f.retrabalho OR f.nova_os_com_retrabalho_anterior OR f.nova_os_sem_retrabalho_anterior THEN 1
+                    ELSE 0
+                END AS problem_no,
+                f.*
+            FROM
+                os_with_flags f
+        )
+        SELECT 
+            od_fix.problem_no,
+            od_fix.retrabalho,
+            od_fix.correcao,
+            od_fix.correcao_primeira,
+            od_fix.nova_os_com_retrabalho_anterior,
+            od_fix.nova_os_sem_retrabalho_anterior,
+            od_fix.prev_days,
+            od_fix.next_days,
+            od.*
+        FROM 
+            os_clean od
+        LEFT JOIN 
+            os_with_fix_problem_number od_fix 
+        ON 
+            od."NUMERO DA OS" = od_fix."NUMERO DA OS" 
+            AND od."DESCRICAO DO SERVICO" = od_fix."DESCRICAO DO SERVICO"
+        ORDER BY od."DATA DA ABERTURA DA OS"
+        """
+
+        return query
+
+    def obtem_os_clean_sql(self, lista_modelos, lista_oficinas, lista_os):
+        """
+        Retorna todo o histórico de os_dados dos filtros, limpo como no os_clean de obtem_dados_os_sql,
+        para ser classificado em Python (ver obtem_dados_os_python)
+        """
+        params = {}
+
+        # Subqueries
+        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="od.", termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="od.", params=params)
+        subquery_os_str = subquery_os(lista_os, prefix="od.", params=params)
+
+        colunas_str = ", ".join([f'od."{coluna}"' for coluna in COLUNAS_OS_CLEAN])
+
+        query = f"""
+        SELECT
+            {colunas_str}
+        FROM
+            os_dados od
+        WHERE
+            od."DATA DA ABERTURA DA OS" >= '2024-01-01'
+            {subquery_modelos_str}
+            {subquery_oficinas_str}
+            {subquery_os_str}
+        """
+        df_os_dados = le_sql(query, self.dbEngine, params)
+
+        return limpa_os_dados(df_os_dados)
+
+    def obtem_agora_sql(self):
+        """
+        Retorna a data e hora atual do banco, no fuso da sessão (a mesma referência de now() nas queries, que compara
+        com as datas das OSs convertidas para timestamp nesse fuso)
+        """
+        df = le_sql("SELECT LOCALTIMESTAMP AS agora", self.dbEngine)
+
+        return pd.Timestamp(df["agora"].iloc[0])
+
+    def obtem_dados_os_python(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os, df_os_clean=None, agora=None):
+        """
+        Mesmo resultado de obtem_dados_os_sql, com a classificação feita em Python. Para simular vários min_dias,
+        extraia o histórico uma vez com obtem_os_clean_sql e passe-o em df_os_clean. Sem agora, usa a hora do banco
+        """
+        if agora is None:
+            agora = self.obtem_agora_sql()
+
+        # Remove min_dias do fim do período, como em obtem_dados_os_sql
+        data_fim = pd.to_datetime(datas[1]) - pd.DateOffset(days=min_dias + 1)
+        data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        return df_os_query
+        if df_os_clean is None:
+            df_os_clean = self.obtem_os_clean_sql(lista_modelos, lista_oficinas, lista_os)
 
+        df_os = classifica_os_periodo(df_os_clean, datas[0], data_fim_str, min_dias, agora)
+
+        return trata_datas_servico_os(df_os)
+
+    def compara_classificacao_python_sql(self, datas, lista_min_dias, lista_modelos, lista_oficinas, lista_os):
+        """
+        Compara, para cada min_dias, o tempo e o resultado da classificação no banco (obtem_dados_os_sql, sem cache)
+        e em Python (extraindo o histórico uma única vez). Retorna um DataFrame com uma linha por min_dias
+        """
+        inicio = time.perf_counter()
+        df_os_clean = self.obtem_os_clean_sql(lista_modelos, lista_oficinas, lista_os)
+        tempo_extracao = time.perf_counter() - inicio
+
+        resultados = []
+        for min_dias in lista_min_dias:
+            # A classificação em Python usa a data atual do banco, lida junto com a query
+            agora = self.obtem_agora_sql()
+
+            inicio = time.perf_counter()
+            df_sql = TipoServicoService.obtem_dados_os_sql.__wrapped__(
+                self, datas, min_dias, lista_modelos, lista_oficinas, lista_os
+            )
+            tempo_sql = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            df_python = self.obtem_dados_os_python(
+                datas, min_dias, lista_modelos, lista_oficinas, lista_os, df_os_clean=df_os_clean, agora=agora
+            )
+            tempo_python = time.perf_counter() - inicio
+
+            resultados.append(
+                {
+                    "min_dias": min_dias,
+                    "LINHAS_SQL": len(df_sql),
+                    "LINHAS_PYTHON": len(df_python),
+                    "DIFERENCAS": diferencas_classificacao(df_sql, df_python),
+                    "TEMPO_SQL_S": round(tempo_sql, 3),
+                    "TEMPO_PYTHON_S": round(tempo_python, 3),
+                    "TEMPO_EXTRACAO_S": round(tempo_extracao, 3),
+                }
+            )
+
+        return pd.DataFrame(resultados)
+
+    @cache_servico(cache_tipo_servico, termos_all=TERMOS_ALL_TIPO_SERVICO)
     def obtem_dados_os_llm_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os):
+        params = {}
+        query = self.query_dados_os_llm_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os, params)
+        df_llm = le_sql(query, self.dbEngine, params)
+
+        return df_llm
+
+    def query_dados_os_llm_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os, params):
+        """Retorna a query de obtem_dados_os_llm_sql (preenchendo params)"""
         # Extraí a data inicial (já em string)
         data_inicio_str = datas[0]
 
@@ -342,14 +703,18 @@ class TipoServicoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query (registrados sem sobrescrever os das outras queries que compartilham params)
+        data_inicio_sql = registra_parametro(params, "data_inicio", data_inicio_str)
+        data_fim_sql = registra_parametro(params, "data_fim", data_fim_str)
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="main.", termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="main.")
-        subquery_os_str = subquery_os(lista_os, prefix="main.")
+        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="main.", termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="main.", params=params)
+        subquery_os_str = subquery_os(lista_os, prefix="main.", params=params)
 
         query = f"""
         SELECT 
-            *
+            {colunas_sql(COLUNAS_OS_LLM)}
         FROM 
             os_dados main
         LEFT JOIN
@@ -357,7 +722,7 @@ class TipoServicoService:
         ON 
             main."KEY_HASH" = osclass."KEY_HASH"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN {data_inicio_sql} AND {data_fim_sql}
             AND main."DATA DA ABERTURA DA OS" IS NOT NULL 
             AND main."DATA DO FECHAMENTO DA OS" IS NOT NULL 
             AND main."DATA DA ABERTURA DA OS" ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}$'::text 
@@ -368,12 +733,18 @@ class TipoServicoService:
             {subquery_os_str}
 	    """
 
-        df_llm = pd.read_sql_query(query, self.dbEngine)
-        df_llm = df_llm.loc[:, ~df_llm.columns.duplicated()]
-
-        return df_llm
+        return query
 
+    @cache_servico(cache_tipo_servico, termos_all=TERMOS_ALL_TIPO_SERVICO)
     def obtem_dados_os_custo_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os):
+        params = {}
+        query = self.query_dados_os_custo_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os, params)
+        df_custo = le_sql(query, self.dbEngine, params)
+
+        return df_custo
+
+    def query_dados_os_custo_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os, params):
+        """Retorna a query de obtem_dados_os_custo_sql (preenchendo params)"""
         # Extraí a data inicial (já em string)
         data_inicio_str = datas[0]
 
@@ -383,14 +754,19 @@ class TipoServicoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query (registrados sem sobrescrever os das outras queries que compartilham params)
+        data_inicio_sql = registra_parametro(params, "data_inicio", data_inicio_str)
+        data_fim_sql = registra_parametro(params, "data_fim", data_fim_str)
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="main.", termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="main.")
-        subquery_os_str = subquery_os(lista_os, prefix="main.")
+        subquery_modelos_str = subquery_modelos(lista_modelos, prefix="main.", termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, prefix="main.", params=params)
+        subquery_os_str = subquery_os(lista_os, prefix="main.", params=params)
 
+        # Uma linha por OS e valor de peça (as linhas repetidas pelos colaboradores da OS são descartadas no banco)
         query = f"""
-        SELECT 
-            *
+        SELECT DISTINCT
+            {colunas_sql(COLUNAS_OS_CUSTO)}
         FROM 
             os_dados main
         JOIN
@@ -398,7 +774,7 @@ class TipoServicoService:
         ON
             main."NUMERO DA OS" = pg."OS"
         WHERE
-            main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            main."DATA DO FECHAMENTO DA OS" BETWEEN {data_inicio_sql} AND {data_fim_sql}
             AND main."DATA DA ABERTURA DA OS" IS NOT NULL 
             AND main."DATA DO FECHAMENTO DA OS" IS NOT NULL 
             AND main."DATA DA ABERTURA DA OS" ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}T\\d{{2}}:\\d{{2}}:\\d{{2}}$'::text 
@@ -409,16 +785,224 @@ class TipoServicoService:
             {subquery_os_str}
 	    """
 
-        df_custo = pd.read_sql_query(query, self.dbEngine)
-        df_custo = df_custo.loc[:, ~df_custo.columns.duplicated()]
+        return query
 
-        return df_custo
+    @cache_servico(cache_tipo_servico, termos_all=TERMOS_ALL_TIPO_SERVICO)
+    def obtem_agregados_os_sql(self, datas, min_dias, lista_modelos, lista_oficinas, lista_os):
+        """
+        Retorna os agregados usados pelos gráficos, indicadores e tabela de colaboradores da página, calculados no banco
+        em uma única query (as OSs são classificadas uma única vez), no lugar das OSs, da LLM e das peças de cada OS:
+        {"df_resumo", "df_modelo", "df_problema", "df_colaborador"} (colunas em COLUNAS_AGREGADOS_OS).
+        As OSs repetidas (mais de um serviço ou colaborador) são contadas uma vez pela primeira linha da OS, na ordem
+        de abertura, serviço e KEY_HASH
+        """
+        params = {}
+        query_os = self.query_dados_os_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os, params)
+        query_llm = self.query_dados_os_llm_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os, params)
+        query_custo = self.query_dados_os_custo_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os, params)
+
+        # Dias entre a primeira abertura e o último fechamento (arredondado para baixo, como em Timedelta.days)
+        dias_problema_sql = """
+            floor(
+                extract(epoch FROM MAX(os."DATA DO FECHAMENTO DA OS")::timestamp - MIN(os."DATA DA ABERTURA DA OS")::timestamp)
+                / 86400
+            )
+        """
+
+        # As CTEs usadas mais de uma vez (os_tipo_servico e os_distintas) são calculadas uma única vez pelo PostgreSQL
+        query = f"""
+        WITH
+        os_tipo_servico AS (
+            {query_os}
+        ),
+        os_distintas AS (
+            SELECT DISTINCT ON (os."NUMERO DA OS")
+                os.*
+            FROM
+                os_tipo_servico os
+            ORDER BY
+                os."NUMERO DA OS", os."DATA DA ABERTURA DA OS", os."DESCRICAO DO SERVICO", os."KEY_HASH"
+        ),
+        os_distintas_fechadas AS (
+            SELECT
+                *
+            FROM
+                os_distintas os
+            WHERE
+                os."DATA DO FECHAMENTO DA OS" IS NOT NULL
+        ),
+        custo_os AS (
+            SELECT
+                c."NUMERO DA OS",
+                SUM(c."VALOR") AS "VALOR"
+            FROM
+                ({query_custo}) c
+            GROUP BY
+                c."NUMERO DA OS"
+        ),
+        llm_colaborador AS (
+            SELECT
+                l."COLABORADOR QUE EXECUTOU O SERVICO",
+                COALESCE(SUM(l."SOLUTION_HAS_COHERENCE_TO_PROBLEM"::int), 0) AS sum_coherence,
+                COUNT(l."SOLUTION_HAS_COHERENCE_TO_PROBLEM") AS count_coherence,
+                AVG(l."SCORE_SOLUTION_TEXT_QUALITY")::double precision AS "NOTA_MEDIA_SOLUCAO"
+            FROM
+                ({query_llm}) l
+            WHERE
+                l."COLABORADOR QUE EXECUTOU O SERVICO" IS NOT NULL
+            GROUP BY
+                l."COLABORADOR QUE EXECUTOU O SERVICO"
+            HAVING
+                AVG(l."SCORE_SOLUTION_TEXT_QUALITY") IS NOT NULL
+        ),
+        dias_por_problema AS (
+            SELECT
+                {dias_problema_sql} AS dias_correcao
+            FROM
+                os_distintas_fechadas os
+            WHERE
+                os.problem_no IS NOT NULL
+                AND os."CODIGO DO VEICULO" IS NOT NULL
+                AND os."DESCRICAO DO MODELO" IS NOT NULL
+            GROUP BY
+                os.problem_no, os."CODIGO DO VEICULO", os."DESCRICAO DO MODELO"
+        ),
+        os_por_problema AS (
+            SELECT
+                COUNT(*) AS total_de_os
+            FROM
+                os_distintas_fechadas os
+            WHERE
+                os.problem_no IS NOT NULL
+                AND os."CODIGO DO VEICULO" IS NOT NULL
+            GROUP BY
+                os.problem_no, os."CODIGO DO VEICULO"
+        ),
+        resumo AS (
+            SELECT
+                COUNT(*) AS "TOTAL_NUM_OS",
+                COUNT(*) FILTER (WHERE os.retrabalho) AS "TOTAL_RETRABALHO",
+                COUNT(*) FILTER (WHERE os.correcao) AS "TOTAL_CORRECAO",
+                COUNT(*) FILTER (WHERE os.correcao_primeira) AS "TOTAL_CORRECAO_PRIMEIRA",
+                COUNT(*) FILTER (WHERE os."DATA DO FECHAMENTO DA OS" IS NOT NULL) AS "TOTAL_DE_OS",
+                COUNT(*) FILTER (WHERE os."DATA DO FECHAMENTO DA OS" IS NOT NULL AND os.correcao) AS "TOTAL_DE_PROBLEMAS",
+                COUNT(*) FILTER (WHERE os."DATA DO FECHAMENTO DA OS" IS NOT NULL AND os.retrabalho) AS "TOTAL_DE_RETRABALHOS",
+                COUNT(*) FILTER (WHERE os."DATA DO FECHAMENTO DA OS" IS NOT NULL AND os.correcao) AS "TOTAL_DE_CORRECOES",
+                COUNT(*) FILTER (WHERE os."DATA DO FECHAMENTO DA OS" IS NOT NULL AND os.correcao_primeira) AS "TOTAL_DE_CORRECOES_DE_PRIMEIRA",
+                (SELECT AVG(d.dias_correcao) FROM dias_por_problema d)::double precision AS "MEDIA_DE_DIAS_PARA_CORRECAO",
+                (
+                    SELECT percentile_cont(0.5) WITHIN GROUP (ORDER BY d.dias_correcao) FROM dias_por_problema d
+                ) AS "MEDIANA_DE_DIAS_PARA_CORRECAO",
+                (SELECT AVG(p.total_de_os) FROM os_por_problema p)::double precision AS "MEDIA_DE_OS_PARA_CORRECAO",
+                (SELECT COUNT(*) FROM os_por_problema p WHERE p.total_de_os = 1) AS "NUM_PROBLEMAS_COM_UMA_OS",
+                COALESCE(SUM(c."VALOR"), 0) AS "CUSTO_TOTAL",
+                COALESCE(SUM(c."VALOR") FILTER (WHERE os.retrabalho), 0) AS "CUSTO_RETRABALHO"
+            FROM
+                os_distintas os
+            LEFT JOIN
+                custo_os c
+            ON
+                os."NUMERO DA OS" = c."NUMERO DA OS"
+        ),
+        modelo AS (
+            SELECT
+                mv."DESCRICAO DO MODELO",
+                SUM(mv.total_de_os) AS "TOTAL_DE_OS",
+                SUM(mv.retrabalho) AS "RETRABALHO",
+                SUM(mv.correcao) AS "CORRECAO",
+                SUM(mv.correcao_primeira) AS "CORRECOES_DE_PRIMEIRA",
+                SUM(mv.num_problemas) AS "NUM_PROBLEMAS"
+            FROM (
+                SELECT
+                    os."DESCRICAO DO MODELO",
+                    COUNT(os."NUMERO DA OS") AS total_de_os,
+                    COUNT(*) FILTER (WHERE os.retrabalho) AS retrabalho,
+                    COUNT(*) FILTER (WHERE os.correcao) AS correcao,
+                    COUNT(*) FILTER (WHERE os.correcao_primeira) AS correcao_primeira,
+                    COUNT(DISTINCT os.problem_no) AS num_problemas
+                FROM
+                    os_distintas os
+                WHERE
+                    os."DESCRICAO DO MODELO" IS NOT NULL
+                    AND os."CODIGO DO VEICULO" IS NOT NULL
+                GROUP BY
+                    os."DESCRICAO DO MODELO", os."CODIGO DO VEICULO"
+            ) mv
+            GROUP BY
+                mv."DESCRICAO DO MODELO"
+        ),
+        problema AS (
+            -- Problemas que tiveram solução (ao menos uma correção), com todas as linhas das OSs
+            SELECT
+                os.problem_no,
+                os."CODIGO DO VEICULO" AS vehicle_id,
+                CASE
+                    WHEN MAX(os."DATA DO FECHAMENTO DA OS") IS NOT NULL THEN GREATEST({dias_problema_sql}, 0)
+                END AS tempo_cumulativo
+            FROM
+                os_tipo_servico os
+            WHERE
+                os.problem_no IS NOT NULL
+                AND os."CODIGO DO VEICULO" IS NOT NULL
+            GROUP BY
+                os.problem_no, os."CODIGO DO VEICULO"
+            HAVING
+                COUNT(*) FILTER (WHERE os.correcao) > 0
+        ),
+        colaborador AS (
+            SELECT
+                os."COLABORADOR QUE EXECUTOU O SERVICO",
+                COUNT(os."NUMERO DA OS") AS "TOTAL_DE_OS",
+                COUNT(*) FILTER (WHERE os.retrabalho) AS "RETRABALHOS",
+                COUNT(*) FILTER (WHERE os.correcao) AS "CORRECOES",
+                COUNT(*) FILTER (WHERE os.correcao_primeira) AS "CORRECOES_DE_PRIMEIRA",
+                COUNT(DISTINCT os.problem_no) AS "NUM_PROBLEMAS",
+                COALESCE(SUM(c."VALOR") FILTER (WHERE os.retrabalho), 0) AS "TOTAL_GASTO_RETRABALHO",
+                COALESCE(SUM(c."VALOR"), 0) AS "TOTAL_GASTO",
+                MAX(l.sum_coherence) AS sum_coherence,
+                MAX(l.count_coherence) AS count_coherence,
+                MAX(l."NOTA_MEDIA_SOLUCAO") AS "NOTA_MEDIA_SOLUCAO"
+            FROM
+                os_tipo_servico os
+            LEFT JOIN
+                custo_os c
+            ON
+                os."NUMERO DA OS" = c."NUMERO DA OS"
+            LEFT JOIN
+                llm_colaborador l
+            ON
+                os."COLABORADOR QUE EXECUTOU O SERVICO" = l."COLABORADOR QUE EXECUTOU O SERVICO"
+            WHERE
+                os."COLABORADOR QUE EXECUTOU O SERVICO" IS NOT NULL
+            GROUP BY
+                os."COLABORADOR QUE EXECUTOU O SERVICO"
+        )
+        SELECT
+            (SELECT row_to_json(r) FROM resumo r) AS df_resumo,
+            (SELECT json_agg(m ORDER BY m."DESCRICAO DO MODELO") FROM modelo m) AS df_modelo,
+            (SELECT json_agg(p) FROM problema p) AS df_problema,
+            (SELECT json_agg(c ORDER BY c."COLABORADOR QUE EXECUTOU O SERVICO") FROM colaborador c) AS df_colaborador
+        """
+        df_agregados = le_sql(query, self.dbEngine, params)
+        linha = df_agregados.iloc[0]
+
+        dict_agregados = {}
+        for nome_df, colunas in COLUNAS_AGREGADOS_OS.items():
+            registros = linha[nome_df]
+            if isinstance(registros, dict):
+                registros = [registros]
+
+            df = pd.DataFrame(registros or [], columns=colunas)
+            for coluna in colunas:
+                if coluna not in COLUNAS_TEXTO_AGREGADOS_OS:
+                    df[coluna] = pd.to_numeric(df[coluna])
+
+            dict_agregados[nome_df] = df
+
+        return dict_agregados
 
     # Função que retorna os dados dos colaboradores de um conjunto de OS
     def obtem_dados_colaboradores_pandas(self, df_os, df_llm, df_custo):
-        # Obtem lista de mecânicos
-        df_mecanicos = get_mecanicos(self.dbEngine)
-
         # Estatísticas por colaborador
         df_colaborador = (
             df_os.groupby("COLABORADOR QUE EXECUTOU O SERVICO")
@@ -481,6 +1065,24 @@ class TipoServicoService:
         # Merge com custos
         df_colaborador = df_colaborador.merge(df_retrabalho_custo_colaborador, on="COLABORADOR QUE EXECUTOU O SERVICO", how="left")
         df_colaborador = df_colaborador.merge(df_total_custo_colaborador, on="COLABORADOR QUE EXECUTOU O SERVICO", how="left")
+
+        return self.finaliza_dados_colaboradores(df_colaborador)
+
+    def obtem_dados_colaboradores_agregados(self, df_colaborador_agg):
+        """Retorna os dados dos colaboradores (como obtem_dados_colaboradores_pandas) a partir de df_colaborador de obtem_agregados_os_sql"""
+        df_colaborador = df_colaborador_agg.copy()
+        df_colaborador["TOTAL_PROBLEMA"] = df_colaborador["NUM_PROBLEMAS"]
+        df_colaborador["PERC_SOLUCAO_COERENTE"] = 100 * (
+            df_colaborador["sum_coherence"] / df_colaborador["count_coherence"]
+        )
+
+        return self.finaliza_dados_colaboradores(df_colaborador)
+
+    def finaliza_dados_colaboradores(self, df_colaborador):
+        """Calcula as porcentagens e adiciona o nome dos colaboradores às estatísticas por colaborador"""
+        # Obtem a dimensão dos colaboradores
+        df_colaboradores = get_dimensao_colaboradores(self.dbEngine)
+
         df_colaborador = df_colaborador.fillna(0)
 
         # Correções Tardias
@@ -502,18 +1104,7 @@ class TipoServicoService:
         ].astype(int)
 
         # Encontra o nome do colaborador
-        for ix, linha in df_colaborador.iterrows():
-            colaborador = linha["COLABORADOR QUE EXECUTOU O SERVICO"]
-            nome_colaborador = "Não encontrado"
-            if colaborador in df_mecanicos["cod_colaborador"].values:
-                nome_colaborador = df_mecanicos[df_mecanicos["cod_colaborador"] == colaborador][
-                    "nome_colaborador"
-                ].values[0]
-                nome_colaborador = re.sub(r"(?<!^)([A-Z])", r" \1", nome_colaborador)
-
-            df_colaborador.at[ix, "LABEL_COLABORADOR"] = f"{nome_colaborador} - {int(colaborador)}"
-            df_colaborador.at[ix, "NOME_COLABORADOR"] = f"{nome_colaborador}"
-            df_colaborador.at[ix, "ID_COLABORADOR"] = int(colaborador)
+        adiciona_nome_colaborador(df_colaborador, df_colaboradores)
 
         return df_colaborador
 
@@ -523,6 +1114,22 @@ class TipoServicoService:
         total_retrabalho = len(df[df["retrabalho"]])
         total_correcao = len(df[df["correcao"]])
         total_correcao_primeira = len(df[df["correcao_primeira"]])
+
+        return self.calcula_sintese_os(total_num_os, total_retrabalho, total_correcao, total_correcao_primeira)
+
+    def get_sintese_os_agregada(self, df_resumo):
+        """Retorna a síntese geral das OS (como get_sintese_os) a partir de df_resumo de obtem_agregados_os_sql"""
+        resumo = df_resumo.iloc[0]
+
+        return self.calcula_sintese_os(
+            int(resumo["TOTAL_NUM_OS"]),
+            int(resumo["TOTAL_RETRABALHO"]),
+            int(resumo["TOTAL_CORRECAO"]),
+            int(resumo["TOTAL_CORRECAO_PRIMEIRA"]),
+        )
+
+    def calcula_sintese_os(self, total_num_os, total_retrabalho, total_correcao, total_correcao_primeira):
+        """Calcula as correções tardias e as porcentagens da síntese geral das OS"""
         total_correcao_tardia = total_correcao - total_correcao_primeira
 
         perc_retrabalho = (total_retrabalho / total_num_os) * 100
@@ -544,42 +1151,67 @@ class TipoServicoService:
         # Processa cada problema de um veiculo
         # Cálculo entre DATA DA ABERTURA DA OS do início do problem até a DATA DO FECHAMENTO DA OS da solução
 
-        # Lista de tempos cumulativos
-        tempos_cumulativos = []
-
-        for (problem_no, vehicle_id), group in df.groupby(["problem_no", "CODIGO DO VEICULO"]):
-            try:
-                # Vamos verificar se houve solução
-                if group["correcao"].sum() > 0:
-                    data_abertura_os = pd.to_datetime(group["DATA DA ABERTURA DA OS"].min())
-                    data_fechamento_os = pd.to_datetime(group["DATA DO FECHAMENTO DA OS"].max())
+        # Converte as datas uma única vez (datas preenchidas que não puderam ser convertidas são sinalizadas)
+        data_abertura_os = converte_datas_os(df["DATA DA ABERTURA DA OS"])
+        data_fechamento_os = converte_datas_os(df["DATA DO FECHAMENTO DA OS"])
+        df_datas = pd.DataFrame(
+            {
+                "problem_no": df["problem_no"],
+                "vehicle_id": df["CODIGO DO VEICULO"],
+                "correcao": df["correcao"],
+                "data_abertura_os": data_abertura_os,
+                "data_fechamento_os": data_fechamento_os,
+                "data_invalida": data_invalida_os(df["DATA DA ABERTURA DA OS"], data_abertura_os)
+                | data_invalida_os(df["DATA DO FECHAMENTO DA OS"], data_fechamento_os),
+            }
+        )
 
-                    # Calcula a diferença em dias
-                    diff_in_days = (data_fechamento_os - data_abertura_os).days
+        # Primeira abertura, último fechamento e número de correções de cada problema de cada veículo
+        df_problemas = (
+            df_datas.groupby(["problem_no", "vehicle_id"])
+            .agg(
+                data_abertura_os=("data_abertura_os", "min"),
+                data_fechamento_os=("data_fechamento_os", "max"),
+                num_correcoes=("correcao", "sum"),
+                data_invalida=("data_invalida", "any"),
+            )
+            .reset_index()
+        )
 
-                    # Diff tem que ser no minimo 0
-                    if diff_in_days < 0:
-                        diff_in_days = 0
+        # Vamos considerar apenas os problemas que tiveram solução
+        df_problemas = df_problemas[df_problemas["num_correcoes"] > 0]
 
-                    tempos_cumulativos.append(
-                        {"problem_no": problem_no, "vehicle_id": vehicle_id, "tempo_cumulativo": diff_in_days}
-                    )
-            except Exception as e:
-                print(e)
-                # Adiciona como -1 para indicar que não foi possível calcular e sinalizar o problema
-                tempos_cumulativos.append({"problem_no": problem_no, "vehicle_id": vehicle_id, "tempo_cumulativo": -1})
+        # Calcula a diferença em dias (tem que ser no mínimo 0)
+        # Problemas com datas inválidas ficam com -1 para sinalizar que não foi possível calcular
+        tempo_cumulativo = (
+            (df_problemas["data_fechamento_os"] - df_problemas["data_abertura_os"])
+            .dt.days.clip(lower=0)
+            .mask(df_problemas["data_invalida"], -1)
+        )
 
         # Recria o dataframe
-        df_tempos_cumulativos = pd.DataFrame(tempos_cumulativos)
+        df_tempos_cumulativos = pd.DataFrame(
+            {
+                "problem_no": df_problemas["problem_no"].to_numpy(),
+                "vehicle_id": df_problemas["vehicle_id"].to_numpy(),
+                "tempo_cumulativo": tempo_cumulativo.to_numpy(),
+            }
+        )
+
+        return self.calcula_percentual_cumulativo(df_tempos_cumulativos)
+
+    def get_tempo_cumulativo_para_retrabalho_agregado(self, df_problema):
+        """Retorna os tempos cumulativos (como get_tempo_cumulativo_para_retrabalho) a partir de df_problema de obtem_agregados_os_sql"""
+        return self.calcula_percentual_cumulativo(df_problema.copy())
 
+    def calcula_percentual_cumulativo(self, df_tempos_cumulativos):
+        """Ordena os problemas pelo tempo até a correção e calcula o percentual cumulativo"""
         # Ordena
         df_tempos_cumulativos_sorted = df_tempos_cumulativos.sort_values(by="tempo_cumulativo")
 
-        # Criando a coluna cumulativa em termos percentuais
+        # Criando a coluna cumulativa em termos percentuais (posição de cada problema na ordenação)
         df_tempos_cumulativos_sorted["cumulative_percentage"] = (
-            df_tempos_cumulativos_sorted["tempo_cumulativo"].expanding().count()
-            / len(df_tempos_cumulativos_sorted)
-            * 100
+            df_tempos_cumulativos_sorted["tempo_cumulativo"].notna().cumsum() / len(df_tempos_cumulativos_sorted) * 100
         )
 
         return df_tempos_cumulativos_sorted
@@ -626,6 +1258,14 @@ class TipoServicoService:
             inplace=True,
         )
 
+        return self.calcula_percentuais_modelo(df_modelo)
+
+    def get_retrabalho_por_modelo_agregado(self, df_modelo_agg):
+        """Retorna o retrabalho por modelo (como get_retrabalho_por_modelo) a partir de df_modelo de obtem_agregados_os_sql"""
+        return self.calcula_percentuais_modelo(df_modelo_agg.copy())
+
+    def calcula_percentuais_modelo(self, df_modelo):
+        """Adiciona as correções tardias e as porcentagens às estatísticas por modelo"""
         # Adiciona algumas colunas para facilitar a análise
         df_modelo["CORRECOES_TARDIA"] = df_modelo["CORRECAO"] - df_modelo["CORRECOES_DE_PRIMEIRA"]
 
@@ -671,6 +1311,32 @@ class TipoServicoService:
             },
             index=[0],
         )
+
+        return df_dias_para_correcao, df_num_os_por_problema, self.calcula_percentuais_indicadores_gerais(df_estatistica)
+
+    def get_indicadores_gerais_agregados(self, df_resumo):
+        """
+        Retorna as estatísticas gerais (df_estatistica de get_indicadores_gerais, com o número de problemas resolvidos
+        com uma única OS) a partir de df_resumo de obtem_agregados_os_sql
+        """
+        df_estatistica = df_resumo[
+            [
+                "TOTAL_DE_OS",
+                "TOTAL_DE_PROBLEMAS",
+                "TOTAL_DE_RETRABALHOS",
+                "TOTAL_DE_CORRECOES",
+                "TOTAL_DE_CORRECOES_DE_PRIMEIRA",
+                "MEDIA_DE_DIAS_PARA_CORRECAO",
+                "MEDIANA_DE_DIAS_PARA_CORRECAO",
+                "MEDIA_DE_OS_PARA_CORRECAO",
+                "NUM_PROBLEMAS_COM_UMA_OS",
+            ]
+        ].copy()
+
+        return self.calcula_percentuais_indicadores_gerais(df_estatistica)
+
+    def calcula_percentuais_indicadores_gerais(self, df_estatistica):
+        """Adiciona as correções tardias, a relação OS/problema e as porcentagens às estatísticas gerais"""
         # Correções tardias
         df_estatistica["TOTAL_DE_CORRECOES_TARDIAS"] = (
             df_estatistica["TOTAL_DE_CORRECOES"] - df_estatistica["TOTAL_DE_CORRECOES_DE_PRIMEIRA"]
@@ -690,7 +1356,7 @@ class TipoServicoService:
             df_estatistica["TOTAL_DE_CORRECOES_TARDIAS"] / df_estatistica["TOTAL_DE_OS"]
         )
 
-        return df_dias_para_correcao, df_num_os_por_problema, df_estatistica
+        return df_estatistica
 
     def get_indicadores_colaboradores(self, df):
         df_colaborador = (
@@ -7,8 +7,9 @@ import numpy as np
 import re
 
 
-from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_veiculos, subquery_modelos_veiculos
+from modules.sql_utils import subquery_oficinas, subquery_secoes, subquery_os, subquery_veiculos, subquery_modelos_veiculos, sql_ano_mes, le_sql
 from modules.veiculos.inputs import input_valido2, input_valido
+from modules.views_retrabalho_utils import get_view_retrabalho
 
 
 class HelpsVeiculos:
@@ -28,22 +29,25 @@ class HelpsVeiculos:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelos = subquery_modelos_veiculos(lista_modelos)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelos = subquery_modelos_veiculos(lista_modelos, params=params)
 
         query = f"""
         SELECT
-            to_char(to_timestamp("DATA DE FECHAMENTO DO SERVICO", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DE FECHAMENTO DO SERVICO")} AS year_month,
             100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
             "DESCRICAO DO MODELO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DE FECHAMENTO DO SERVICO" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DE FECHAMENTO DO SERVICO" BETWEEN :data_inicio AND :data_fim
             {subquery_oficinas_str} 
             {subquery_secoes_str}
             {subquery_os_str}
@@ -55,7 +59,7 @@ class HelpsVeiculos:
         """
 
         # Executa query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Arruma dt
         df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
@@ -99,20 +103,23 @@ class HelpsVeiculos:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         query = f"""
         SELECT
-            to_char(to_timestamp("DATA DE FECHAMENTO DO SERVICO", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DE FECHAMENTO DO SERVICO")} AS year_month,
             100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DE FECHAMENTO DO SERVICO" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DE FECHAMENTO DO SERVICO" BETWEEN :data_inicio AND :data_fim
             {subquery_oficinas_str} 
             {subquery_secoes_str}
             {subquery_os_str}
@@ -123,7 +130,7 @@ class HelpsVeiculos:
         """
 
         # Executa query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Arruma dt
         df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
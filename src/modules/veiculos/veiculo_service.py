@@ -16,10 +16,38 @@ from modules.sql_utils import (
     subquery_modelos_veiculos,
     subquery_equipamentos,
     subquery_modelos_pecas,
+    sql_ano_mes,
+    le_sql,
 )
 
-from modules.service_utils import definir_status
+from modules.service_utils import adiciona_status_os
 from modules.veiculos.helps import HelpsVeiculos
+from modules.cache_utils import CacheResultados, cache_servico
+from modules.ranking_mensal_utils import (
+    subquery_parciais_mensais,
+    le_sql_ranking_mensal,
+    SQL_GASTO_PECAS_LINHA,
+    SQL_QUANTIDADE_PECAS_LINHA,
+)
+from modules.views_retrabalho_utils import get_view_retrabalho
+
+# Cache compartilhado pelos callbacks da página de veículos
+cache_veiculos = CacheResultados("veiculos")
+
+# Termos para "todas as opções" de cada filtro (usado na chave do cache)
+TERMOS_ALL_VEICULOS = {"lista_modelos": "TODOS"}
+
+# Métricas de uma linha (OS) usadas nos rankings dos veículos, as mesmas dos agregados mensais
+# mat_view_ranking_mensal_veiculo_{min_dias}_dias (ver sql/003_rankings_mensais.sql)
+METRICAS_RANKING_VEICULO = [
+    ("quantidade_de_os", "1"),
+    ("quantidade_de_os_retrabalho", "CASE WHEN main.retrabalho THEN 1 ELSE 0 END"),
+    ("quantidade_de_os_correcao_primeira", "CASE WHEN main.correcao_primeira THEN 1 ELSE 0 END"),
+    ("total_gasto", SQL_GASTO_PECAS_LINHA),
+    ("quantidade_de_pecas", SQL_QUANTIDADE_PECAS_LINHA),
+    ("total_gasto_retrabalho", f"CASE WHEN main.retrabalho THEN {SQL_GASTO_PECAS_LINHA} END"),
+    ("quantidade_de_pecas_retrabalho", f"CASE WHEN main.retrabalho THEN {SQL_QUANTIDADE_PECAS_LINHA} ELSE 0 END"),
+]
 
 
 # Classe do serviço
@@ -27,9 +55,13 @@ class VeiculoService:
     def __init__(self, dbEngine):
         self.dbEngine = dbEngine
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_veiculos_possiveis_nos_modelos(self, modelos_selecionados):
+        # Parâmetros da query
+        params = {}
+
         # Filtro
-        subquery_modelos_veiculos_str = subquery_modelos_veiculos(modelos_selecionados)
+        subquery_modelos_veiculos_str = subquery_modelos_veiculos(modelos_selecionados, params=params)
 
         # Query
         query = f"""
@@ -43,29 +75,34 @@ class VeiculoService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Ordenar os resultados
         df = df.sort_values("VEICULO")
 
         return df
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_os_possiveis_do_veiculo(self, id_veiculo):
-        query = f"""
+        # Parâmetros da query
+        params = {"id_veiculo": id_veiculo}
+
+        query = """
             SELECT DISTINCT
                 "DESCRICAO DO SERVICO" AS "SERVICO"
             FROM
                 mat_view_retrabalho_10_dias
             WHERE
-                "CODIGO DO VEICULO" = '{id_veiculo}'
+                "CODIGO DO VEICULO" = :id_veiculo
             ORDER BY
                 "DESCRICAO DO SERVICO" ASC
         """
 
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         return df
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_sinteze_retrabalho_veiculo_para_grafico_pizza(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -77,11 +114,14 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
+
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficinas, params=params)
 
         query = f"""
         SELECT
@@ -93,168 +133,31 @@ class VeiculoService:
             100 * ROUND(SUM(CASE WHEN correcao THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-            AND "CODIGO DO VEICULO" = '{id_veiculo}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim 
+            AND "CODIGO DO VEICULO" = :id_veiculo
             {subquery_secoes_str}
             {subquery_os_str}
             {subquery_modelo_str}
             {subquery_oficina_str}
         """
         # Executa query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Calcula o total de correções tardia
         df["TOTAL_CORRECAO_TARDIA"] = df["TOTAL_CORRECAO"] - df["TOTAL_CORRECAO_PRIMEIRA"]
 
         return df
 
-    def get_indicador_rank_retrabalho_modelo_veiculo(
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
+    def get_indicadores_modelo_veiculo(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
-        """Função para obter o ranking do veículo em termos de retrabalho por modelo nas opções selecionadas"""
-
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
-
-        query = f"""
-        WITH TABELA_RANK AS (       
-            SELECT 
-                "CODIGO DO VEICULO",
-                COUNT(*) AS quantidade_de_os_retrabalho,
-                ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) AS rank_veiculo
-            FROM
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                retrabalho = TRUE
-                AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-            GROUP BY
-                "CODIGO DO VEICULO"
-        ), 
-        TOTAL AS (
-            SELECT 
-                COUNT(DISTINCT "CODIGO DO VEICULO") as total_veiculos 
-            FROM 
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-        )
-        SELECT 
-            tr.rank_veiculo || '/' || t.total_veiculos AS rank_veiculo
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
         """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_rank_correcao_primeira_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o ranking do veículo em termos de correção de primeira por modelo nas opções selecionadas"""
-
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
-
-        query = f"""
-        WITH TABELA_RANK AS (       
-            SELECT 
-                "CODIGO DO VEICULO",
-                COUNT(*) AS quantidade_de_os_correcao_primeira,
-                ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) AS rank_veiculo
-            FROM
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                correcao_primeira = TRUE
-                AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-            GROUP BY
-                "CODIGO DO VEICULO"
-        ), 
-        TOTAL AS (
-            SELECT 
-                COUNT(DISTINCT "CODIGO DO VEICULO") as total_veiculos 
-            FROM 
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-        )
-        SELECT 
-            tr.rank_veiculo || '/' || t.total_veiculos AS rank_veiculo
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
+        Função para obter, em uma única query, os indicadores do veículo no período e o seu ranking entre os veículos
+        do(s) mesmo(s) modelo(s): retrabalho, correção de primeira, total de OS, gasto com peças e gasto com peças em retrabalho
         """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_total_os_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o total de OS que um veículo teve em um determinado período"""
-
         data_inicio_str = datas[0]
 
         # Remove min_dias antes para evitar que a última OS não seja retrabalho
@@ -262,330 +165,191 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
-
-        query = f"""
-        SELECT 
-            COUNT(*) AS quantidade_de_os
-        FROM
-            mat_view_retrabalho_{min_dias}_dias
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-        """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_rank_total_os_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o ranking de OS que um veículo teve em um determinado período"""
-
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
 
         # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficina_str = subquery_oficinas(lista_oficinas, params=params)
 
-        query = f"""
-        WITH TABELA_RANK AS (       
-            SELECT 
-                "CODIGO DO VEICULO",
-                COUNT(*) AS quantidade_de_os,
-                ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) AS rank_veiculo
-            FROM
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-            GROUP BY
-                "CODIGO DO VEICULO"
-        ), 
-        TOTAL AS (
-            SELECT 
-                COUNT(DISTINCT "CODIGO DO VEICULO") as total_veiculos 
-            FROM 
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
+        # Os veículos considerados são os do(s) mesmo(s) modelo(s) do veículo
+        filtros = f"""
                 AND "DESCRICAO DO MODELO" IN (
                     SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
+                    FROM {get_view_retrabalho(self.dbEngine, min_dias)}
+                    WHERE "CODIGO DO VEICULO" = :id_veiculo
                 )
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_modelo_str}
                 {subquery_oficina_str}
-        )
-        SELECT 
-            tr.rank_veiculo || '/' || t.total_veiculos AS rank_veiculo
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
         """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_total_gasto_pecas_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o total gasto com peças que um veículo teve em um determinado período"""
-
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
 
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
-
-        query = f"""
-        SELECT
-            SUM(pg."VALOR") AS "TOTAL_GASTO"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias main
-        JOIN
-            view_pecas_desconsiderando_combustivel pg 
-        ON
-            main."NUMERO DA OS" = pg."OS"
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-        GROUP BY
-            "CODIGO DO VEICULO"
-        """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_rank_gasto_total_pecas_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o ranking de gasto com peças que um veículo teve em um determinado período"""
-
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
-
-        query = f"""
-        WITH TABELA_RANK AS (       
-            SELECT 
-                "CODIGO DO VEICULO",
-                SUM(pg."VALOR") AS "TOTAL_GASTO",
-                ROW_NUMBER() OVER (ORDER BY SUM(pg."VALOR") DESC) AS rank_veiculo
-            FROM
-                mat_view_retrabalho_{min_dias}_dias main
-            JOIN
-                view_pecas_desconsiderando_combustivel pg 
-            ON
-                main."NUMERO DA OS" = pg."OS"
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
+        # As métricas de cada veículo são somadas a partir dos agregados mensais (e das linhas dos dias restantes).
+        # Sem os agregados mensais, as métricas são calculadas sobre as linhas do período, com a junção das peças.
+        # Os rankings consideram apenas os veículos com valor > 0 no indicador (ex: com retrabalho, com peças),
+        # mas o total de veículos (denominador) inclui todos os veículos do modelo com OS no período.
+        # Empates são desfeitos pelo código do veículo, para o ranking não mudar entre execuções
+        def monta_query(view_mensal, periodo_mensal, params):
+            view_linhas = get_view_retrabalho(self.dbEngine, min_dias)
+
+            if view_mensal is None:
+                subquery_por_veiculo_str = f"""
+            BASE AS (
+                SELECT 
+                    "CODIGO DO VEICULO",
+                    "NUMERO DA OS",
+                    retrabalho,
+                    correcao_primeira
+                FROM
+                    {view_linhas} main
+                WHERE
+                    "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim 
+                    {filtros}
+            ),
+            OS_POR_VEICULO AS (
+                SELECT 
+                    "CODIGO DO VEICULO",
+                    COUNT(*) AS quantidade_de_os,
+                    COUNT(*) FILTER (WHERE retrabalho) AS quantidade_de_os_retrabalho,
+                    COUNT(*) FILTER (WHERE correcao_primeira) AS quantidade_de_os_correcao_primeira
+                FROM
+                    BASE
+                GROUP BY
+                    "CODIGO DO VEICULO"
+            ),
+            PECAS_POR_VEICULO AS (
+                SELECT 
+                    b."CODIGO DO VEICULO",
+                    SUM(pg."VALOR") AS total_gasto,
+                    COUNT(pg."OS") AS quantidade_de_pecas,
+                    SUM(pg."VALOR") FILTER (WHERE b.retrabalho) AS total_gasto_retrabalho,
+                    COUNT(pg."OS") FILTER (WHERE b.retrabalho) AS quantidade_de_pecas_retrabalho
+                FROM
+                    BASE b
+                JOIN
+                    view_pecas_desconsiderando_combustivel pg 
+                ON
+                    b."NUMERO DA OS" = pg."OS"
+                GROUP BY
+                    b."CODIGO DO VEICULO"
+            ),
+            POR_VEICULO AS (
+                SELECT 
+                    v."CODIGO DO VEICULO",
+                    v.quantidade_de_os,
+                    v.quantidade_de_os_retrabalho,
+                    v.quantidade_de_os_correcao_primeira,
+                    p.total_gasto,
+                    COALESCE(p.quantidade_de_pecas, 0) AS quantidade_de_pecas,
+                    p.total_gasto_retrabalho,
+                    COALESCE(p.quantidade_de_pecas_retrabalho, 0) AS quantidade_de_pecas_retrabalho
+                FROM
+                    OS_POR_VEICULO v
+                LEFT JOIN
+                    PECAS_POR_VEICULO p
+                ON
+                    v."CODIGO DO VEICULO" = p."CODIGO DO VEICULO"
+            ),"""
+            else:
+                subquery_parciais_str = subquery_parciais_mensais(
+                    ['"CODIGO DO VEICULO"'],
+                    METRICAS_RANKING_VEICULO,
+                    view_linhas,
+                    view_mensal,
+                    periodo_mensal,
+                    filtros,
+                    params,
                 )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-            GROUP BY
-                "CODIGO DO VEICULO"
-        ), 
-        TOTAL AS (
+                subquery_por_veiculo_str = f"""
+            PARCIAIS AS (
+                {subquery_parciais_str}
+            ),
+            POR_VEICULO AS (
+                SELECT 
+                    "CODIGO DO VEICULO",
+                    SUM(quantidade_de_os)::BIGINT AS quantidade_de_os,
+                    SUM(quantidade_de_os_retrabalho) AS quantidade_de_os_retrabalho,
+                    SUM(quantidade_de_os_correcao_primeira) AS quantidade_de_os_correcao_primeira,
+                    SUM(total_gasto) AS total_gasto,
+                    SUM(quantidade_de_pecas) AS quantidade_de_pecas,
+                    SUM(total_gasto_retrabalho) AS total_gasto_retrabalho,
+                    SUM(quantidade_de_pecas_retrabalho) AS quantidade_de_pecas_retrabalho
+                FROM
+                    PARCIAIS
+                GROUP BY
+                    "CODIGO DO VEICULO"
+            ),"""
+
+            return f"""
+            WITH {subquery_por_veiculo_str}
+            TABELA_RANK AS (
+                SELECT 
+                    v."CODIGO DO VEICULO",
+                    v.quantidade_de_os,
+                    v.total_gasto,
+                    v.total_gasto_retrabalho,
+                    CASE WHEN v.quantidade_de_os_retrabalho > 0 THEN
+                        ROW_NUMBER() OVER (
+                            PARTITION BY v.quantidade_de_os_retrabalho > 0
+                            ORDER BY v.quantidade_de_os_retrabalho DESC, v."CODIGO DO VEICULO"
+                        )
+                    END AS rank_retrabalho,
+                    CASE WHEN v.quantidade_de_os_correcao_primeira > 0 THEN
+                        ROW_NUMBER() OVER (
+                            PARTITION BY v.quantidade_de_os_correcao_primeira > 0
+                            ORDER BY v.quantidade_de_os_correcao_primeira DESC, v."CODIGO DO VEICULO"
+                        )
+                    END AS rank_correcao_primeira,
+                    ROW_NUMBER() OVER (ORDER BY v.quantidade_de_os DESC, v."CODIGO DO VEICULO") AS rank_total_os,
+                    CASE WHEN v.quantidade_de_pecas > 0 THEN
+                        ROW_NUMBER() OVER (
+                            PARTITION BY v.quantidade_de_pecas > 0
+                            ORDER BY v.total_gasto DESC, v."CODIGO DO VEICULO"
+                        )
+                    END AS rank_gasto_pecas,
+                    CASE WHEN v.quantidade_de_pecas_retrabalho > 0 THEN
+                        ROW_NUMBER() OVER (
+                            PARTITION BY v.quantidade_de_pecas_retrabalho > 0
+                            ORDER BY v.total_gasto_retrabalho DESC, v."CODIGO DO VEICULO"
+                        )
+                    END AS rank_gasto_retrabalho_pecas
+                FROM
+                    POR_VEICULO v
+            ),
+            TOTAL AS (
+                SELECT 
+                    COUNT(*) AS total_veiculos 
+                FROM 
+                    POR_VEICULO
+            )
             SELECT 
-                COUNT(DISTINCT "CODIGO DO VEICULO") as total_veiculos 
+                tr.rank_retrabalho || '/' || t.total_veiculos AS rank_retrabalho,
+                tr.rank_correcao_primeira || '/' || t.total_veiculos AS rank_correcao_primeira,
+                COALESCE(tr.quantidade_de_os, 0) AS quantidade_de_os,
+                tr.rank_total_os || '/' || t.total_veiculos AS rank_total_os,
+                tr.total_gasto AS total_gasto_pecas,
+                tr.rank_gasto_pecas || '/' || t.total_veiculos AS rank_gasto_pecas,
+                tr.total_gasto_retrabalho AS total_gasto_retrabalho_pecas,
+                tr.rank_gasto_retrabalho_pecas || '/' || t.total_veiculos AS rank_gasto_retrabalho_pecas
             FROM 
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-        )
-        SELECT 
-            tr.rank_veiculo || '/' || t.total_veiculos AS rank_veiculo
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
-        """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_total_gasto_retrabalho_pecas_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o total gasto com peças vinculadas a retrabalho que um veículo teve em um determinado período"""
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
+                TOTAL t
+            LEFT JOIN
+                TABELA_RANK tr
+            ON
+                tr."CODIGO DO VEICULO" = :id_veiculo
+            """
 
-        query = f"""
-        SELECT
-            SUM(pg."VALOR") AS "TOTAL_GASTO"
-        FROM
-            mat_view_retrabalho_{min_dias}_dias main
-        JOIN
-            view_pecas_desconsiderando_combustivel pg 
-        ON
-            main."NUMERO DA OS" = pg."OS"
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
-            AND "retrabalho" = TRUE
-            AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            {subquery_secoes_str}
-            {subquery_os_str}
-            {subquery_modelo_str}
-            {subquery_oficina_str}
-        GROUP BY
-            "CODIGO DO VEICULO"
-        """
         # Executa query
-        df = pd.read_sql(query, self.dbEngine)
-
-        return df
-
-    def get_indicador_rank_gasto_retrabalho_pecas_modelo_veiculo(
-        self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    ):
-        """Função para obter o ranking de gasto com peças em retrabalho que um veículo teve em um determinado período"""
-
-        data_inicio_str = datas[0]
-
-        # Remove min_dias antes para evitar que a última OS não seja retrabalho
-        data_fim = pd.to_datetime(datas[1])
-        data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
-        data_fim_str = data_fim.strftime("%Y-%m-%d")
-
-        # Filtro das subqueries
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_modelo_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficina_str = subquery_oficinas(lista_oficinas)
-
-        query = f"""
-        WITH TABELA_RANK AS (       
-            SELECT 
-                "CODIGO DO VEICULO",
-                SUM(pg."VALOR") AS "TOTAL_GASTO",
-                ROW_NUMBER() OVER (ORDER BY SUM(pg."VALOR") DESC) AS rank_veiculo
-            FROM
-                mat_view_retrabalho_{min_dias}_dias main
-            JOIN
-                view_pecas_desconsiderando_combustivel pg 
-            ON
-                main."NUMERO DA OS" = pg."OS"
-            WHERE
-                "retrabalho" = TRUE
-                AND "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
-            GROUP BY
-                "CODIGO DO VEICULO"
-        ), 
-        TOTAL AS (
-            SELECT 
-                COUNT(DISTINCT "CODIGO DO VEICULO") as total_veiculos 
-            FROM 
-                mat_view_retrabalho_{min_dias}_dias
-            WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "DESCRICAO DO MODELO" IN (
-                    SELECT DISTINCT "DESCRICAO DO MODELO"
-                    FROM mat_view_retrabalho_{min_dias}_dias
-                    WHERE "CODIGO DO VEICULO" = '{id_veiculo}'
-                )
-                {subquery_secoes_str}
-                {subquery_os_str}
-                {subquery_modelo_str}
-                {subquery_oficina_str}
+        df = le_sql_ranking_mensal(
+            monta_query, f"mat_view_ranking_mensal_veiculo_{min_dias}_dias", data_inicio_str, data_fim_str, self.dbEngine, params
         )
-        SELECT 
-            tr.rank_veiculo || '/' || t.total_veiculos AS rank_veiculo
-        FROM 
-            TABELA_RANK tr, TOTAL t
-        WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
-        """
-        # Executa query
-        df = pd.read_sql(query, self.dbEngine)
 
         return df
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_evolucao_quantidade_os_por_mes(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -599,11 +363,14 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         # Query tem quatro partes:
         # 1 - Quantidade de OSs por mês por veículo
@@ -615,12 +382,12 @@ class VeiculoService:
             SELECT 
                 "DESCRICAO DO MODELO",
                 "CODIGO DO VEICULO",
-                to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+                {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
                 COUNT(DISTINCT "NUMERO DA OS") AS "QUANTIDADE_DE_OS"
             FROM 
-                mat_view_retrabalho_{min_dias}_dias
+                {get_view_retrabalho(self.dbEngine, min_dias)}
             WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_oficinas_str}
                 {subquery_secoes_str}
                 {subquery_os_str}
@@ -642,7 +409,7 @@ class VeiculoService:
                     FROM
                         qtd_os_por_veiculo_por_mes
                     WHERE
-                        "CODIGO DO VEICULO" = '{id_veiculo}'
+                        "CODIGO DO VEICULO" = :id_veiculo
                 )
             GROUP BY
                 "DESCRICAO DO MODELO",
@@ -677,11 +444,11 @@ class VeiculoService:
         FROM 
             qtd_os_por_veiculo_por_mes
         WHERE
-            "CODIGO DO VEICULO" = '{id_veiculo}'
+            "CODIGO DO VEICULO" = :id_veiculo
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Verifica se há veículo no dataframe para cada mês
         # Quando não houver, adiciona uma linha com o mês e o escopo "VEÍCULO" e media_gasto = 0
@@ -703,6 +470,7 @@ class VeiculoService:
 
         return df
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_evolucao_retrabalho_por_veiculo_por_mes(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -716,12 +484,15 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
+
         # Subqueries
-        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS")
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
-        subquery_veiculos_str = subquery_veiculos([id_veiculo])
+        subquery_modelos_str = subquery_modelos(lista_modelos, termo_all="TODOS", params=params)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
+        subquery_veiculos_str = subquery_veiculos([id_veiculo], params=params)
 
         # Query tem três partes:
         # 1 - Retrabalho por veículo por mês
@@ -730,16 +501,16 @@ class VeiculoService:
 
         query = f"""
         SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
             "CODIGO DO VEICULO",
             "DESCRICAO DO MODELO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            AND "CODIGO DO VEICULO" IN ('{id_veiculo}')
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
+            AND "CODIGO DO VEICULO" IN (:id_veiculo)
             {subquery_secoes_str}
             {subquery_os_str}
         GROUP BY
@@ -748,21 +519,21 @@ class VeiculoService:
         UNION ALL 
         
         SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
             "DESCRICAO DO MODELO" as "CODIGO DO VEICULO",
             "DESCRICAO DO MODELO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             AND "DESCRICAO DO MODELO" in (
              	SELECT DISTINCT "DESCRICAO DO MODELO"
                 FROM
-                	mat_view_retrabalho_{min_dias}_dias
+                	{get_view_retrabalho(self.dbEngine, min_dias)}
                 WHERE
-                	"CODIGO DO VEICULO" = '{id_veiculo}'
+                	"CODIGO DO VEICULO" = :id_veiculo
             )
             {subquery_secoes_str}
             {subquery_os_str}
@@ -772,15 +543,15 @@ class VeiculoService:
         UNION ALL 
         
         SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA",
             'MÉDIA GERAL' as "CODIGO DO VEICULO",
             'TODOS OS MODELOS' as "DESCRICAO DO MODELO"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
             {subquery_secoes_str}
             {subquery_os_str}
         GROUP BY
@@ -790,7 +561,7 @@ class VeiculoService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Arruma dt
         df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
@@ -809,6 +580,7 @@ class VeiculoService:
         )
         return df_combinado
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_evolucao_retrabalho_por_secao_por_mes(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -820,22 +592,25 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
+
         # Subqueries
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         query = f"""
         SELECT
-            to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+            {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
             "DESCRICAO DA SECAO",
             100 * ROUND(SUM(CASE WHEN retrabalho THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_RETRABALHO",
             100 * ROUND(SUM(CASE WHEN correcao_primeira THEN 1 ELSE 0 END)::NUMERIC / COUNT(*)::NUMERIC, 4) AS "PERC_CORRECAO_PRIMEIRA"
         FROM
-            mat_view_retrabalho_{min_dias}_dias
+            {get_view_retrabalho(self.dbEngine, min_dias)}
         WHERE
-            "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
-            AND "CODIGO DO VEICULO" = '{id_veiculo}'
+            "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
+            AND "CODIGO DO VEICULO" = :id_veiculo
             {subquery_oficinas_str}
             {subquery_secoes_str}
             {subquery_os_str}
@@ -846,7 +621,7 @@ class VeiculoService:
         """
 
         # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Arruma dt
         df["year_month_dt"] = pd.to_datetime(df["year_month"], format="%Y-%m", errors="coerce")
@@ -866,6 +641,7 @@ class VeiculoService:
 
         return df_combinado
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_evolucao_custo_por_mes(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -877,10 +653,13 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
+
         # Subqueries
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         # Query para obter o custo total por mês
         # Primeiro, calcula o custo por veículo por mês
@@ -891,19 +670,19 @@ class VeiculoService:
         query = f"""
         WITH media_custo_por_veiculo as (
             SELECT
-                    to_char(to_timestamp("DATA DO FECHAMENTO DA OS", 'YYYY-MM-DD"T"HH24:MI:SS'), 'YYYY-MM') AS year_month,
+                    {sql_ano_mes("DATA DO FECHAMENTO DA OS")} AS year_month,
                     SUM(pg."VALOR") AS "TOTAL_GASTO",
                     SUM(CASE WHEN main.retrabalho THEN pg."VALOR" ELSE NULL END) AS "TOTAL_GASTO_RETRABALHO",
                     "CODIGO DO VEICULO",
                     "DESCRICAO DO MODELO"
                 FROM
-                    mat_view_retrabalho_{min_dias}_dias_distinct main
+                    {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)} main
                 JOIN
                     view_pecas_desconsiderando_combustivel pg 
                 ON
                     main."NUMERO DA OS" = pg."OS"
                 WHERE
-                    "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                    "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                     {subquery_oficinas_str}
                     {subquery_secoes_str}
                     {subquery_os_str}
@@ -920,7 +699,7 @@ class VeiculoService:
         FROM 
             media_custo_por_veiculo
         WHERE 
-            "CODIGO DO VEICULO" IN ('{id_veiculo}')
+            "CODIGO DO VEICULO" IN (:id_veiculo)
         GROUP BY 
             "CODIGO DO VEICULO", year_month
 
@@ -938,9 +717,9 @@ class VeiculoService:
             "DESCRICAO DO MODELO" in (
                 SELECT DISTINCT "DESCRICAO DO MODELO"
                 FROM
-                    mat_view_retrabalho_{min_dias}_dias_distinct
+                    {get_view_retrabalho(self.dbEngine, min_dias, distinct=True)}
                 WHERE
-                    "CODIGO DO VEICULO" = '{id_veiculo}'
+                    "CODIGO DO VEICULO" = :id_veiculo
             )
         GROUP BY 
             "DESCRICAO DO MODELO", year_month
@@ -962,7 +741,7 @@ class VeiculoService:
         """
 
         # Executa Query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Limpa os valores nulos
         df["TOTAL_GASTO"] = df["TOTAL_GASTO"].fillna(0)
@@ -1008,6 +787,7 @@ class VeiculoService:
 
         return df_melt
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_dados_tabela_top_servicos_veiculo(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -1019,24 +799,27 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"id_veiculo": id_veiculo, "data_inicio": data_inicio_str, "data_fim": data_fim_str}
+
         # Subqueries
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         query = f"""
         WITH veiculo_com_pecas AS (
             SELECT
                 main.*,
                 pg."VALOR"
-            FROM mat_view_retrabalho_{min_dias}_dias main
+            FROM {get_view_retrabalho(self.dbEngine, min_dias)} main
             LEFT JOIN 
                 view_pecas_desconsiderando_combustivel pg
             ON 
                 main."NUMERO DA OS" = pg."OS"
             WHERE
-                "CODIGO DO VEICULO" = '{id_veiculo}'
-                AND main."DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                "CODIGO DO VEICULO" = :id_veiculo
+                AND main."DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_oficinas_str}
@@ -1085,12 +868,13 @@ class VeiculoService:
         ORDER BY "TOTAL_GASTO_RETRABALHO" DESC
         """
 
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
         df["TOTAL_GASTO_RETRABALHO"] = df["TOTAL_GASTO_RETRABALHO"].replace(np.nan, 0)
         df["TOTAL_GASTO"] = df["TOTAL_GASTO"].replace(np.nan, 0)
 
         return df
 
+    @cache_servico(cache_veiculos, termos_all=TERMOS_ALL_VEICULOS)
     def get_dados_tabela_lista_os_pecas_veiculo(
         self, id_veiculo, datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     ):
@@ -1102,10 +886,13 @@ class VeiculoService:
         data_fim = data_fim - pd.DateOffset(days=min_dias + 1)
         data_fim_str = data_fim.strftime("%Y-%m-%d")
 
+        # Parâmetros da query
+        params = {"data_inicio": data_inicio_str, "data_fim": data_fim_str, "id_veiculo": id_veiculo}
+
         # Subqueries
-        subquery_oficinas_str = subquery_oficinas(lista_oficinas)
-        subquery_secoes_str = subquery_secoes(lista_secaos)
-        subquery_os_str = subquery_os(lista_os)
+        subquery_oficinas_str = subquery_oficinas(lista_oficinas, params=params)
+        subquery_secoes_str = subquery_secoes(lista_secaos, params=params)
+        subquery_os_str = subquery_os(lista_os, params=params)
 
         query = f"""
         WITH 
@@ -1118,7 +905,7 @@ class VeiculoService:
             FROM 
                 view_pecas_desconsiderando_combustivel pg 
             WHERE 
-                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN '{data_inicio_str}' AND '{data_fim_str}'
+                to_timestamp(pg."DATA", 'DD/MM/YYYY') BETWEEN :data_inicio AND :data_fim
             GROUP BY 
                 pg."OS"
         ),
@@ -1126,14 +913,14 @@ class VeiculoService:
             SELECT
                 *
             FROM
-                mat_view_retrabalho_{min_dias}_dias m
+                {get_view_retrabalho(self.dbEngine, min_dias)} m
             LEFT JOIN 
                 os_dados_classificacao odc
             ON 
                 m."KEY_HASH" = odc."KEY_HASH" 
             WHERE
-                "DATA DO FECHAMENTO DA OS" BETWEEN '{data_inicio_str}' AND '{data_fim_str}' 
-                AND "CODIGO DO VEICULO" = '{id_veiculo}'
+                "DATA DO FECHAMENTO DA OS" BETWEEN :data_inicio AND :data_fim 
+                AND "CODIGO DO VEICULO" = :id_veiculo
                 {subquery_secoes_str}
                 {subquery_os_str}
                 {subquery_oficinas_str}
@@ -1145,7 +932,7 @@ class VeiculoService:
         """
 
         # Executa a query
-        df = pd.read_sql(query, self.dbEngine)
+        df = le_sql(query, self.dbEngine, params)
 
         # Preenche valores nulos
         df["total_valor"] = df["total_valor"].fillna(0)
@@ -1153,7 +940,7 @@ class VeiculoService:
         df["pecas_trocadas_str"] = df["pecas_trocadas_str"].fillna("Nenhuma")
 
         # Aplica a função para definir o status de cada OS
-        df["status_os"] = df.apply(definir_status, axis=1)
+        adiciona_status_os(df, label=False, emoji=False)
 
         # Datas aberturas (converte para DT)
         df["DATA DA ABERTURA DA OS DT"] = pd.to_datetime(df["DATA DA ABERTURA DA OS"])
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Escolha da view de retrabalho lida pelos serviços para cada número de dias (min_dias)
+#
+# Cada número de dias pode ter as views materializadas mat_view_retrabalho_{min_dias}_dias(_distinct) ou as views
+# derivadas de mat_view_retrabalho_base, view_retrabalho_{min_dias}_dias(_distinct), criadas com
+# cria_views_retrabalho(min_dias) (ver sql/005_retrabalho_base.sql). As views mat_view_retrabalho_* têm preferência.
+# O mesmo catálogo indica se as views de dimensão dos filtros (ver sql/002_dimensoes_filtros.sql), os agregados
+# mensais dos rankings (ver sql/003_rankings_mensais.sql) e a classificação incremental das OSs por tipo de serviço
+# (ver sql/004_classificacao_os_tipo_servico.sql) já foram criados.
+
+# Imports básicos
+import time
+from threading import Lock
+
+# Imports auxiliares
+from modules.data_version_utils import VERSAO_DADOS_INTERVALO_SEGUNDOS
+from modules.sql_utils import le_sql
+
+##############################################################################
+# CATÁLOGO ###################################################################
+##############################################################################
+# Views de retrabalho (e de dimensão e agregados mensais dos rankings) existentes no banco, por engine: {id(engine): (instante da consulta, conjunto de nomes)}
+_views_por_engine = {}
+_lock_views = Lock()
+
+
+def _consulta_views_retrabalho(dbEngine):
+    """Retorna os nomes das views de retrabalho, de dimensão e dos agregados mensais (e da tabela de execuções da classificação incremental) existentes no banco"""
+    query = """
+    SELECT
+        c.relname
+    FROM
+        pg_class c
+    WHERE
+        (
+            c.relkind IN ('m', 'v')
+            AND (
+                c.relname ~ '^(mat_view|view)_retrabalho_[0-9]+_dias(_distinct)?$'
+                OR c.relname ~ '^mat_view_dim_[a-z]+$'
+                OR c.relname ~ '^mat_view_ranking_mensal_(veiculo|colaborador)_[0-9]+_dias$'
+            )
+        )
+        OR (c.relkind = 'r' AND c.relname = 'os_classificacao_tipo_servico_execucoes')
+    """
+    df = le_sql(query, dbEngine)
+
+    return set(df["relname"])
+
+
+def get_views_retrabalho(dbEngine):
+    """Retorna os nomes das views de retrabalho existentes (consulta o catálogo no máximo uma vez por intervalo)"""
+    with _lock_views:
+        agora = time.monotonic()
+        consulta, views = _views_por_engine.get(id(dbEngine), (None, None))
+
+        if views is None or agora - consulta >= VERSAO_DADOS_INTERVALO_SEGUNDOS:
+            try:
+                views = _consulta_views_retrabalho(dbEngine)
+            except Exception as e:
+                # Sem acesso ao catálogo, os serviços continuam usando as views materializadas
+                print(f"Erro ao consultar as views de retrabalho: {e}")
+                views = views or set()
+
+            _views_por_engine[id(dbEngine)] = (agora, views)
+
+        return views
+
+
+def view_existe(dbEngine, nome_view):
+    """Indica se a view (de retrabalho, de dimensão ou agregado mensal) ou tabela opcional existe no banco, segundo o catálogo em memória"""
+    return nome_view in get_views_retrabalho(dbEngine)
+
+
+##############################################################################
+# ESCOLHA DA VIEW ############################################################
+##############################################################################
+def get_view_retrabalho(dbEngine, min_dias, distinct=False):
+    """
+    Retorna o nome da view de retrabalho de min_dias: a view materializada, se existir, ou a view derivada da base.
+    Se nenhuma das duas existir, retorna o nome da view materializada (o erro da query indica a view ausente)
+    """
+    sufixo = "_distinct" if distinct else ""
+    view_materializada = f"mat_view_retrabalho_{int(min_dias)}_dias{sufixo}"
+    view_derivada = f"view_retrabalho_{int(min_dias)}_dias{sufixo}"
+
+    views = get_views_retrabalho(dbEngine)
+    if view_materializada not in views and view_derivada in views:
+        return view_derivada
+
+    return view_materializada
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Tela de administração com a latência dos callbacks do Dash (percentis, tamanho das requisições/respostas e erros)
+
+##############################################################################
+# IMPORTS ####################################################################
+##############################################################################
+# Bibliotecas básicas
+import os
+from datetime import datetime
+
+# Importar bibliotecas do dash básicas e plotly
+import dash
+from dash import html, dcc, callback, Input, Output
+
+# Importar bibliotecas do bootstrap e ag-grid
+import dash_bootstrap_components as dbc
+import dash_ag_grid as dag
+
+# Dash componentes Mantine e icones
+import dash_mantine_components as dmc
+from dash_iconify import DashIconify
+
+# Importar nossas constantes e funções utilitárias
+import locale_utils
+
+# Imports específicos
+from modules.callback_metricas_utils import metricas_callbacks, CALLBACK_METRICAS_AMOSTRAS
+import modules.admin.tabelas as admin_tabelas
+
+
+##############################################################################
+# DADOS ######################################################################
+##############################################################################
+# Colunas arredondadas para exibição
+COLUNAS_ARREDONDADAS = [
+    "tempo_total_ms",
+    "tempo_medio_ms",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "max_ms",
+    "bytes_entrada_medio",
+    "bytes_saida_medio",
+]
+
+
+# Função para preparar as estatísticas para a tabela
+def prepara_dados_estatisticas():
+    estatisticas = metricas_callbacks.estatisticas()
+    for c in estatisticas:
+        for coluna in COLUNAS_ARREDONDADAS:
+            c[coluna] = round(c[coluna], 1)
+
+    return estatisticas
+
+
+# Função para gerar o resumo do processo (worker) que atendeu a requisição
+def gera_resumo_processo(estatisticas):
+    total_chamadas = sum(c["chamadas"] for c in estatisticas)
+    total_erros = sum(c["erros"] for c in estatisticas)
+
+    return [
+        dmc.Badge(f"Processo (PID): {os.getpid()}", variant="outline"),
+        dmc.Badge(f"Callbacks executados: {len(estatisticas)}", variant="outline"),
+        dmc.Badge(f"Chamadas: {total_chamadas}", variant="outline"),
+        dmc.Badge(f"Erros: {total_erros}", variant="outline", color="red"),
+        dmc.Badge(f"Percentis sobre as últimas {CALLBACK_METRICAS_AMOSTRAS} chamadas", variant="outline", color="gray"),
+    ]
+
+
+##############################################################################
+# CALLBACKS ##################################################################
+##############################################################################
+
+
+# Callback para carregar (ou zerar) as estatísticas
+@callback(
+    [
+        Output("tabela-admin-callbacks", "rowData"),
+        Output("resumo-admin-callbacks", "children"),
+    ],
+    Input("btn-atualizar-admin-callbacks", "n_clicks"),
+    Input("btn-zerar-admin-callbacks", "n_clicks"),
+    Input("intervalo-admin-callbacks", "n_intervals"),
+)
+def cb_carregar_estatisticas_callbacks(n_clicks_atualizar, n_clicks_zerar, n_intervals):
+    if dash.ctx.triggered_id == "btn-zerar-admin-callbacks":
+        metricas_callbacks.reinicia()
+
+    estatisticas = prepara_dados_estatisticas()
+
+    return estatisticas, gera_resumo_processo(estatisticas)
+
+
+# Callback para exportar as estatísticas em JSON
+@callback(
+    Output("download-json-admin-callbacks", "data"),
+    Input("btn-exportar-admin-callbacks", "n_clicks"),
+    prevent_initial_call=True,
+)
+def cb_exportar_estatisticas_callbacks(n_clicks):
+    if n_clicks is None or n_clicks == 0:
+        return dash.no_update
+
+    nome_arquivo = f"metricas_callbacks_{os.getpid()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+    return dict(content=metricas_callbacks.exporta_json(), filename=nome_arquivo)
+
+
+##############################################################################
+# Layout #####################################################################
+##############################################################################
+def layout(**kwargs):
+    return dbc.Container(
+        [
+            # Atualização automática e download
+            dcc.Interval(id="intervalo-admin-callbacks", interval=60 * 1000),
+            dcc.Download(id="download-json-admin-callbacks"),
+            # Cabeçalho
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:timer-cog-outline", width=45), width="auto"),
+                    dbc.Col(
+                        html.H1(
+                            [
+                                html.Strong("Latência"),
+                                "\u00a0 dos Callbacks",
+                            ],
+                            className="align-self-center",
+                        ),
+                        width=True,
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            [DashIconify(icon="mdi:refresh", className="me-1"), "Atualizar"],
+                            id="btn-atualizar-admin-callbacks",
+                            color="primary",
+                            className="me-1",
+                            style={"padding": "1em"},
+                        ),
+                        className="mt-3 mt-md-0",
+                        width="auto",
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            [DashIconify(icon="mdi:code-json", className="me-1"), "Exportar JSON"],
+                            id="btn-exportar-admin-callbacks",
+                            color="success",
+                            className="me-1",
+                            style={"padding": "1em"},
+                        ),
+                        className="mt-3 mt-md-0",
+                        width="auto",
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            [DashIconify(icon="mdi:delete-sweep", className="me-1"), "Zerar"],
+                            id="btn-zerar-admin-callbacks",
+                            color="danger",
+                            outline=True,
+                            className="me-1",
+                            style={"padding": "1em"},
+                        ),
+                        className="mt-3 mt-md-0",
+                        width="auto",
+                    ),
+                ],
+                align="center",
+            ),
+            html.Hr(),
+            dmc.Text(
+                "As estatísticas são do processo (worker) que atendeu esta requisição e são zeradas quando ele é reiniciado. "
+                "O tempo é o da execução do callback no servidor, incluindo a serialização da resposta; "
+                "os tamanhos são os da requisição recebida e da resposta JSON. "
+                "As mesmas métricas estão disponíveis em JSON na rota /metrics/callbacks.",
+                size="sm",
+                c="dimmed",
+            ),
+            dmc.Space(h=10),
+            dmc.Group(id="resumo-admin-callbacks", gap="xs"),
+            dmc.Space(h=20),
+            dag.AgGrid(
+                id="tabela-admin-callbacks",
+                columnDefs=admin_tabelas.tbl_metricas_callbacks,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True, "resizable": True},
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                    "enableCellTextSelection": True,
+                    "ensureDomOrder": True,
+                    "tooltipShowDelay": 300,
+                },
+                style={"height": 600, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+        ]
+    )
+
+
+##############################################################################
+# Registro da página #########################################################
+##############################################################################
+dash.register_page(
+    __name__, name="Latência dos Callbacks", path="/admin-callbacks", icon="mdi:timer-cog-outline", hide_page=True
+)
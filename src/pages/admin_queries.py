@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Tela de administração com o desempenho das queries executadas pelos serviços (tempos, linhas e queries lentas)
+
+##############################################################################
+# IMPORTS ####################################################################
+##############################################################################
+# Bibliotecas básicas
+import os
+
+# Importar bibliotecas do dash básicas e plotly
+import dash
+from dash import html, dcc, callback, Input, Output
+
+# Importar bibliotecas do bootstrap e ag-grid
+import dash_bootstrap_components as dbc
+import dash_ag_grid as dag
+
+# Dash componentes Mantine e icones
+import dash_mantine_components as dmc
+from dash_iconify import DashIconify
+
+# Importar nossas constantes e funções utilitárias
+import locale_utils
+
+# Banco de Dados
+from db import PostgresSingleton
+
+# Imports específicos
+from modules.query_metricas_utils import metricas_queries, QUERY_LENTA_LOG_MS
+from modules.pool_metricas_utils import estatisticas_pool
+import modules.admin.tabelas as admin_tabelas
+
+
+##############################################################################
+# LEITURA DE DADOS ###########################################################
+##############################################################################
+# Conexão com os bancos
+pgDB = PostgresSingleton.get_instance()
+pgEngine = pgDB.get_engine()
+
+# Colunas arredondadas para exibição
+COLUNAS_ARREDONDADAS = [
+    "tempo_total_ms",
+    "tempo_banco_medio_ms",
+    "tempo_banco_max_ms",
+    "tempo_dataframe_medio_ms",
+    "tempo_dataframe_max_ms",
+    "linhas_media",
+]
+
+
+# Função para preparar as estatísticas para a tabela
+def prepara_dados_estatisticas():
+    estatisticas = metricas_queries.estatisticas()
+    for e in estatisticas:
+        for coluna in COLUNAS_ARREDONDADAS:
+            e[coluna] = round(e[coluna], 1)
+
+    return estatisticas
+
+
+# Função para gerar o resumo do processo (worker) que atendeu a requisição
+def gera_resumo_processo(estatisticas):
+    pool = estatisticas_pool(pgEngine)
+    total_execucoes = sum(e["execucoes"] for e in estatisticas)
+    total_lentas = sum(e["lentas"] for e in estatisticas)
+
+    return [
+        dmc.Badge(f"Processo (PID): {os.getpid()}", variant="outline"),
+        dmc.Badge(f"Queries distintas: {len(estatisticas)}", variant="outline"),
+        dmc.Badge(f"Execuções: {total_execucoes}", variant="outline"),
+        dmc.Badge(f"Lentas (≥ {QUERY_LENTA_LOG_MS:.0f} ms): {total_lentas}", variant="outline", color="red"),
+        dmc.Badge(f"Pool: {pool['em_uso']} em uso / {pool['livres']} livres", variant="outline", color="gray"),
+        dmc.Badge(f"Timeouts do pool: {pool['total_timeouts']}", variant="outline", color="gray"),
+    ]
+
+
+##############################################################################
+# CALLBACKS ##################################################################
+##############################################################################
+
+
+# Callback para carregar (ou zerar) as estatísticas
+@callback(
+    [
+        Output("tabela-admin-queries-estatisticas", "rowData"),
+        Output("tabela-admin-queries-lentas", "rowData"),
+        Output("resumo-admin-queries", "children"),
+    ],
+    Input("btn-atualizar-admin-queries", "n_clicks"),
+    Input("btn-zerar-admin-queries", "n_clicks"),
+    Input("intervalo-admin-queries", "n_intervals"),
+)
+def cb_carregar_estatisticas_queries(n_clicks_atualizar, n_clicks_zerar, n_intervals):
+    if dash.ctx.triggered_id == "btn-zerar-admin-queries":
+        metricas_queries.reinicia()
+
+    estatisticas = prepara_dados_estatisticas()
+
+    return estatisticas, metricas_queries.queries_lentas(), gera_resumo_processo(estatisticas)
+
+
+##############################################################################
+# Layout #####################################################################
+##############################################################################
+def layout(**kwargs):
+    return dbc.Container(
+        [
+            # Atualização automática
+            dcc.Interval(id="intervalo-admin-queries", interval=60 * 1000),
+            # Cabeçalho
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:database-clock", width=45), width="auto"),
+                    dbc.Col(
+                        html.H1(
+                            [
+                                html.Strong("Desempenho"),
+                                "\u00a0 das Queries",
+                            ],
+                            className="align-self-center",
+                        ),
+                        width=True,
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            [DashIconify(icon="mdi:refresh", className="me-1"), "Atualizar"],
+                            id="btn-atualizar-admin-queries",
+                            color="primary",
+                            className="me-1",
+                            style={"padding": "1em"},
+                        ),
+                        className="mt-3 mt-md-0",
+                        width="auto",
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            [DashIconify(icon="mdi:delete-sweep", className="me-1"), "Zerar"],
+                            id="btn-zerar-admin-queries",
+                            color="danger",
+                            outline=True,
+                            className="me-1",
+                            style={"padding": "1em"},
+                        ),
+                        className="mt-3 mt-md-0",
+                        width="auto",
+                    ),
+                ],
+                align="center",
+            ),
+            html.Hr(),
+            dmc.Text(
+                "As estatísticas são do processo (worker) que atendeu esta requisição e são zeradas quando ele é reiniciado. "
+                "Tempo no banco: execução da query e transferência do resultado; tempo de DataFrame: montagem do DataFrame pelo pandas.",
+                size="sm",
+                c="dimmed",
+            ),
+            dmc.Space(h=10),
+            dmc.Group(id="resumo-admin-queries", gap="xs"),
+            dmc.Space(h=20),
+            html.H4("Estatísticas por query"),
+            dag.AgGrid(
+                id="tabela-admin-queries-estatisticas",
+                columnDefs=admin_tabelas.tbl_estatisticas_queries,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True, "resizable": True},
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                    "enableCellTextSelection": True,
+                    "ensureDomOrder": True,
+                    "tooltipShowDelay": 300,
+                },
+                style={"height": 500, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+            html.H4("Últimas queries lentas"),
+            dag.AgGrid(
+                id="tabela-admin-queries-lentas",
+                columnDefs=admin_tabelas.tbl_queries_lentas,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True, "resizable": True},
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                    "enableCellTextSelection": True,
+                    "ensureDomOrder": True,
+                    "tooltipShowDelay": 300,
+                },
+                style={"height": 400, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+        ]
+    )
+
+
+##############################################################################
+# Registro da página #########################################################
+##############################################################################
+dash.register_page(
+    __name__, name="Desempenho das Queries", path="/admin-queries", icon="mdi:database-clock", hide_page=True
+)
@@ -32,7 +32,8 @@ import locale_utils
 from db import PostgresSingleton
 
 # Imports gerais
-from modules.entities_utils import get_mecanicos, get_lista_os, get_oficinas, get_secoes, get_modelos, gerar_excel
+from modules.entities_utils import gerar_excel
+from modules.catalogo_entidades_utils import get_catalogo_entidades
 
 # Imports específicos
 from modules.home.home_service import HomeService
@@ -49,28 +50,8 @@ pgEngine = pgDB.get_engine()
 # Cria o serviço
 home_service = HomeService(pgEngine)
 
-# Modelos de veículos
-df_modelos_veiculos = get_modelos(pgEngine)
-lista_todos_modelos_veiculos = df_modelos_veiculos.to_dict(orient="records")
-lista_todos_modelos_veiculos.insert(0, {"MODELO": "TODOS"})
-
-# Obtem a lista de Oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
-
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
-
-# Colaboradores / Mecânicos
-df_mecanicos = get_mecanicos(pgEngine)
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-lista_todas_os.insert(0, {"LABEL": "TODAS"})
+# Catálogo das entidades dos filtros (lidas no primeiro uso e atualizadas periodicamente)
+catalogo_entidades = get_catalogo_entidades(pgEngine)
 
 
 ##############################################################################
@@ -172,7 +153,7 @@ def corrige_input_secao(lista_secaos):
 )
 def corrige_input_ordem_servico(lista_os, lista_secaos):
     # Vamos pegar as OS possíveis para as seções selecionadas
-    df_lista_os_secao = df_lista_os
+    df_lista_os_secao = catalogo_entidades.obtem("lista_os")
 
     if "TODAS" not in lista_secaos:
         df_lista_os_secao = df_lista_os_secao[df_lista_os_secao["SECAO"].isin(lista_secaos)]
@@ -259,129 +240,16 @@ def plota_grafico_por_modelo(datas, min_dias, lista_modelos, lista_oficinas, lis
     return fig
 
 
-# Callback para o grafico de evolução do retrabalho por modelo
-@callback(
-    Output("graph-evolucao-retrabalho-por-modelo-por-mes", "figure"),
-    [
-        Input("input-intervalo-datas-geral", "value"),
-        Input("input-select-dias-geral-retrabalho", "value"),
-        Input("input-select-modelo-veiculos-visao-geral", "value"),
-        Input("input-select-oficina-visao-geral", "value"),
-        Input("input-select-secao-visao-geral", "value"),
-        Input("input-select-ordens-servico-visao-geral", "value"),
-    ],
-)
-def plota_grafico_evolucao_retrabalho_por_modelo_por_mes(
-    datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-):
-    # Valida input
-    if not input_valido(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        return go.Figure()
-
-    # Obtem os dados
-    df = home_service.get_evolucao_retrabalho_por_modelo_por_mes(
-        datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    )
-
-    # Gera o gráfico
-    fig = home_graficos.gerar_grafico_evolucao_retrabalho_por_modelo_por_mes(df)
-
-    return fig
-
-
-# Callbacks para o grafico de evolução do retrabalho por oficina
-@callback(
-    Output("graph-evolucao-retrabalho-por-garagem-por-mes", "figure"),
-    [
-        Input("input-intervalo-datas-geral", "value"),
-        Input("input-select-dias-geral-retrabalho", "value"),
-        Input("input-select-modelo-veiculos-visao-geral", "value"),
-        Input("input-select-oficina-visao-geral", "value"),
-        Input("input-select-secao-visao-geral", "value"),
-        Input("input-select-ordens-servico-visao-geral", "value"),
-    ],
-)
-def plota_grafico_evolucao_retrabalho_por_oficina_por_mes(
-    datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-):
-    # Valida input
-    if not input_valido(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        return go.Figure()
-
-    # Obtem os dados
-    df = home_service.get_evolucao_retrabalho_por_oficina_por_mes(
-        datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    )
-
-    # Gera o gráfico
-    fig = home_graficos.gerar_grafico_evolucao_retrabalho_por_oficina_por_mes(df)
-
-    return fig
-
-
-# Callbacks para o grafico de evolução do retrabalho por seção
+# Callback para os gráficos de evolução do retrabalho (modelo, oficina, seção, nota e custo)
+# Os dados de todos os gráficos são obtidos de uma vez e cada gráfico recebe a sua parte
 @callback(
-    Output("graph-evolucao-retrabalho-por-secao-por-mes", "figure"),
     [
-        Input("input-intervalo-datas-geral", "value"),
-        Input("input-select-dias-geral-retrabalho", "value"),
-        Input("input-select-modelo-veiculos-visao-geral", "value"),
-        Input("input-select-oficina-visao-geral", "value"),
-        Input("input-select-secao-visao-geral", "value"),
-        Input("input-select-ordens-servico-visao-geral", "value"),
+        Output("graph-evolucao-retrabalho-por-modelo-por-mes", "figure"),
+        Output("graph-evolucao-retrabalho-por-garagem-por-mes", "figure"),
+        Output("graph-evolucao-retrabalho-por-secao-por-mes", "figure"),
+        Output("graph-evolucao-retrabalho-por-nota-por-mes", "figure"),
+        Output("graph-evolucao-retrabalho-por-custo-por-mes", "figure"),
     ],
-)
-def plota_grafico_evolucao_retrabalho_por_secao_por_mes(
-    datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-):
-    # Valida input
-    if not input_valido(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        return go.Figure()
-
-    # Obtem os dados
-    df = home_service.get_evolucao_retrabalho_por_secao_por_mes(
-        datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    )
-
-    # Gera o gráfico
-    fig = home_graficos.gerar_grafico_evolucao_retrabalho_por_secao_por_mes(df)
-
-    return fig
-
-
-# Callbacks para o grafico de evolução do retrabalho por nota
-@callback(
-    Output("graph-evolucao-retrabalho-por-nota-por-mes", "figure"),
-    [
-        Input("input-intervalo-datas-geral", "value"),
-        Input("input-select-dias-geral-retrabalho", "value"),
-        Input("input-select-modelo-veiculos-visao-geral", "value"),
-        Input("input-select-oficina-visao-geral", "value"),
-        Input("input-select-secao-visao-geral", "value"),
-        Input("input-select-ordens-servico-visao-geral", "value"),
-    ],
-)
-def plota_grafico_evolucao_retrabalho_por_nota_por_mes(
-    datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-):
-    # Valida input
-    if not input_valido(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        return go.Figure()
-
-    # Obtem os dados
-    df = home_service.get_evolucao_retrabalho_por_nota_por_mes(
-        datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-    )
-
-    # Gera o gráfico
-    fig = home_graficos.gerar_grafico_evolucao_retrabalho_por_nota_por_mes(df)
-
-    return fig
-
-
-# Callbacks para o grafico de evolução do retrabalho por custo
-@callback(
-    Output("graph-evolucao-retrabalho-por-custo-por-mes", "figure"),
     [
         Input("input-intervalo-datas-geral", "value"),
         Input("input-select-dias-geral-retrabalho", "value"),
@@ -391,22 +259,24 @@ def plota_grafico_evolucao_retrabalho_por_nota_por_mes(
         Input("input-select-ordens-servico-visao-geral", "value"),
     ],
 )
-def plota_grafico_evolucao_retrabalho_por_custo_por_mes(
-    datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
-):
+def plota_graficos_evolucao_retrabalho_por_mes(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
     # Valida input
     if not input_valido(datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os):
-        return go.Figure()
+        return go.Figure(), go.Figure(), go.Figure(), go.Figure(), go.Figure()
 
     # Obtem os dados
-    df = home_service.get_evolucao_retrabalho_por_custo_por_mes(
+    dados_evolucao = home_service.get_evolucao_retrabalho_por_mes(
         datas, min_dias, lista_modelos, lista_oficinas, lista_secaos, lista_os
     )
 
-    # Gera o gráfico
-    fig = home_graficos.gerar_grafico_evolucao_retrabalho_por_custo_por_mes(df)
+    # Gera os gráficos
+    fig_modelo = home_graficos.gerar_grafico_evolucao_retrabalho_por_modelo_por_mes(dados_evolucao["modelo"])
+    fig_oficina = home_graficos.gerar_grafico_evolucao_retrabalho_por_oficina_por_mes(dados_evolucao["oficina"])
+    fig_secao = home_graficos.gerar_grafico_evolucao_retrabalho_por_secao_por_mes(dados_evolucao["secao"])
+    fig_nota = home_graficos.gerar_grafico_evolucao_retrabalho_por_nota_por_mes(dados_evolucao["nota"])
+    fig_custo = home_graficos.gerar_grafico_evolucao_retrabalho_por_custo_por_mes(dados_evolucao["custo"])
 
-    return fig
+    return fig_modelo, fig_oficina, fig_secao, fig_nota, fig_custo
 
 
 ##############################################################################
@@ -732,662 +602,669 @@ def gera_labels_inputs_visao_geral(campo):
 ##############################################################################
 # Layout #####################################################################
 ##############################################################################
-layout = dbc.Container(
-    [
-        # Loading
-        dmc.LoadingOverlay(
-            visible=True,
-            id="loading-overlay-guia-geral",
-            loaderProps={"size": "xl"},
-            overlayProps={
-                "radius": "lg",
-                "blur": 2,
-                "style": {
-                    "top": 0,  # Start from the top of the viewport
-                    "left": 0,  # Start from the left of the viewport
-                    "width": "100vw",  # Cover the entire width of the viewport
-                    "height": "100vh",  # Cover the entire height of the viewport
+def layout(**kwargs):
+    # Listas dos filtros (obtidas do catálogo a cada carregamento da página, para refletir os dados atuais)
+    lista_todos_modelos_veiculos = catalogo_entidades.lista_registros("modelos", {"MODELO": "TODOS"})
+    lista_todas_oficinas = catalogo_entidades.lista_registros("oficinas", {"LABEL": "TODAS"})
+    lista_todas_secoes = catalogo_entidades.lista_registros("secoes", {"LABEL": "TODAS"})
+    lista_todas_os = catalogo_entidades.lista_registros("lista_os", {"LABEL": "TODAS"})
+
+    return dbc.Container(
+        [
+            # Loading
+            dmc.LoadingOverlay(
+                visible=True,
+                id="loading-overlay-guia-geral",
+                loaderProps={"size": "xl"},
+                overlayProps={
+                    "radius": "lg",
+                    "blur": 2,
+                    "style": {
+                        "top": 0,  # Start from the top of the viewport
+                        "left": 0,  # Start from the left of the viewport
+                        "width": "100vw",  # Cover the entire width of the viewport
+                        "height": "100vh",  # Cover the entire height of the viewport
+                    },
                 },
-            },
-            zIndex=10,
-        ),
-        # Informações / Ajuda
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        dbc.Alert(
-                            [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(DashIconify(icon="gravity-ui:target-dart", width=45), width="auto"),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Correção de primeira:"),
-                                                    """
+                zIndex=10,
+            ),
+            # Informações / Ajuda
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Alert(
+                                [
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="gravity-ui:target-dart", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Correção de primeira:"),
+                                                        """
                                                 sem nova OS para o mesmo problema no período selecionado.
                                                 """,
-                                                ]
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
+                                        ],
+                                        align="center",
+                                    ),
+                                ],
+                                dismissable=True,
+                                color="success",
+                            ),
+                        ],
+                        md=4,
+                    ),
+                    dbc.Col(
+                        [
+                            dbc.Alert(
+                                [
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(
+                                                DashIconify(icon="game-icons:multiple-targets", width=45), width="auto"
+                                            ),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Correção tardia:"),
+                                                        """
+                                                havia OS anterior, mas não há nova para o mesmo problema no período.
+                                                """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
+                                        ],
+                                        align="center",
+                                    ),
+                                ],
+                                dismissable=True,
+                                color="warning",
+                            ),
+                        ],
+                        md=4,
+                    ),
+                    dbc.Col(
+                        [
+                            dbc.Alert(
+                                [
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="pepicons-pop:rewind-time", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Retrabalho:"),
+                                                        """
+                                                possui OS anterior e posterior para o mesmo problema no período.
+                                                """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
+                                        ],
+                                        align="center",
+                                    ),
+                                ],
+                                dismissable=True,
+                                color="danger",
+                            ),
+                        ],
+                        md=4,
+                    ),
+                ]
+            ),
+            # Cabeçalho
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            # Cabeçalho e Inputs
+                            dbc.Row(
+                                [
+                                    html.Hr(),
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="mdi:bus-alert", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.H1(
+                                                    [
+                                                        "Visão geral do\u00a0",
+                                                        html.Strong("retrabalho"),
+                                                    ],
+                                                    className="align-self-center",
+                                                ),
+                                                width=True,
                                             ),
-                                            className="mt-2",
-                                            width=True,
+                                        ],
+                                        align="center",
+                                    ),
+                                    dmc.Space(h=15),
+                                    html.Hr(),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Data (intervalo) de análise"),
+                                                        dmc.DatePicker(
+                                                            id="input-intervalo-datas-geral",
+                                                            allowSingleDateInRange=True,
+                                                            type="range",
+                                                            minDate=date(2024, 8, 1),
+                                                            maxDate=date.today(),
+                                                            value=[date(2024, 8, 1), date.today()],
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                )
+                                            ],
+                                            body=True,
                                         ),
-                                    ],
-                                    align="center",
-                                ),
-                            ],
-                            dismissable=True,
-                            color="success",
-                        ),
-                    ],
-                    md=4,
-                ),
-                dbc.Col(
-                    [
-                        dbc.Alert(
+                                        md=6,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Tempo (em dias) entre OS para retrabalho"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-dias-geral-retrabalho",
+                                                            options=[
+                                                                {"label": "10 dias", "value": 10},
+                                                                {"label": "15 dias", "value": 15},
+                                                                {"label": "30 dias", "value": 30},
+                                                            ],
+                                                            placeholder="Período em dias",
+                                                            value=10,
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                    ),
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Modelos de Veículos"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-modelo-veiculos-visao-geral",
+                                                            options=[
+                                                                {
+                                                                    "label": os["MODELO"],
+                                                                    "value": os["MODELO"],
+                                                                }
+                                                                for os in lista_todos_modelos_veiculos
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODOS"],
+                                                            placeholder="Selecione um ou mais modelos...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=12,
+                                    ),
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Oficinas"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-oficina-visao-geral",
+                                                            options=[
+                                                                {"label": os["LABEL"], "value": os["LABEL"]}
+                                                                for os in lista_todas_oficinas
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODAS"],
+                                                            placeholder="Selecione uma ou mais oficinas...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Seções (categorias) de manutenção"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-secao-visao-geral",
+                                                            options=[
+                                                                {"label": sec["LABEL"], "value": sec["LABEL"]}
+                                                                for sec in lista_todas_secoes
+                                                            ],
+                                                            multi=True,
+                                                            value=["MANUTENCAO ELETRICA", "MANUTENCAO MECANICA"],
+                                                            placeholder="Selecione uma ou mais seções...",
+                                                        ),
+                                                    ],
+                                                    # className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                    ),
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Ordens de Serviço"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-ordens-servico-visao-geral",
+                                                            options=[
+                                                                {"label": os["LABEL"], "value": os["LABEL"]}
+                                                                for os in lista_todas_os
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODAS"],
+                                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=12,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                ]
+                            ),
+                        ],
+                        md=8,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        # Resumo
+                        dbc.Row(
                             [
                                 dbc.Row(
                                     [
+                                        # Cabeçalho
+                                        html.Hr(),
                                         dbc.Col(
-                                            DashIconify(icon="game-icons:multiple-targets", width=45), width="auto"
-                                        ),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Correção tardia:"),
-                                                    """
-                                                havia OS anterior, mas não há nova para o mesmo problema no período.
-                                                """,
-                                                ]
-                                            ),
-                                            className="mt-2",
-                                            width=True,
+                                            DashIconify(icon="wpf:statistics", width=45),
+                                            width="auto",
                                         ),
+                                        dbc.Col(html.H1("Resumo", className="align-self-center"), width=True),
+                                        dmc.Space(h=15),
+                                        html.Hr(),
                                     ],
                                     align="center",
                                 ),
-                            ],
-                            dismissable=True,
-                            color="warning",
+                                dcc.Graph(id="graph-pizza-sintese-retrabalho-geral"),
+                            ]
                         ),
-                    ],
-                    md=4,
-                ),
-                dbc.Col(
-                    [
-                        dbc.Alert(
+                        md=4,
+                    ),
+                ]
+            ),
+            # Gráfico de Retrabalho por Modelo
+            dmc.Space(h=30),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:fleet", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Quantitativo da frota que teve problema e retrabalho por modelo",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_visao_geral("visao-geral-quanti-frota"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-visao-geral-por-modelo"),
+            dmc.Space(h=40),
+            # Grafico de Evolução do Retrabalho por Modelo
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-settings-20-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do retrabalho por modelo / mês",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_visao_geral("visao-geral-evolucao-por-modelo"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-por-modelo-por-mes"),
+            dmc.Space(h=40),
+            # Graficos de Evolução do Retrabalho por Garagem e Seção
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-wrench-20-filled", width=45), width="auto"),
+                    # dbc.Col(html.H4("Evolução do retrabalho por oficina / mês", className="align-self-center"), width=True),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do retrabalho por oficina / mês",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_visao_geral("visao-geral-evolucao-por-oficina"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-por-garagem-por-mes"),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-text-20-filled", width=45), width="auto"),
+                    # dbc.Col(html.H4("Evolução do retrabalho por seção / mês", className="align-self-center"), width=True),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do retrabalho por seção / mês",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_visao_geral("visao-geral-evolucao-por-secao"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-por-secao-por-mes"),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-sparkle-20-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução da nota do retrabalho por mês",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_visao_geral("visao-geral-evolucao-por-nota"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-por-nota-por-mes"),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="hugeicons:search-dollar", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do custo (peças) do retrabalho por mês",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_visao_geral("visao-geral-evolucao-por-custo"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-por-custo-por-mes"),
+            dmc.Space(h=40),
+            # Tabela com as estatísticas gerais de Retrabalho
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:line-horizontal-4-search-16-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
                             [
+                                html.H4(
+                                    "Detalhamento por tipo de OS (serviço)",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
                                 dbc.Row(
                                     [
-                                        dbc.Col(DashIconify(icon="pepicons-pop:rewind-time", width=45), width="auto"),
+                                        dbc.Col(gera_labels_inputs_visao_geral("visao-geral-tabela-tipo-os"), width=True),
                                         dbc.Col(
-                                            html.P(
+                                            html.Div(
                                                 [
-                                                    html.Strong("Retrabalho:"),
-                                                    """
-                                                possui OS anterior e posterior para o mesmo problema no período.
-                                                """,
-                                                ]
+                                                    html.Button(
+                                                        "Exportar para Excel",
+                                                        id="btn-exportar-tipo-os",
+                                                        n_clicks=0,
+                                                        style={
+                                                            "background-color": "#007bff",  # Azul
+                                                            "color": "white",
+                                                            "border": "none",
+                                                            "padding": "10px 20px",
+                                                            "border-radius": "8px",
+                                                            "cursor": "pointer",
+                                                            "font-size": "16px",
+                                                            "font-weight": "bold",
+                                                        },
+                                                        className="btnExcel",
+                                                    ),
+                                                    dcc.Download(id="download-excel-tipo-os"),
+                                                ],
+                                                style={"text-align": "right"},
                                             ),
-                                            className="mt-2",
-                                            width=True,
+                                            width="auto",
                                         ),
                                     ],
                                     align="center",
+                                    justify="between",  # Deixa os itens espaçados
                                 ),
-                            ],
-                            dismissable=True,
-                            color="danger",
+                            ]
                         ),
-                    ],
-                    md=4,
-                ),
-            ]
-        ),
-        # Cabeçalho
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        # Cabeçalho e Inputs
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dmc.Space(h=20),
+            dag.AgGrid(
+                # enableEnterpriseModules=True,
+                id="tabela-top-os-retrabalho-geral",
+                columnDefs=home_tabelas.tbl_top_os_geral_retrabalho,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                },
+                # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
+                style={"height": 400, "resize": "vertical", "overflow": "hidden"},
+            ),
+            dmc.Space(h=40),
+            # Tabela com as estatísticas gerais por Colaborador
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:account-wrench", width=45), width="auto"),
+                    dbc.Col(
                         dbc.Row(
                             [
-                                html.Hr(),
+                                html.H4(
+                                    "Detalhamento por colaborador das OSs escolhidas",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
                                 dbc.Row(
                                     [
-                                        dbc.Col(DashIconify(icon="mdi:bus-alert", width=45), width="auto"),
                                         dbc.Col(
-                                            html.H1(
-                                                [
-                                                    "Visão geral do\u00a0",
-                                                    html.Strong("retrabalho"),
-                                                ],
-                                                className="align-self-center",
-                                            ),
-                                            width=True,
+                                            gera_labels_inputs_visao_geral("visao-geral-tabela-colaborador-os"), width=True
                                         ),
-                                    ],
-                                    align="center",
-                                ),
-                                dmc.Space(h=15),
-                                html.Hr(),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Data (intervalo) de análise"),
-                                                    dmc.DatePicker(
-                                                        id="input-intervalo-datas-geral",
-                                                        allowSingleDateInRange=True,
-                                                        type="range",
-                                                        minDate=date(2024, 8, 1),
-                                                        maxDate=date.today(),
-                                                        value=[date(2024, 8, 1), date.today()],
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            )
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=6,
-                                    className="mb-3 mb-md-0",
-                                ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Tempo (em dias) entre OS para retrabalho"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-dias-geral-retrabalho",
-                                                        options=[
-                                                            {"label": "10 dias", "value": 10},
-                                                            {"label": "15 dias", "value": 15},
-                                                            {"label": "30 dias", "value": 30},
-                                                        ],
-                                                        placeholder="Período em dias",
-                                                        value=10,
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=6,
-                                ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Modelos de Veículos"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-modelo-veiculos-visao-geral",
-                                                        options=[
-                                                            {
-                                                                "label": os["MODELO"],
-                                                                "value": os["MODELO"],
-                                                            }
-                                                            for os in lista_todos_modelos_veiculos
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODOS"],
-                                                        placeholder="Selecione um ou mais modelos...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=12,
-                                ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
+                                        dbc.Col(
                                             html.Div(
                                                 [
-                                                    dbc.Label("Oficinas"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-oficina-visao-geral",
-                                                        options=[
-                                                            {"label": os["LABEL"], "value": os["LABEL"]}
-                                                            for os in lista_todas_oficinas
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODAS"],
-                                                        placeholder="Selecione uma ou mais oficinas...",
+                                                    html.Button(
+                                                        "Exportar para Excel",
+                                                        id="btn-exportar-tabela-colaborador",
+                                                        n_clicks=0,
+                                                        style={
+                                                            "background-color": "#007bff",  # Azul
+                                                            "color": "white",
+                                                            "border": "none",
+                                                            "padding": "10px 20px",
+                                                            "border-radius": "8px",
+                                                            "cursor": "pointer",
+                                                            "font-size": "16px",
+                                                            "font-weight": "bold",
+                                                        },
+                                                        className="btnExcel",
                                                     ),
+                                                    dcc.Download(id="download-excel-tabela-colaborador"),
                                                 ],
-                                                className="dash-bootstrap",
+                                                style={"text-align": "right"},
                                             ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=6,
-                                    className="mb-3 mb-md-0",
+                                            width="auto",
+                                        ),
+                                    ],
+                                    align="center",
+                                    justify="between",  # Deixa os itens espaçados
                                 ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Seções (categorias) de manutenção"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-secao-visao-geral",
-                                                        options=[
-                                                            {"label": sec["LABEL"], "value": sec["LABEL"]}
-                                                            for sec in lista_todas_secoes
-                                                        ],
-                                                        multi=True,
-                                                        value=["MANUTENCAO ELETRICA", "MANUTENCAO MECANICA"],
-                                                        placeholder="Selecione uma ou mais seções...",
-                                                    ),
-                                                ],
-                                                # className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=6,
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dmc.Space(h=20),
+            dag.AgGrid(
+                id="tabela-top-os-colaborador-geral",
+                columnDefs=home_tabelas.tbl_top_colaborador_geral_retrabalho,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                    "enableCellTextSelection": True,
+                    "ensureDomOrder": True,
+                },
+                # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
+                style={"height": 400, "resize": "vertical", "overflow": "hidden"},
+            ),
+            dmc.Space(h=40),
+            # Tabela com as estatísticas gerais por Veículo
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:bus-wrench", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Detalhamento por veículo das OSs escolhidas",
+                                    className="align-self-center",
                                 ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
+                                dmc.Space(h=5),
+                                dbc.Row(
+                                    [
+                                        dbc.Col(gera_labels_inputs_visao_geral("visao-geral-tabela-veiculo"), width=True),
+                                        dbc.Col(
                                             html.Div(
                                                 [
-                                                    dbc.Label("Ordens de Serviço"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-ordens-servico-visao-geral",
-                                                        options=[
-                                                            {"label": os["LABEL"], "value": os["LABEL"]}
-                                                            for os in lista_todas_os
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODAS"],
-                                                        placeholder="Selecione uma ou mais ordens de serviço...",
+                                                    html.Button(
+                                                        "Exportar para Excel",
+                                                        id="btn-exportar-tabela-veiculo",
+                                                        n_clicks=0,
+                                                        style={
+                                                            "background-color": "#007bff",  # Azul
+                                                            "color": "white",
+                                                            "border": "none",
+                                                            "padding": "10px 20px",
+                                                            "border-radius": "8px",
+                                                            "cursor": "pointer",
+                                                            "font-size": "16px",
+                                                            "font-weight": "bold",
+                                                        },
+                                                        className="btnExcel",
                                                     ),
+                                                    dcc.Download(id="download-excel-tabela-veiculo"),
                                                 ],
-                                                className="dash-bootstrap",
+                                                style={"text-align": "right"},
                                             ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=12,
-                                    className="mb-3 mb-md-0",
+                                            width="auto",
+                                        ),
+                                    ],
+                                    align="center",
+                                    justify="between",  # Deixa os itens espaçados
                                 ),
                             ]
                         ),
-                    ],
-                    md=8,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    # Resumo
-                    dbc.Row(
-                        [
-                            dbc.Row(
-                                [
-                                    # Cabeçalho
-                                    html.Hr(),
-                                    dbc.Col(
-                                        DashIconify(icon="wpf:statistics", width=45),
-                                        width="auto",
-                                    ),
-                                    dbc.Col(html.H1("Resumo", className="align-self-center"), width=True),
-                                    dmc.Space(h=15),
-                                    html.Hr(),
-                                ],
-                                align="center",
-                            ),
-                            dcc.Graph(id="graph-pizza-sintese-retrabalho-geral"),
-                        ]
-                    ),
-                    md=4,
-                ),
-            ]
-        ),
-        # Gráfico de Retrabalho por Modelo
-        dmc.Space(h=30),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:fleet", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Quantitativo da frota que teve problema e retrabalho por modelo",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_visao_geral("visao-geral-quanti-frota"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-visao-geral-por-modelo"),
-        dmc.Space(h=40),
-        # Grafico de Evolução do Retrabalho por Modelo
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-settings-20-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do retrabalho por modelo / mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_visao_geral("visao-geral-evolucao-por-modelo"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-por-modelo-por-mes"),
-        dmc.Space(h=40),
-        # Graficos de Evolução do Retrabalho por Garagem e Seção
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-wrench-20-filled", width=45), width="auto"),
-                # dbc.Col(html.H4("Evolução do retrabalho por oficina / mês", className="align-self-center"), width=True),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do retrabalho por oficina / mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_visao_geral("visao-geral-evolucao-por-oficina"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-por-garagem-por-mes"),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-text-20-filled", width=45), width="auto"),
-                # dbc.Col(html.H4("Evolução do retrabalho por seção / mês", className="align-self-center"), width=True),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do retrabalho por seção / mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_visao_geral("visao-geral-evolucao-por-secao"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-por-secao-por-mes"),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-sparkle-20-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução da nota do retrabalho por mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_visao_geral("visao-geral-evolucao-por-nota"),
-                        ]
+                        width=True,
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-por-nota-por-mes"),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="hugeicons:search-dollar", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do custo (peças) do retrabalho por mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_visao_geral("visao-geral-evolucao-por-custo"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-por-custo-por-mes"),
-        dmc.Space(h=40),
-        # Tabela com as estatísticas gerais de Retrabalho
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:line-horizontal-4-search-16-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Detalhamento por tipo de OS (serviço)",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            dbc.Row(
-                                [
-                                    dbc.Col(gera_labels_inputs_visao_geral("visao-geral-tabela-tipo-os"), width=True),
-                                    dbc.Col(
-                                        html.Div(
-                                            [
-                                                html.Button(
-                                                    "Exportar para Excel",
-                                                    id="btn-exportar-tipo-os",
-                                                    n_clicks=0,
-                                                    style={
-                                                        "background-color": "#007bff",  # Azul
-                                                        "color": "white",
-                                                        "border": "none",
-                                                        "padding": "10px 20px",
-                                                        "border-radius": "8px",
-                                                        "cursor": "pointer",
-                                                        "font-size": "16px",
-                                                        "font-weight": "bold",
-                                                    },
-                                                    className="btnExcel",
-                                                ),
-                                                dcc.Download(id="download-excel-tipo-os"),
-                                            ],
-                                            style={"text-align": "right"},
-                                        ),
-                                        width="auto",
-                                    ),
-                                ],
-                                align="center",
-                                justify="between",  # Deixa os itens espaçados
-                            ),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=20),
-        dag.AgGrid(
-            # enableEnterpriseModules=True,
-            id="tabela-top-os-retrabalho-geral",
-            columnDefs=home_tabelas.tbl_top_os_geral_retrabalho,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-            },
-            # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
-            style={"height": 400, "resize": "vertical", "overflow": "hidden"},
-        ),
-        dmc.Space(h=40),
-        # Tabela com as estatísticas gerais por Colaborador
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:account-wrench", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Detalhamento por colaborador das OSs escolhidas",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            dbc.Row(
-                                [
-                                    dbc.Col(
-                                        gera_labels_inputs_visao_geral("visao-geral-tabela-colaborador-os"), width=True
-                                    ),
-                                    dbc.Col(
-                                        html.Div(
-                                            [
-                                                html.Button(
-                                                    "Exportar para Excel",
-                                                    id="btn-exportar-tabela-colaborador",
-                                                    n_clicks=0,
-                                                    style={
-                                                        "background-color": "#007bff",  # Azul
-                                                        "color": "white",
-                                                        "border": "none",
-                                                        "padding": "10px 20px",
-                                                        "border-radius": "8px",
-                                                        "cursor": "pointer",
-                                                        "font-size": "16px",
-                                                        "font-weight": "bold",
-                                                    },
-                                                    className="btnExcel",
-                                                ),
-                                                dcc.Download(id="download-excel-tabela-colaborador"),
-                                            ],
-                                            style={"text-align": "right"},
-                                        ),
-                                        width="auto",
-                                    ),
-                                ],
-                                align="center",
-                                justify="between",  # Deixa os itens espaçados
-                            ),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=20),
-        dag.AgGrid(
-            id="tabela-top-os-colaborador-geral",
-            columnDefs=home_tabelas.tbl_top_colaborador_geral_retrabalho,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-                "enableCellTextSelection": True,
-                "ensureDomOrder": True,
-            },
-            # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
-            style={"height": 400, "resize": "vertical", "overflow": "hidden"},
-        ),
-        dmc.Space(h=40),
-        # Tabela com as estatísticas gerais por Veículo
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:bus-wrench", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Detalhamento por veículo das OSs escolhidas",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            dbc.Row(
-                                [
-                                    dbc.Col(gera_labels_inputs_visao_geral("visao-geral-tabela-veiculo"), width=True),
-                                    dbc.Col(
-                                        html.Div(
-                                            [
-                                                html.Button(
-                                                    "Exportar para Excel",
-                                                    id="btn-exportar-tabela-veiculo",
-                                                    n_clicks=0,
-                                                    style={
-                                                        "background-color": "#007bff",  # Azul
-                                                        "color": "white",
-                                                        "border": "none",
-                                                        "padding": "10px 20px",
-                                                        "border-radius": "8px",
-                                                        "cursor": "pointer",
-                                                        "font-size": "16px",
-                                                        "font-weight": "bold",
-                                                    },
-                                                    className="btnExcel",
-                                                ),
-                                                dcc.Download(id="download-excel-tabela-veiculo"),
-                                            ],
-                                            style={"text-align": "right"},
-                                        ),
-                                        width="auto",
-                                    ),
-                                ],
-                                align="center",
-                                justify="between",  # Deixa os itens espaçados
-                            ),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=20),
-        dag.AgGrid(
-            id="tabela-top-veiculos-geral",
-            columnDefs=home_tabelas.tbl_top_veiculo_retrabalho,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-            },
-            # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
-            style={"height": 400, "resize": "vertical", "overflow": "hidden"},
-        ),
-        dmc.Space(h=40),
-    ]
-)
+                ],
+                align="center",
+            ),
+            dmc.Space(h=20),
+            dag.AgGrid(
+                id="tabela-top-veiculos-geral",
+                columnDefs=home_tabelas.tbl_top_veiculo_retrabalho,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                },
+                # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
+                style={"height": 400, "resize": "vertical", "overflow": "hidden"},
+            ),
+            dmc.Space(h=40),
+        ]
+    )
 
 
 ##############################################################################
@@ -29,7 +29,8 @@ import locale_utils
 from db import PostgresSingleton
 
 # Imports gerais
-from modules.entities_utils import get_mecanicos, get_lista_os, get_oficinas, get_secoes, get_modelos, gerar_excel
+from modules.entities_utils import gerar_excel
+from modules.catalogo_entidades_utils import get_catalogo_entidades
 
 # Imports específicos
 from modules.crud_regra.crud_regra_service import CRUDRegraService
@@ -52,28 +53,8 @@ pgEngine = pgDB.get_engine()
 home_service = HomeService(pgEngine)
 crud_regra_service = CRUDRegraService(pgEngine)
 
-# Modelos de veículos
-df_modelos_veiculos = get_modelos(pgEngine)
-lista_todos_modelos_veiculos = df_modelos_veiculos.to_dict(orient="records")
-lista_todos_modelos_veiculos.insert(0, {"MODELO": "TODOS"})
-
-# Obtem a lista de Oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
-
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
-
-# Colaboradores / Mecânicos
-df_mecanicos = get_mecanicos(pgEngine)
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-lista_todas_os.insert(0, {"LABEL": "TODAS"})
+# Catálogo das entidades dos filtros (lidas no primeiro uso e atualizadas periodicamente)
+catalogo_entidades = get_catalogo_entidades(pgEngine)
 
 
 ##############################################################################
@@ -186,7 +167,7 @@ def corrige_input_secao(lista_secaos):
 )
 def corrige_input_ordem_servico(lista_os, lista_secaos):
     # Vamos pegar as OS possíveis para as seções selecionadas
-    df_lista_os_secao = df_lista_os
+    df_lista_os_secao = catalogo_entidades.obtem("lista_os")
 
     if "TODAS" not in lista_secaos:
         df_lista_os_secao = df_lista_os_secao[df_lista_os_secao["SECAO"].isin(lista_secaos)]
@@ -851,855 +832,862 @@ def callback_botao_relatorio_criacao_regra(
 ##############################################################################
 # Layout #####################################################################
 ##############################################################################
-layout = dbc.Container(
-    [
-        # Loading
-        # dmc.LoadingOverlay(
-        #     visible=False,
-        #     id="loading-overlay-guia-criar-regra",
-        #     loaderProps={"size": "xl"},
-        #     overlayProps={
-        #         "radius": "lg",
-        #         "blur": 2,
-        #         "style": {
-        #             "top": 0,  # Start from the top of the viewport
-        #             "left": 0,  # Start from the left of the viewport
-        #             "width": "100vw",  # Cover the entire width of the viewport
-        #             "height": "100vh",  # Cover the entire height of the viewport
-        #         },
-        #     },
-        #     zIndex=10,
-        # ),
-        # Informações / Ajuda
-        dmc.Modal(
-            # title="Erro ao carregar os dados",
-            id="modal-erro-teste-regra",
-            centered=True,
-            radius="lg",
-            size="md",
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro!", order=1),
-                    dmc.Text("Ocorreu um erro ao testar a regra. Verifique se a regra possui:"),
-                    dmc.List(
-                        [
-                            dmc.ListItem("Nome da regra;"),
-                            dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
-                            dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
-                        ],
-                    ),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="btn-close-modal-erro-teste-regra",
-                            ),
-                        ],
-                    ),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dmc.Modal(
-            # title="Erro ao carregar os dados",
-            id="modal-sucesso-teste-regra",
-            centered=True,
-            radius="lg",
-            size="lg",
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="xl",
-                        size=128,
-                        color="green",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Sucesso!", order=1),
-                    dmc.Text("A regra foi testada com sucesso."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="green",
-                                variant="outline",
-                                id="btn-close-modal-sucesso-teste-regra",
-                            ),
-                        ],
-                    ),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dmc.Modal(
-            # title="Erro ao carregar os dados",
-            id="modal-erro-salvar-regra",
-            centered=True,
-            radius="lg",
-            size="md",
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro!", order=1),
-                    dmc.Text("Ocorreu um erro ao salvar a regra. Verifique se a regra possui:"),
-                    dmc.List(
-                        [
-                            dmc.ListItem("Nome da regra;"),
-                            dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
-                            dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
-                        ],
-                    ),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="btn-close-modal-erro-salvar-regra",
-                            ),
-                        ],
-                    ),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dmc.Modal(
-            # title="Erro ao carregar os dados",
-            id="modal-sucesso-salvar-regra",
-            centered=True,
-            radius="lg",
-            size="lg",
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="xl",
-                        size=128,
-                        color="green",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Sucesso!", order=1),
-                    dmc.Text("A regra foi salva com sucesso."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="green",
-                                variant="outline",
-                                id="btn-close-modal-sucesso-salvar-regra",
-                            ),
-                        ],
-                        # justify="flex-end",
-                    ),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
+def layout(**kwargs):
+    # Listas dos filtros (obtidas do catálogo a cada carregamento da página, para refletir os dados atuais)
+    lista_todos_modelos_veiculos = catalogo_entidades.lista_registros("modelos", {"MODELO": "TODOS"})
+    lista_todas_oficinas = catalogo_entidades.lista_registros("oficinas", {"LABEL": "TODAS"})
+    lista_todas_secoes = catalogo_entidades.lista_registros("secoes", {"LABEL": "TODAS"})
+    lista_todas_os = catalogo_entidades.lista_registros("lista_os", {"LABEL": "TODAS"})
+
+    return dbc.Container(
+        [
+            # Loading
+            # dmc.LoadingOverlay(
+            #     visible=False,
+            #     id="loading-overlay-guia-criar-regra",
+            #     loaderProps={"size": "xl"},
+            #     overlayProps={
+            #         "radius": "lg",
+            #         "blur": 2,
+            #         "style": {
+            #             "top": 0,  # Start from the top of the viewport
+            #             "left": 0,  # Start from the left of the viewport
+            #             "width": "100vw",  # Cover the entire width of the viewport
+            #             "height": "100vh",  # Cover the entire height of the viewport
+            #         },
+            #     },
+            #     zIndex=10,
+            # ),
+            # Informações / Ajuda
+            dmc.Modal(
+                # title="Erro ao carregar os dados",
+                id="modal-erro-teste-regra",
+                centered=True,
+                radius="lg",
+                size="md",
+                children=dmc.Stack(
                     [
-                        dbc.Alert(
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro!", order=1),
+                        dmc.Text("Ocorreu um erro ao testar a regra. Verifique se a regra possui:"),
+                        dmc.List(
                             [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(
-                                            DashIconify(icon="material-symbols:date-range", width=45), width="auto"
-                                        ),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Período de monitoramento:"),
-                                                    #     """
-                                                    # período em que as OSs estarão ativas para os filtros da regra de monitoramento contínuo.
-                                                    # """,
-                                                    """
-                                                intervalo em que as OSs serão analisadas pelos filtros da regra de 
-                                                monitoramento contínuo. Esse valor é diferente do período de retrabalho,
-                                                que define o número mínimo de dias entre OS para que uma nova OS não 
-                                                seja considerada retrabalho. Exemplo: um monitoramento de 2 dias com
-                                                período de retrabalho de 30 dias irá avaliar continuamente 
-                                                as OSs dos dois últimos dias para identificar retrabalhos.
-                                                """,
-                                                ]
-                                            ),
-                                            className="mt-2",
-                                            width=True,
-                                        ),
-                                    ],
-                                    align="center",
-                                ),
+                                dmc.ListItem("Nome da regra;"),
+                                dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
+                                dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
                             ],
-                            dismissable=True,
-                            color="secondary",
                         ),
-                    ],
-                    md=12,
-                ),
-                dbc.Col(
-                    [
-                        dbc.Alert(
+                        dmc.Group(
                             [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(DashIconify(icon="mdi:new-box", width=45), width="auto"),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Nova OS, sem retrabalho prévio:"),
-                                                    """
-                                                não há OS anterior no período de retrabalho
-                                                """,
-                                                ]
-                                            ),
-                                            className="mt-2",
-                                            width=True,
-                                        ),
-                                    ],
-                                    align="center",
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="btn-close-modal-erro-teste-regra",
                                 ),
                             ],
-                            dismissable=True,
-                            color="info",
                         ),
                     ],
-                    md=4,
+                    align="center",
+                    gap="md",
                 ),
-                dbc.Col(
+            ),
+            dmc.Modal(
+                # title="Erro ao carregar os dados",
+                id="modal-sucesso-teste-regra",
+                centered=True,
+                radius="lg",
+                size="lg",
+                children=dmc.Stack(
                     [
-                        dbc.Alert(
+                        dmc.ThemeIcon(
+                            radius="xl",
+                            size=128,
+                            color="green",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Sucesso!", order=1),
+                        dmc.Text("A regra foi testada com sucesso."),
+                        dmc.Group(
                             [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(DashIconify(icon="mdi:alert-decagram-outline", width=45), width="auto"),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Nova OS, com retrabalho prévio:"),
-                                                    """
-                                                possui OS dentro do intervalo de retrabalho
-                                                """,
-                                                ]
-                                            ),
-                                            className="mt-2",
-                                            width=True,
-                                        ),
-                                    ],
-                                    align="center",
+                                dmc.Button(
+                                    "Fechar",
+                                    color="green",
+                                    variant="outline",
+                                    id="btn-close-modal-sucesso-teste-regra",
                                 ),
                             ],
-                            dismissable=True,
-                            color="warning",
                         ),
                     ],
-                    md=4,
+                    align="center",
+                    gap="md",
                 ),
-                dbc.Col(
+            ),
+            dmc.Modal(
+                # title="Erro ao carregar os dados",
+                id="modal-erro-salvar-regra",
+                centered=True,
+                radius="lg",
+                size="md",
+                children=dmc.Stack(
                     [
-                        dbc.Alert(
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro!", order=1),
+                        dmc.Text("Ocorreu um erro ao salvar a regra. Verifique se a regra possui:"),
+                        dmc.List(
                             [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(DashIconify(icon="pepicons-pop:rewind-time", width=45), width="auto"),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Retrabalho:"),
-                                                    """
-                                                OS de retrabalho confirmada dentro do período de monitoramento
-                                                """,
-                                                ]
-                                            ),
-                                            className="mt-2",
-                                            width=True,
-                                        ),
-                                    ],
-                                    align="center",
-                                ),
+                                dmc.ListItem("Nome da regra;"),
+                                dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
+                                dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
                             ],
-                            dismissable=True,
-                            color="danger",
                         ),
-                    ],
-                    md=4,
-                ),
-            ]
-        ),
-        # Cabeçalho e Inputs
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="carbon:rule-draft", width=45), width="auto"),
-                dbc.Col(
-                    html.H1(
-                        [
-                            "Criar \u00a0",
-                            html.Strong("regra"),
-                            "\u00a0 para monitoramento do retrabalho",
-                        ],
-                        className="align-self-center",
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        # dmc.Space(h=15),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        html.Div(
+                        dmc.Group(
                             [
-                                dbc.Label("Nome da Regra de Monitoramento"),
-                                dbc.Input(
-                                    id="input-nome-regra-monitoramento-retrabalho",
-                                    type="text",
-                                    placeholder="Ex: Retrabalho OS 'Motor Esquentando' nos últimos 5 dias...",
-                                    value="",
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="btn-close-modal-erro-salvar-regra",
                                 ),
                             ],
-                            className="dash-bootstrap",
                         ),
-                        body=True,
-                    ),
-                    md=12,
+                    ],
+                    align="center",
+                    gap="md",
                 ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        html.Div(
+            ),
+            dmc.Modal(
+                # title="Erro ao carregar os dados",
+                id="modal-sucesso-salvar-regra",
+                centered=True,
+                radius="lg",
+                size="lg",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="xl",
+                            size=128,
+                            color="green",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Sucesso!", order=1),
+                        dmc.Text("A regra foi salva com sucesso."),
+                        dmc.Group(
                             [
-                                dbc.Label("Período de Monitoramento (últimos X dias)"),
-                                dbc.InputGroup(
-                                    [
-                                        dbc.Input(
-                                            id="input-periodo-dias-monitoramento-regra-criar-retrabalho",
-                                            type="number",
-                                            placeholder="Dias",
-                                            value=3,
-                                            step=1,
-                                            min=1,
-                                        ),
-                                        dbc.InputGroupText("dias"),
-                                    ]
-                                ),
-                                dmc.Space(h=5),
-                                dbc.FormText(
-                                    html.Em(
-                                        "Período em que as OSs estarão ativas para os filtros da regra de monitoramento contínuo"
-                                    ),
-                                    color="secondary",
+                                dmc.Button(
+                                    "Fechar",
+                                    color="green",
+                                    variant="outline",
+                                    id="btn-close-modal-sucesso-salvar-regra",
                                 ),
                             ],
-                            className="dash-bootstrap",
+                            # justify="flex-end",
                         ),
-                        body=True,
-                    ),
-                    md=6,
-                    className="mb-3 mb-md-0",
+                    ],
+                    align="center",
+                    gap="md",
                 ),
-                dbc.Col(
-                    dbc.Card(
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
                         [
-                            html.Div(
+                            dbc.Alert(
                                 [
-                                    dbc.Label("Tempo (em dias) entre OS para retrabalho"),
-                                    dcc.Dropdown(
-                                        id="input-select-dias-regra-criar-retrabalho",
-                                        options=[
-                                            {"label": "10 dias", "value": 10},
-                                            {"label": "15 dias", "value": 15},
-                                            {"label": "30 dias", "value": 30},
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(
+                                                DashIconify(icon="material-symbols:date-range", width=45), width="auto"
+                                            ),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Período de monitoramento:"),
+                                                        #     """
+                                                        # período em que as OSs estarão ativas para os filtros da regra de monitoramento contínuo.
+                                                        # """,
+                                                        """
+                                                intervalo em que as OSs serão analisadas pelos filtros da regra de 
+                                                monitoramento contínuo. Esse valor é diferente do período de retrabalho,
+                                                que define o número mínimo de dias entre OS para que uma nova OS não 
+                                                seja considerada retrabalho. Exemplo: um monitoramento de 2 dias com
+                                                período de retrabalho de 30 dias irá avaliar continuamente 
+                                                as OSs dos dois últimos dias para identificar retrabalhos.
+                                                """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
                                         ],
-                                        placeholder="Período em dias",
-                                        value=10,
-                                    ),
-                                    dmc.Space(h=5),
-                                    dbc.FormText(
-                                        html.Em(
-                                            "Período mínimo de dias entre OS para que uma nova OS não seja considerada retrabalho"
-                                        ),
-                                        color="secondary",
+                                        align="center",
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                dismissable=True,
+                                color="secondary",
                             ),
                         ],
-                        body=True,
+                        md=12,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
+                    dbc.Col(
                         [
-                            html.Div(
+                            dbc.Alert(
                                 [
-                                    dbc.Label("Modelos de Veículos"),
-                                    dcc.Dropdown(
-                                        id="input-select-modelo-veiculos-regra-criar-retrabalho",
-                                        options=[
-                                            {
-                                                "label": os["MODELO"],
-                                                "value": os["MODELO"],
-                                            }
-                                            for os in lista_todos_modelos_veiculos
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="mdi:new-box", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Nova OS, sem retrabalho prévio:"),
+                                                        """
+                                                não há OS anterior no período de retrabalho
+                                                """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
                                         ],
-                                        multi=True,
-                                        value=["TODOS"],
-                                        placeholder="Selecione um ou mais modelos...",
+                                        align="center",
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                dismissable=True,
+                                color="info",
                             ),
                         ],
-                        body=True,
+                        md=4,
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
+                    dbc.Col(
                         [
-                            html.Div(
+                            dbc.Alert(
                                 [
-                                    dbc.Label("Oficinas"),
-                                    dcc.Dropdown(
-                                        id="input-select-oficina-regra-criar-retrabalho",
-                                        options=[
-                                            {"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_oficinas
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="mdi:alert-decagram-outline", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Nova OS, com retrabalho prévio:"),
+                                                        """
+                                                possui OS dentro do intervalo de retrabalho
+                                                """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
                                         ],
-                                        multi=True,
-                                        value=["TODAS"],
-                                        placeholder="Selecione uma ou mais oficinas...",
+                                        align="center",
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                dismissable=True,
+                                color="warning",
                             ),
                         ],
-                        body=True,
+                        md=4,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
+                    dbc.Col(
                         [
-                            html.Div(
+                            dbc.Alert(
                                 [
-                                    dbc.Label("Seções (categorias) de manutenção"),
-                                    dcc.Dropdown(
-                                        id="input-select-secao-regra-criar-retrabalho",
-                                        options=[
-                                            {"label": sec["LABEL"], "value": sec["LABEL"]} for sec in lista_todas_secoes
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="pepicons-pop:rewind-time", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Retrabalho:"),
+                                                        """
+                                                OS de retrabalho confirmada dentro do período de monitoramento
+                                                """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
                                         ],
-                                        multi=True,
-                                        value=["MANUTENCAO ELETRICA", "MANUTENCAO MECANICA"],
-                                        placeholder="Selecione uma ou mais seções...",
+                                        align="center",
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                dismissable=True,
+                                color="danger",
                             ),
                         ],
-                        body=True,
+                        md=4,
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Ordens de Serviço"),
-                                    dcc.Dropdown(
-                                        id="input-select-ordens-servico-regra-criar-retrabalho",
-                                        options=[{"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_os],
-                                        multi=True,
-                                        value=["TODAS"],
-                                        placeholder="Selecione uma ou mais ordens de serviço...",
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
+                ]
+            ),
+            # Cabeçalho e Inputs
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="carbon:rule-draft", width=45), width="auto"),
+                    dbc.Col(
+                        html.H1(
+                            [
+                                "Criar \u00a0",
+                                html.Strong("regra"),
+                                "\u00a0 para monitoramento do retrabalho",
+                            ],
+                            className="align-self-center",
+                        ),
+                        width=True,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
+                ],
+                align="center",
+            ),
+            # dmc.Space(h=15),
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
                             html.Div(
                                 [
-                                    dbc.Label("Alertar:"),
-                                    dbc.Checklist(
-                                        options=[
-                                            {
-                                                "label": "Nova OS, sem retrabalho prévio",
-                                                "value": "nova_os_sem_retrabalho_anterior",
-                                            },
-                                            {
-                                                "label": "Nova OS, com retrabalho prévio",
-                                                "value": "nova_os_com_retrabalho_anterior",
-                                            },
-                                            {"label": "Retrabalho", "value": "retrabalho"},
-                                            # {
-                                            #     "label": "Correção de Primeira",
-                                            #     "value": "correcao_primeira",
-                                            # },
-                                            # {
-                                            #     "label": "Correção tardia",
-                                            #     "value": "correcao_tardia",
-                                            # },
-                                        ],
-                                        value=["nova_os_com_retrabalho_anterior", "retrabalho"],
-                                        id="checklist-alertar-alvo-regra-criar-retrabalho",
-                                        inline=True,
+                                    dbc.Label("Nome da Regra de Monitoramento"),
+                                    dbc.Input(
+                                        id="input-nome-regra-monitoramento-retrabalho",
+                                        type="text",
+                                        placeholder="Ex: Retrabalho OS 'Motor Esquentando' nos últimos 5 dias...",
+                                        value="",
                                     ),
                                 ],
                                 className="dash-bootstrap",
                             ),
-                        ],
-                        body=True,
+                            body=True,
+                        ),
+                        md=12,
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
                             html.Div(
                                 [
-                                    dbc.Label("Horário de envio:"),
-                                    dmc.TimeInput(
-                                        debounce=True, id="horario-envio-regra-criar-retrabalho", value="06:00"
+                                    dbc.Label("Período de Monitoramento (últimos X dias)"),
+                                    dbc.InputGroup(
+                                        [
+                                            dbc.Input(
+                                                id="input-periodo-dias-monitoramento-regra-criar-retrabalho",
+                                                type="number",
+                                                placeholder="Dias",
+                                                value=3,
+                                                step=1,
+                                                min=1,
+                                            ),
+                                            dbc.InputGroupText("dias"),
+                                        ]
+                                    ),
+                                    dmc.Space(h=5),
+                                    dbc.FormText(
+                                        html.Em(
+                                            "Período em que as OSs estarão ativas para os filtros da regra de monitoramento contínuo"
+                                        ),
+                                        color="secondary",
                                     ),
                                 ],
                                 className="dash-bootstrap",
                             ),
-                        ],
-                        body=True,
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        dbc.Row(
+                    dbc.Col(
+                        dbc.Card(
                             [
-                                dbc.Col(
-                                    dmc.Switch(
-                                        id="switch-enviar-email-regra-criar-retrabalho",
-                                        label="Enviar email",
-                                        checked=False,
-                                        size="md",
-                                    ),
-                                    width="auto",
-                                ),
-                                dbc.Col(
-                                    dbc.Row(
-                                        [
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dbc.Label("Emails de destino (Digite até 5 emails)"),
-                                                md=12,
+                                html.Div(
+                                    [
+                                        dbc.Label("Tempo (em dias) entre OS para retrabalho"),
+                                        dcc.Dropdown(
+                                            id="input-select-dias-regra-criar-retrabalho",
+                                            options=[
+                                                {"label": "10 dias", "value": 10},
+                                                {"label": "15 dias", "value": 15},
+                                                {"label": "30 dias", "value": 30},
+                                            ],
+                                            placeholder="Período em dias",
+                                            value=10,
+                                        ),
+                                        dmc.Space(h=5),
+                                        dbc.FormText(
+                                            html.Em(
+                                                "Período mínimo de dias entre OS para que uma nova OS não seja considerada retrabalho"
                                             ),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-email-1-regra-criar-retrabalho",
-                                                    placeholder="email1@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                            color="secondary",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Modelos de Veículos"),
+                                        dcc.Dropdown(
+                                            id="input-select-modelo-veiculos-regra-criar-retrabalho",
+                                            options=[
+                                                {
+                                                    "label": os["MODELO"],
+                                                    "value": os["MODELO"],
+                                                }
+                                                for os in lista_todos_modelos_veiculos
+                                            ],
+                                            multi=True,
+                                            value=["TODOS"],
+                                            placeholder="Selecione um ou mais modelos...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Oficinas"),
+                                        dcc.Dropdown(
+                                            id="input-select-oficina-regra-criar-retrabalho",
+                                            options=[
+                                                {"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_oficinas
+                                            ],
+                                            multi=True,
+                                            value=["TODAS"],
+                                            placeholder="Selecione uma ou mais oficinas...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Seções (categorias) de manutenção"),
+                                        dcc.Dropdown(
+                                            id="input-select-secao-regra-criar-retrabalho",
+                                            options=[
+                                                {"label": sec["LABEL"], "value": sec["LABEL"]} for sec in lista_todas_secoes
+                                            ],
+                                            multi=True,
+                                            value=["MANUTENCAO ELETRICA", "MANUTENCAO MECANICA"],
+                                            placeholder="Selecione uma ou mais seções...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Ordens de Serviço"),
+                                        dcc.Dropdown(
+                                            id="input-select-ordens-servico-regra-criar-retrabalho",
+                                            options=[{"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_os],
+                                            multi=True,
+                                            value=["TODAS"],
+                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Alertar:"),
+                                        dbc.Checklist(
+                                            options=[
+                                                {
+                                                    "label": "Nova OS, sem retrabalho prévio",
+                                                    "value": "nova_os_sem_retrabalho_anterior",
+                                                },
+                                                {
+                                                    "label": "Nova OS, com retrabalho prévio",
+                                                    "value": "nova_os_com_retrabalho_anterior",
+                                                },
+                                                {"label": "Retrabalho", "value": "retrabalho"},
+                                                # {
+                                                #     "label": "Correção de Primeira",
+                                                #     "value": "correcao_primeira",
+                                                # },
+                                                # {
+                                                #     "label": "Correção tardia",
+                                                #     "value": "correcao_tardia",
+                                                # },
+                                            ],
+                                            value=["nova_os_com_retrabalho_anterior", "retrabalho"],
+                                            id="checklist-alertar-alvo-regra-criar-retrabalho",
+                                            inline=True,
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Horário de envio:"),
+                                        dmc.TimeInput(
+                                            debounce=True, id="horario-envio-regra-criar-retrabalho", value="06:00"
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        dmc.Switch(
+                                            id="switch-enviar-email-regra-criar-retrabalho",
+                                            label="Enviar email",
+                                            checked=False,
+                                            size="md",
+                                        ),
+                                        width="auto",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dbc.Label("Emails de destino (Digite até 5 emails)"),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-email-2-regra-criar-retrabalho",
-                                                    placeholder="email2@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-email-1-regra-criar-retrabalho",
+                                                        placeholder="email1@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-email-3-regra-criar-retrabalho",
-                                                    placeholder="email3@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-email-2-regra-criar-retrabalho",
+                                                        placeholder="email2@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-email-4-regra-criar-retrabalho",
-                                                    placeholder="email4@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-email-3-regra-criar-retrabalho",
+                                                        placeholder="email3@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-email-5-regra-criar-retrabalho",
-                                                    placeholder="email5@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-email-4-regra-criar-retrabalho",
+                                                        placeholder="email4@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                        ],
-                                        align="center",
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-email-5-regra-criar-retrabalho",
+                                                        placeholder="email5@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                            ],
+                                            align="center",
+                                        ),
+                                        id="input-email-destino-container-regra-criar-retrabalho",
+                                        md=12,
                                     ),
-                                    id="input-email-destino-container-regra-criar-retrabalho",
-                                    md=12,
-                                ),
-                            ],
-                            align="center",
+                                ],
+                                align="center",
+                            ),
+                            body=True,
                         ),
-                        body=True,
+                        md=6,
+                        className="mb-3 mb-md-0",
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    dmc.Switch(
-                                        id="switch-enviar-wpp-regra-criar-retrabalho",
-                                        label="Enviar WhatsApp",
-                                        checked=False,
-                                        size="md",
+                    dbc.Col(
+                        dbc.Card(
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        dmc.Switch(
+                                            id="switch-enviar-wpp-regra-criar-retrabalho",
+                                            label="Enviar WhatsApp",
+                                            checked=False,
+                                            size="md",
+                                        ),
+                                        width="auto",
                                     ),
-                                    width="auto",
-                                ),
-                                dbc.Col(
-                                    dbc.Row(
-                                        [
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dbc.Label("WhatsApp de destino (Digite até 5 números)"),
-                                                md=12,
-                                            ),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-wpp-1-regra-criar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dbc.Label("WhatsApp de destino (Digite até 5 números)"),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-wpp-2-regra-criar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-wpp-1-regra-criar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-wpp-3-regra-criar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-wpp-2-regra-criar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-wpp-4-regra-criar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-wpp-3-regra-criar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="input-wpp-5-regra-criar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-wpp-4-regra-criar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                        ],
-                                        align="center",
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="input-wpp-5-regra-criar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                            ],
+                                            align="center",
+                                        ),
+                                        id="input-wpp-destino-container-regra-criar-retrabalho",
+                                        md=12,
                                     ),
-                                    id="input-wpp-destino-container-regra-criar-retrabalho",
-                                    md=12,
-                                ),
-                            ],
-                            align="center",
+                                ],
+                                align="center",
+                            ),
+                            body=True,
                         ),
-                        body=True,
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=30),
-        # Botão Criar Regra
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Button(
-                        "Testar Regra (enviar mensagem)",
-                        id="btn-testar-regra-monitoramento-criar-retrabalho",
-                        color="info",
-                        className="me-1",
-                        style={"padding": "1em", "width": "100%"},
+                ]
+            ),
+            dmc.Space(h=30),
+            # Botão Criar Regra
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Button(
+                            "Testar Regra (enviar mensagem)",
+                            id="btn-testar-regra-monitoramento-criar-retrabalho",
+                            color="info",
+                            className="me-1",
+                            style={"padding": "1em", "width": "100%"},
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Button(
-                        "Criar Regra",
-                        id="btn-salvar-regra-monitoramento-criar-retrabalho",
-                        color="success",
-                        className="me-1",
-                        style={"padding": "1em", "width": "100%"},
+                    dbc.Col(
+                        dbc.Button(
+                            "Criar Regra",
+                            id="btn-salvar-regra-monitoramento-criar-retrabalho",
+                            color="success",
+                            className="me-1",
+                            style={"padding": "1em", "width": "100%"},
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ],
-            justify="center",
-        ),
-        html.Div(id="mensagem-sucesso", style={"marginTop": "10px", "fontWeight": "bold"}),
-        dmc.Space(h=40),
-        # Resumo
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            # Cabeçalho
-                            html.Hr(),
-                            dbc.Col(
-                                DashIconify(icon="wpf:statistics", width=45),
-                                width="auto",
-                            ),
-                            dbc.Col(html.H1("Total de OS no período", className="align-self-center"), width=True),
-                            dmc.Space(h=15),
-                            html.Hr(),
-                            dbc.Row(dcc.Graph(id="graph-pizza-sintese-retrabalho-regra-criar")),
-                        ]
+                ],
+                justify="center",
+            ),
+            html.Div(id="mensagem-sucesso", style={"marginTop": "10px", "fontWeight": "bold"}),
+            dmc.Space(h=40),
+            # Resumo
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                # Cabeçalho
+                                html.Hr(),
+                                dbc.Col(
+                                    DashIconify(icon="wpf:statistics", width=45),
+                                    width="auto",
+                                ),
+                                dbc.Col(html.H1("Total de OS no período", className="align-self-center"), width=True),
+                                dmc.Space(h=15),
+                                html.Hr(),
+                                dbc.Row(dcc.Graph(id="graph-pizza-sintese-retrabalho-regra-criar")),
+                            ]
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            # Cabeçalho
-                            html.Hr(),
-                            dbc.Col(
-                                DashIconify(icon="meteor-icons:filter", width=45),
-                                width="auto",
-                            ),
-                            dbc.Col(html.H1("OSs filtradas", className="align-self-center"), width=True),
-                            dmc.Space(h=15),
-                            html.Hr(),
-                            dbc.Row(dcc.Graph(id="graph-pizza-filtro-retrabalho-regra-criar")),
-                        ]
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                # Cabeçalho
+                                html.Hr(),
+                                dbc.Col(
+                                    DashIconify(icon="meteor-icons:filter", width=45),
+                                    width="auto",
+                                ),
+                                dbc.Col(html.H1("OSs filtradas", className="align-self-center"), width=True),
+                                dmc.Space(h=15),
+                                html.Hr(),
+                                dbc.Row(dcc.Graph(id="graph-pizza-filtro-retrabalho-regra-criar")),
+                            ]
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:car-search-outline", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Pré-visualização das OSs que foram filtradas pela regra criada",
-                                className="align-self-center",
-                            ),
-                        ]
+                ]
+            ),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:car-search-outline", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Pré-visualização das OSs que foram filtradas pela regra criada",
+                                    className="align-self-center",
+                                ),
+                            ]
+                        ),
+                        width=True,
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=40),
-        dag.AgGrid(
-            id="tabela-previa-os-regra-criar",
-            columnDefs=crud_regra_tabelas.tbl_detalhamento_problema_regra,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-                "enableCellTextSelection": True,
-                "ensureDomOrder": True,
-            },
-            style={"height": 500, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
-        ),
-        dmc.Space(h=40),
-    ]
-)
+                ],
+                align="center",
+            ),
+            dmc.Space(h=40),
+            dag.AgGrid(
+                id="tabela-previa-os-regra-criar",
+                columnDefs=crud_regra_tabelas.tbl_detalhamento_problema_regra,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                    "enableCellTextSelection": True,
+                    "ensureDomOrder": True,
+                },
+                style={"height": 500, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+        ]
+    )
 
 
 ##############################################################################
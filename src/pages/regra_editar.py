@@ -32,7 +32,8 @@ import locale_utils
 from db import PostgresSingleton
 
 # Imports gerais
-from modules.entities_utils import get_mecanicos, get_lista_os, get_oficinas, get_secoes, get_modelos, gerar_excel
+from modules.entities_utils import gerar_excel
+from modules.catalogo_entidades_utils import get_catalogo_entidades
 
 # Imports específicos
 from modules.crud_regra.crud_regra_service import CRUDRegraService
@@ -52,28 +53,8 @@ pgEngine = pgDB.get_engine()
 # Cria o serviço
 crud_regra_service = CRUDRegraService(pgEngine)
 
-# Modelos de veículos
-df_modelos_veiculos = get_modelos(pgEngine)
-lista_todos_modelos_veiculos = df_modelos_veiculos.to_dict(orient="records")
-lista_todos_modelos_veiculos.insert(0, {"MODELO": "TODOS"})
-
-# Obtem a lista de Oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
-
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
-
-# Colaboradores / Mecânicos
-df_mecanicos = get_mecanicos(pgEngine)
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-lista_todas_os.insert(0, {"LABEL": "TODAS"})
+# Catálogo das entidades dos filtros (lidas no primeiro uso e atualizadas periodicamente)
+catalogo_entidades = get_catalogo_entidades(pgEngine)
 
 
 ##############################################################################
@@ -337,7 +318,7 @@ def corrige_input_secao_editar_regra(lista_secaos):
 )
 def corrige_input_ordem_servico_editar_regra(lista_os, lista_secaos):
     # Vamos pegar as OS possíveis para as seções selecionadas
-    df_lista_os_secao = df_lista_os
+    df_lista_os_secao = catalogo_entidades.obtem("lista_os")
 
     if "TODAS" not in lista_secaos:
         df_lista_os_secao = df_lista_os_secao[df_lista_os_secao["SECAO"].isin(lista_secaos)]
@@ -979,750 +960,757 @@ def atualizar_regra_monitoramento_retrabalho_editar_regra(
 ##############################################################################
 # Layout #####################################################################
 ##############################################################################
-layout = dbc.Container(
-    [
-        # Estado
-        dcc.Store(id="store-editar-input-id-editar-regra"),
-        # Loading
-        dmc.LoadingOverlay(
-            visible=True,
-            id="loading-overlay-guia-editar-regra",
-            loaderProps={"size": "xl"},
-            overlayProps={
-                "radius": "lg",
-                "blur": 2,
-                "style": {
-                    "top": 0,  # Start from the top of the viewport
-                    "left": 0,  # Start from the left of the viewport
-                    "width": "100vw",  # Cover the entire width of the viewport
-                    "height": "100vh",  # Cover the entire height of the viewport
+def layout(**kwargs):
+    # Listas dos filtros (obtidas do catálogo a cada carregamento da página, para refletir os dados atuais)
+    lista_todos_modelos_veiculos = catalogo_entidades.lista_registros("modelos", {"MODELO": "TODOS"})
+    lista_todas_oficinas = catalogo_entidades.lista_registros("oficinas", {"LABEL": "TODAS"})
+    lista_todas_secoes = catalogo_entidades.lista_registros("secoes", {"LABEL": "TODAS"})
+    lista_todas_os = catalogo_entidades.lista_registros("lista_os", {"LABEL": "TODAS"})
+
+    return dbc.Container(
+        [
+            # Estado
+            dcc.Store(id="store-editar-input-id-editar-regra"),
+            # Loading
+            dmc.LoadingOverlay(
+                visible=True,
+                id="loading-overlay-guia-editar-regra",
+                loaderProps={"size": "xl"},
+                overlayProps={
+                    "radius": "lg",
+                    "blur": 2,
+                    "style": {
+                        "top": 0,  # Start from the top of the viewport
+                        "left": 0,  # Start from the left of the viewport
+                        "width": "100vw",  # Cover the entire width of the viewport
+                        "height": "100vh",  # Cover the entire height of the viewport
+                    },
                 },
-            },
-            zIndex=10,
-        ),
-        # Modais
-        dmc.Modal(
-            id="editar-modalerro-carregar-dados-editar-regra",
-            centered=True,
-            radius="lg",
-            size="md",
-            closeOnClickOutside=False,
-            closeOnEscape=False,
-            children=dmc.Stack(
+                zIndex=10,
+            ),
+            # Modais
+            dmc.Modal(
+                id="editar-modalerro-carregar-dados-editar-regra",
+                centered=True,
+                radius="lg",
+                size="md",
+                closeOnClickOutside=False,
+                closeOnEscape=False,
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro ao carregar dados!", order=1),
+                        dmc.Text("Ocorreu um erro ao carregar os dados da regra."),
+                        dmc.Group(
+                            [
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="btn-close-editar-modalerro-carregar-dados-editar-regra",
+                                ),
+                            ],
+                        ),
+                        dmc.Space(h=20),
+                    ],
+                    align="center",
+                    gap="md",
+                ),
+            ),
+            dmc.Modal(
+                id="editar-modalerro-teste-editar-regra",
+                centered=True,
+                radius="lg",
+                size="md",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro!", order=1),
+                        dmc.Text("Ocorreu um erro ao testar a regra. Verifique se a regra possui:"),
+                        dmc.List(
+                            [
+                                dmc.ListItem("Nome da regra;"),
+                                dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
+                                dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
+                            ],
+                        ),
+                        dmc.Group(
+                            [
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="btn-close-editar-modalerro-teste-editar-regra",
+                                ),
+                            ],
+                        ),
+                    ],
+                    align="center",
+                    gap="md",
+                ),
+            ),
+            dmc.Modal(
+                id="editar-modalsucesso-teste-editar-regra",
+                centered=True,
+                radius="lg",
+                size="lg",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="xl",
+                            size=128,
+                            color="green",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Sucesso!", order=1),
+                        dmc.Text("A regra foi testada com sucesso."),
+                        dmc.Group(
+                            [
+                                dmc.Button(
+                                    "Fechar",
+                                    color="green",
+                                    variant="outline",
+                                    id="btn-close-editar-modalsucesso-teste-editar-regra",
+                                ),
+                            ],
+                        ),
+                    ],
+                    align="center",
+                    gap="md",
+                ),
+            ),
+            dmc.Modal(
+                id="editar-modalerro-atualizar-editar-regra",
+                centered=True,
+                radius="lg",
+                size="md",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro!", order=1),
+                        dmc.Text("Ocorreu um erro ao atualizar a regra. Verifique se a regra possui:"),
+                        dmc.List(
+                            [
+                                dmc.ListItem("Nome da regra;"),
+                                dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
+                                dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
+                            ],
+                        ),
+                        dmc.Group(
+                            [
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="btn-close-editar-modalerro-atualizar-editar-regra",
+                                ),
+                            ],
+                        ),
+                    ],
+                    align="center",
+                    gap="md",
+                ),
+            ),
+            dmc.Modal(
+                id="editar-modalsucesso-atualizar-editar-regra",
+                centered=True,
+                radius="lg",
+                size="lg",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="xl",
+                            size=128,
+                            color="green",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Sucesso!", order=1),
+                        dmc.Text("A regra foi atualizada com sucesso."),
+                        dmc.Group(
+                            [
+                                dmc.Button(
+                                    "Fechar",
+                                    color="green",
+                                    variant="outline",
+                                    id="btn-close-editar-modalsucesso-atualizar-editar-regra",
+                                ),
+                            ],
+                        ),
+                    ],
+                    align="center",
+                    gap="md",
+                ),
+            ),
+            # Cabeçalho e Inputs
+            html.Hr(),
+            dbc.Row(
                 [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro ao carregar dados!", order=1),
-                    dmc.Text("Ocorreu um erro ao carregar os dados da regra."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="btn-close-editar-modalerro-carregar-dados-editar-regra",
-                            ),
-                        ],
+                    dbc.Col(DashIconify(icon="carbon:rule-draft", width=45), width="auto"),
+                    dbc.Col(
+                        html.H1(
+                            [
+                                "Editar \u00a0",
+                                html.Strong("regra"),
+                                "\u00a0 de monitoramento do retrabalho",
+                            ],
+                            className="align-self-center",
+                        ),
+                        width=True,
                     ),
-                    dmc.Space(h=20),
                 ],
                 align="center",
-                gap="md",
             ),
-        ),
-        dmc.Modal(
-            id="editar-modalerro-teste-editar-regra",
-            centered=True,
-            radius="lg",
-            size="md",
-            children=dmc.Stack(
+            # dmc.Space(h=15),
+            html.Hr(),
+            dbc.Row(
                 [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro!", order=1),
-                    dmc.Text("Ocorreu um erro ao testar a regra. Verifique se a regra possui:"),
-                    dmc.List(
-                        [
-                            dmc.ListItem("Nome da regra;"),
-                            dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
-                            dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
-                        ],
-                    ),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="btn-close-editar-modalerro-teste-editar-regra",
+                    dbc.Col(
+                        dbc.Card(
+                            html.Div(
+                                [
+                                    dbc.Label("Nome da Regra de Monitoramento"),
+                                    dbc.Input(
+                                        id="editar-input-nome-regra-monitoramento-retrabalho",
+                                        type="text",
+                                        placeholder="Ex: Retrabalho OS 'Motor Esquentando' nos últimos 5 dias...",
+                                        value="",
+                                    ),
+                                ],
+                                className="dash-bootstrap",
                             ),
-                        ],
+                            body=True,
+                        ),
+                        md=12,
                     ),
-                ],
-                align="center",
-                gap="md",
+                ]
             ),
-        ),
-        dmc.Modal(
-            id="editar-modalsucesso-teste-editar-regra",
-            centered=True,
-            radius="lg",
-            size="lg",
-            children=dmc.Stack(
+            dmc.Space(h=10),
+            dbc.Row(
                 [
-                    dmc.ThemeIcon(
-                        radius="xl",
-                        size=128,
-                        color="green",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Sucesso!", order=1),
-                    dmc.Text("A regra foi testada com sucesso."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="green",
-                                variant="outline",
-                                id="btn-close-editar-modalsucesso-teste-editar-regra",
+                    dbc.Col(
+                        dbc.Card(
+                            html.Div(
+                                [
+                                    dbc.Label("Período de Monitoramento (últimos X dias)"),
+                                    dbc.InputGroup(
+                                        [
+                                            dbc.Input(
+                                                id="editar-input-periodo-dias-monitoramento-regra-editar-retrabalho",
+                                                type="number",
+                                                placeholder="Dias",
+                                                value=3,
+                                                step=1,
+                                                min=1,
+                                            ),
+                                            dbc.InputGroupText("dias"),
+                                        ]
+                                    ),
+                                    dmc.Space(h=5),
+                                    dbc.FormText(
+                                        html.Em(
+                                            "Período em que as OSs estarão ativas para os filtros da regra de monitoramento contínuo"
+                                        ),
+                                        color="secondary",
+                                    ),
+                                ],
+                                className="dash-bootstrap",
                             ),
-                        ],
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                ],
-                align="center",
-                gap="md",
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Tempo (em dias) entre OS para retrabalho"),
+                                        dcc.Dropdown(
+                                            id="editar-input-select-dias-regra-editar-retrabalho",
+                                            options=[
+                                                {"label": "10 dias", "value": 10},
+                                                {"label": "15 dias", "value": 15},
+                                                {"label": "30 dias", "value": 30},
+                                            ],
+                                            placeholder="Período em dias",
+                                            value=10,
+                                        ),
+                                        dmc.Space(h=5),
+                                        dbc.FormText(
+                                            html.Em(
+                                                "Período mínimo de dias entre OS para que uma nova OS não seja considerada retrabalho"
+                                            ),
+                                            color="secondary",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
             ),
-        ),
-        dmc.Modal(
-            id="editar-modalerro-atualizar-editar-regra",
-            centered=True,
-            radius="lg",
-            size="md",
-            children=dmc.Stack(
+            dmc.Space(h=10),
+            dbc.Row(
                 [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro!", order=1),
-                    dmc.Text("Ocorreu um erro ao atualizar a regra. Verifique se a regra possui:"),
-                    dmc.List(
-                        [
-                            dmc.ListItem("Nome da regra;"),
-                            dmc.ListItem("Pelo menos um alerta alvo (nova OS, retrabalho, etc);"),
-                            dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
-                        ],
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Modelos de Veículos"),
+                                        dcc.Dropdown(
+                                            id="editar-input-select-modelo-veiculos-regra-editar-retrabalho",
+                                            options=[
+                                                {
+                                                    "label": os["MODELO"],
+                                                    "value": os["MODELO"],
+                                                }
+                                                for os in lista_todos_modelos_veiculos
+                                            ],
+                                            multi=True,
+                                            value=["TODOS"],
+                                            placeholder="Selecione um ou mais modelos...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="btn-close-editar-modalerro-atualizar-editar-regra",
-                            ),
-                        ],
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Oficinas"),
+                                        dcc.Dropdown(
+                                            id="editar-input-select-oficina-regra-editar-retrabalho",
+                                            options=[
+                                                {"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_oficinas
+                                            ],
+                                            multi=True,
+                                            value=["TODAS"],
+                                            placeholder="Selecione uma ou mais oficinas...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                ],
-                align="center",
-                gap="md",
+                ]
             ),
-        ),
-        dmc.Modal(
-            id="editar-modalsucesso-atualizar-editar-regra",
-            centered=True,
-            radius="lg",
-            size="lg",
-            children=dmc.Stack(
+            dmc.Space(h=10),
+            dbc.Row(
                 [
-                    dmc.ThemeIcon(
-                        radius="xl",
-                        size=128,
-                        color="green",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Seções (categorias) de manutenção"),
+                                        dcc.Dropdown(
+                                            id="editar-input-select-secao-regra-editar-retrabalho",
+                                            options=[
+                                                {"label": sec["LABEL"], "value": sec["LABEL"]} for sec in lista_todas_secoes
+                                            ],
+                                            multi=True,
+                                            value=["MANUTENCAO ELETRICA", "MANUTENCAO MECANICA"],
+                                            placeholder="Selecione uma ou mais seções...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                    dmc.Title("Sucesso!", order=1),
-                    dmc.Text("A regra foi atualizada com sucesso."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="green",
-                                variant="outline",
-                                id="btn-close-editar-modalsucesso-atualizar-editar-regra",
-                            ),
-                        ],
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Ordens de Serviço"),
+                                        dcc.Dropdown(
+                                            id="editar-input-select-ordens-servico-regra-editar-retrabalho",
+                                            options=[{"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_os],
+                                            multi=True,
+                                            value=["TODAS"],
+                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                ],
-                align="center",
-                gap="md",
+                ]
             ),
-        ),
-        # Cabeçalho e Inputs
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="carbon:rule-draft", width=45), width="auto"),
-                dbc.Col(
-                    html.H1(
-                        [
-                            "Editar \u00a0",
-                            html.Strong("regra"),
-                            "\u00a0 de monitoramento do retrabalho",
-                        ],
-                        className="align-self-center",
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        # dmc.Space(h=15),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        html.Div(
+            dmc.Space(h=10),
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
                             [
-                                dbc.Label("Nome da Regra de Monitoramento"),
-                                dbc.Input(
-                                    id="editar-input-nome-regra-monitoramento-retrabalho",
-                                    type="text",
-                                    placeholder="Ex: Retrabalho OS 'Motor Esquentando' nos últimos 5 dias...",
-                                    value="",
+                                html.Div(
+                                    [
+                                        dbc.Label("Alertar:"),
+                                        dbc.Checklist(
+                                            options=[
+                                                {
+                                                    "label": "Nova OS, sem retrabalho prévio",
+                                                    "value": "nova_os_sem_retrabalho_anterior",
+                                                },
+                                                {
+                                                    "label": "Nova OS, com retrabalho prévio",
+                                                    "value": "nova_os_com_retrabalho_anterior",
+                                                },
+                                                {"label": "Retrabalho", "value": "retrabalho"},
+                                                # {
+                                                #     "label": "Correção de Primeira",
+                                                #     "value": "correcao_primeira",
+                                                # },
+                                                # {
+                                                #     "label": "Correção tardia",
+                                                #     "value": "correcao_tardia",
+                                                # },
+                                            ],
+                                            value=["nova_os_com_retrabalho_anterior", "retrabalho"],
+                                            id="editar-checklist-alertar-alvo-regra-editar-retrabalho",
+                                            inline=True,
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
                                 ),
                             ],
-                            className="dash-bootstrap",
+                            body=True,
                         ),
-                        body=True,
+                        md=6,
                     ),
-                    md=12,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        html.Div(
+                    dbc.Col(
+                        dbc.Card(
                             [
-                                dbc.Label("Período de Monitoramento (últimos X dias)"),
-                                dbc.InputGroup(
+                                html.Div(
                                     [
-                                        dbc.Input(
-                                            id="editar-input-periodo-dias-monitoramento-regra-editar-retrabalho",
-                                            type="number",
-                                            placeholder="Dias",
-                                            value=3,
-                                            step=1,
-                                            min=1,
+                                        dbc.Label("Horário de envio:"),
+                                        dmc.TimeInput(
+                                            debounce=True, id="editar-horario-envio-regra-editar-retrabalho", value="06:00"
                                         ),
-                                        dbc.InputGroupText("dias"),
-                                    ]
-                                ),
-                                dmc.Space(h=5),
-                                dbc.FormText(
-                                    html.Em(
-                                        "Período em que as OSs estarão ativas para os filtros da regra de monitoramento contínuo"
-                                    ),
-                                    color="secondary",
+                                    ],
+                                    className="dash-bootstrap",
                                 ),
                             ],
-                            className="dash-bootstrap",
+                            body=True,
                         ),
-                        body=True,
+                        md=6,
                     ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            dbc.Row(
                                 [
-                                    dbc.Label("Tempo (em dias) entre OS para retrabalho"),
-                                    dcc.Dropdown(
-                                        id="editar-input-select-dias-regra-editar-retrabalho",
-                                        options=[
-                                            {"label": "10 dias", "value": 10},
-                                            {"label": "15 dias", "value": 15},
-                                            {"label": "30 dias", "value": 30},
-                                        ],
-                                        placeholder="Período em dias",
-                                        value=10,
-                                    ),
-                                    dmc.Space(h=5),
-                                    dbc.FormText(
-                                        html.Em(
-                                            "Período mínimo de dias entre OS para que uma nova OS não seja considerada retrabalho"
+                                    dbc.Col(
+                                        dmc.Switch(
+                                            id="editar-switch-enviar-email-regra-editar-retrabalho",
+                                            label="Enviar email",
+                                            checked=False,
+                                            size="md",
                                         ),
-                                        color="secondary",
+                                        width="auto",
                                     ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
-                    ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Modelos de Veículos"),
-                                    dcc.Dropdown(
-                                        id="editar-input-select-modelo-veiculos-regra-editar-retrabalho",
-                                        options=[
-                                            {
-                                                "label": os["MODELO"],
-                                                "value": os["MODELO"],
-                                            }
-                                            for os in lista_todos_modelos_veiculos
-                                        ],
-                                        multi=True,
-                                        value=["TODOS"],
-                                        placeholder="Selecione um ou mais modelos...",
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
-                    ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Oficinas"),
-                                    dcc.Dropdown(
-                                        id="editar-input-select-oficina-regra-editar-retrabalho",
-                                        options=[
-                                            {"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_oficinas
-                                        ],
-                                        multi=True,
-                                        value=["TODAS"],
-                                        placeholder="Selecione uma ou mais oficinas...",
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dbc.Label("Emails de destino (Digite até 5 emails)"),
+                                                    md=12,
+                                                ),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-email-1-regra-editar-retrabalho",
+                                                        placeholder="email1@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-email-2-regra-editar-retrabalho",
+                                                        placeholder="email2@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-email-3-regra-editar-retrabalho",
+                                                        placeholder="email3@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-email-4-regra-editar-retrabalho",
+                                                        placeholder="email4@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-email-5-regra-editar-retrabalho",
+                                                        placeholder="email5@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                            ],
+                                            align="center",
+                                        ),
+                                        id="editar-input-email-destino-container-regra-editar-retrabalho",
+                                        md=12,
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                align="center",
                             ),
-                        ],
-                        body=True,
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
+                    dbc.Col(
+                        dbc.Card(
+                            dbc.Row(
                                 [
-                                    dbc.Label("Seções (categorias) de manutenção"),
-                                    dcc.Dropdown(
-                                        id="editar-input-select-secao-regra-editar-retrabalho",
-                                        options=[
-                                            {"label": sec["LABEL"], "value": sec["LABEL"]} for sec in lista_todas_secoes
-                                        ],
-                                        multi=True,
-                                        value=["MANUTENCAO ELETRICA", "MANUTENCAO MECANICA"],
-                                        placeholder="Selecione uma ou mais seções...",
+                                    dbc.Col(
+                                        dmc.Switch(
+                                            id="editar-switch-enviar-wpp-regra-editar-retrabalho",
+                                            label="Enviar WhatsApp",
+                                            checked=False,
+                                            size="md",
+                                        ),
+                                        width="auto",
                                     ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
-                    ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Ordens de Serviço"),
-                                    dcc.Dropdown(
-                                        id="editar-input-select-ordens-servico-regra-editar-retrabalho",
-                                        options=[{"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_os],
-                                        multi=True,
-                                        value=["TODAS"],
-                                        placeholder="Selecione uma ou mais ordens de serviço...",
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dbc.Label("WhatsApp de destino (Digite até 5 números)"),
+                                                    md=12,
+                                                ),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-wpp-1-regra-editar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-wpp-2-regra-editar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-wpp-3-regra-editar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-wpp-4-regra-editar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="editar-input-wpp-5-regra-editar-retrabalho",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                            ],
+                                            align="center",
+                                        ),
+                                        id="editar-input-wpp-destino-container-regra-editar-retrabalho",
+                                        md=12,
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                align="center",
                             ),
-                        ],
-                        body=True,
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Alertar:"),
-                                    dbc.Checklist(
-                                        options=[
-                                            {
-                                                "label": "Nova OS, sem retrabalho prévio",
-                                                "value": "nova_os_sem_retrabalho_anterior",
-                                            },
-                                            {
-                                                "label": "Nova OS, com retrabalho prévio",
-                                                "value": "nova_os_com_retrabalho_anterior",
-                                            },
-                                            {"label": "Retrabalho", "value": "retrabalho"},
-                                            # {
-                                            #     "label": "Correção de Primeira",
-                                            #     "value": "correcao_primeira",
-                                            # },
-                                            # {
-                                            #     "label": "Correção tardia",
-                                            #     "value": "correcao_tardia",
-                                            # },
-                                        ],
-                                        value=["nova_os_com_retrabalho_anterior", "retrabalho"],
-                                        id="editar-checklist-alertar-alvo-regra-editar-retrabalho",
-                                        inline=True,
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
+                ]
+            ),
+            dmc.Space(h=30),
+            # Botão Criar Regra
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Button(
+                            "Testar Regra (enviar mensagem)",
+                            id="btn-testar-regra-monitoramento-editar-retrabalho",
+                            color="info",
+                            className="me-1",
+                            style={"padding": "1em", "width": "100%"},
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Horário de envio:"),
-                                    dmc.TimeInput(
-                                        debounce=True, id="editar-horario-envio-regra-editar-retrabalho", value="06:00"
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
+                    dbc.Col(
+                        dbc.Button(
+                            "Atualizar Regra",
+                            id="btn-editar-regra-monitoramento-atualizar-retrabalho",
+                            color="success",
+                            className="me-1",
+                            style={"padding": "1em", "width": "100%"},
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
+                ],
+                justify="center",
+            ),
+            html.Div(id="mensagem-sucesso", style={"marginTop": "10px", "fontWeight": "bold"}),
+            dmc.Space(h=40),
+            # Resumo
+            dbc.Row(
+                [
+                    dbc.Col(
                         dbc.Row(
                             [
+                                # Cabeçalho
+                                html.Hr(),
                                 dbc.Col(
-                                    dmc.Switch(
-                                        id="editar-switch-enviar-email-regra-editar-retrabalho",
-                                        label="Enviar email",
-                                        checked=False,
-                                        size="md",
-                                    ),
+                                    DashIconify(icon="wpf:statistics", width=45),
                                     width="auto",
                                 ),
-                                dbc.Col(
-                                    dbc.Row(
-                                        [
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dbc.Label("Emails de destino (Digite até 5 emails)"),
-                                                md=12,
-                                            ),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-email-1-regra-editar-retrabalho",
-                                                    placeholder="email1@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-email-2-regra-editar-retrabalho",
-                                                    placeholder="email2@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-email-3-regra-editar-retrabalho",
-                                                    placeholder="email3@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-email-4-regra-editar-retrabalho",
-                                                    placeholder="email4@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-email-5-regra-editar-retrabalho",
-                                                    placeholder="email5@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
-                                                ),
-                                                md=12,
-                                            ),
-                                        ],
-                                        align="center",
-                                    ),
-                                    id="editar-input-email-destino-container-regra-editar-retrabalho",
-                                    md=12,
-                                ),
-                            ],
-                            align="center",
+                                dbc.Col(html.H1("Total de OS no período", className="align-self-center"), width=True),
+                                dmc.Space(h=15),
+                                html.Hr(),
+                                dbc.Row(dcc.Graph(id="editar-graph-pizza-sintese-retrabalho-regra-editar")),
+                            ]
                         ),
-                        body=True,
+                        md=6,
                     ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
+                    dbc.Col(
                         dbc.Row(
                             [
+                                # Cabeçalho
+                                html.Hr(),
                                 dbc.Col(
-                                    dmc.Switch(
-                                        id="editar-switch-enviar-wpp-regra-editar-retrabalho",
-                                        label="Enviar WhatsApp",
-                                        checked=False,
-                                        size="md",
-                                    ),
+                                    DashIconify(icon="meteor-icons:filter", width=45),
                                     width="auto",
                                 ),
-                                dbc.Col(
-                                    dbc.Row(
-                                        [
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dbc.Label("WhatsApp de destino (Digite até 5 números)"),
-                                                md=12,
-                                            ),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-wpp-1-regra-editar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-wpp-2-regra-editar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-wpp-3-regra-editar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-wpp-4-regra-editar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
-                                                ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="editar-input-wpp-5-regra-editar-retrabalho",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
-                                                ),
-                                                md=12,
-                                            ),
-                                        ],
-                                        align="center",
-                                    ),
-                                    id="editar-input-wpp-destino-container-regra-editar-retrabalho",
-                                    md=12,
-                                ),
-                            ],
-                            align="center",
+                                dbc.Col(html.H1("OSs filtradas", className="align-self-center"), width=True),
+                                dmc.Space(h=15),
+                                html.Hr(),
+                                dbc.Row(dcc.Graph(id="editar-graph-pizza-filtro-retrabalho-regra-editar")),
+                            ]
                         ),
-                        body=True,
-                    ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=30),
-        # Botão Criar Regra
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Button(
-                        "Testar Regra (enviar mensagem)",
-                        id="btn-testar-regra-monitoramento-editar-retrabalho",
-                        color="info",
-                        className="me-1",
-                        style={"padding": "1em", "width": "100%"},
-                    ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Button(
-                        "Atualizar Regra",
-                        id="btn-editar-regra-monitoramento-atualizar-retrabalho",
-                        color="success",
-                        className="me-1",
-                        style={"padding": "1em", "width": "100%"},
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ],
-            justify="center",
-        ),
-        html.Div(id="mensagem-sucesso", style={"marginTop": "10px", "fontWeight": "bold"}),
-        dmc.Space(h=40),
-        # Resumo
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            # Cabeçalho
-                            html.Hr(),
-                            dbc.Col(
-                                DashIconify(icon="wpf:statistics", width=45),
-                                width="auto",
-                            ),
-                            dbc.Col(html.H1("Total de OS no período", className="align-self-center"), width=True),
-                            dmc.Space(h=15),
-                            html.Hr(),
-                            dbc.Row(dcc.Graph(id="editar-graph-pizza-sintese-retrabalho-regra-editar")),
-                        ]
-                    ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            # Cabeçalho
-                            html.Hr(),
-                            dbc.Col(
-                                DashIconify(icon="meteor-icons:filter", width=45),
-                                width="auto",
-                            ),
-                            dbc.Col(html.H1("OSs filtradas", className="align-self-center"), width=True),
-                            dmc.Space(h=15),
-                            html.Hr(),
-                            dbc.Row(dcc.Graph(id="editar-graph-pizza-filtro-retrabalho-regra-editar")),
-                        ]
-                    ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:car-search-outline", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Pré-visualização das OSs que foram filtradas pela regra criada",
-                                className="align-self-center",
-                            ),
-                        ]
+                ]
+            ),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:car-search-outline", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Pré-visualização das OSs que foram filtradas pela regra criada",
+                                    className="align-self-center",
+                                ),
+                            ]
+                        ),
+                        width=True,
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=40),
-        dag.AgGrid(
-            id="tabela-previa-os-regra-editar",
-            columnDefs=crud_regra_tabelas.tbl_detalhamento_problema_regra,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-                "enableCellTextSelection": True,
-                "ensureDomOrder": True,
-            },
-            style={"height": 500, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
-        ),
-        dmc.Space(h=40),
-    ]
-)
+                ],
+                align="center",
+            ),
+            dmc.Space(h=40),
+            dag.AgGrid(
+                id="tabela-previa-os-regra-editar",
+                columnDefs=crud_regra_tabelas.tbl_detalhamento_problema_regra,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                    "enableCellTextSelection": True,
+                    "ensureDomOrder": True,
+                },
+                style={"height": 500, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+        ]
+    )
 
 
 ##############################################################################
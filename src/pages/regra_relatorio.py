@@ -39,7 +39,8 @@ import locale_utils
 from db import PostgresSingleton
 
 # Imports gerais
-from modules.entities_utils import get_regras_monitoramento_os, get_mecanicos, get_lista_os, get_oficinas, get_secoes, get_modelos, gerar_excel
+from modules.entities_utils import get_regras_monitoramento_os, gerar_excel
+from modules.dataframe_codec_utils import codifica_saida_dataframes, decodifica_entrada_dataframes
 
 # Imports específicos
 from modules.crud_regra.crud_regra_service import CRUDRegraService
@@ -61,29 +62,6 @@ crud_regra_service = CRUDRegraService(pgEngine)
 df_regras_monitoramento_os = get_regras_monitoramento_os(pgEngine)
 lista_regras_monitoramento_os = df_regras_monitoramento_os.to_dict(orient="records")
 
-# Modelos de veículos
-df_modelos_veiculos = get_modelos(pgEngine)
-lista_todos_modelos_veiculos = df_modelos_veiculos.to_dict(orient="records")
-lista_todos_modelos_veiculos.insert(0, {"MODELO": "TODOS"})
-
-# Obtem a lista de Oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
-
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
-
-# Colaboradores / Mecânicos
-df_mecanicos = get_mecanicos(pgEngine)
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-lista_todas_os.insert(0, {"LABEL": "TODAS"})
-
 
 ##############################################################################
 # CALLBACKS ##################################################################
@@ -145,6 +123,7 @@ def callback_receber_campos_via_url_relatorio_regra(href):
     Input("relatorio-input-data-relatorio-regra-retrabalho", "value"),
     running=[(Output("loading-overlay-guia-relatorio-regra", "visible"), True, False)],
 )
+@codifica_saida_dataframes
 def callback_sincroniza_input_store_relatorio_regra(id_regra, dia_execucao):
     # Flags para validação
     input_regra_valido = True
@@ -210,7 +189,7 @@ def callback_sincroniza_input_store_relatorio_regra(id_regra, dia_execucao):
             "id_regra": id_regra,
             "nome_regra": nome_regra,
             "min_dias_retrabalho": min_dias_retrabalho,
-            "df_resultado_regra": df_resultado_regra.to_dict(orient="records"),
+            "df_resultado_regra": df_resultado_regra,
             "dados_regra": dados_regra,
         }
 
@@ -328,6 +307,7 @@ def atualiza_dados_card_descricao_regra_relatorio(store_relatorio_regra):
     ],
     Input("store-relatorio-relatorio-regra", "data"),
 )
+@decodifica_entrada_dataframes
 def atualiza_dados_card_resultado_regra_relatorio(store_relatorio_regra):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not store_relatorio_regra or not store_relatorio_regra["valido"]:
@@ -342,7 +322,7 @@ def atualiza_dados_card_resultado_regra_relatorio(store_relatorio_regra):
         ]
 
     # Obtem o resultado da regra
-    df_resultado_regra = pd.DataFrame(store_relatorio_regra["df_resultado_regra"])
+    df_resultado_regra = store_relatorio_regra["df_resultado_regra"]
 
     # Obtem os dados do dataframe
     total_os_detectadas = df_resultado_regra["os_num"].nunique()
@@ -387,10 +367,11 @@ def atualiza_dados_card_resultado_regra_relatorio(store_relatorio_regra):
     Output("tabela-relatorio-regra", "rowData"),
     Input("store-relatorio-relatorio-regra", "data"),
 )
+@decodifica_entrada_dataframes
 def tabela_relatorio_regra(store_relatorio_regra):
     # Valida input
     if store_relatorio_regra and store_relatorio_regra["valido"]:
-        df = pd.DataFrame(store_relatorio_regra["df_resultado_regra"])
+        df = store_relatorio_regra["df_resultado_regra"]
 
         # Datas aberturas (converte para DT) 
         df["DATA DA ABERTURA DA OS DT"] = pd.to_datetime(df["DATA DA ABERTURA DA OS"])
@@ -453,9 +434,10 @@ def callback_botao_relatorio_detalhamento_regra(
     Input("store-relatorio-relatorio-regra", "data"),
     Input("store-window-size", "data"),
 )
+@decodifica_entrada_dataframes
 def graph_relatorio_regra_por_servico(store_relatorio_regra, metadata_browser):
     if store_relatorio_regra and store_relatorio_regra["valido"]:
-        df = pd.DataFrame(store_relatorio_regra["df_resultado_regra"])
+        df = store_relatorio_regra["df_resultado_regra"]
         
         # Agrega por problema
         df_agg = df.groupby("DESCRICAO DO SERVICO").size().reset_index(name="count").sort_values(by="count", ascending=False)
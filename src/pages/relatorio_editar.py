@@ -32,7 +32,7 @@ import locale_utils
 from db import PostgresSingleton
 
 # Imports gerais
-from modules.entities_utils import get_mecanicos, get_lista_os, get_oficinas, get_secoes, get_modelos
+from modules.catalogo_entidades_utils import get_catalogo_entidades
 
 # Imports específicos
 from modules.crud_relatorio.crud_relatorio_service import CRUDRelatorioService
@@ -47,28 +47,8 @@ pgEngine = pgDB.get_engine()
 # Cria o serviço
 crud_relatorio_service = CRUDRelatorioService(pgEngine)
 
-# Modelos de veículos
-df_modelos_veiculos = get_modelos(pgEngine)
-lista_todos_modelos_veiculos = df_modelos_veiculos.to_dict(orient="records")
-lista_todos_modelos_veiculos.insert(0, {"MODELO": "TODOS"})
-
-# Obtem a lista de Oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
-
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
-
-# Colaboradores / Mecânicos
-df_mecanicos = get_mecanicos(pgEngine)
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-lista_todas_os.insert(0, {"LABEL": "TODAS"})
+# Catálogo das entidades dos filtros (lidas no primeiro uso e atualizadas periodicamente)
+catalogo_entidades = get_catalogo_entidades(pgEngine)
 
 
 ##############################################################################
@@ -324,7 +304,7 @@ def corrige_input_secao(lista_secaos):
 )
 def corrige_input_ordem_servico(lista_os, lista_secaos):
     # Vamos pegar as OS possíveis para as seções selecionadas
-    df_lista_os_secao = df_lista_os
+    df_lista_os_secao = catalogo_entidades.obtem("lista_os")
 
     if "TODAS" not in lista_secaos:
         df_lista_os_secao = df_lista_os_secao[df_lista_os_secao["SECAO"].isin(lista_secaos)]
@@ -683,637 +663,644 @@ def cb_atualizarr_regra_relatorio(
 ##############################################################################
 # Layout #####################################################################
 ##############################################################################
-layout = dbc.Container(
-    [
-        dcc.Store(id="pag-editar-relatorio-store-id-regra"),
-        # Modais
-        dmc.Modal(
-            id="pag-editar-relatorio-modal-erro-carregar-dados",
-            centered=True,
-            radius="lg",
-            size="md",
-            closeOnClickOutside=False,
-            closeOnEscape=False,
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro ao carregar dados!", order=1),
-                    dmc.Text("Ocorreu um erro ao carregar os dados da regra."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="pag-editar-relatorio-btn-close-modal-erro-carregar-dados",
-                            ),
-                        ],
-                    ),
-                    dmc.Space(h=20),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dmc.Modal(
-            # title="Erro ao carregar os dados",
-            id="pag-editar-relatorio-modal-erro-salvar",
-            centered=True,
-            radius="lg",
-            size="md",
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="lg",
-                        size=128,
-                        color="red",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Erro!", order=1),
-                    dmc.Text("Ocorreu um erro ao atualizar a regra. Verifique se a regra possui:"),
-                    dmc.List(
-                        [
-                            dmc.ListItem("Nome do relatório;"),
-                            dmc.ListItem("Pelo menos um dia de alerta (Segunda, Terça, etc);"),
-                            dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
-                        ],
-                    ),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="red",
-                                variant="outline",
-                                id="pag-editar-relatorio-btn-close-modal-erro-salvar",
-                            ),
-                        ],
-                    ),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dmc.Modal(
-            # title="Erro ao carregar os dados",
-            id="pag-editar-relatorio-modal-sucesso-salvar",
-            centered=True,
-            radius="lg",
-            size="lg",
-            children=dmc.Stack(
-                [
-                    dmc.ThemeIcon(
-                        radius="xl",
-                        size=128,
-                        color="green",
-                        variant="light",
-                        children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
-                    ),
-                    dmc.Title("Sucesso!", order=1),
-                    dmc.Text("A regra foi atualizada com sucesso."),
-                    dmc.Group(
-                        [
-                            dmc.Button(
-                                "Fechar",
-                                color="green",
-                                variant="outline",
-                                id="pag-editar-relatorio-btn-close-modal-sucesso-salvar",
-                            ),
-                        ],
-                        # justify="flex-end",
-                    ),
-                ],
-                align="center",
-                gap="md",
-            ),
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
+def layout(**kwargs):
+    # Listas dos filtros (obtidas do catálogo a cada carregamento da página, para refletir os dados atuais)
+    lista_todos_modelos_veiculos = catalogo_entidades.lista_registros("modelos", {"MODELO": "TODOS"})
+    lista_todas_oficinas = catalogo_entidades.lista_registros("oficinas", {"LABEL": "TODAS"})
+    lista_todas_secoes = catalogo_entidades.lista_registros("secoes", {"LABEL": "TODAS"})
+    lista_todas_os = catalogo_entidades.lista_registros("lista_os", {"LABEL": "TODAS"})
+
+    return dbc.Container(
+        [
+            dcc.Store(id="pag-editar-relatorio-store-id-regra"),
+            # Modais
+            dmc.Modal(
+                id="pag-editar-relatorio-modal-erro-carregar-dados",
+                centered=True,
+                radius="lg",
+                size="md",
+                closeOnClickOutside=False,
+                closeOnEscape=False,
+                children=dmc.Stack(
                     [
-                        dbc.Alert(
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro ao carregar dados!", order=1),
+                        dmc.Text("Ocorreu um erro ao carregar os dados da regra."),
+                        dmc.Group(
                             [
-                                dbc.Row(
-                                    [
-                                        dbc.Col(
-                                            DashIconify(icon="material-symbols:date-range", width=45), width="auto"
-                                        ),
-                                        dbc.Col(
-                                            html.P(
-                                                [
-                                                    html.Strong("Período do relatório:"),
-                                                    """
-                                                    intervalo em que as OS serão analisadas. Também será analisado o
-                                                    período anterior. Exemplo: um período de 7 dias indica que será 
-                                                    analisado o retrabalho nos 7 dias anteriores, bem como da outra
-                                                    semana (14 dias). A idéia é que isso permita avaliar a evolução
-                                                    do retrabalho.
-                                                    """,
-                                                ]
-                                            ),
-                                            className="mt-2",
-                                            width=True,
-                                        ),
-                                    ],
-                                    align="center",
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="pag-editar-relatorio-btn-close-modal-erro-carregar-dados",
                                 ),
                             ],
-                            dismissable=True,
-                            color="secondary",
                         ),
+                        dmc.Space(h=20),
                     ],
-                    md=12,
+                    align="center",
+                    gap="md",
                 ),
-            ]
-        ),
-        # Cabeçalho e Inputs
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="carbon:rule-draft", width=45), width="auto"),
-                dbc.Col(
-                    html.H1(
-                        [
-                            "Atualizar regra para \u00a0",
-                            html.Strong("relatório LLM"),
-                        ],
-                        className="align-self-center",
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        # dmc.Space(h=15),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        html.Div(
+            ),
+            dmc.Modal(
+                # title="Erro ao carregar os dados",
+                id="pag-editar-relatorio-modal-erro-salvar",
+                centered=True,
+                radius="lg",
+                size="md",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="lg",
+                            size=128,
+                            color="red",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:error-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Erro!", order=1),
+                        dmc.Text("Ocorreu um erro ao atualizar a regra. Verifique se a regra possui:"),
+                        dmc.List(
                             [
-                                dbc.Label("Nome do Relatório"),
-                                dbc.Input(
-                                    id="pag-editar-relatorio-input-nome",
-                                    type="text",
-                                    placeholder="Ex: Relatório do Setor Elétrico...",
-                                    value="",
+                                dmc.ListItem("Nome do relatório;"),
+                                dmc.ListItem("Pelo menos um dia de alerta (Segunda, Terça, etc);"),
+                                dmc.ListItem("Pelo menos um destino de email ou WhatsApp ativo."),
+                            ],
+                        ),
+                        dmc.Group(
+                            [
+                                dmc.Button(
+                                    "Fechar",
+                                    color="red",
+                                    variant="outline",
+                                    id="pag-editar-relatorio-btn-close-modal-erro-salvar",
                                 ),
                             ],
-                            className="dash-bootstrap",
                         ),
-                        body=True,
-                    ),
-                    md=12,
+                    ],
+                    align="center",
+                    gap="md",
                 ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        html.Div(
+            ),
+            dmc.Modal(
+                # title="Erro ao carregar os dados",
+                id="pag-editar-relatorio-modal-sucesso-salvar",
+                centered=True,
+                radius="lg",
+                size="lg",
+                children=dmc.Stack(
+                    [
+                        dmc.ThemeIcon(
+                            radius="xl",
+                            size=128,
+                            color="green",
+                            variant="light",
+                            children=DashIconify(icon="material-symbols:check-circle-rounded", width=128, height=128),
+                        ),
+                        dmc.Title("Sucesso!", order=1),
+                        dmc.Text("A regra foi atualizada com sucesso."),
+                        dmc.Group(
                             [
-                                dbc.Label("Período (últimos X dias)"),
-                                dbc.InputGroup(
-                                    [
-                                        dbc.Input(
-                                            id="pag-editar-relatorio-input-periodo-dias-monitoramento",
-                                            type="number",
-                                            placeholder="Dias",
-                                            value=7,
-                                            step=1,
-                                            min=1,
-                                        ),
-                                        dbc.InputGroupText("dias"),
-                                    ]
-                                ),
-                                dmc.Space(h=5),
-                                dbc.FormText(
-                                    html.Em(
-                                        "Período de análise do relatório"
-                                    ),
-                                    color="secondary",
+                                dmc.Button(
+                                    "Fechar",
+                                    color="green",
+                                    variant="outline",
+                                    id="pag-editar-relatorio-btn-close-modal-sucesso-salvar",
                                 ),
                             ],
-                            className="dash-bootstrap",
+                            # justify="flex-end",
                         ),
-                        body=True,
-                    ),
-                    md=6,
-                    className="mb-3 mb-md-0",
+                    ],
+                    align="center",
+                    gap="md",
                 ),
-                dbc.Col(
-                    dbc.Card(
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
                         [
-                            html.Div(
+                            dbc.Alert(
                                 [
-                                    dbc.Label("Tempo (em dias) entre OS para retrabalho"),
-                                    dcc.Dropdown(
-                                        id="pag-editar-relatorio-input-select-dias",
-                                        options=[
-                                            {"label": "10 dias", "value": 10},
-                                            {"label": "15 dias", "value": 15},
-                                            {"label": "30 dias", "value": 30},
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(
+                                                DashIconify(icon="material-symbols:date-range", width=45), width="auto"
+                                            ),
+                                            dbc.Col(
+                                                html.P(
+                                                    [
+                                                        html.Strong("Período do relatório:"),
+                                                        """
+                                                    intervalo em que as OS serão analisadas. Também será analisado o
+                                                    período anterior. Exemplo: um período de 7 dias indica que será 
+                                                    analisado o retrabalho nos 7 dias anteriores, bem como da outra
+                                                    semana (14 dias). A idéia é que isso permita avaliar a evolução
+                                                    do retrabalho.
+                                                    """,
+                                                    ]
+                                                ),
+                                                className="mt-2",
+                                                width=True,
+                                            ),
                                         ],
-                                        placeholder="Período em dias",
-                                        value=10,
-                                    ),
-                                    dmc.Space(h=5),
-                                    dbc.FormText(
-                                        html.Em(
-                                            "Período mínimo de dias entre OS para que uma nova OS não seja considerada retrabalho"
-                                        ),
-                                        color="secondary",
+                                        align="center",
                                     ),
                                 ],
-                                className="dash-bootstrap",
+                                dismissable=True,
+                                color="secondary",
                             ),
                         ],
-                        body=True,
+                        md=12,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Modelos de Veículos"),
-                                    dcc.Dropdown(
-                                        id="pag-editar-relatorio-input-select-modelo-veiculos",
-                                        options=[
-                                            {
-                                                "label": os["MODELO"],
-                                                "value": os["MODELO"],
-                                            }
-                                            for os in lista_todos_modelos_veiculos
-                                        ],
-                                        multi=True,
-                                        value=["TODOS"],
-                                        placeholder="Selecione um ou mais modelos...",
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
+                ]
+            ),
+            # Cabeçalho e Inputs
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="carbon:rule-draft", width=45), width="auto"),
+                    dbc.Col(
+                        html.H1(
+                            [
+                                "Atualizar regra para \u00a0",
+                                html.Strong("relatório LLM"),
+                            ],
+                            className="align-self-center",
+                        ),
+                        width=True,
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
+                ],
+                align="center",
+            ),
+            # dmc.Space(h=15),
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
                             html.Div(
                                 [
-                                    dbc.Label("Oficinas"),
-                                    dcc.Dropdown(
-                                        id="pag-editar-relatorio-input-select-oficina",
-                                        options=[
-                                            {"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_oficinas
-                                        ],
-                                        multi=True,
-                                        value=["TODAS"],
-                                        placeholder="Selecione uma ou mais oficinas...",
+                                    dbc.Label("Nome do Relatório"),
+                                    dbc.Input(
+                                        id="pag-editar-relatorio-input-nome",
+                                        type="text",
+                                        placeholder="Ex: Relatório do Setor Elétrico...",
+                                        value="",
                                     ),
                                 ],
                                 className="dash-bootstrap",
                             ),
-                        ],
-                        body=True,
+                            body=True,
+                        ),
+                        md=12,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
                             html.Div(
                                 [
-                                    dbc.Label("Seções (categorias) de manutenção"),
-                                    dcc.Dropdown(
-                                        id="pag-editar-relatorio-input-select-secao",
-                                        options=[
-                                            {"label": sec["LABEL"], "value": sec["LABEL"]} for sec in lista_todas_secoes
-                                        ],
-                                        multi=True,
-                                        value=["MANUTENCAO ELETRICA"],
-                                        placeholder="Selecione uma ou mais seções...",
+                                    dbc.Label("Período (últimos X dias)"),
+                                    dbc.InputGroup(
+                                        [
+                                            dbc.Input(
+                                                id="pag-editar-relatorio-input-periodo-dias-monitoramento",
+                                                type="number",
+                                                placeholder="Dias",
+                                                value=7,
+                                                step=1,
+                                                min=1,
+                                            ),
+                                            dbc.InputGroupText("dias"),
+                                        ]
                                     ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
-                    ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Ordens de Serviço"),
-                                    dcc.Dropdown(
-                                        id="pag-editar-relatorio-input-select-ordens-servico",
-                                        options=[{"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_os],
-                                        multi=True,
-                                        value=["TODAS"],
-                                        placeholder="Selecione uma ou mais ordens de serviço...",
+                                    dmc.Space(h=5),
+                                    dbc.FormText(
+                                        html.Em(
+                                            "Período de análise do relatório"
+                                        ),
+                                        color="secondary",
                                     ),
                                 ],
                                 className="dash-bootstrap",
                             ),
-                        ],
-                        body=True,
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Dia da semana:"),
-                                    dbc.RadioItems(
-                                        options=[
-                                            {
-                                                "label": "SEG",
-                                                "value": 0,
-                                            },
-                                            {
-                                                "label": "TER",
-                                                "value": 1,
-                                            },
-                                            {
-                                                "label": "QUA",
-                                                "value": 2,
-                                            },
-                                            {
-                                                "label": "QUI",
-                                                "value": 3,
-                                            },
-                                            {
-                                                "label": "SEX",
-                                                "value": 4,
-                                            },
-                                            {
-                                                "label": "SAB",
-                                                "value": 5,
-                                            },
-                                            {
-                                                "label": "DOM",
-                                                "value": 6,
-                                            },
-                                        ],
-                                        value=1,
-                                        id="pag-editar-relatorio-checklist-dia-semana",
-                                        inline=True,
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Tempo (em dias) entre OS para retrabalho"),
+                                        dcc.Dropdown(
+                                            id="pag-editar-relatorio-input-select-dias",
+                                            options=[
+                                                {"label": "10 dias", "value": 10},
+                                                {"label": "15 dias", "value": 15},
+                                                {"label": "30 dias", "value": 30},
+                                            ],
+                                            placeholder="Período em dias",
+                                            value=10,
+                                        ),
+                                        dmc.Space(h=5),
+                                        dbc.FormText(
+                                            html.Em(
+                                                "Período mínimo de dias entre OS para que uma nova OS não seja considerada retrabalho"
+                                            ),
+                                            color="secondary",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            html.Div(
-                                [
-                                    dbc.Label("Horário de envio:"),
-                                    dmc.TimeInput(
-                                        debounce=True, id="pag-editar-relatorio-horario-envio-regra", value="06:00"
-                                    ),
-                                ],
-                                className="dash-bootstrap",
-                            ),
-                        ],
-                        body=True,
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Modelos de Veículos"),
+                                        dcc.Dropdown(
+                                            id="pag-editar-relatorio-input-select-modelo-veiculos",
+                                            options=[
+                                                {
+                                                    "label": os["MODELO"],
+                                                    "value": os["MODELO"],
+                                                }
+                                                for os in lista_todos_modelos_veiculos
+                                            ],
+                                            multi=True,
+                                            value=["TODOS"],
+                                            placeholder="Selecione um ou mais modelos...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        dbc.Row(
+                    dbc.Col(
+                        dbc.Card(
                             [
-                                dbc.Col(
-                                    dmc.Switch(
-                                        id="pag-editar-relatorio-switch-enviar-email",
-                                        label="Enviar email",
-                                        checked=False,
-                                        size="md",
-                                    ),
-                                    width="auto",
+                                html.Div(
+                                    [
+                                        dbc.Label("Oficinas"),
+                                        dcc.Dropdown(
+                                            id="pag-editar-relatorio-input-select-oficina",
+                                            options=[
+                                                {"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_oficinas
+                                            ],
+                                            multi=True,
+                                            value=["TODAS"],
+                                            placeholder="Selecione uma ou mais oficinas...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
                                 ),
-                                dbc.Col(
-                                    dbc.Row(
-                                        [
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dbc.Label("Emails de destino (Digite até 5 emails)"),
-                                                md=12,
-                                            ),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-email-1",
-                                                    placeholder="email1@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Seções (categorias) de manutenção"),
+                                        dcc.Dropdown(
+                                            id="pag-editar-relatorio-input-select-secao",
+                                            options=[
+                                                {"label": sec["LABEL"], "value": sec["LABEL"]} for sec in lista_todas_secoes
+                                            ],
+                                            multi=True,
+                                            value=["MANUTENCAO ELETRICA"],
+                                            placeholder="Selecione uma ou mais seções...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Ordens de Serviço"),
+                                        dcc.Dropdown(
+                                            id="pag-editar-relatorio-input-select-ordens-servico",
+                                            options=[{"label": os["LABEL"], "value": os["LABEL"]} for os in lista_todas_os],
+                                            multi=True,
+                                            value=["TODAS"],
+                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Dia da semana:"),
+                                        dbc.RadioItems(
+                                            options=[
+                                                {
+                                                    "label": "SEG",
+                                                    "value": 0,
+                                                },
+                                                {
+                                                    "label": "TER",
+                                                    "value": 1,
+                                                },
+                                                {
+                                                    "label": "QUA",
+                                                    "value": 2,
+                                                },
+                                                {
+                                                    "label": "QUI",
+                                                    "value": 3,
+                                                },
+                                                {
+                                                    "label": "SEX",
+                                                    "value": 4,
+                                                },
+                                                {
+                                                    "label": "SAB",
+                                                    "value": 5,
+                                                },
+                                                {
+                                                    "label": "DOM",
+                                                    "value": 6,
+                                                },
+                                            ],
+                                            value=1,
+                                            id="pag-editar-relatorio-checklist-dia-semana",
+                                            inline=True,
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                html.Div(
+                                    [
+                                        dbc.Label("Horário de envio:"),
+                                        dmc.TimeInput(
+                                            debounce=True, id="pag-editar-relatorio-horario-envio-regra", value="06:00"
+                                        ),
+                                    ],
+                                    className="dash-bootstrap",
+                                ),
+                            ],
+                            body=True,
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dmc.Space(h=10),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        dmc.Switch(
+                                            id="pag-editar-relatorio-switch-enviar-email",
+                                            label="Enviar email",
+                                            checked=False,
+                                            size="md",
+                                        ),
+                                        width="auto",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dbc.Label("Emails de destino (Digite até 5 emails)"),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-email-2",
-                                                    placeholder="email2@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-email-1",
+                                                        placeholder="email1@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-email-3",
-                                                    placeholder="email3@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-email-2",
+                                                        placeholder="email2@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-email-4",
-                                                    placeholder="email4@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-email-3",
+                                                        placeholder="email3@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-email-5",
-                                                    placeholder="email5@odilonsantos.com",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="mdi:email"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-email-4",
+                                                        placeholder="email4@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                        ],
-                                        align="center",
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-email-5",
+                                                        placeholder="email5@odilonsantos.com",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="mdi:email"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                            ],
+                                            align="center",
+                                        ),
+                                        id="pag-editar-relatorio-input-email-destino-container",
+                                        md=12,
                                     ),
-                                    id="pag-editar-relatorio-input-email-destino-container",
-                                    md=12,
-                                ),
-                            ],
-                            align="center",
+                                ],
+                                align="center",
+                            ),
+                            body=True,
                         ),
-                        body=True,
+                        md=6,
+                        className="mb-3 mb-md-0",
                     ),
-                    md=6,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        dbc.Row(
-                            [
-                                dbc.Col(
-                                    dmc.Switch(
-                                        id="pag-editar-relatorio-switch-enviar-wpp-regra",
-                                        label="Enviar WhatsApp",
-                                        checked=False,
-                                        size="md",
+                    dbc.Col(
+                        dbc.Card(
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        dmc.Switch(
+                                            id="pag-editar-relatorio-switch-enviar-wpp-regra",
+                                            label="Enviar WhatsApp",
+                                            checked=False,
+                                            size="md",
+                                        ),
+                                        width="auto",
                                     ),
-                                    width="auto",
-                                ),
-                                dbc.Col(
-                                    dbc.Row(
-                                        [
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dbc.Label("WhatsApp de destino (Digite até 5 números)"),
-                                                md=12,
-                                            ),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-wpp-1",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dbc.Label("WhatsApp de destino (Digite até 5 números)"),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-wpp-2",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-wpp-1",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-wpp-3",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-wpp-2",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-wpp-4",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-wpp-3",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                            dmc.Space(h=10),
-                                            dbc.Col(
-                                                dmc.TextInput(
-                                                    id="pag-editar-relatorio-input-wpp-5",
-                                                    placeholder="(62) 99999-9999",
-                                                    value="",
-                                                    leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-wpp-4",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
                                                 ),
-                                                md=12,
-                                            ),
-                                        ],
-                                        align="center",
+                                                dmc.Space(h=10),
+                                                dbc.Col(
+                                                    dmc.TextInput(
+                                                        id="pag-editar-relatorio-input-wpp-5",
+                                                        placeholder="(62) 99999-9999",
+                                                        value="",
+                                                        leftSection=DashIconify(icon="logos:whatsapp-icon"),
+                                                    ),
+                                                    md=12,
+                                                ),
+                                            ],
+                                            align="center",
+                                        ),
+                                        id="pag-editar-relatorio-input-wpp-destino-container",
+                                        md=12,
                                     ),
-                                    id="pag-editar-relatorio-input-wpp-destino-container",
-                                    md=12,
-                                ),
-                            ],
-                            align="center",
+                                ],
+                                align="center",
+                            ),
+                            body=True,
                         ),
-                        body=True,
+                        md=6,
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dmc.Space(h=30),
-        # Botão Atualizar Regra
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Button(
-                        "Atualizar Regra",
-                        id="pag-editar-relatorio-btn-salvar-regra",
-                        color="success",
-                        className="me-1",
-                        style={"padding": "1em", "width": "100%"},
+                ]
+            ),
+            dmc.Space(h=30),
+            # Botão Atualizar Regra
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Button(
+                            "Atualizar Regra",
+                            id="pag-editar-relatorio-btn-salvar-regra",
+                            color="success",
+                            className="me-1",
+                            style={"padding": "1em", "width": "100%"},
+                        ),
+                        md=12,
                     ),
-                    md=12,
-                ),
-            ],
-            justify="center",
-        ),
-        dmc.Space(h=100),
-    ]
-)
+                ],
+                justify="center",
+            ),
+            dmc.Space(h=100),
+        ]
+    )
 
 
 ##############################################################################
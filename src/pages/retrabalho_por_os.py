@@ -35,6 +35,7 @@ from db import PostgresSingleton
 
 # Imports gerais
 from modules.entities_utils import get_tipos_eventos_telemetria_mix_com_data, get_tipos_eventos_telemetria_mix_com_gps
+from modules.dataframe_codec_utils import codifica_saida_dataframes, decodifica_entrada_dataframes
 
 # Imports específicos
 from modules.os.os_service import OSService
@@ -199,6 +200,7 @@ def callback_sincroniza_input_store(os_value, dias_value):
     Output("store-output-dados-detalhamento-os", "data"),
     Input("store-input-dados-detalhamento-os", "data"),
 )
+@codifica_saida_dataframes
 def callback_recupera_os_armazena_store_output(data):
     saida = {
         "sucesso": False,
@@ -226,7 +228,7 @@ def callback_recupera_os_armazena_store_output(data):
     df_os = os_service.obtem_detalhamento_os(os_numero, min_dias)
 
     saida["sucesso"] = True
-    saida["df_os"] = df_os.to_dict(orient="records")
+    saida["df_os"] = df_os
 
     # Demais dados
     saida["os_numero"] = os_numero
@@ -317,6 +319,7 @@ def gera_labels_inputs_detalhamento_os(campo):
     ],
     Input("store-output-dados-detalhamento-os", "data"),
 )
+@decodifica_entrada_dataframes
 def atualiza_dados_card_detalhamento_os(data):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
@@ -335,7 +338,7 @@ def atualiza_dados_card_detalhamento_os(data):
     os_numero = data["os_numero"]
     min_dias = data["min_dias_retrabalho"]
     num_problema_os = data["num_problema_os"]
-    df_os = pd.DataFrame(data["df_os"]).copy()
+    df_os = data["df_os"].copy()
 
     # Pega o status da OS
     txt_status_label = df_os[df_os["NUMERO DA OS"] == int(os_numero)]["status_os_label"].values[0]
@@ -381,6 +384,7 @@ def atualiza_dados_card_detalhamento_os(data):
     ],
     Input("store-output-dados-detalhamento-os", "data"),
 )
+@decodifica_entrada_dataframes
 def atualiza_dados_card_detalhamento_problema(data):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
@@ -398,7 +402,7 @@ def atualiza_dados_card_detalhamento_problema(data):
     # Obtem os dados
     os_numero = data["os_numero"]
     min_dias = data["min_dias_retrabalho"]
-    df_os = pd.DataFrame(data["df_os"]).copy()
+    df_os = data["df_os"].copy()
 
     # Pega o problema da OS alvo
     problem_no = df_os[df_os["NUMERO DA OS"] == int(os_numero)]["problem_no"].values[0]
@@ -492,13 +496,14 @@ def atualiza_dados_card_detalhamento_problema(data):
     Output("timeline-detalhamento-os", "children"),
     Input("store-output-dados-detalhamento-os", "data"),
 )
+@decodifica_entrada_dataframes
 def preencher_timeline(data):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
         return []
 
     os_numero = data["os_numero"]
-    df_os = pd.DataFrame(data["df_os"]).copy()
+    df_os = data["df_os"].copy()
 
     # Preenche a linha do tempo somente com o problema da OS atual
     problem_no = df_os[df_os["NUMERO DA OS"] == int(os_numero)]["problem_no"].values[0]
@@ -588,13 +593,14 @@ def preencher_timeline(data):
     Output("tabela-detalhamento-previa-os-retrabalho", "rowData"),
     Input("store-output-dados-detalhamento-os", "data"),
 )
+@decodifica_entrada_dataframes
 def preencher_tabela(data):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
         return []
 
     # Obtem os dados do estado
-    df_os = pd.DataFrame(data["df_os"])
+    df_os = data["df_os"]
 
     return df_os.to_dict(orient="records")
 
@@ -610,13 +616,14 @@ def preencher_tabela(data):
     Input("store-output-dados-detalhamento-os", "data"),
     Input("store-window-size", "data"),
 )
+@decodifica_entrada_dataframes
 def plota_grafico_gantt_retrabalho_os(data, metadata_browser):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
         return go.Figure()
 
     # Obtem os dados do estado
-    df_os = pd.DataFrame(data["df_os"])
+    df_os = data["df_os"]
     os_numero = data["os_numero"]
 
     # Gera o gráfico
@@ -653,13 +660,14 @@ def preenche_dias_sem_eventos(df, data_inicio_problema, data_fim_problema, vec_a
     Input("input-select-data-eventos-mix-detalhamento-os", "value"),
     Input("store-window-size", "data"),
 )
+@decodifica_entrada_dataframes
 def plota_grafico_eventos_retrabalho_os(data, lista_dropdown_eventos_mix, metadata_browser):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
         return go.Figure()
 
     # Obtem os dados do estado
-    df_os = pd.DataFrame(data["df_os"])
+    df_os = data["df_os"]
     codigo_veiculo = data["codigo_veiculo"]
     os_numero = data["os_numero"]
     problem_no = data["num_problema_os"]
@@ -797,6 +805,7 @@ def gera_layer_evento_mix(vec_asset_id, evt, data_inicio_problema_str, data_fim_
     Input("input-select-data-eventos-mix-detalhamento-os", "value"),
     Input("graph-historico-eventos-detalhamento-os", "relayoutData"),
 )
+@decodifica_entrada_dataframes
 def cb_mapa_eventos_mix_retrabalho_os(data, eventos_selecionados, relayoutData):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["sucesso"]:
@@ -806,7 +815,7 @@ def cb_mapa_eventos_mix_retrabalho_os(data, eventos_selecionados, relayoutData):
         return dash.no_update, dash.no_update
 
     # Obtem os dados do estado
-    df_os = pd.DataFrame(data["df_os"])
+    df_os = data["df_os"]
     problem_no = data["num_problema_os"]
     vec_asset_id = data["vec_asset_id"]
 
@@ -32,10 +32,12 @@ import locale_utils
 from db import PostgresSingleton
 
 # Imports gerais
-from modules.entities_utils import get_mecanicos, get_lista_os, get_oficinas, get_secoes, get_modelos
+from modules.catalogo_entidades_utils import get_catalogo_entidades
+from modules.dataframe_store_utils import ArmazemDataFrames
+from modules.data_version_utils import get_versao_dados
 
 # Imports específicos
-from modules.tipo_servico.tipo_servico_service import TipoServicoService
+from modules.tipo_servico.tipo_servico_service import TipoServicoService, TERMOS_ALL_TIPO_SERVICO
 import modules.tipo_servico.graficos as tipo_servico_graficos
 import modules.tipo_servico.tabelas as tipo_servico_tabelas
 
@@ -49,28 +51,12 @@ pgEngine = pgDB.get_engine()
 # Cria o serviço
 tipo_servico_service = TipoServicoService(pgEngine)
 
-# Obtem a lista de Oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
+# Armazém dos DataFrames calculados (o store da página guarda apenas o identificador dos dados)
+armazem_tipo_servico = ArmazemDataFrames("tipo_servico")
 
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
+# Catálogo das entidades dos filtros (lidas no primeiro uso e atualizadas periodicamente)
+catalogo_entidades = get_catalogo_entidades(pgEngine)
 
-# Colaboradores / Mecânicos
-df_mecanicos = get_mecanicos(pgEngine)
-
-# Modelos de veículos
-df_modelos_veiculos = get_modelos(pgEngine)
-lista_todos_modelos_veiculos = df_modelos_veiculos.to_dict(orient="records")
-lista_todos_modelos_veiculos.insert(0, {"MODELO": "TODOS"})
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-# lista_todas_os.insert(0, {"LABEL": "TODAS"})
 
 ##############################################################################
 # CALLBACKS ##################################################################
@@ -228,6 +214,31 @@ def gera_labels_inputs(campo):
 ##############################################################################
 
 
+def computa_dados_tipo_servico(datas, min_dias, lista_modelos, lista_oficinas, lista_os):
+    """Calcula os DataFrames usados pelos gráficos, indicadores e tabelas da página (agregados no banco)"""
+    # Obtém os agregados das OSs (resumo, por modelo, por problema e por colaborador)
+    dict_agregados = tipo_servico_service.obtem_agregados_os_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os)
+
+    # Obtem dados dos colaboradores
+    df_colaborador = tipo_servico_service.obtem_dados_colaboradores_agregados(dict_agregados["df_colaborador"])
+
+    return {
+        "df_resumo": dict_agregados["df_resumo"],
+        "df_modelo": dict_agregados["df_modelo"],
+        "df_problema": dict_agregados["df_problema"],
+        "df_colaborador": df_colaborador,
+    }
+
+
+def obtem_dados_store(store_payload, nome_df):
+    """Retorna o DataFrame nome_df a partir do identificador do store (recalcula se não estiver no armazém)"""
+    filtros = store_payload["filtros"]
+
+    return armazem_tipo_servico.carrega(
+        store_payload["handle"], nome_df, lambda: computa_dados_tipo_servico(**filtros)
+    )
+
+
 @callback(
     Output("store-dados-tipo-servico", "data"),
     [
@@ -240,47 +251,29 @@ def gera_labels_inputs(campo):
     running=[(Output("loading-overlay-guia-os", "visible"), True, False)],
 )
 def computa_retrabalho(datas, min_dias, lista_modelos, lista_oficinas, lista_os):
-    dados_vazios = {
-        "df_os": pd.DataFrame().to_dict("records"),
-        "vazio": True,
-    }
+    dados_vazios = {"vazio": True}
 
     # Valida input
     if not input_valido_tela_tipo_servico(datas, min_dias, lista_modelos, lista_oficinas, lista_os):
         return dados_vazios
 
-    # Obtém dados das os
-    df_os = tipo_servico_service.obtem_dados_os_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os)
-
-    # Obtem os dados da LLM
-    df_llm_raw = tipo_servico_service.obtem_dados_os_llm_sql(datas, min_dias, lista_modelos, lista_oficinas, lista_os)
-
-    # Faz o merge
-    df_os_llm = df_os.merge(df_llm_raw, on="KEY_HASH", how="left")
-
-    # Obtem os dados de custo
-    df_custo_raw = tipo_servico_service.obtem_dados_os_custo_sql(
-        datas, min_dias, lista_modelos, lista_oficinas, lista_os
-    )
-
-    # Obtem os dados de custo agregados por OS
-    df_custo_por_os_raw = df_custo_raw[["NUMERO DA OS", "VALOR"]].drop_duplicates()
-    df_custo_por_os_agg = df_custo_por_os_raw.groupby("NUMERO DA OS")["VALOR"].sum().reset_index()
-
-    # Faz o merge
-    df_os_custo_agg = df_os.merge(df_custo_por_os_agg, on="NUMERO DA OS", how="left")
+    # Os DataFrames ficam no servidor, o store recebe apenas o identificador e os filtros (para recalcular se preciso)
+    filtros = {
+        "datas": datas,
+        "min_dias": min_dias,
+        "lista_modelos": lista_modelos,
+        "lista_oficinas": lista_oficinas,
+        "lista_os": lista_os,
+    }
+    handle = armazem_tipo_servico.gera_handle(get_versao_dados(pgEngine), filtros, TERMOS_ALL_TIPO_SERVICO)
 
-    # Obtem dados dos colaboradores
-    df_colaborador = tipo_servico_service.obtem_dados_colaboradores_pandas(df_os, df_llm_raw, df_custo_por_os_agg)
+    # Calcula (ou reaproveita) os dados
+    df_resumo = obtem_dados_store({"handle": handle, "filtros": filtros}, "df_resumo")
 
     return {
-        "df_os": df_os.to_dict("records"),
-        "df_os_llm": df_os_llm.to_dict("records"),
-        "df_custo_raw": df_custo_raw.to_dict("records"),
-        "df_custo_por_os_agg": df_custo_por_os_agg.to_dict("records"),
-        "df_os_custo_agg": df_os_custo_agg.to_dict("records"),
-        "df_colaborador": df_colaborador.to_dict("records"),
-        "vazio": df_os.empty,
+        "handle": handle,
+        "filtros": filtros,
+        "vazio": bool(df_resumo["TOTAL_NUM_OS"].iloc[0] == 0),
     }
 
 
@@ -296,17 +289,10 @@ def plota_grafico_pizza_sintese_os(store_payload):
         return go.Figure()
 
     # Obtem os dados
-    df_os_raw = pd.DataFrame(store_payload["df_os"])
-
-    # Verifica se há dados
-    if df_os_raw.empty:
-        return go.Figure()
+    df_resumo = obtem_dados_store(store_payload, "df_resumo")
 
-    # Remove duplicatas
-    df = df_os_raw.drop_duplicates(subset=["NUMERO DA OS"])
-
-    # Computa sintese
-    estatistica_retrabalho = tipo_servico_service.get_sintese_os(df)
+    # Computa sintese (OSs distintas)
+    estatistica_retrabalho = tipo_servico_service.get_sintese_os_agregada(df_resumo)
 
     # Prepara os dados para o gráfico
     labels = ["Correções de Primeira", "Correções Tardias", "Retrabalhos"]
@@ -317,7 +303,7 @@ def plota_grafico_pizza_sintese_os(store_payload):
     ]
 
     # Gera o gráfico
-    fig = tipo_servico_graficos.gerar_grafico_pizza_sinteze_os(df, labels, values)
+    fig = tipo_servico_graficos.gerar_grafico_pizza_sinteze_os(estatistica_retrabalho["total_num_os"], labels, values)
 
     return fig
 
@@ -329,14 +315,10 @@ def plota_grafico_cumulativo_retrabalho_os(store_payload):
         return go.Figure()
 
     # Obtem os dados
-    df_os_raw = pd.DataFrame(store_payload["df_os"])
-
-    # Verifica se há dados
-    if df_os_raw.empty:
-        return go.Figure()
+    df_problema = obtem_dados_store(store_payload, "df_problema")
 
     # Computa os dados
-    df_os_cumulativo = tipo_servico_service.get_tempo_cumulativo_para_retrabalho(df_os_raw)
+    df_os_cumulativo = tipo_servico_service.get_tempo_cumulativo_para_retrabalho_agregado(df_problema)
 
     # Gera o gráfico
     fig = tipo_servico_graficos.gerar_grafico_cumulativo_os(df_os_cumulativo)
@@ -350,13 +332,10 @@ def plota_grafico_retrabalho_por_modelo_perc_os(store_payload):
         return go.Figure()
 
     # Obtem os dados
-    df_os_raw = pd.DataFrame(store_payload["df_os"])
+    df_modelo_agg = obtem_dados_store(store_payload, "df_modelo")
 
-    # Remove duplicatas
-    df = df_os_raw.drop_duplicates(subset=["NUMERO DA OS"])
-
-    # Estatística por modelo
-    df_modelo = tipo_servico_service.get_retrabalho_por_modelo(df)
+    # Estatística por modelo (OSs distintas)
+    df_modelo = tipo_servico_service.get_retrabalho_por_modelo_agregado(df_modelo_agg)
 
     # Gera o gráfico
     fig = tipo_servico_graficos.gerar_grafico_barras_retrabalho_por_modelo_perc(df_modelo)
@@ -364,37 +343,6 @@ def plota_grafico_retrabalho_por_modelo_perc_os(store_payload):
     return fig
 
 
-def plota_grafico_evolucao_retrabalho_por_oficina_por_mes_os(store_payload):
-    if store_payload["vazio"]:
-        return go.Figure()
-
-    # Obtem os dados
-    df_os_raw = pd.DataFrame(store_payload["df_os"])
-
-    # Remove duplicatas
-    df = df_os_raw.drop_duplicates(subset=["NUMERO DA OS"])
-
-    # Adiciona a coluna de ano-mês
-    df["year_month"] = pd.to_datetime(df["DATA DA ABERTURA DA OS"]).dt.strftime("%Y-%m")
-
-    result = (
-        df.groupby(["year_month", "DESCRICAO DA OFICINA"])
-        .agg(
-            PERC_RETRABALHO=("retrabalho", lambda x: 100 * round(x.sum() / len(x), 4)),
-            PERC_CORRECAO_PRIMEIRA=("correcao_primeira", lambda x: 100 * round(x.sum() / len(x), 4)),
-        )
-        .reset_index()
-    )
-
-    # Estatística por oficina
-    df_oficina = tipo_servico_service.get_retrabalho_por_oficina(df)
-
-    # Gera o gráfico
-    fig = tipo_servico_graficos.gerar_grafico_evolucao_retrabalho_por_oficina_por_mes(df_oficina)
-
-    return fig
-
-
 ##############################################################################
 # Callbacks para os indicadores ##############################################
 ##############################################################################
@@ -416,29 +364,23 @@ def atualiza_indicadores_os_gerais(store_payload):
         return ["", "", "", "", "", ""]
 
     # Obtem os dados
-    df_os_raw = pd.DataFrame(store_payload["df_os"])
+    df_resumo = obtem_dados_store(store_payload, "df_resumo")
 
-    # Remove duplicatas
-    df = df_os_raw.drop_duplicates(subset=["NUMERO DA OS"])
-
-    # Remove NaNs e NaTs
-    df = df[df["DATA DO FECHAMENTO DA OS"].notna()].copy()
-
-    # Cálculo
-    df_dias_para_correcao, df_num_os_por_problema, df_estatistica = tipo_servico_service.get_indicadores_gerais(df)
+    # Cálculo (OSs distintas e fechadas)
+    df_estatistica = tipo_servico_service.get_indicadores_gerais_agregados(df_resumo)
 
     # Valores
     total_de_problemas = int(df_estatistica["TOTAL_DE_PROBLEMAS"].values[0])
     total_de_os = int(df_estatistica["TOTAL_DE_OS"].values[0])
     rel_os_problemas = round(float(df_estatistica["RELACAO_OS_PROBLEMA"].values[0]), 2)
 
-    num_problema_sem_retrabalho = int(len(df_num_os_por_problema[df_num_os_por_problema["TOTAL_DE_OS"] == 1]))
+    num_problema_sem_retrabalho = int(df_estatistica["NUM_PROBLEMAS_COM_UMA_OS"].values[0])
     perc_problema_com_retrabalho = round(100 * (1 - (num_problema_sem_retrabalho / total_de_problemas)), 2)
 
     num_retrabalho = int(df_estatistica["TOTAL_DE_RETRABALHOS"].values[0])
     perc_retrabalho = round(float(df_estatistica["PERC_RETRABALHO"].values[0]), 2)
-    dias_ate_corrigir = round(float(df_dias_para_correcao["dias_correcao"].mean()), 2)
-    num_os_ate_corrigir = round(float(df_num_os_por_problema["TOTAL_DE_OS"].mean()), 2)
+    dias_ate_corrigir = round(float(df_estatistica["MEDIA_DE_DIAS_PARA_CORRECAO"].values[0]), 2)
+    num_os_ate_corrigir = round(float(df_estatistica["MEDIA_DE_OS_PARA_CORRECAO"].values[0]), 2)
 
     return [
         f"{total_de_problemas} problemas",
@@ -462,18 +404,12 @@ def atualiza_indicadores_os_custos(store_payload):
     if store_payload["vazio"]:
         return ["", "", ""]
 
-    # Faz o merge
-    df_os_custo_agg = pd.DataFrame(store_payload["df_os_custo_agg"])
-
-    # Remove duplicatas
-    df_os_custo_agg_distinct = df_os_custo_agg.drop_duplicates(subset=["NUMERO DA OS"])
-
-    # OS que tem retrabalho
-    df_os_custo_agg_distinct_retrabalho = df_os_custo_agg_distinct[df_os_custo_agg_distinct["retrabalho"] == True]
+    # Obtem os dados (custos das OSs distintas)
+    df_resumo = obtem_dados_store(store_payload, "df_resumo")
 
     # Indicadores
-    custo_total = round(float(df_os_custo_agg_distinct["VALOR"].sum()), 2)
-    custo_retrabalho = round(float(df_os_custo_agg_distinct_retrabalho["VALOR"].sum()), 2)
+    custo_total = round(float(df_resumo["CUSTO_TOTAL"].values[0]), 2)
+    custo_retrabalho = round(float(df_resumo["CUSTO_RETRABALHO"].values[0]), 2)
     perc_custo_retrabalho = round(100 * (custo_retrabalho / custo_total), 2)
 
     custo_total_str = "R$ " + formata_moeda(custo_total)
@@ -496,11 +432,8 @@ def atualiza_indicadores_os_mecanico(store_payload):
     if store_payload["vazio"]:
         return ["", "", "", ""]
 
-    # Obtem os dados
-    df_os_raw = pd.DataFrame(store_payload["df_os"])
-
     # Obtem indicadores
-    df_colaborador = tipo_servico_service.get_indicadores_colaboradores(df_os_raw)
+    df_colaborador = obtem_dados_store(store_payload, "df_colaborador")
 
     # Média de OS por mecânico
     media_os_por_mecanico = round(float(df_colaborador["TOTAL_DE_OS"].mean()), 2)
@@ -509,7 +442,7 @@ def atualiza_indicadores_os_mecanico(store_payload):
     media_retrabalhos_por_mecanico = round(float(df_colaborador["PERC_RETRABALHO"].mean()), 2)
 
     # Correções de Primeira
-    media_correcoes_primeira = round(float(df_colaborador["PERC_CORRECOES_DE_PRIMEIRA"].mean()), 2)
+    media_correcoes_primeira = round(float(df_colaborador["PERC_CORRECAO_PRIMEIRA"].mean()), 2)
 
     # Correções Tardias
     media_correcoes_tardias = round(float(df_colaborador["PERC_CORRECOES_TARDIA"].mean()), 2)
@@ -535,7 +468,7 @@ def update_tabela_mecanicos_retrabalho(store_payload):
     if store_payload["vazio"]:
         return []
 
-    df_colaborador = pd.DataFrame(store_payload["df_colaborador"])
+    df_colaborador = obtem_dados_store(store_payload, "df_colaborador")
 
     # # Prepara o dataframe para a tabela
     # df_colaborador["REL_OS_PROB"] = round(
@@ -557,713 +490,719 @@ def update_tabela_mecanicos_retrabalho(store_payload):
 ##############################################################################
 # Layout #####################################################################
 ##############################################################################
-layout = dbc.Container(
-    [
-        # Loading
-        dmc.LoadingOverlay(
-            visible=True,
-            id="loading-overlay-guia-os",
-            loaderProps={"size": "xl"},
-            overlayProps={
-                "radius": "lg",
-                "blur": 2,
-                "style": {
-                    "top": 0,  # Start from the top of the viewport
-                    "left": 0,  # Start from the left of the viewport
-                    "width": "100vw",  # Cover the entire width of the viewport
-                    "height": "100vh",  # Cover the entire height of the viewport
+def layout(**kwargs):
+    # Listas dos filtros (obtidas do catálogo a cada carregamento da página, para refletir os dados atuais)
+    lista_todos_modelos_veiculos = catalogo_entidades.lista_registros("modelos", {"MODELO": "TODOS"})
+    lista_todas_oficinas = catalogo_entidades.lista_registros("oficinas", {"LABEL": "TODAS"})
+    lista_todas_os = catalogo_entidades.lista_registros("lista_os")
+
+    return dbc.Container(
+        [
+            # Loading
+            dmc.LoadingOverlay(
+                visible=True,
+                id="loading-overlay-guia-os",
+                loaderProps={"size": "xl"},
+                overlayProps={
+                    "radius": "lg",
+                    "blur": 2,
+                    "style": {
+                        "top": 0,  # Start from the top of the viewport
+                        "left": 0,  # Start from the left of the viewport
+                        "width": "100vw",  # Cover the entire width of the viewport
+                        "height": "100vh",  # Cover the entire height of the viewport
+                    },
                 },
-            },
-            zIndex=10,
-        ),
-        # Alerta
-        dbc.Alert(
-            [
-                dbc.Row(
-                    [
-                        dbc.Col(DashIconify(icon="ooui:alert", width=45), width="auto"),
-                        dbc.Col(
-                            html.P(
-                                """
+                zIndex=10,
+            ),
+            # Alerta
+            dbc.Alert(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(DashIconify(icon="ooui:alert", width=45), width="auto"),
+                            dbc.Col(
+                                html.P(
+                                    """
                                 As Ordens de Serviço serão analisadas em conjunto, ou seja, mesmo que seja OS de categoria diferente, 
                                 as OSs serão consideradas como um único grupo para o cálculo de retrabalho.
                                 """
-                            ),
-                            className="mt-2",
-                            width=True,
-                        ),
-                    ],
-                    align="center",
-                ),
-            ],
-            dismissable=True,
-            color="warning",
-        ),
-        # Cabeçalho
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        # Cabeçalho e Inputs
-                        dbc.Row(
-                            [
-                                html.Hr(),
-                                dbc.Row(
-                                    [
-                                        dbc.Col(DashIconify(icon="ic:baseline-category", width=45), width="auto"),
-                                        dbc.Col(
-                                            html.H1(
-                                                [
-                                                    "Retrabalho por\u00a0",
-                                                    html.Strong("tipo de serviço (OS)"),
-                                                ],
-                                                className="align-self-center",
-                                            ),
-                                            width=True,
-                                        ),
-                                    ],
-                                    align="center",
-                                ),
-                                dmc.Space(h=15),
-                                html.Hr(),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Data (intervalo) de análise"),
-                                                    dmc.DatePicker(
-                                                        id="input-intervalo-datas-os",
-                                                        allowSingleDateInRange=True,
-                                                        type="range",
-                                                        minDate=date(2024, 8, 1),
-                                                        maxDate=date.today(),
-                                                        value=[date(2024, 8, 1), date.today()],
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            )
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=6,
                                 ),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Tempo (em dias) entre OS para retrabalho"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-dias-os-retrabalho",
-                                                        options=[
-                                                            {"label": "10 dias", "value": 10},
-                                                            {"label": "15 dias", "value": 15},
-                                                            {"label": "30 dias", "value": 30},
-                                                        ],
-                                                        placeholder="Período em dias",
-                                                        value=10,
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=6,
-                                ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Modelos de Veículos"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-modelo-veiculos-visao-tipo-servico",
-                                                        options=[
-                                                            {
-                                                                "label": os["MODELO"],
-                                                                "value": os["MODELO"],
-                                                            }
-                                                            for os in lista_todos_modelos_veiculos
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODOS"],
-                                                        placeholder="Selecione uma ou mais ordens de serviço...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=12,
-                                ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Oficinas"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-oficina-visao-tipo-servico",
-                                                        options=[
-                                                            {"label": os["LABEL"], "value": os["LABEL"]}
-                                                            for os in lista_todas_oficinas
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODAS"],
-                                                        placeholder="Selecione uma ou mais oficinas...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=12,
-                                ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
-                                        [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Ordens de Serviço"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-ordens-servico-visao-tipo-servico",
-                                                        options=[
-                                                            {"label": os["LABEL"], "value": os["LABEL"]}
-                                                            for os in lista_todas_os
-                                                        ],
-                                                        multi=True,
-                                                        value=[],
-                                                        placeholder="Selecione uma ou mais ordens de serviço...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            ),
-                                        ],
-                                        body=True,
-                                    ),
-                                    md=12,
-                                ),
-                                dmc.Space(h=10),
-                            ]
-                        ),
-                    ],
-                    md=8,
-                ),
-                dbc.Col(
-                    # Resumo
-                    dbc.Row(
+                                className="mt-2",
+                                width=True,
+                            ),
+                        ],
+                        align="center",
+                    ),
+                ],
+                dismissable=True,
+                color="warning",
+            ),
+            # Cabeçalho
+            dbc.Row(
+                [
+                    dbc.Col(
                         [
+                            # Cabeçalho e Inputs
                             dbc.Row(
                                 [
-                                    # Cabeçalho
                                     html.Hr(),
-                                    dbc.Col(
-                                        DashIconify(icon="wpf:statistics", width=45),
-                                        width="auto",
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="ic:baseline-category", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.H1(
+                                                    [
+                                                        "Retrabalho por\u00a0",
+                                                        html.Strong("tipo de serviço (OS)"),
+                                                    ],
+                                                    className="align-self-center",
+                                                ),
+                                                width=True,
+                                            ),
+                                        ],
+                                        align="center",
                                     ),
-                                    dbc.Col(html.H1("Resumo", className="align-self-center"), width=True),
                                     dmc.Space(h=15),
                                     html.Hr(),
-                                ],
-                                align="center",
-                            ),
-                            dcc.Graph(id="graph-pizza-sintese-retrabalho-os"),
-                        ]
-                    ),
-                    md=4,
-                ),
-            ]
-        ),
-        # Estado
-        dcc.Store(id="store-dados-tipo-servico"),
-        # Indicadores
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="icon-park-outline:ranking-list", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Indicadores",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs("labels-indicadores-pag-os"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=20),
-        dbc.Row(
-            [
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
+                                    dbc.Col(
+                                        dbc.Card(
                                             [
-                                                dmc.Title(
-                                                    id="indicador-total-problemas",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="mdi:bomb",
-                                                    width=48,
-                                                    color="black",
-                                                ),
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Data (intervalo) de análise"),
+                                                        dmc.DatePicker(
+                                                            id="input-intervalo-datas-os",
+                                                            allowSingleDateInRange=True,
+                                                            type="range",
+                                                            minDate=date(2024, 8, 1),
+                                                            maxDate=date.today(),
+                                                            value=[date(2024, 8, 1), date.today()],
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                )
                                             ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                                            body=True,
                                         ),
+                                        md=6,
                                     ),
-                                    dbc.CardFooter("Total de problemas"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
+                                    dbc.Col(
+                                        dbc.Card(
                                             [
-                                                dmc.Title(
-                                                    id="indicador-total-os",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="material-symbols:order-play-outline",
-                                                    width=48,
-                                                    color="black",
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Tempo (em dias) entre OS para retrabalho"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-dias-os-retrabalho",
+                                                            options=[
+                                                                {"label": "10 dias", "value": 10},
+                                                                {"label": "15 dias", "value": 15},
+                                                                {"label": "30 dias", "value": 30},
+                                                            ],
+                                                            placeholder="Período em dias",
+                                                            value=10,
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
                                                 ),
                                             ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                                            body=True,
                                         ),
+                                        md=6,
                                     ),
-                                    dbc.CardFooter("Total de OS"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
                                             [
-                                                dmc.Title(
-                                                    id="indicador-relacao-problema-os",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="icon-park-solid:division",
-                                                    width=48,
-                                                    color="black",
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Modelos de Veículos"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-modelo-veiculos-visao-tipo-servico",
+                                                            options=[
+                                                                {
+                                                                    "label": os["MODELO"],
+                                                                    "value": os["MODELO"],
+                                                                }
+                                                                for os in lista_todos_modelos_veiculos
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODOS"],
+                                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
                                                 ),
                                             ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                                            body=True,
                                         ),
+                                        md=12,
                                     ),
-                                    dbc.CardFooter("Média de OS / problema"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
-                        ),
-                    ]
-                ),
-                dbc.Row(dmc.Space(h=20)),
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
                                             [
-                                                dmc.Title(
-                                                    id="indicador-porcentagem-prob-com-retrabalho",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="game-icons:time-bomb",
-                                                    width=48,
-                                                    color="black",
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Oficinas"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-oficina-visao-tipo-servico",
+                                                            options=[
+                                                                {"label": os["LABEL"], "value": os["LABEL"]}
+                                                                for os in lista_todas_oficinas
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODAS"],
+                                                            placeholder="Selecione uma ou mais oficinas...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
                                                 ),
                                             ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                                            body=True,
                                         ),
+                                        md=12,
                                     ),
-                                    dbc.CardFooter("% de problemas com retrabalho (> 1 OS)"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
                                             [
-                                                dmc.Title(
-                                                    id="indicador-porcentagem-retrabalho",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="tabler:reorder",
-                                                    width=48,
-                                                    color="black",
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Ordens de Serviço"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-ordens-servico-visao-tipo-servico",
+                                                            options=[
+                                                                {"label": os["LABEL"], "value": os["LABEL"]}
+                                                                for os in lista_todas_os
+                                                            ],
+                                                            multi=True,
+                                                            value=[],
+                                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
                                                 ),
                                             ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                                            body=True,
                                         ),
+                                        md=12,
                                     ),
-                                    dbc.CardFooter("% das OS são retrabalho"),
-                                ],
-                                class_name="card-box",
+                                    dmc.Space(h=10),
+                                ]
                             ),
-                            md=4,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
-                                            [
-                                                dmc.Title(
-                                                    id="indicador-num-medio-dias-correcao",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="lucide:calendar-days",
-                                                    width=48,
-                                                    color="black",
-                                                ),
-                                            ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                        ],
+                        md=8,
+                    ),
+                    dbc.Col(
+                        # Resumo
+                        dbc.Row(
+                            [
+                                dbc.Row(
+                                    [
+                                        # Cabeçalho
+                                        html.Hr(),
+                                        dbc.Col(
+                                            DashIconify(icon="wpf:statistics", width=45),
+                                            width="auto",
                                         ),
-                                    ),
-                                    dbc.CardFooter("Média de dias até correção"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
+                                        dbc.Col(html.H1("Resumo", className="align-self-center"), width=True),
+                                        dmc.Space(h=15),
+                                        html.Hr(),
+                                    ],
+                                    align="center",
+                                ),
+                                dcc.Graph(id="graph-pizza-sintese-retrabalho-os"),
+                            ]
                         ),
-                    ]
-                ),
-                dbc.Row(dmc.Space(h=20)),
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
-                                            [
-                                                dmc.Title(
-                                                    id="indicador-custo-total-os",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="hugeicons:search-dollar",
-                                                    width=48,
-                                                    color="black",
-                                                ),
-                                            ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
-                                        ),
-                                    ),
-                                    dbc.CardFooter("Total gasto com peças"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
+                        md=4,
+                    ),
+                ]
+            ),
+            # Estado
+            dcc.Store(id="store-dados-tipo-servico"),
+            # Indicadores
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="icon-park-outline:ranking-list", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Indicadores",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs("labels-indicadores-pag-os"),
+                            ]
                         ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
-                                            [
-                                                dmc.Title(
-                                                    id="indicador-custo-retrabalho-os",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="emojione-monotone:money-with-wings",
-                                                    width=48,
-                                                    color="black",
-                                                ),
-                                            ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dmc.Space(h=20),
+            dbc.Row(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                dbc.Card(
+                                    [
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-total-problemas",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="mdi:bomb",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
-                                    ),
-                                    dbc.CardFooter("Total gasto com retrabalho"),
-                                ],
-                                class_name="card-box",
+                                        dbc.CardFooter("Total de problemas"),
+                                    ],
+                                    class_name="card-box",
+                                ),
+                                md=4,
                             ),
-                            md=4,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        dmc.Group(
-                                            [
-                                                dmc.Title(
-                                                    id="indicador-custo-percentagem-os",
-                                                    order=2,
-                                                ),
-                                                DashIconify(
-                                                    icon="icon-park-solid:division",
-                                                    width=48,
-                                                    color="black",
-                                                ),
-                                            ],
-                                            justify="space-around",
-                                            mt="md",
-                                            mb="xs",
+                            dbc.Col(
+                                dbc.Card(
+                                    [
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-total-os",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="material-symbols:order-play-outline",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
-                                    ),
-                                    dbc.CardFooter("% do custo em retrabalho"),
-                                ],
-                                class_name="card-box",
-                            ),
-                            md=4,
-                        ),
-                    ]
-                ),
-            ]
-        ),
-        dmc.Space(h=10),
-        html.Hr(),
-        # Gráficos
-        # Gráfico cumulativo
-        dmc.Space(h=30),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:chart-bell-curve-cumulative", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Gráfico cumulativo de dias para solução do problema",
-                                className="align-self-center",
+                                        dbc.CardFooter("Total de OS"),
+                                    ],
+                                    class_name="card-box",
+                                ),
+                                md=4,
                             ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs("labels-grafico-cumulativo-pag-os"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-retrabalho-cumulativo-os"),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:fleet", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Retrabalho por modelo (%)",
-                                className="align-self-center",
+                            dbc.Col(
+                                dbc.Card(
+                                    [
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-relacao-problema-os",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="icon-park-solid:division",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
+                                        ),
+                                        dbc.CardFooter("Média de OS / problema"),
+                                    ],
+                                    class_name="card-box",
+                                ),
+                                md=4,
                             ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs("labels-retrabalho-modelo-pag-os"),
                         ]
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-retrabalho-por-modelo-perc-os"),
-        dmc.Space(h=20),
-        # Top Colaboradores Retrabalho
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:mechanic", width=45), width="auto"),
-                dbc.Col(
+                    dbc.Row(dmc.Space(h=20)),
                     dbc.Row(
                         [
-                            html.H4(
-                                "Ranking de colaboradores por retrabalho",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs("labels-retrabalho-colaboradores-pag-os"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        html.Hr(),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
+                            dbc.Col(
+                                dbc.Card(
                                     [
-                                        dmc.Title(id="indicador-media-os-colaborador", order=2),
-                                        DashIconify(
-                                            icon="bxs:car-mechanic",
-                                            width=48,
-                                            color="black",
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-porcentagem-prob-com-retrabalho",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="game-icons:time-bomb",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
+                                        dbc.CardFooter("% de problemas com retrabalho (> 1 OS)"),
                                     ],
-                                    justify="space-around",
-                                    mt="md",
-                                    mb="xs",
+                                    class_name="card-box",
                                 ),
+                                md=4,
                             ),
-                            dbc.CardFooter("Média de OS / Colaborador"),
-                        ],
-                    ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
+                            dbc.Col(
+                                dbc.Card(
                                     [
-                                        dmc.Title(
-                                            id="indicador-media-porcentagem-retrabalho",
-                                            order=2,
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-porcentagem-retrabalho",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="tabler:reorder",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
-                                        DashIconify(
-                                            icon="pepicons-pop:rewind-time",
-                                            width=48,
-                                            color="black",
+                                        dbc.CardFooter("% das OS são retrabalho"),
+                                    ],
+                                    class_name="card-box",
+                                ),
+                                md=4,
+                            ),
+                            dbc.Col(
+                                dbc.Card(
+                                    [
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-num-medio-dias-correcao",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="lucide:calendar-days",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
+                                        dbc.CardFooter("Média de dias até correção"),
                                     ],
-                                    justify="space-around",
-                                    mt="md",
-                                    mb="xs",
+                                    class_name="card-box",
                                 ),
+                                md=4,
                             ),
-                            dbc.CardFooter("Média da % de retrabalho dos colaboradores"),
-                        ],
+                        ]
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dbc.Row(dmc.Space(h=20)),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
+                    dbc.Row(dmc.Space(h=20)),
+                    dbc.Row(
                         [
-                            dbc.CardBody(
-                                dmc.Group(
+                            dbc.Col(
+                                dbc.Card(
                                     [
-                                        dmc.Title(
-                                            id="indicador-media-correcoes-primeira-colaborador",
-                                            order=2,
-                                        ),
-                                        DashIconify(
-                                            icon="gravity-ui:target-dart",
-                                            width=48,
-                                            color="black",
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-custo-total-os",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="hugeicons:search-dollar",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
+                                        dbc.CardFooter("Total gasto com peças"),
                                     ],
-                                    justify="space-around",
-                                    mt="md",
-                                    mb="xs",
+                                    class_name="card-box",
                                 ),
+                                md=4,
                             ),
-                            dbc.CardFooter("Média da % de correções de primeira dos colaboradores"),
-                        ],
-                    ),
-                    md=6,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
+                            dbc.Col(
+                                dbc.Card(
                                     [
-                                        dmc.Title(
-                                            id="indicador-media-correcoes-tardias-colaborador",
-                                            order=2,
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-custo-retrabalho-os",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="emojione-monotone:money-with-wings",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
-                                        DashIconify(
-                                            icon="game-icons:multiple-targets",
-                                            width=48,
-                                            color="black",
+                                        dbc.CardFooter("Total gasto com retrabalho"),
+                                    ],
+                                    class_name="card-box",
+                                ),
+                                md=4,
+                            ),
+                            dbc.Col(
+                                dbc.Card(
+                                    [
+                                        dbc.CardBody(
+                                            dmc.Group(
+                                                [
+                                                    dmc.Title(
+                                                        id="indicador-custo-percentagem-os",
+                                                        order=2,
+                                                    ),
+                                                    DashIconify(
+                                                        icon="icon-park-solid:division",
+                                                        width=48,
+                                                        color="black",
+                                                    ),
+                                                ],
+                                                justify="space-around",
+                                                mt="md",
+                                                mb="xs",
+                                            ),
                                         ),
+                                        dbc.CardFooter("% do custo em retrabalho"),
                                     ],
-                                    justify="space-around",
-                                    mt="md",
-                                    mb="xs",
+                                    class_name="card-box",
                                 ),
+                                md=4,
                             ),
-                            dbc.CardFooter("Média da % de correções tardias dos colaboradores"),
-                        ],
+                        ]
                     ),
-                    md=6,
-                ),
-            ]
-        ),
-        dbc.Row(dmc.Space(h=20)),
-        dbc.Row(
-            [
-                dag.AgGrid(
-                    id="tabela-top-mecanicos",
-                    columnDefs=tipo_servico_tabelas.tbl_top_mecanicos,
-                    rowData=[],
-                    defaultColDef={"filter": True, "floatingFilter": True},
-                    columnSize="autoSize",
-                    dashGridOptions={
-                        "localeText": locale_utils.AG_GRID_LOCALE_BR,
-                    },
-                    # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
-                    style={"height": 400, "resize": "vertical", "overflow": "hidden"},
-                ),
-            ]
-        ),
-    ]
-)
+                ]
+            ),
+            dmc.Space(h=10),
+            html.Hr(),
+            # Gráficos
+            # Gráfico cumulativo
+            dmc.Space(h=30),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:chart-bell-curve-cumulative", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Gráfico cumulativo de dias para solução do problema",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs("labels-grafico-cumulativo-pag-os"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-retrabalho-cumulativo-os"),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:fleet", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Retrabalho por modelo (%)",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs("labels-retrabalho-modelo-pag-os"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-retrabalho-por-modelo-perc-os"),
+            dmc.Space(h=20),
+            # Top Colaboradores Retrabalho
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:mechanic", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Ranking de colaboradores por retrabalho",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                gera_labels_inputs("labels-retrabalho-colaboradores-pag-os"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            html.Hr(),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
+                                        [
+                                            dmc.Title(id="indicador-media-os-colaborador", order=2),
+                                            DashIconify(
+                                                icon="bxs:car-mechanic",
+                                                width=48,
+                                                color="black",
+                                            ),
+                                        ],
+                                        justify="space-around",
+                                        mt="md",
+                                        mb="xs",
+                                    ),
+                                ),
+                                dbc.CardFooter("Média de OS / Colaborador"),
+                            ],
+                        ),
+                        md=6,
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
+                                        [
+                                            dmc.Title(
+                                                id="indicador-media-porcentagem-retrabalho",
+                                                order=2,
+                                            ),
+                                            DashIconify(
+                                                icon="pepicons-pop:rewind-time",
+                                                width=48,
+                                                color="black",
+                                            ),
+                                        ],
+                                        justify="space-around",
+                                        mt="md",
+                                        mb="xs",
+                                    ),
+                                ),
+                                dbc.CardFooter("Média da % de retrabalho dos colaboradores"),
+                            ],
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dbc.Row(dmc.Space(h=20)),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
+                                        [
+                                            dmc.Title(
+                                                id="indicador-media-correcoes-primeira-colaborador",
+                                                order=2,
+                                            ),
+                                            DashIconify(
+                                                icon="gravity-ui:target-dart",
+                                                width=48,
+                                                color="black",
+                                            ),
+                                        ],
+                                        justify="space-around",
+                                        mt="md",
+                                        mb="xs",
+                                    ),
+                                ),
+                                dbc.CardFooter("Média da % de correções de primeira dos colaboradores"),
+                            ],
+                        ),
+                        md=6,
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
+                                        [
+                                            dmc.Title(
+                                                id="indicador-media-correcoes-tardias-colaborador",
+                                                order=2,
+                                            ),
+                                            DashIconify(
+                                                icon="game-icons:multiple-targets",
+                                                width=48,
+                                                color="black",
+                                            ),
+                                        ],
+                                        justify="space-around",
+                                        mt="md",
+                                        mb="xs",
+                                    ),
+                                ),
+                                dbc.CardFooter("Média da % de correções tardias dos colaboradores"),
+                            ],
+                        ),
+                        md=6,
+                    ),
+                ]
+            ),
+            dbc.Row(dmc.Space(h=20)),
+            dbc.Row(
+                [
+                    dag.AgGrid(
+                        id="tabela-top-mecanicos",
+                        columnDefs=tipo_servico_tabelas.tbl_top_mecanicos,
+                        rowData=[],
+                        defaultColDef={"filter": True, "floatingFilter": True},
+                        columnSize="autoSize",
+                        dashGridOptions={
+                            "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                        },
+                        # Permite resize --> https://community.plotly.com/t/anyone-have-better-ag-grid-resizing-scheme/78398/5
+                        style={"height": 400, "resize": "vertical", "overflow": "hidden"},
+                    ),
+                ]
+            ),
+        ]
+    )
 
 ##############################################################################
 # Registro da página #########################################################
@@ -37,7 +37,8 @@ import modules.veiculos.graficos as veiculos_graficos
 import modules.veiculos.tabelas as veiculos_tabelas
 
 # Improts gerais
-from modules.entities_utils import get_modelos, get_lista_os, get_veiculos, get_oficinas, get_secoes, gerar_excel
+from modules.entities_utils import gerar_excel
+from modules.catalogo_entidades_utils import get_catalogo_entidades
 from modules.veiculos.tabelas import *
 from modules.sql_utils import *
 from modules.veiculos.inputs import input_valido4
@@ -56,30 +57,8 @@ pgEngine = pgDB.get_engine()
 # Cria o serviço
 veiculos_service = VeiculoService(pgEngine)
 
-# Obtém a lista de veículos
-df_veiculos = get_veiculos(pgEngine)
-df_veiculos.sort_values("VEICULO", inplace=True)
-
-# Obtém a lista de oficinas
-df_oficinas = get_oficinas(pgEngine)
-lista_todas_oficinas = df_oficinas.to_dict(orient="records")
-lista_todas_oficinas.insert(0, {"LABEL": "TODAS"})
-
-# Obtem a lista de OS
-df_lista_os = get_lista_os(pgEngine)
-lista_todas_os = df_lista_os.to_dict(orient="records")
-lista_todas_os.insert(0, {"LABEL": "TODAS"})
-
-# Modelos
-df_lista_modelos = get_modelos(pgEngine)
-df_lista_modelos.sort_values("MODELO", inplace=True)
-lista_todos_modelos = df_lista_modelos.to_dict(orient="records")
-lista_todos_modelos.insert(0, {"LABEL": "TODOS", "MODELO": "TODOS"})
-
-# Obtem a lista de Seções
-df_secoes = get_secoes(pgEngine)
-lista_todas_secoes = df_secoes.to_dict(orient="records")
-lista_todas_secoes.insert(0, {"LABEL": "TODAS"})
+# Catálogo das entidades dos filtros (lidas no primeiro uso e atualizadas periodicamente)
+catalogo_entidades = get_catalogo_entidades(pgEngine)
 
 
 ##############################################################################
@@ -251,6 +230,7 @@ def corrige_input_secao(lista_secaos):
 def corrige_input_veiculos_ao_mudar_modelo(modelo_escolhido, vec_escolhido):
     if modelo_escolhido is None or modelo_escolhido == "" or modelo_escolhido == [] or len(modelo_escolhido) == 0:
         # Retorna a opção padrão (TODOS OS VEICULOS)
+        df_veiculos = catalogo_entidades.obtem("veiculos", ordena_por="VEICULO")
         lista_padrao_veiculos = [
             {
                 "label": veiculo["VEICULO"],
@@ -416,228 +396,36 @@ def formata_float_para_real(valor):
     return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
 
 
-##############################################################################
-# Callbacks para os indicadores ##############################################
-##############################################################################
-
-
-@callback(
-    Output("indicador-rank-retrabalho-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_rank_retrabalho_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_rank_retrabalho_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
-
-    if df.empty:
-        return ""
-
-    return df["rank_veiculo"].values[0]
-
-
-@callback(
-    Output("indicador-rank-correcao-de-primeira-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_rank_correcao_primeira_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_rank_correcao_primeira_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
-
-    if df.empty:
-        return ""
-
-    return df["rank_veiculo"].values[0]
-
-
-@callback(
-    Output("indicador-total-os-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_total_os_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_total_os_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
-
-    if df.empty:
-        return ""
-
-    return df["quantidade_de_os"].values[0]
-
-
-@callback(
-    Output("indicador-rank-os-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_rank_total_os_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_rank_total_os_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
-
-    if df.empty:
-        return ""
-
-    return df["rank_veiculo"].values[0]
-
-
-@callback(
-    Output("indicador-gasto-total-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_total_gasto_pecas_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_total_gasto_pecas_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
-
-    if df.empty:
-        return ""
-
-    total_gasto = df["TOTAL_GASTO"].values[0]
-    total_gasto_fmt = formata_float_para_real(total_gasto)
-
-    return total_gasto_fmt
-
+def texto_ou_vazio(valor):
+    return "" if pd.isna(valor) else valor
 
-@callback(
-    Output("indicador-rank-gasto-total-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_rank_gasto_total_pecas_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_rank_gasto_total_pecas_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
-
-    if df.empty:
-        return ""
-
-    return df["rank_veiculo"].values[0]
-
-
-@callback(
-    Output("indicador-gasto-retrabalho-total-veiculo", "children"),
-    Input("store-input-dados-retrabalho-veiculo", "data"),
-)
-def cb_total_gasto_retrabalho_pecas_veiculo_modelo(data):
-    # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
-    if not data or not data["valido"]:
-        return ""
-
-    # Obtem os dados do estado
-    id_veiculo = data["id_veiculo"]
-    datas = data["datas"]
-    min_dias = data["min_dias"]
-    modelo_escolhido = data["modelo_escolhido"]
-    lista_oficinas = data["lista_oficinas"]
-    lista_secaos = data["lista_secaos"]
-    lista_os = data["lista_os"]
-
-    # Obtém os dados
-    df = veiculos_service.get_indicador_total_gasto_retrabalho_pecas_modelo_veiculo(
-        id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
-    )
 
-    if df.empty:
-        return ""
+def real_ou_vazio(valor):
+    return "" if pd.isna(valor) else formata_float_para_real(valor)
 
-    total_gasto = df["TOTAL_GASTO"].values[0]
-    total_gasto_fmt = formata_float_para_real(total_gasto)
 
-    return total_gasto_fmt
+##############################################################################
+# Callbacks para os indicadores ##############################################
+##############################################################################
 
 
 @callback(
-    Output("indicador-rank-gasto-retrabalho-veiculo", "children"),
+    [
+        Output("indicador-rank-retrabalho-veiculo", "children"),
+        Output("indicador-rank-correcao-de-primeira-veiculo", "children"),
+        Output("indicador-total-os-veiculo", "children"),
+        Output("indicador-rank-os-veiculo", "children"),
+        Output("indicador-gasto-total-veiculo", "children"),
+        Output("indicador-rank-gasto-total-veiculo", "children"),
+        Output("indicador-gasto-retrabalho-total-veiculo", "children"),
+        Output("indicador-rank-gasto-retrabalho-veiculo", "children"),
+    ],
     Input("store-input-dados-retrabalho-veiculo", "data"),
 )
-def cb_rank_gasto_retrabalho_pecas_veiculo_modelo(data):
+def cb_indicadores_veiculo_modelo(data):
     # Valida se os dados do estado estão OK, caso contrário retorna os dados padrão
     if not data or not data["valido"]:
-        return ""
+        return [""] * 8
 
     # Obtem os dados do estado
     id_veiculo = data["id_veiculo"]
@@ -648,15 +436,27 @@ def cb_rank_gasto_retrabalho_pecas_veiculo_modelo(data):
     lista_secaos = data["lista_secaos"]
     lista_os = data["lista_os"]
 
-    # Obtém os dados
-    df = veiculos_service.get_indicador_rank_gasto_retrabalho_pecas_modelo_veiculo(
+    # Obtém todos os indicadores em uma única query
+    df = veiculos_service.get_indicadores_modelo_veiculo(
         id_veiculo, datas, min_dias, [modelo_escolhido], lista_oficinas, lista_secaos, lista_os
     )
 
     if df.empty:
-        return ""
-
-    return df["rank_veiculo"].values[0]
+        return [""] * 8
+
+    # Valores ausentes (ex: veículo sem retrabalho não entra no ranking, veículo sem peças) ficam em branco
+    indicadores = df.iloc[0]
+
+    return [
+        texto_ou_vazio(indicadores["rank_retrabalho"]),
+        texto_ou_vazio(indicadores["rank_correcao_primeira"]),
+        int(indicadores["quantidade_de_os"]),
+        texto_ou_vazio(indicadores["rank_total_os"]),
+        real_ou_vazio(indicadores["total_gasto_pecas"]),
+        texto_ou_vazio(indicadores["rank_gasto_pecas"]),
+        real_ou_vazio(indicadores["total_gasto_retrabalho_pecas"]),
+        texto_ou_vazio(indicadores["rank_gasto_retrabalho_pecas"]),
+    ]
 
 
 ##############################################################################
@@ -1010,701 +810,709 @@ def cb_pag_veiculo_botao_detalhar_os_tabela_os(linha, linha_virtual, data):
 ##############################################################################
 # Layout #####################################################################
 ##############################################################################
-layout = dbc.Container(
-    [
-        # Estado
-        dcc.Store(id="store-input-dados-retrabalho-veiculo"),
-        # Loading
-        dmc.LoadingOverlay(
-            visible=True,
-            id="loading-overlay-guia-por-veiculo",
-            loaderProps={"size": "xl"},
-            overlayProps={
-                "radius": "lg",
-                "blur": 2,
-                "style": {
-                    "top": 0,  # Start from the top of the viewport
-                    "left": 0,  # Start from the left of the viewport
-                    "width": "100vw",  # Cover the entire width of the viewport
-                    "height": "100vh",  # Cover the entire height of the viewport
+def layout(**kwargs):
+    # Listas dos filtros (obtidas do catálogo a cada carregamento da página, para refletir os dados atuais)
+    lista_todas_oficinas = catalogo_entidades.lista_registros("oficinas", {"LABEL": "TODAS"})
+    lista_todas_secoes = catalogo_entidades.lista_registros("secoes", {"LABEL": "TODAS"})
+    lista_todas_os = catalogo_entidades.lista_registros("lista_os", {"LABEL": "TODAS"})
+    df_veiculos = catalogo_entidades.obtem("veiculos", ordena_por="VEICULO")
+    lista_todos_modelos = catalogo_entidades.lista_registros("modelos", {"LABEL": "TODOS", "MODELO": "TODOS"}, ordena_por="MODELO")
+
+    return dbc.Container(
+        [
+            # Estado
+            dcc.Store(id="store-input-dados-retrabalho-veiculo"),
+            # Loading
+            dmc.LoadingOverlay(
+                visible=True,
+                id="loading-overlay-guia-por-veiculo",
+                loaderProps={"size": "xl"},
+                overlayProps={
+                    "radius": "lg",
+                    "blur": 2,
+                    "style": {
+                        "top": 0,  # Start from the top of the viewport
+                        "left": 0,  # Start from the left of the viewport
+                        "width": "100vw",  # Cover the entire width of the viewport
+                        "height": "100vh",  # Cover the entire height of the viewport
+                    },
                 },
-            },
-            zIndex=10,
-        ),
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        # Cabeçalho e Inputs
+                zIndex=10,
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            # Cabeçalho e Inputs
+                            dbc.Row(
+                                [
+                                    html.Hr(),
+                                    dbc.Row(
+                                        [
+                                            dbc.Col(DashIconify(icon="mdi:bus", width=45), width="auto"),
+                                            dbc.Col(
+                                                html.H1(
+                                                    [
+                                                        "Retrabalho por\u00a0",
+                                                        html.Strong("veículo"),
+                                                    ],
+                                                    className="align-self-center",
+                                                ),
+                                                width=True,
+                                            ),
+                                        ],
+                                        align="center",
+                                    ),
+                                    dmc.Space(h=15),
+                                    html.Hr(),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Data (intervalo) de análise"),
+                                                        dmc.DatePicker(
+                                                            id="input-intervalo-datas-veiculo",
+                                                            allowSingleDateInRange=True,
+                                                            type="range",
+                                                            minDate=date(2024, 8, 1),
+                                                            maxDate=date.today(),
+                                                            value=[date(2024, 8, 1), date.today()],
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                )
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Tempo (em dias) entre OS para retrabalho"),
+                                                        dcc.Dropdown(
+                                                            id="input-min-dias-veiculo",
+                                                            options=[
+                                                                {"label": "10 dias", "value": 10},
+                                                                {"label": "15 dias", "value": 15},
+                                                                {"label": "30 dias", "value": 30},
+                                                            ],
+                                                            placeholder="Período em dias",
+                                                            value=10,
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                    ),
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Modelos"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-modelos-veiculo",
+                                                            options=[
+                                                                {"label": os["MODELO"], "value": os["MODELO"]}
+                                                                for os in lista_todos_modelos
+                                                            ],
+                                                            value="TODOS",
+                                                            placeholder="Selecione o modelo do veículo",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Veículos"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-veiculos-veiculo",
+                                                            multi=False,
+                                                            options=[
+                                                                {
+                                                                    "label": veiculo["VEICULO"],
+                                                                    "value": veiculo["VEICULO"],
+                                                                }
+                                                                for _, veiculo in df_veiculos.iterrows()
+                                                            ],
+                                                            value=df_veiculos.iloc[0]["VEICULO"],
+                                                            placeholder="Selecione o veículo",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                    ),
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Oficinas"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-oficina-veiculo",
+                                                            options=[
+                                                                {"label": oficina["LABEL"], "value": oficina["LABEL"]}
+                                                                for oficina in lista_todas_oficinas
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODAS"],
+                                                            placeholder="Selecione uma ou mais oficinas...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Seções (categorias) de manutenção"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-secao-veiculo",
+                                                            options=[
+                                                                {"label": sec["LABEL"], "value": sec["LABEL"]}
+                                                                for sec in lista_todas_secoes
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODAS"],
+                                                            placeholder="Selecione uma ou mais seções...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=6,
+                                    ),
+                                    dmc.Space(h=10),
+                                    dbc.Col(
+                                        dbc.Card(
+                                            [
+                                                html.Div(
+                                                    [
+                                                        dbc.Label("Ordens de Serviço"),
+                                                        dcc.Dropdown(
+                                                            id="input-select-ordens-servico-veiculos",
+                                                            options=[
+                                                                {"label": os["LABEL"], "value": os["LABEL"]}
+                                                                for os in lista_todas_os
+                                                            ],
+                                                            multi=True,
+                                                            value=["TODAS"],
+                                                            placeholder="Selecione uma ou mais ordens de serviço...",
+                                                        ),
+                                                    ],
+                                                    className="dash-bootstrap",
+                                                ),
+                                            ],
+                                            body=True,
+                                        ),
+                                        md=12,
+                                        className="mb-3 mb-md-0",
+                                    ),
+                                ]
+                            ),
+                        ],
+                        md=8,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        # Resumo
                         dbc.Row(
                             [
-                                html.Hr(),
                                 dbc.Row(
                                     [
-                                        dbc.Col(DashIconify(icon="mdi:bus", width=45), width="auto"),
+                                        # Cabeçalho
+                                        html.Hr(),
                                         dbc.Col(
-                                            html.H1(
-                                                [
-                                                    "Retrabalho por\u00a0",
-                                                    html.Strong("veículo"),
-                                                ],
-                                                className="align-self-center",
-                                            ),
-                                            width=True,
+                                            DashIconify(icon="wpf:statistics", width=45),
+                                            width="auto",
                                         ),
+                                        dbc.Col(html.H1("Resumo", className="align-self-center"), width=True),
+                                        dmc.Space(h=15),
+                                        html.Hr(),
                                     ],
                                     align="center",
                                 ),
-                                dmc.Space(h=15),
-                                html.Hr(),
-                                dbc.Col(
-                                    dbc.Card(
+                                dmc.Space(h=30),
+                                # Gráfico de pizza com a relação entre Retrabalho e Correção
+                                dcc.Graph(id="graph-pizza-sintese-veiculo"),
+                            ]
+                        ),
+                        md=4,
+                    ),
+                ]
+            ),
+            dmc.Space(h=30),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="icon-park-outline:ranking-list", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4("Indicadores", className="align-self-center"),
+                                dmc.Space(h=5),
+                                gera_labels_inputs_veiculos("labels-indicadores-pag-veiculo"),
+                            ]
+                        ),
+                        width=True,
+                    ),
+                ],
+                align="center",
+            ),
+            dmc.Space(h=20),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Data (intervalo) de análise"),
-                                                    dmc.DatePicker(
-                                                        id="input-intervalo-datas-veiculo",
-                                                        allowSingleDateInRange=True,
-                                                        type="range",
-                                                        minDate=date(2024, 8, 1),
-                                                        maxDate=date.today(),
-                                                        value=[date(2024, 8, 1), date.today()],
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
-                                            )
+                                            dmc.Title(id="indicador-rank-retrabalho-veiculo", order=2),
+                                            DashIconify(
+                                                icon="tabler:reorder",
+                                                width=48,
+                                                color="black",
+                                            ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=6,
-                                    className="mb-3 mb-md-0",
                                 ),
-                                dbc.Col(
-                                    dbc.Card(
+                                dbc.CardFooter(["Rank Retrabalho / Modelo", html.Br(), "(menor = melhor)"]),
+                            ],
+                            class_name="card-box-shadow",
+                        ),
+                        md=3,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Tempo (em dias) entre OS para retrabalho"),
-                                                    dcc.Dropdown(
-                                                        id="input-min-dias-veiculo",
-                                                        options=[
-                                                            {"label": "10 dias", "value": 10},
-                                                            {"label": "15 dias", "value": 15},
-                                                            {"label": "30 dias", "value": 30},
-                                                        ],
-                                                        placeholder="Período em dias",
-                                                        value=10,
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
+                                            dmc.Title(id="indicador-rank-correcao-de-primeira-veiculo", order=2),
+                                            DashIconify(
+                                                icon="gravity-ui:target-dart",
+                                                width=48,
+                                                color="black",
                                             ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=6,
                                 ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
+                                dbc.CardFooter(["Rank Correção Primeira / Modelo", html.Br(), "(maior = melhor)"]),
+                            ],
+                            class_name="card-box-shadow",
+                        ),
+                        md=3,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Modelos"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-modelos-veiculo",
-                                                        options=[
-                                                            {"label": os["MODELO"], "value": os["MODELO"]}
-                                                            for os in lista_todos_modelos
-                                                        ],
-                                                        value="TODOS",
-                                                        placeholder="Selecione o modelo do veículo",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
+                                            dmc.Title(id="indicador-total-os-veiculo", order=2),
+                                            DashIconify(
+                                                icon="pajamas:task-done",
+                                                width=48,
+                                                color="black",
                                             ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=6,
-                                    className="mb-3 mb-md-0",
                                 ),
-                                dbc.Col(
-                                    dbc.Card(
+                                dbc.CardFooter(["Total de OSs executadas", html.Br(), "(no período selecionado)"]),
+                            ],
+                            className="card-box",
+                        ),
+                        md=3,
+                        className="mb-3 mb-md-0",
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Veículos"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-veiculos-veiculo",
-                                                        multi=False,
-                                                        options=[
-                                                            {
-                                                                "label": veiculo["VEICULO"],
-                                                                "value": veiculo["VEICULO"],
-                                                            }
-                                                            for _, veiculo in df_veiculos.iterrows()
-                                                        ],
-                                                        value=df_veiculos.iloc[0]["VEICULO"],
-                                                        placeholder="Selecione o veículo",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
+                                            dmc.Title(id="indicador-rank-os-veiculo", order=2),
+                                            DashIconify(
+                                                icon="solar:ranking-linear",
+                                                width=48,
+                                                color="black",
                                             ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=6,
                                 ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
+                                dbc.CardFooter(["Rank de OSs / Modelo", html.Br(), "(menor = melhor)"]),
+                            ],
+                            className="card-box",
+                        ),
+                        md=3,
+                        className="mb-3 mb-md-0",
+                    ),
+                ],
+                justify="center",
+            ),
+            dmc.Space(h=20),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Oficinas"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-oficina-veiculo",
-                                                        options=[
-                                                            {"label": oficina["LABEL"], "value": oficina["LABEL"]}
-                                                            for oficina in lista_todas_oficinas
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODAS"],
-                                                        placeholder="Selecione uma ou mais oficinas...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
+                                            dmc.Title(id="indicador-gasto-total-veiculo", order=2),
+                                            DashIconify(
+                                                icon="hugeicons:search-dollar",
+                                                width=48,
+                                                color="black",
                                             ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=6,
-                                    className="mb-3 mb-md-0",
                                 ),
-                                dbc.Col(
-                                    dbc.Card(
+                                dbc.CardFooter(["Total gasto com peças", html.Br(), "(no período)"]),
+                            ],
+                            class_name="card-box-shadow",
+                        ),
+                        md=3,
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Seções (categorias) de manutenção"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-secao-veiculo",
-                                                        options=[
-                                                            {"label": sec["LABEL"], "value": sec["LABEL"]}
-                                                            for sec in lista_todas_secoes
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODAS"],
-                                                        placeholder="Selecione uma ou mais seções...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
+                                            dmc.Title(id="indicador-rank-gasto-total-veiculo", order=2),
+                                            DashIconify(
+                                                icon="ion:analytics-sharp",
+                                                width=48,
+                                                color="black",
                                             ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=6,
                                 ),
-                                dmc.Space(h=10),
-                                dbc.Col(
-                                    dbc.Card(
+                                dbc.CardFooter(["Rank Gasto Total Peças / Modelo", html.Br(), "(menor = melhor)"]),
+                            ],
+                            class_name="card-box-shadow",
+                        ),
+                        md=3,
+                    ),
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
                                         [
-                                            html.Div(
-                                                [
-                                                    dbc.Label("Ordens de Serviço"),
-                                                    dcc.Dropdown(
-                                                        id="input-select-ordens-servico-veiculos",
-                                                        options=[
-                                                            {"label": os["LABEL"], "value": os["LABEL"]}
-                                                            for os in lista_todas_os
-                                                        ],
-                                                        multi=True,
-                                                        value=["TODAS"],
-                                                        placeholder="Selecione uma ou mais ordens de serviço...",
-                                                    ),
-                                                ],
-                                                className="dash-bootstrap",
+                                            dmc.Title(id="indicador-gasto-retrabalho-total-veiculo", order=2),
+                                            DashIconify(
+                                                icon="emojione-monotone:money-with-wings",
+                                                width=48,
+                                                color="black",
                                             ),
                                         ],
-                                        body=True,
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
                                     ),
-                                    md=12,
-                                    className="mb-3 mb-md-0",
                                 ),
-                            ]
+                                dbc.CardFooter(["Total gasto com retrabalho", html.Br(), "(no período selecionado)"]),
+                            ],
+                            class_name="card-box-shadow",
                         ),
-                    ],
-                    md=8,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    # Resumo
-                    dbc.Row(
-                        [
-                            dbc.Row(
-                                [
-                                    # Cabeçalho
-                                    html.Hr(),
-                                    dbc.Col(
-                                        DashIconify(icon="wpf:statistics", width=45),
-                                        width="auto",
-                                    ),
-                                    dbc.Col(html.H1("Resumo", className="align-self-center"), width=True),
-                                    dmc.Space(h=15),
-                                    html.Hr(),
-                                ],
-                                align="center",
-                            ),
-                            dmc.Space(h=30),
-                            # Gráfico de pizza com a relação entre Retrabalho e Correção
-                            dcc.Graph(id="graph-pizza-sintese-veiculo"),
-                        ]
-                    ),
-                    md=4,
-                ),
-            ]
-        ),
-        dmc.Space(h=30),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="icon-park-outline:ranking-list", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4("Indicadores", className="align-self-center"),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_veiculos("labels-indicadores-pag-veiculo"),
-                        ]
+                        md=3,
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=20),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-rank-retrabalho-veiculo", order=2),
-                                        DashIconify(
-                                            icon="tabler:reorder",
-                                            width=48,
-                                            color="black",
-                                        ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                    dbc.Col(
+                        dbc.Card(
+                            [
+                                dbc.CardBody(
+                                    dmc.Group(
+                                        [
+                                            dmc.Title(id="indicador-rank-gasto-retrabalho-veiculo", order=2),
+                                            DashIconify(
+                                                icon="ion:analytics-sharp",
+                                                width=48,
+                                                color="black",
+                                            ),
+                                        ],
+                                        justify="center",
+                                        mt="md",
+                                        mb="xs",
+                                    ),
                                 ),
-                            ),
-                            dbc.CardFooter(["Rank Retrabalho / Modelo", html.Br(), "(menor = melhor)"]),
-                        ],
-                        class_name="card-box-shadow",
+                                dbc.CardFooter(["Rank Gasto Retrabalho / Modelo", html.Br(), "(menor = melhor)"]),
+                            ],
+                            class_name="card-box-shadow",
+                        ),
+                        md=3,
                     ),
-                    md=3,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-rank-correcao-de-primeira-veiculo", order=2),
-                                        DashIconify(
-                                            icon="gravity-ui:target-dart",
-                                            width=48,
-                                            color="black",
-                                        ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                ],
+                justify="center",
+            ),
+            dbc.Row(dmc.Space(h=40)),
+            dmc.Space(h=40),
+            # Gráfico de Quantidade de OS / mes
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-text-20-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do número de OS por mês",
+                                    className="align-self-center",
                                 ),
-                            ),
-                            dbc.CardFooter(["Rank Correção Primeira / Modelo", html.Br(), "(maior = melhor)"]),
-                        ],
-                        class_name="card-box-shadow",
+                                dmc.Space(h=5),
+                                gera_labels_inputs_veiculos("evolucao-os-mes-veiculo"),
+                            ]
+                        ),
+                        width=True,
                     ),
-                    md=3,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-total-os-veiculo", order=2),
-                                        DashIconify(
-                                            icon="pajamas:task-done",
-                                            width=48,
-                                            color="black",
-                                        ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-os-mes-veiculo"),
+            dmc.Space(h=40),
+            # Graficos de Evolução do Retrabalho por Mês
+            dmc.Space(h=30),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-wrench-20-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do retrabalho por veículo",
+                                    className="align-self-center",
                                 ),
-                            ),
-                            dbc.CardFooter(["Total de OSs executadas", html.Br(), "(no período selecionado)"]),
-                        ],
-                        className="card-box",
+                                dmc.Space(h=5),
+                                gera_labels_inputs_veiculos("evolucao-retrabalho-por-garagem-por-mes-veiculos"),
+                            ]
+                        ),
+                        width=True,
                     ),
-                    md=3,
-                    className="mb-3 mb-md-0",
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-rank-os-veiculo", order=2),
-                                        DashIconify(
-                                            icon="solar:ranking-linear",
-                                            width=48,
-                                            color="black",
-                                        ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-mes-por-veiculo"),
+            dmc.Space(h=40),
+            # Graficos de Evolução do Retrabalho por Seção
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-text-20-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do retrabalho por seção",
+                                    className="align-self-center",
                                 ),
-                            ),
-                            dbc.CardFooter(["Rank de OSs / Modelo", html.Br(), "(menor = melhor)"]),
-                        ],
-                        className="card-box",
+                                dmc.Space(h=5),
+                                gera_labels_inputs_veiculos("evolucao-retrabalho-por-secao-por-mes-veiculos"),
+                            ]
+                        ),
+                        width=True,
                     ),
-                    md=3,
-                    className="mb-3 mb-md-0",
-                ),
-            ],
-            justify="center",
-        ),
-        dmc.Space(h=20),
-        dbc.Row(
-            [
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-gasto-total-veiculo", order=2),
-                                        DashIconify(
-                                            icon="hugeicons:search-dollar",
-                                            width=48,
-                                            color="black",
-                                        ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-retrabalho-por-secao-por-mes-veiculos-v2"),
+            dmc.Space(h=40),
+            # Grafico de Evolução do Custo
+            dmc.Space(h=30),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="fluent:arrow-trending-wrench-20-filled", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Evolução do custo de peças trocadas por mês",
+                                    className="align-self-center",
                                 ),
-                            ),
-                            dbc.CardFooter(["Total gasto com peças", html.Br(), "(no período)"]),
-                        ],
-                        class_name="card-box-shadow",
+                                dmc.Space(h=5),
+                                gera_labels_inputs_veiculos("evolucao-custo-por-mes-veiculos"),
+                            ]
+                        ),
+                        width=True,
                     ),
-                    md=3,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-rank-gasto-total-veiculo", order=2),
-                                        DashIconify(
-                                            icon="ion:analytics-sharp",
-                                            width=48,
-                                            color="black",
-                                        ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                ],
+                align="center",
+            ),
+            dcc.Graph(id="graph-evolucao-custo-por-mes-veiculo"),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:account-wrench", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Detalhamento dos Serviços",
+                                    className="align-self-center",
                                 ),
-                            ),
-                            dbc.CardFooter(["Rank Gasto Total Peças / Modelo", html.Br(), "(menor = melhor)"]),
-                        ],
-                        class_name="card-box-shadow",
-                    ),
-                    md=3,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
+                                dmc.Space(h=5),
+                                dbc.Row(
                                     [
-                                        dmc.Title(id="indicador-gasto-retrabalho-total-veiculo", order=2),
-                                        DashIconify(
-                                            icon="emojione-monotone:money-with-wings",
-                                            width=48,
-                                            color="black",
+                                        dbc.Col(
+                                            gera_labels_inputs_veiculos("labels-tabela-top-servicos-categorizados-veiculo"),
+                                            width=True,
                                         ),
-                                    ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
-                                ),
-                            ),
-                            dbc.CardFooter(["Total gasto com retrabalho", html.Br(), "(no período selecionado)"]),
-                        ],
-                        class_name="card-box-shadow",
-                    ),
-                    md=3,
-                ),
-                dbc.Col(
-                    dbc.Card(
-                        [
-                            dbc.CardBody(
-                                dmc.Group(
-                                    [
-                                        dmc.Title(id="indicador-rank-gasto-retrabalho-veiculo", order=2),
-                                        DashIconify(
-                                            icon="ion:analytics-sharp",
-                                            width=48,
-                                            color="black",
+                                        dbc.Col(
+                                            html.Div(
+                                                [
+                                                    html.Button(
+                                                        "Exportar para Excel",
+                                                        id="btn-exportar-excel-top-servicos-veiculo",
+                                                        n_clicks=0,
+                                                        style={
+                                                            "background-color": "#007bff",  # Azul
+                                                            "color": "white",
+                                                            "border": "none",
+                                                            "padding": "10px 20px",
+                                                            "border-radius": "8px",
+                                                            "cursor": "pointer",
+                                                            "font-size": "16px",
+                                                            "font-weight": "bold",
+                                                        },
+                                                    ),
+                                                    dcc.Download(id="download-excel-top-servicos-veiculo"),
+                                                ],
+                                                style={"text-align": "right"},
+                                            ),
+                                            width="auto",
                                         ),
                                     ],
-                                    justify="center",
-                                    mt="md",
-                                    mb="xs",
+                                    align="center",
+                                    justify="between",  # Deixa os itens espaçados
                                 ),
-                            ),
-                            dbc.CardFooter(["Rank Gasto Retrabalho / Modelo", html.Br(), "(menor = melhor)"]),
-                        ],
-                        class_name="card-box-shadow",
-                    ),
-                    md=3,
-                ),
-            ],
-            justify="center",
-        ),
-        dbc.Row(dmc.Space(h=40)),
-        dmc.Space(h=40),
-        # Gráfico de Quantidade de OS / mes
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-text-20-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do número de OS por mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_veiculos("evolucao-os-mes-veiculo"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-os-mes-veiculo"),
-        dmc.Space(h=40),
-        # Graficos de Evolução do Retrabalho por Mês
-        dmc.Space(h=30),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-wrench-20-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do retrabalho por veículo",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_veiculos("evolucao-retrabalho-por-garagem-por-mes-veiculos"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-mes-por-veiculo"),
-        dmc.Space(h=40),
-        # Graficos de Evolução do Retrabalho por Seção
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-text-20-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do retrabalho por seção",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_veiculos("evolucao-retrabalho-por-secao-por-mes-veiculos"),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-retrabalho-por-secao-por-mes-veiculos-v2"),
-        dmc.Space(h=40),
-        # Grafico de Evolução do Custo
-        dmc.Space(h=30),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="fluent:arrow-trending-wrench-20-filled", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Evolução do custo de peças trocadas por mês",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            gera_labels_inputs_veiculos("evolucao-custo-por-mes-veiculos"),
-                        ]
+                            ]
+                        ),
+                        width=True,
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dcc.Graph(id="graph-evolucao-custo-por-mes-veiculo"),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:account-wrench", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Detalhamento dos Serviços",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            dbc.Row(
-                                [
-                                    dbc.Col(
-                                        gera_labels_inputs_veiculos("labels-tabela-top-servicos-categorizados-veiculo"),
-                                        width=True,
-                                    ),
-                                    dbc.Col(
-                                        html.Div(
-                                            [
-                                                html.Button(
-                                                    "Exportar para Excel",
-                                                    id="btn-exportar-excel-top-servicos-veiculo",
-                                                    n_clicks=0,
-                                                    style={
-                                                        "background-color": "#007bff",  # Azul
-                                                        "color": "white",
-                                                        "border": "none",
-                                                        "padding": "10px 20px",
-                                                        "border-radius": "8px",
-                                                        "cursor": "pointer",
-                                                        "font-size": "16px",
-                                                        "font-weight": "bold",
-                                                    },
-                                                ),
-                                                dcc.Download(id="download-excel-top-servicos-veiculo"),
-                                            ],
-                                            style={"text-align": "right"},
-                                        ),
-                                        width="auto",
+                ],
+                align="center",
+            ),
+            dmc.Space(h=40),
+            dag.AgGrid(
+                id="tabela-top-servicos-categorizados-veiculo",
+                columnDefs=veiculos_tabelas.tbl_top_servicos_categorizados_veiculo,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                },
+                style={"height": 400, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+            dbc.Row(
+                [
+                    dbc.Col(DashIconify(icon="mdi:cog-outline", width=45), width="auto"),
+                    dbc.Col(
+                        dbc.Row(
+                            [
+                                html.H4(
+                                    "Lista de OS e Peças do Veículo",
+                                    className="align-self-center",
+                                ),
+                                dmc.Space(h=5),
+                                dbc.Col(gera_labels_inputs_veiculos("labels-tabela-lista-os-pecas-do-veiculo"), width=True),
+                                dbc.Col(
+                                    html.Div(
+                                        [
+                                            html.Button(
+                                                "Exportar para Excel",
+                                                id="btn-exportar-excel-tabela-os-pecas-veiculo",
+                                                n_clicks=0,
+                                                style={
+                                                    "background-color": "#007bff",  # Azul
+                                                    "color": "white",
+                                                    "border": "none",
+                                                    "padding": "10px 20px",
+                                                    "border-radius": "8px",
+                                                    "cursor": "pointer",
+                                                    "font-size": "16px",
+                                                    "font-weight": "bold",
+                                                },
+                                            ),
+                                            dcc.Download(id="download-excel-tabela-os-pecas-veiculo"),
+                                        ],
+                                        style={"text-align": "right"},
                                     ),
-                                ],
-                                align="center",
-                                justify="between",  # Deixa os itens espaçados
-                            ),
-                        ]
-                    ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=40),
-        dag.AgGrid(
-            id="tabela-top-servicos-categorizados-veiculo",
-            columnDefs=veiculos_tabelas.tbl_top_servicos_categorizados_veiculo,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-            },
-            style={"height": 400, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
-        ),
-        dmc.Space(h=40),
-        dbc.Row(
-            [
-                dbc.Col(DashIconify(icon="mdi:cog-outline", width=45), width="auto"),
-                dbc.Col(
-                    dbc.Row(
-                        [
-                            html.H4(
-                                "Lista de OS e Peças do Veículo",
-                                className="align-self-center",
-                            ),
-                            dmc.Space(h=5),
-                            dbc.Col(gera_labels_inputs_veiculos("labels-tabela-lista-os-pecas-do-veiculo"), width=True),
-                            dbc.Col(
-                                html.Div(
-                                    [
-                                        html.Button(
-                                            "Exportar para Excel",
-                                            id="btn-exportar-excel-tabela-os-pecas-veiculo",
-                                            n_clicks=0,
-                                            style={
-                                                "background-color": "#007bff",  # Azul
-                                                "color": "white",
-                                                "border": "none",
-                                                "padding": "10px 20px",
-                                                "border-radius": "8px",
-                                                "cursor": "pointer",
-                                                "font-size": "16px",
-                                                "font-weight": "bold",
-                                            },
-                                        ),
-                                        dcc.Download(id="download-excel-tabela-os-pecas-veiculo"),
-                                    ],
-                                    style={"text-align": "right"},
+                                    width="auto",
                                 ),
-                                width="auto",
-                            ),
-                        ]
+                            ]
+                        ),
+                        width=True,
                     ),
-                    width=True,
-                ),
-            ],
-            align="center",
-        ),
-        dmc.Space(h=40),
-        dag.AgGrid(
-            id="tabela-lista-os-pecas-veiculo",
-            columnDefs=veiculos_tabelas.tbl_detalhamento_os_pecas_veiculo,
-            rowData=[],
-            defaultColDef={"filter": True, "floatingFilter": True},
-            columnSize="autoSize",
-            dashGridOptions={
-                "localeText": locale_utils.AG_GRID_LOCALE_BR,
-            },
-            style={"height": 600, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
-        ),
-        dmc.Space(h=40),
-    ]
-)
+                ],
+                align="center",
+            ),
+            dmc.Space(h=40),
+            dag.AgGrid(
+                id="tabela-lista-os-pecas-veiculo",
+                columnDefs=veiculos_tabelas.tbl_detalhamento_os_pecas_veiculo,
+                rowData=[],
+                defaultColDef={"filter": True, "floatingFilter": True},
+                columnSize="autoSize",
+                dashGridOptions={
+                    "localeText": locale_utils.AG_GRID_LOCALE_BR,
+                },
+                style={"height": 600, "resize": "vertical", "overflow": "hidden"},  # -> permite resize
+            ),
+            dmc.Space(h=40),
+        ]
+    )
 
 
 ##############################################################################
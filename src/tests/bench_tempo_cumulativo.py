@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Benchmark de TipoServicoService.get_tempo_cumulativo_para_retrabalho (10 mil, 100 mil e 1 milhão de OSs)
+# Execução (no diretório src): python -m tests.bench_tempo_cumulativo [--sem-referencia]
+# A implementação anterior (laço por grupo) é medida até 100 mil OSs, pois leva minutos para 1 milhão
+
+# Imports básicos
+import sys
+import time
+import pandas as pd
+
+# Imports auxiliares
+from tests.test_tempo_cumulativo import gera_os, tempo_cumulativo_atual, tempo_cumulativo_referencia
+
+TAMANHOS = [10_000, 100_000, 1_000_000]
+TAMANHO_MAX_REFERENCIA = 100_000
+
+
+def mede(funcao, df):
+    inicio = time.perf_counter()
+    resultado = funcao(df)
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    usa_referencia = "--sem-referencia" not in sys.argv
+
+    for num_linhas in TAMANHOS:
+        df = gera_os(num_linhas)
+        df_atual, tempo_atual_ms = mede(tempo_cumulativo_atual, df)
+
+        if usa_referencia and num_linhas <= TAMANHO_MAX_REFERENCIA:
+            df_referencia, tempo_referencia_ms = mede(tempo_cumulativo_referencia, df)
+            pd.testing.assert_frame_equal(df_referencia, df_atual, check_dtype=False)
+            print(f"{num_linhas:>9} OSs: anterior {tempo_referencia_ms:9.0f} ms, atual {tempo_atual_ms:7.0f} ms")
+        else:
+            print(f"{num_linhas:>9} OSs: atual {tempo_atual_ms:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
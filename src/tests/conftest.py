@@ -0,0 +1,5 @@
+# Os testes importam os módulos do painel (modules.*) a partir do diretório src, como o app.py
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
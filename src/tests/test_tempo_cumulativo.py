@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Regressão de TipoServicoService.get_tempo_cumulativo_para_retrabalho contra a implementação anterior (laço por grupo)
+# Execução (no diretório src): python -m pytest tests
+
+# Imports básicos
+import contextlib
+import io
+import numpy as np
+import pandas as pd
+
+# Imports auxiliares
+from modules.tipo_servico.tipo_servico_service import TipoServicoService
+
+
+##############################################################################
+# IMPLEMENTAÇÃO ANTERIOR #####################################################
+##############################################################################
+def tempo_cumulativo_referencia(df):
+    """Implementação anterior de get_tempo_cumulativo_para_retrabalho (um laço por problema de cada veículo)"""
+    tempos_cumulativos = []
+
+    for (problem_no, vehicle_id), group in df.groupby(["problem_no", "CODIGO DO VEICULO"]):
+        try:
+            if group["correcao"].sum() > 0:
+                data_abertura_os = pd.to_datetime(group["DATA DA ABERTURA DA OS"].min())
+                data_fechamento_os = pd.to_datetime(group["DATA DO FECHAMENTO DA OS"].max())
+
+                diff_in_days = (data_fechamento_os - data_abertura_os).days
+                if diff_in_days < 0:
+                    diff_in_days = 0
+
+                tempos_cumulativos.append(
+                    {"problem_no": problem_no, "vehicle_id": vehicle_id, "tempo_cumulativo": diff_in_days}
+                )
+        except Exception as e:
+            print(e)
+            tempos_cumulativos.append({"problem_no": problem_no, "vehicle_id": vehicle_id, "tempo_cumulativo": -1})
+
+    df_tempos_cumulativos = pd.DataFrame(tempos_cumulativos)
+    df_tempos_cumulativos_sorted = df_tempos_cumulativos.sort_values(by="tempo_cumulativo")
+    df_tempos_cumulativos_sorted["cumulative_percentage"] = (
+        df_tempos_cumulativos_sorted["tempo_cumulativo"].expanding().count() / len(df_tempos_cumulativos_sorted) * 100
+    )
+
+    return df_tempos_cumulativos_sorted
+
+
+##############################################################################
+# DADOS ######################################################################
+##############################################################################
+def gera_os(num_linhas, seed=0):
+    """Gera OSs sintéticas (um ano de aberturas, fechamentos de 2 dias antes a 20 dias depois)"""
+    rng = np.random.default_rng(seed)
+    abertura = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365 * 24 * 60, num_linhas), unit="min")
+    fechamento = abertura + pd.to_timedelta(rng.integers(-2 * 24 * 60, 20 * 24 * 60, num_linhas), unit="min")
+
+    return pd.DataFrame(
+        {
+            "problem_no": rng.integers(0, num_linhas // 8 + 1, num_linhas),
+            "CODIGO DO VEICULO": rng.integers(0, 400, num_linhas),
+            "correcao": rng.random(num_linhas) < 0.3,
+            "DATA DA ABERTURA DA OS": abertura.strftime("%Y-%m-%dT%H:%M:%S"),
+            "DATA DO FECHAMENTO DA OS": pd.Series(fechamento.strftime("%Y-%m-%dT%H:%M:%S")),
+        }
+    )
+
+
+def gera_os_datas_irregulares(num_linhas=5000, seed=1):
+    """OSs com fechamentos nulos e vazios, uma abertura fora do formato ISO e um problema com aberturas inválidas"""
+    df = gera_os(num_linhas, seed)
+    df.loc[::97, "DATA DO FECHAMENTO DA OS"] = None
+    df.loc[::89, "DATA DO FECHAMENTO DA OS"] = ""
+    df.loc[5, "DATA DA ABERTURA DA OS"] = "01/02/2024 10:00"
+
+    # Todas as aberturas do problema são inválidas (a versão anterior só detectava a inválida no mínimo/máximo do texto)
+    mesmo_problema = (df["problem_no"] == df.loc[7, "problem_no"]) & (
+        df["CODIGO DO VEICULO"] == df.loc[7, "CODIGO DO VEICULO"]
+    )
+    df.loc[mesmo_problema, "DATA DA ABERTURA DA OS"] = "lixo"
+    df.loc[mesmo_problema, "correcao"] = True
+
+    return df
+
+
+def tempo_cumulativo_atual(df):
+    return TipoServicoService(None).get_tempo_cumulativo_para_retrabalho(df)
+
+
+##############################################################################
+# TESTES #####################################################################
+##############################################################################
+def test_datas_iso():
+    df = gera_os(5000)
+    pd.testing.assert_frame_equal(tempo_cumulativo_referencia(df), tempo_cumulativo_atual(df), check_dtype=False)
+
+
+def test_datas_nulas_vazias_e_fora_do_formato():
+    df = gera_os_datas_irregulares()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df_referencia = tempo_cumulativo_referencia(df)
+    df_atual = tempo_cumulativo_atual(df)
+
+    pd.testing.assert_frame_equal(df_referencia, df_atual, check_dtype=False)
+
+    # Fechamentos nulos/vazios ficam sem tempo e as datas inválidas são sinalizadas com -1
+    assert df_atual["tempo_cumulativo"].isna().any()
+    assert (df_atual["tempo_cumulativo"] == -1).sum() == 1
+
+
+def test_sem_os():
+    # A versão anterior gerava KeyError; a atual retorna um DataFrame vazio
+    df_atual = tempo_cumulativo_atual(gera_os(0))
+
+    assert df_atual.empty
+    assert list(df_atual.columns) == ["problem_no", "vehicle_id", "tempo_cumulativo", "cumulative_percentage"]